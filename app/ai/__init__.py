@@ -0,0 +1 @@
+"""AI side of voice/text commands: local intent parsing and the remote model."""
@@ -0,0 +1,268 @@
+"""Action router: structured AI actions -> one batched reminder-list mutation.
+
+The model (or the local intent parser) returns actions such as
+
+    {"type": "create_todo", "title": "Call mom", "due": "2026-03-02 17:00"}
+    {"type": "add_shopping_items", "items": ["Milk", {"name": "Eggs", "quantity": 2, "unit": "cartons"}]}
+
+validate_actions() checks a batch against ACTION_SCHEMA and flattens it to one
+NewItem per list entry. apply_actions() then drops items already open on the
+list (normalized-title index, see normalize_title) or repeated in the batch,
+and inserts the rest in one transaction: a single block insert, a single
+`reminders_version` bump (so one re-render however many items), and, when an
+OpLog is given, a single log record. The summary feeds the voice overlay.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import re
+from typing import Any, Iterable, Optional
+
+from app.ai.intents import Item, canonical_unit
+from app.core.reminder_index import writable_reminder_index
+from app.core.state import AppState, Reminder
+from app.storage.oplog import OpLog
+
+# type -> {field: (accepted types, required)}
+ACTION_SCHEMA: dict[str, dict[str, tuple[tuple[type, ...], bool]]] = {
+    "create_todo": {"title": ((str,), True), "due": ((str,), False), "category": ((str,), False)},
+    "add_shopping_items": {"items": ((list,), True)},
+}
+MAX_ACTIONS = 100
+MAX_TITLE = 80
+
+_PAREN = re.compile(r"\([^)]*\)")
+_WORD = re.compile(r"[^\W_]+")
+_LEADING = {"a", "an", "the", "some", "more", "buy", "get"}
+
+
+class ActionError(ValueError):
+    pass
+
+
+@dataclass
+class NewItem:
+    """One list entry a validated action asks for."""
+
+    title: str
+    category: str = "general"
+    due: Optional[datetime] = None
+
+
+@dataclass
+class ActionSummary:
+    added: list[Reminder] = field(default_factory=list)
+    duplicates: list[str] = field(default_factory=list)
+    rejected: list[str] = field(default_factory=list)
+    # What was committed, as oplog ops ({"op": "add", ...}); empty when nothing changed.
+    ops: list[dict] = field(default_factory=list)
+    version: int = 0
+    source: str = ""
+
+    def detail(self) -> str:
+        parts = []
+        if self.added:
+            parts.append("Added " + ", ".join(r.title for r in self.added))
+        if self.duplicates:
+            n = len(self.duplicates)
+            parts.append(f"{n} already on the list" if n > 1 else f"{self.duplicates[0]} already on the list")
+        if self.rejected and not self.added:
+            parts.append(f"{len(self.rejected)} not understood")
+        return "; ".join(parts) or "Nothing to add"
+
+
+def normalize_title(title: str) -> str:
+    """Dedupe key: case/punctuation/quantity-insensitive, leading verbs/articles and plural 's' dropped.
+
+    "Eggs (2 cartons)", "eggs", "Buy eggs!" and "the egg" all map to "egg".
+    """
+    words = _WORD.findall(_PAREN.sub(" ", title.casefold()))
+    while len(words) > 1 and words[0] in _LEADING:
+        words = words[1:]
+    if words:
+        w = words[-1]
+        if len(w) > 4 and w.endswith("ies"):
+            words[-1] = w[:-3] + "y"
+        elif len(w) > 4 and w.endswith("oes"):
+            words[-1] = w[:-2]
+        elif len(w) > 3 and w.endswith("s") and not w.endswith("ss"):
+            words[-1] = w[:-1]
+    return " ".join(words)
+
+
+class TitleIndex:
+    """Normalized titles of the open reminders, for one list object at one `reminders_version`."""
+
+    __slots__ = ("_source", "_size", "version", "_titles")
+
+    def __init__(self, reminders: list[Reminder], version: int = 0):
+        self._source = reminders
+        self._size = len(reminders)
+        self.version = int(version)
+        self._titles = {normalize_title(r.title) for r in reminders if not r.completed}
+
+    def matches(self, reminders: list[Reminder], version: int) -> bool:
+        return reminders is self._source and len(reminders) == self._size and int(version) == self.version
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._titles
+
+    def copy(self) -> TitleIndex:
+        other = TitleIndex.__new__(TitleIndex)
+        other._source = self._source
+        other._size = self._size
+        other.version = self.version
+        other._titles = set(self._titles)
+        return other
+
+    def added(self, reminders: list[Reminder], keys: Iterable[str], *, version: int) -> None:
+        """Account for keys just inserted into `reminders` (now at `version`)."""
+        self._titles.update(keys)
+        self._source = reminders
+        self._size = len(reminders)
+        self.version = int(version)
+
+
+def title_index(state: AppState) -> TitleIndex:
+    """Current title index for `state.model.reminders`, rebuilt only when stale."""
+    model = state.model
+    version = int(state.ui.reminders_version or 0)
+    index = model.title_index
+    if index is None or not index.matches(model.reminders, version):
+        index = TitleIndex(model.reminders, version)
+        model.title_index = index
+    return index
+
+
+def _title(value: Any) -> str:
+    if isinstance(value, dict):
+        name = value.get("name")
+        qty = value.get("quantity")
+        unit = value.get("unit") or ""
+        if not isinstance(name, str) or (qty is not None and not isinstance(qty, int)) or not isinstance(unit, str):
+            raise ActionError(f"bad item {value!r}")
+        title = Item(name.strip(), qty, canonical_unit(unit)).label() if name.strip() else ""
+    elif isinstance(value, str):
+        title = value.strip()
+        title = title[:1].upper() + title[1:]
+    else:
+        raise ActionError(f"bad item {value!r}")
+    title = " ".join(title.split())
+    if not title:
+        raise ActionError("empty title")
+    return title[:MAX_TITLE]
+
+
+def _due(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.strip())
+    except ValueError as exc:
+        raise ActionError(f"bad due {value!r}") from exc
+
+
+def validate_action(raw: Any) -> list[NewItem]:
+    """The list entries one raw action asks for; raises ActionError when it doesn't fit ACTION_SCHEMA."""
+    if not isinstance(raw, dict):
+        raise ActionError(f"not an object: {raw!r}")
+    kind = raw.get("type")
+    schema = ACTION_SCHEMA.get(kind) if isinstance(kind, str) else None
+    if schema is None:
+        raise ActionError(f"unknown action {kind!r}")
+    for name, (types, required) in schema.items():
+        value = raw.get(name)
+        if value is None:
+            if required:
+                raise ActionError(f"{kind}: missing {name}")
+        elif not isinstance(value, types):
+            raise ActionError(f"{kind}: {name} must be {types[0].__name__}")
+    if kind == "create_todo":
+        category = (raw.get("category") or "general").strip().lower() or "general"
+        return [NewItem(_title(raw["title"]), category, _due(raw.get("due")))]
+    return [NewItem(_title(v), "shopping") for v in raw["items"]]
+
+
+def validate_actions(actions: Iterable[Any]) -> tuple[list[NewItem], list[str]]:
+    """(items, errors): invalid actions are reported and skipped, the rest still apply."""
+    items: list[NewItem] = []
+    errors: list[str] = []
+    for k, raw in enumerate(actions):
+        if k >= MAX_ACTIONS:
+            errors.append(f"more than {MAX_ACTIONS} actions")
+            break
+        try:
+            items.extend(validate_action(raw))
+        except ActionError as exc:
+            errors.append(str(exc))
+    return items, errors
+
+
+def _right(due: Optional[datetime], now: float) -> str:
+    """Due text in the dashboard's style: "17:00" today, "Mar 5" otherwise."""
+    if due is None:
+        return ""
+    if due.date() == datetime.fromtimestamp(now).date():
+        return due.strftime("%H:%M")
+    return f"{due:%b} {due.day}"
+
+
+def apply_actions(
+    state: AppState,
+    actions: Iterable[Any],
+    *,
+    now: float,
+    source: str = "ai",
+    oplog: Optional[OpLog] = None,
+) -> ActionSummary:
+    """Validate, dedupe and insert `actions` as one batch (mutates `state` like a reducer step)."""
+    items, errors = validate_actions(actions)
+    summary = ActionSummary(rejected=errors, version=int(state.ui.reminders_version or 0), source=source)
+    titles = title_index(state)
+    fresh: list[tuple[str, NewItem]] = []
+    seen: set[str] = set()
+    for item in items:
+        key = normalize_title(item.title)
+        if key in titles or key in seen:
+            summary.duplicates.append(item.title)
+            continue
+        seen.add(key)
+        fresh.append((key, item))
+    if not fresh:
+        return summary
+
+    model = state.model
+    index = writable_reminder_index(state)
+    # New items go above the completed ones, where a reorder would put them.
+    pos = index.first_completed()
+    if state.model is not model:
+        titles = titles.copy()  # the old snapshot keeps its own index
+    ui = state.ui
+    ui.reminders_version = int(ui.reminders_version or 0) + 1
+    stamp = int(now * 1000)
+    added = [
+        Reminder(
+            rid=f"{source}-{stamp}-{k}",
+            title=item.title,
+            right=_right(item.due, now),
+            category=item.category,
+            created_at=now,
+        )
+        for k, (_, item) in enumerate(fresh)
+    ]
+    index.insert_many(pos, added, version=ui.reminders_version)
+    titles.added(state.model.reminders, (key for key, _ in fresh), version=ui.reminders_version)
+    state.model.title_index = titles
+
+    summary.added = added
+    summary.version = ui.reminders_version
+    for r, (_, item) in zip(added, fresh):
+        op = {"op": "add", "rid": r.rid, "title": r.title, "category": r.category, "pos": pos + len(summary.ops)}
+        if item.due is not None:
+            op["due"] = item.due.strftime("%Y-%m-%d %H:%M")
+        summary.ops.append(op)
+    if oplog is not None:
+        oplog.append(summary.ops, ts=now, source=source)
+    return summary
@@ -0,0 +1,314 @@
+"""Model client: one backend connection per process, cached text replies, coalesced requests.
+
+    client = AiClient(GenaiBackend())            # or HttpBackend(url) for tools/fake_model_server.py
+    reply = client.analyze_text("buy milk, bread and two cartons of eggs")
+
+- Text requests are cached by their normalized text (case, spacing and
+  trailing punctuation ignored) for `ttl_s`. Replies hold absolute due times,
+  so the key also carries the date, and the minute when the text has a
+  relative time ("in 20 minutes").
+- Identical requests that arrive while one is in flight wait for it instead
+  of sending their own (audio clips are coalesced by content hash, never cached).
+- Every call has a timeout, and transient failures (timeouts, connection
+  errors, 408/429/5xx) are retried with exponential backoff and jitter.
+
+AiClient.stats counts hits, coalesced requests, backend calls and retries and
+keeps request latencies for percentiles (tools/bench_ai_client.py).
+"""
+
+from __future__ import annotations
+
+import base64
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Optional, Protocol
+import urllib.error
+import urllib.request
+
+VOICE_PROMPT = (
+    "Transcribe the audio into English text and extract todos/reminders."
+    "Output JSON only, format:"
+    '{"transcript":"...","todos":["..."],"reminders":[{"text":"...","due":"YYYY-MM-DD HH:MM"}]}'
+    "If a relative time is mentioned, convert it to an absolute datetime."
+    "Current time: "
+)
+TEXT_PROMPT = (
+    "Parse the input into todos or reminders."
+    "Return JSON:"
+    '{"transcript":"...","todos":["..."],"reminders":[{"text":"...","due":"YYYY-MM-DD HH:MM"}]}\n'
+    "If a relative time is mentioned, convert it to an absolute datetime."
+    "Current time: "
+)
+
+_RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+_RELATIVE = re.compile(r"\b(in|from now|later|ago|minutes?|mins?|hours?|hrs?|seconds?)\b")
+
+
+@dataclass
+class VoiceReply:
+    transcript: str = ""
+    todos: list[str] = field(default_factory=list)
+    # app.ai.action_router actions (validated when applied).
+    actions: list[dict] = field(default_factory=list)
+
+
+def extract_json(text: str) -> Optional[str]:
+    """The outermost {...} in a model reply (models like to wrap JSON in prose/fences)."""
+    text = text.strip()
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end > start:
+        return text[start : end + 1]
+    return None
+
+
+def parse_reply(text: str) -> VoiceReply:
+    """Read the model's {"transcript", "todos", "reminders", "actions"} JSON; anything else is a bare transcript."""
+    payload = extract_json(text or "")
+    if payload is None:
+        return VoiceReply(transcript=(text or "").strip())
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return VoiceReply(transcript=text.strip())
+    if not isinstance(data, dict):
+        return VoiceReply(transcript=text.strip())
+    todos = [t.strip() for t in data.get("todos") or [] if isinstance(t, str) and t.strip()]
+    actions = [a for a in data.get("actions") or [] if isinstance(a, dict)]
+    for r in data.get("reminders") or []:
+        if isinstance(r, dict) and isinstance(r.get("text"), str) and r["text"].strip():
+            action = {"type": "create_todo", "title": r["text"].strip()}
+            if isinstance(r.get("due"), str) and r["due"].strip():
+                action["due"] = r["due"].strip()
+            actions.append(action)
+    return VoiceReply(transcript=str(data.get("transcript") or ""), todos=todos, actions=actions)
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.casefold().split()).rstrip(" .!?,;")
+
+
+def is_retryable(exc: BaseException) -> bool:
+    status = getattr(exc, "code", None) or getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status in _RETRY_STATUS
+    return isinstance(exc, (TimeoutError, ConnectionError, urllib.error.URLError))
+
+
+class ModelBackend(Protocol):
+    """One model round trip. `contents` holds prompt strings and audio parts (audio_part())."""
+
+    def generate(self, contents: list[Any], *, timeout_s: float) -> str: ...
+
+    def audio_part(self, wav: bytes) -> Any: ...
+
+
+_GENAI_CLIENTS: dict[tuple[str, int], Any] = {}
+_GENAI_LOCK = threading.Lock()
+
+
+def genai_client(api_key: Optional[str] = None, *, timeout_s: float = 20.0) -> Any:
+    """The process-wide google-genai client for this key/timeout (created on first use)."""
+    try:
+        from google import genai  # type: ignore
+    except Exception as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError("google-genai not installed. pip install google-genai") from exc
+    api_key = api_key or os.environ.get("GOOGLE_API_KEY")
+    if not api_key:
+        raise RuntimeError("missing API key env: GOOGLE_API_KEY")
+    key = (api_key, int(timeout_s * 1000))
+    with _GENAI_LOCK:
+        client = _GENAI_CLIENTS.get(key)
+        if client is None:
+            client = genai.Client(api_key=api_key, http_options={"timeout": key[1]})
+            _GENAI_CLIENTS[key] = client
+        return client
+
+
+class GenaiBackend:
+    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash"):
+        self.api_key = api_key
+        self.model = model
+
+    def generate(self, contents: list[Any], *, timeout_s: float) -> str:
+        client = genai_client(self.api_key, timeout_s=timeout_s)
+        response = client.models.generate_content(model=self.model, contents=contents)
+        return (response.text or "").strip()
+
+    def audio_part(self, wav: bytes) -> Any:
+        from google import genai  # type: ignore
+
+        return genai.types.Part.from_bytes(data=wav, mime_type="audio/wav")
+
+
+class HttpBackend:
+    """Plain JSON over HTTP: POST {"model", "contents"} -> {"text"} (tools/fake_model_server.py)."""
+
+    def __init__(self, url: str, model: str = "fake"):
+        self.url = url
+        self.model = model
+
+    def generate(self, contents: list[Any], *, timeout_s: float) -> str:
+        body = json.dumps({"model": self.model, "contents": contents}).encode("utf-8")
+        req = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            return str(json.loads(resp.read().decode("utf-8")).get("text") or "").strip()
+
+    def audio_part(self, wav: bytes) -> Any:
+        return {"mime_type": "audio/wav", "data": base64.b64encode(wav).decode("ascii")}
+
+
+@dataclass
+class AiClientStats:
+    requests: int = 0
+    hits: int = 0
+    coalesced: int = 0
+    calls: int = 0  # backend round trips, retries included
+    retries: int = 0
+    errors: int = 0
+    # Per request, wall time seen by the caller (hits and waits included);
+    # the last AiClient `latency_window` requests.
+    latency_s: deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+    def percentile(self, q: float) -> float:
+        if not self.latency_s:
+            return 0.0
+        ordered = sorted(self.latency_s)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class AiClient:
+    def __init__(
+        self,
+        backend: ModelBackend,
+        *,
+        ttl_s: float = 600.0,
+        max_entries: int = 256,
+        timeout_s: float = 20.0,
+        retries: int = 2,
+        backoff_s: float = 0.5,
+        coalesce: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        latency_window: int = 1024,
+    ):
+        self.backend = backend
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.timeout_s = timeout_s
+        self.retries = retries
+        self.backoff_s = backoff_s
+        self.coalesce = coalesce
+        self.clock = clock
+        self.sleep = sleep
+        self.stats = AiClientStats(latency_s=deque(maxlen=latency_window))
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[tuple, tuple[float, VoiceReply]] = OrderedDict()
+        self._inflight: dict[tuple, _Flight] = {}
+
+    # ---- requests ----
+
+    def analyze_text(self, text: str, now: Optional[datetime] = None) -> VoiceReply:
+        """Todos/reminders in a typed or transcribed command (cached, coalesced)."""
+        now = now or datetime.now()
+        norm = normalize_text(text)
+        stamp = now.strftime("%Y-%m-%d %H:%M") if _RELATIVE.search(norm) else now.strftime("%Y-%m-%d")
+        prompt = TEXT_PROMPT + now.strftime("%Y-%m-%d %H:%M:%S")
+        return self._request(("text", norm, stamp), lambda: parse_reply(self.generate([prompt, text])), cache=True)
+
+    def transcribe(self, wav: bytes, now: Optional[datetime] = None) -> VoiceReply:
+        """Transcript and todos/reminders for a WAV clip (coalesced, not cached)."""
+        now = now or datetime.now()
+        prompt = VOICE_PROMPT + now.strftime("%Y-%m-%d %H:%M:%S")
+        key = ("audio", hashlib.sha1(wav).hexdigest(), now.strftime("%Y-%m-%d %H:%M"))
+        return self._request(key, lambda: parse_reply(self.generate([prompt, self.backend.audio_part(wav)])), cache=False)
+
+    def generate(self, contents: list[Any]) -> str:
+        """One model call with timeout and retries (no caching)."""
+        for attempt in range(self.retries + 1):
+            with self._lock:
+                self.stats.calls += 1
+            try:
+                return self.backend.generate(contents, timeout_s=self.timeout_s)
+            except Exception as exc:
+                if attempt >= self.retries or not is_retryable(exc):
+                    raise
+                with self._lock:
+                    self.stats.retries += 1
+                self.sleep(self.backoff_s * (2**attempt) * random.uniform(0.5, 1.0))
+        raise AssertionError("unreachable")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    # ---- cache + coalescing ----
+
+    def _request(self, key: tuple, call: Callable[[], VoiceReply], *, cache: bool) -> VoiceReply:
+        t0 = self.clock()
+        lead = False
+        with self._lock:
+            self.stats.requests += 1
+            hit = self._cache.get(key) if cache else None
+            if hit is not None and hit[0] > t0:
+                self._cache.move_to_end(key)
+                self.stats.hits += 1
+                self.stats.latency_s.append(self.clock() - t0)
+                return _copy(hit[1])
+            flight = self._inflight.get(key) if self.coalesce else None
+            if flight is None:
+                flight = _Flight()
+                lead = True
+                if self.coalesce:
+                    self._inflight[key] = flight
+            else:
+                self.stats.coalesced += 1
+        if lead:
+            try:
+                flight.result = call()
+            except BaseException as exc:
+                flight.error = exc
+            with self._lock:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+                if flight.error is None and cache and self.ttl_s > 0:
+                    self._cache[key] = (self.clock() + self.ttl_s, flight.result)
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > self.max_entries:
+                        self._cache.popitem(last=False)
+            flight.done.set()
+        else:
+            flight.done.wait()
+        with self._lock:
+            self.stats.latency_s.append(self.clock() - t0)
+            if flight.error is not None:
+                self.stats.errors += 1
+        if flight.error is not None:
+            raise flight.error
+        return _copy(flight.result)
+
+
+def _copy(reply: VoiceReply) -> VoiceReply:
+    # Callers may edit what they get back; the cached reply must not change.
+    return VoiceReply(reply.transcript, list(reply.todos), [dict(a) for a in reply.actions])
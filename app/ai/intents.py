@@ -0,0 +1,684 @@
+"""Rule-based intent parser for short household commands (the offline fast path).
+
+The common shapes are handled instantly, without a model round trip:
+
+    buy milk, two cartons of eggs and bread        shopping items with quantities
+    we're out of coffee / running low on butter    shopping items
+    add apples to the shopping list                shopping items
+    remind me to call mom at 5pm / in 20 minutes   reminder with a due time
+    remind me tomorrow to take out the trash       reminder (9:00 unless a time is given)
+    I need to fix the sink                         task without a due time
+
+The text is tokenized once. A command is a trigger phrase plus a body, and
+time expressions may appear anywhere in the body. Several commands can be
+joined with "and"/","/"then". Anything the grammar does not fully account
+for is marked `escalate` so the caller asks the remote model instead: for
+example questions, negations, "or", recurring times, time words it cannot
+place, or item phrases that look like sentences.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+import re
+from typing import Optional
+
+_TOKEN = re.compile(
+    r"\d{4}-\d{1,2}-\d{1,2}"
+    r"|\d{1,2}/\d{1,2}(?:/\d{2,4})?"
+    r"|\d{1,2}:\d{2}(?:am|pm)?"
+    r"|\d+(?:am|pm|st|nd|rd|th)?"
+    r"|[a-z]+(?:'[a-z]+)?"
+    r"|[,&?]"
+)
+
+_CONTRACTIONS = {
+    "we're": ("we", "are"),
+    "i'm": ("i", "am"),
+    "they're": ("they", "are"),
+    "don't": ("do", "not"),
+    "doesn't": ("does", "not"),
+    "didn't": ("did", "not"),
+    "can't": ("can", "not"),
+    "won't": ("will", "not"),
+    "isn't": ("is", "not"),
+    "aren't": ("are", "not"),
+    "let's": ("let", "us"),
+    "what's": ("what", "is"),
+    "when's": ("when", "is"),
+    "where's": ("where", "is"),
+    "how's": ("how", "is"),
+    "it's": ("it", "is"),
+    "there's": ("there", "is"),
+    "i've": ("i", "have"),
+    "we've": ("we", "have"),
+    "i'll": ("i", "will"),
+    "we'll": ("we", "will"),
+    "o'clock": ("oclock",),
+}
+
+_ONES = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8,
+    "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14, "fifteen": 15,
+    "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19,
+}
+_TENS = {"twenty": 20, "thirty": 30, "forty": 40, "fifty": 50, "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90}
+
+_WEEKDAYS = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3, "friday": 4, "saturday": 5, "sunday": 6,
+}
+_MONTHS = {
+    "january": 1, "february": 2, "march": 3, "april": 4, "may": 5, "june": 6, "july": 7,
+    "august": 8, "september": 9, "october": 10, "november": 11, "december": 12,
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "jun": 6, "jul": 7, "aug": 8, "sep": 9, "sept": 9,
+    "oct": 10, "nov": 11, "dec": 12,
+}
+_PARTS = {"morning": 9, "afternoon": 15, "evening": 19, "night": 21}
+_DELTA_UNITS = {
+    "minute": 60, "minutes": 60, "min": 60, "mins": 60,
+    "hour": 3600, "hours": 3600, "hr": 3600, "hrs": 3600,
+    "day": 86400, "days": 86400, "week": 604800, "weeks": 604800,
+}
+# Day-only reminders are due at this hour (as the hardware demo's parse_due_datetime).
+DEFAULT_HOUR = 9
+
+_UNITS = {
+    "bottle": "bottle", "bottles": "bottle", "carton": "carton", "cartons": "carton", "can": "can",
+    "cans": "can", "pack": "pack", "packs": "pack", "packet": "packet", "packets": "packet", "bag": "bag",
+    "bags": "bag", "box": "box", "boxes": "box", "jar": "jar", "jars": "jar", "loaf": "loaf",
+    "loaves": "loaf", "kg": "kg", "kilo": "kg", "kilos": "kg", "g": "g", "grams": "g", "lb": "lb",
+    "lbs": "lb", "pound": "lb", "pounds": "lb", "liter": "l", "liters": "l", "litre": "l", "litres": "l",
+    "gallon": "gallon", "gallons": "gallon", "bunch": "bunch", "bunches": "bunch", "head": "head",
+    "heads": "head", "tub": "tub", "tubs": "tub", "roll": "roll", "rolls": "roll", "bar": "bar",
+    "bars": "bar", "dozen": "dozen", "tin": "tin", "tins": "tin", "block": "block", "blocks": "block",
+}
+# "X and Y" that is one item, not two.
+_COMPOUNDS = {
+    ("mac", "and", "cheese"), ("salt", "and", "pepper"), ("fish", "and", "chips"),
+    ("peanut", "butter", "and", "jelly"), ("half", "and", "half"), ("oil", "and", "vinegar"),
+}
+
+_PREFIXES = (
+    ("please",), ("hey",), ("ok",), ("okay",), ("oh",), ("um",), ("uh",), ("so",), ("and",), ("also",),
+    ("can", "you"), ("could", "you"), ("would", "you"), ("will", "you"), ("can", "we"),
+    ("i", "want", "you", "to"), ("go", "ahead", "and"), ("quick", "reminder"),
+)
+_SUFFIXES = (("please",), ("thanks",), ("thank", "you"), ("too",), ("as", "well"), ("also",))
+
+# (tokens, kind): "shop" = shopping items, "task" = reminder/todo text, "need" = shop
+# unless followed by "to <verb>" (then a task), "add" = list named by a suffix.
+_TRIGGERS: list[tuple[tuple[str, ...], str]] = sorted(
+    [
+        (("buy",), "shop"), (("get",), "shop"), (("grab",), "shop"), (("pick", "up"), "shop"),
+        (("purchase",), "shop"), (("restock",), "shop"), (("get", "more"), "shop"), (("buy", "more"), "shop"),
+        (("we", "need"), "need"), (("i", "need"), "need"), (("need",), "need"), (("we", "need", "more"), "shop"),
+        (("we", "should", "buy"), "shop"), (("we", "should", "get"), "shop"),
+        (("we", "are", "out", "of"), "shop"), (("we", "are", "all", "out", "of"), "shop"),
+        (("we", "ran", "out", "of"), "shop"), (("we", "just", "ran", "out", "of"), "shop"),
+        (("ran", "out", "of"), "shop"), (("out", "of"), "shop"), (("all", "out", "of"), "shop"),
+        (("we", "are", "low", "on"), "shop"), (("we", "are", "running", "low", "on"), "shop"),
+        (("running", "low", "on"), "shop"), (("low", "on"), "shop"), (("we", "have", "no"), "shop"),
+        (("there", "is", "no"), "shop"), (("no", "more"), "shop"),
+        (("add",), "add"), (("put",), "add"),
+        (("remind", "me"), "task"), (("remind", "us"), "task"), (("set", "a", "reminder"), "task"),
+        (("set", "reminder"), "task"), (("create", "a", "reminder"), "task"), (("add", "a", "reminder"), "task"),
+        (("reminder",), "task"), (("do", "not", "forget"), "task"), (("remember",), "task"),
+        (("make", "sure"), "task"), (("i", "have", "to"), "task"), (("we", "have", "to"), "task"),
+        (("i", "must"), "task"), (("we", "must"), "task"), (("todo",), "task"),
+    ],
+    key=lambda t: -len(t[0]),
+)
+# Words after a task trigger that only link it to the body.
+_TASK_LINKS = ("to", "that", "about", "for", "of", "i", "we")
+_QUESTION = {"what", "when", "where", "who", "why", "how", "which", "is", "are", "do", "does", "did", "should", "shall"}
+# Other commands (edit/delete/...) and words the grammar can't place: the model decides.
+_ESCALATE_WORDS = {
+    "or", "not", "never", "cancel", "delete", "remove", "undo", "clear", "mark", "done", "finished",
+    "every", "daily", "weekly", "monthly", "yearly", "each", "later", "soon", "sometime", "someday",
+    "eventually", "whenever", "weekend", "until", "before", "after", "maybe", "probably", "if", "unless",
+}
+_VAGUE_TIME = {"morning", "afternoon", "evening", "night", "tonight", "noon", "midnight", "week", "month", "year", "next", "this"}
+_ITEM_STOP = {"at", "from", "for", "in", "on", "by", "with", "to", "is", "are", "was", "if", "so", "because"}
+_TASK_TRAIL = {"at", "on", "by", "in", "the", "to", "and", ","}
+_MAX_ITEM_WORDS = 4
+
+
+@dataclass
+class Item:
+    name: str
+    quantity: Optional[int] = None
+    unit: str = ""
+
+    def label(self) -> str:
+        name = self.name[:1].upper() + self.name[1:]
+        if self.quantity is None:
+            return name
+        unit = f" {_plural(self.unit, self.quantity)}" if self.unit else ""
+        return f"{name} ({self.quantity}{unit})"
+
+
+def canonical_unit(word: str) -> str:
+    """Singular, short unit name ("Cartons" -> "carton", "kilos" -> "kg"); unknown units pass through."""
+    return _UNITS.get(word.strip().lower(), word.strip())
+
+
+_UNIT_PLURALS = {"box": "boxes", "loaf": "loaves", "bunch": "bunches", "kg": "kg", "g": "g", "lb": "lb", "l": "l"}
+
+
+def _plural(unit: str, qty: int) -> str:
+    if qty == 1:
+        return unit
+    return _UNIT_PLURALS.get(unit, unit + "s")
+
+
+@dataclass
+class Intent:
+    """One command: shopping items, or a task with an optional due time (a reminder)."""
+
+    kind: str  # "shopping" | "reminder" | "todo"
+    items: list[Item] = field(default_factory=list)
+    text: str = ""
+    due: Optional[datetime] = None
+
+
+@dataclass
+class ParseResult:
+    text: str
+    intents: list[Intent] = field(default_factory=list)
+    # True: the grammar did not account for everything; ask the remote model.
+    escalate: bool = False
+    reason: str = ""
+
+    def todos(self) -> list[str]:
+        """Shopping item labels and due-less tasks, as list entries."""
+        out: list[str] = []
+        for it in self.intents:
+            if it.kind == "shopping":
+                out.extend(item.label() for item in it.items)
+            elif it.kind == "todo":
+                out.append(it.text)
+        return out
+
+    def actions(self) -> list[dict]:
+        """The intents as app.ai.action_router actions."""
+        out: list[dict] = []
+        for it in self.intents:
+            if it.kind == "shopping":
+                out.append({"type": "add_shopping_items", "items": [item.label() for item in it.items]})
+            else:
+                action = {"type": "create_todo", "title": it.text}
+                if it.due is not None:
+                    action["due"] = it.due.strftime("%Y-%m-%d %H:%M")
+                out.append(action)
+        return out
+
+    def reminders(self) -> list[dict]:
+        """Dated tasks as {"text", "due_ts"} (the hardware demo's reminder format)."""
+        return [
+            {"text": it.text, "due_ts": int(it.due.timestamp())}
+            for it in self.intents
+            if it.kind == "reminder" and it.due is not None
+        ]
+
+
+class _Escalate(Exception):
+    pass
+
+
+def tokenize(text: str) -> list[str]:
+    text = text.lower().replace("’", "'")
+    text = re.sub(r"\b([ap])\.\s?m\.?", r"\1m", text)
+    out: list[str] = []
+    for tok in _TOKEN.findall(text):
+        out.extend(_CONTRACTIONS.get(tok, (tok,)))
+    return out
+
+
+def word_to_int(toks: list[str], i: int) -> tuple[Optional[int], int]:
+    """(value, tokens used) for a number at toks[i]: digits, words ("twenty five"), "a couple of", "a dozen"."""
+    n = len(toks)
+    if i >= n:
+        return None, 0
+    t = toks[i]
+    if t.isdigit():
+        return int(t), 1
+    if t in ("a", "an"):
+        if i + 1 < n and toks[i + 1] == "couple":
+            return 2, 3 if i + 2 < n and toks[i + 2] == "of" else 2
+        if i + 1 < n and toks[i + 1] == "dozen":
+            return 12, 2
+        return 1, 1
+    if t == "couple":
+        return 2, 2 if i + 1 < n and toks[i + 1] == "of" else 1
+    if t == "half" and i + 2 < n and toks[i + 1] == "a" and toks[i + 2] == "dozen":
+        return 6, 3
+    if t == "dozen":
+        return 12, 1
+    if t in _ONES:
+        return _ONES[t], 1
+    if t in _TENS:
+        if i + 1 < n and toks[i + 1] in _ONES and 0 < _ONES[toks[i + 1]] < 10:
+            return _TENS[t] + _ONES[toks[i + 1]], 2
+        return _TENS[t], 1
+    return None, 0
+
+
+# ---- time expressions ----
+
+
+@dataclass
+class _When:
+    day: Optional[date] = None
+    clock: Optional[tuple[int, int, str]] = None  # hour, minute, "am"/"pm"/""
+    part: Optional[int] = None  # part-of-day hour ("tomorrow evening")
+    delta: Optional[timedelta] = None
+
+    def set(self, name: str, value) -> None:
+        if getattr(self, name) is not None and getattr(self, name) != value:
+            raise _Escalate(f"conflicting {name}")
+        setattr(self, name, value)
+
+    @property
+    def empty(self) -> bool:
+        return self.day is None and self.clock is None and self.part is None and self.delta is None
+
+
+def _clock_token(tok: str) -> Optional[tuple[int, int, str]]:
+    m = re.fullmatch(r"(\d{1,2})(?::(\d{2}))?(am|pm)?", tok)
+    if not m:
+        return None
+    h, mi = int(m.group(1)), int(m.group(2) or 0)
+    if h > 23 or mi > 59:
+        if m.group(2) is not None or m.group(3):
+            raise _Escalate("bad time")  # "at 25:99", "30pm"
+        return None  # a bare number ("buy 30 eggs")
+    return h, mi, m.group(3) or ""
+
+
+def _match_time(toks: list[str], i: int, now: datetime, when: _When) -> int:
+    """Consume one time expression at toks[i] into `when`; returns tokens used (0: none)."""
+    n = len(toks)
+    t = toks[i]
+    nxt = toks[i + 1] if i + 1 < n else ""
+
+    # in 20 minutes / in an hour / in half an hour / in two days
+    if t == "in":
+        if nxt == "half" and i + 3 < n and toks[i + 2] in ("a", "an") and toks[i + 3] in ("hour", "hr"):
+            when.set("delta", timedelta(minutes=30))
+            return 4
+        qty, used = word_to_int(toks, i + 1)
+        if qty is not None and i + 1 + used < n and toks[i + 1 + used] in _DELTA_UNITS:
+            when.set("delta", timedelta(seconds=qty * _DELTA_UNITS[toks[i + 1 + used]]))
+            return 2 + used
+        if nxt == "the" and i + 2 < n and toks[i + 2] in _PARTS:
+            when.set("part", _PARTS[toks[i + 2]])
+            return 3
+        return 0
+    # 3 days from now / two hours later
+    qty, used = word_to_int(toks, i)
+    if qty is not None and i + used < n and toks[i + used] in _DELTA_UNITS:
+        j = i + used + 1
+        if j < n and toks[j] == "later":
+            when.set("delta", timedelta(seconds=qty * _DELTA_UNITS[toks[i + used]]))
+            return j + 1 - i
+        if j + 1 < n and toks[j] == "from" and toks[j + 1] == "now":
+            when.set("delta", timedelta(seconds=qty * _DELTA_UNITS[toks[i + used]]))
+            return j + 2 - i
+    today = now.date()
+    if t in ("on", "by", "this", "next", "at", "around") and nxt:
+        # Preposition + something below; "next"/"this" only matter for weekdays/weeks.
+        if t == "next" and nxt == "week":
+            when.set("day", today + timedelta(days=7))
+            return 2
+        used = _match_time(toks, i + 1, now, when) if t != "next" or nxt in _WEEKDAYS else 0
+        if used and (t != "at" or toks[i + 1] not in _WEEKDAYS):
+            return 1 + used
+        if t == "at" and i + 1 < n:
+            # "at 5": bare numbers are times only after "at"/"around"/"by".
+            c = _clock_token(nxt)
+            if c is not None:
+                j = i + 2
+                if j < n and toks[j] in ("am", "pm"):
+                    c = (c[0], c[1], toks[j])
+                    j += 1
+                elif j < n and toks[j] == "oclock":
+                    j += 1
+                when.set("clock", c)
+                return j - i
+        if t in ("around", "by") and i + 1 < n:
+            c = _clock_token(nxt)
+            if c is not None and (c[2] or i + 2 < n and toks[i + 2] in ("am", "pm", "oclock")):
+                return 1 + _match_time(toks, i + 1, now, when)
+        if t == "this" and nxt in _PARTS:
+            when.set("day", today)
+            when.set("part", _PARTS[nxt])
+            return 2
+        return 0
+    if t == "today":
+        when.set("day", today)
+        return 1
+    if t == "tonight":
+        when.set("day", today)
+        when.set("part", _PARTS["night"] - 1)
+        return 1
+    if t == "tomorrow":
+        when.set("day", today + timedelta(days=1))
+        if nxt in _PARTS:
+            when.set("part", _PARTS[nxt])
+            return 2
+        return 1
+    if t == "the" and re.fullmatch(r"\d{1,2}(st|nd|rd|th)", nxt):
+        used = _match_time(toks, i + 1, now, when)
+        return 1 + used if used else 0
+    if t in ("the", "day") and " ".join(toks[i : i + 4]).startswith(("the day after tomorrow", "day after tomorrow")):
+        used = 4 if t == "the" else 3
+        when.set("day", today + timedelta(days=2))
+        return used
+    if t in _WEEKDAYS:
+        ahead = (_WEEKDAYS[t] - today.weekday() - 1) % 7 + 1
+        when.set("day", today + timedelta(days=ahead))
+        if nxt in _PARTS:
+            when.set("part", _PARTS[nxt])
+            return 2
+        return 1
+    if t in ("noon", "midday"):
+        when.set("clock", (12, 0, "pm"))
+        return 1
+    if t == "midnight":
+        when.set("clock", (0, 0, "am"))
+        return 1
+    m = re.fullmatch(r"(\d{4})-(\d{1,2})-(\d{1,2})", t)
+    if m:
+        when.set("day", _date(int(m.group(1)), int(m.group(2)), int(m.group(3))))
+        return 1
+    m = re.fullmatch(r"(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?", t)
+    if m:
+        year = int(m.group(3)) if m.group(3) else today.year
+        when.set("day", _date(year + 2000 if year < 100 else year, int(m.group(1)), int(m.group(2))))
+        return 1
+    if t in _MONTHS and t != "may" or t == "may" and re.fullmatch(r"\d{1,2}(st|nd|rd|th)?", nxt or "x"):
+        d = re.fullmatch(r"(\d{1,2})(?:st|nd|rd|th)?", nxt)
+        if d:
+            when.set("day", _future_date(today, _MONTHS[t], int(d.group(1))))
+            return 2
+        return 0
+    d = re.fullmatch(r"(\d{1,2})(st|nd|rd|th)", t)
+    if d and nxt == "of" and i + 2 < n and toks[i + 2] in _MONTHS:
+        when.set("day", _future_date(today, _MONTHS[toks[i + 2]], int(d.group(1))))
+        return 3
+    c = _clock_token(t)
+    if c is not None and (c[2] or ":" in t):
+        when.set("clock", c)
+        return 1
+    if c is not None and nxt in ("am", "pm"):
+        when.set("clock", (c[0], c[1], nxt))
+        return 2
+    return 0
+
+
+def _date(y: int, mo: int, d: int) -> date:
+    try:
+        return date(y, mo, d)
+    except ValueError as exc:
+        raise _Escalate("bad date") from exc
+
+
+def _future_date(today: date, month: int, day: int) -> date:
+    d = _date(today.year, month, day)
+    return d if d >= today else _date(today.year + 1, month, day)
+
+
+def _resolve(when: _When, now: datetime) -> datetime:
+    if when.delta is not None:
+        if when.day is not None or when.clock is not None:
+            raise _Escalate("relative and absolute time")
+        return now + when.delta
+    day = when.day
+    if when.clock is None:
+        hour = when.part if when.part is not None else DEFAULT_HOUR
+        return datetime.combine(day or now.date(), datetime.min.time()).replace(hour=hour)
+    h, mi, mer = when.clock
+    if mer == "pm" and h < 12:
+        h += 12
+    elif mer == "am" and h == 12:
+        h = 0
+    elif not mer and h < 12:
+        if when.part is not None:
+            h = h + 12 if when.part >= 12 and h < 12 else h
+        elif day is not None and day != now.date():
+            # A plain "at 3" on another day: afternoon for 1-6, morning for 7-11.
+            h = h + 12 if h <= 6 else h
+        else:
+            base = day or now.date()
+            for cand in (h, h + 12):
+                at = datetime.combine(base, datetime.min.time()).replace(hour=cand, minute=mi)
+                if at > now:
+                    return at
+            return at + timedelta(hours=12) if day is None else at
+    at = datetime.combine(day or now.date(), datetime.min.time()).replace(hour=h, minute=mi)
+    if day is None and at <= now:
+        at += timedelta(days=1)
+    return at
+
+
+def _strip_time(toks: list[str], now: datetime) -> tuple[list[str], Optional[datetime]]:
+    when = _When()
+    rest: list[str] = []
+    i = 0
+    while i < len(toks):
+        used = _match_time(toks, i, now, when)
+        if used:
+            i += used
+            continue
+        rest.append(toks[i])
+        i += 1
+    return rest, None if when.empty else _resolve(when, now)
+
+
+# ---- commands ----
+
+
+def _match_seq(toks: list[str], i: int, seq: tuple[str, ...]) -> bool:
+    return tuple(toks[i : i + len(seq)]) == seq
+
+
+def _trigger_at(toks: list[str], i: int) -> Optional[tuple[tuple[str, ...], str]]:
+    for seq, kind in _TRIGGERS:
+        if _match_seq(toks, i, seq):
+            return seq, kind
+    return None
+
+
+def _strip_affixes(toks: list[str]) -> list[str]:
+    changed = True
+    while changed and toks:
+        changed = False
+        for seq in _PREFIXES:
+            if _match_seq(toks, 0, seq) and len(toks) > len(seq):
+                toks = toks[len(seq) :]
+                changed = True
+        for seq in _SUFFIXES:
+            if len(toks) > len(seq) and tuple(toks[-len(seq) :]) == seq:
+                toks = toks[: -len(seq)]
+                changed = True
+    while toks and toks[-1] in (",", "&"):
+        toks = toks[:-1]
+    return toks
+
+
+def _clauses(toks: list[str]) -> list[list[str]]:
+    """Split at "and"/","/"then"/"also" when a new trigger phrase follows."""
+    out: list[list[str]] = []
+    start = 0
+    i = 1
+    while i < len(toks):
+        if toks[i] in ("and", ",", "then", "also", "&"):
+            j = i + 1
+            while j < len(toks) and toks[j] in ("and", "then", "also", "please", ","):
+                j += 1
+            trig = _trigger_at(toks, j) if j < len(toks) else None
+            if trig is not None:
+                out.append(toks[start:i])
+                start = j
+                i = j + 1
+                continue
+        i += 1
+    out.append(toks[start:])
+    return [c for c in out if c]
+
+
+def _list_suffix(body: list[str]) -> tuple[list[str], str]:
+    """Remove a trailing "to the shopping/todo list"; returns (body, "shopping"/"todo"/"")."""
+    for k in range(len(body) - 1, -1, -1):
+        if body[k] in ("to", "on", "onto") and k + 1 < len(body) and body[-1] == "list":
+            words = [w for w in body[k + 1 : -1] if w not in ("the", "my", "our")]
+            if not words or words in (["shopping"], ["grocery"], ["groceries"]):
+                return body[:k], "shopping"
+            if words in (["todo"], ["to", "do"], ["task"], ["tasks"]):
+                return body[:k], "todo"
+            raise _Escalate("unknown list")
+    return body, ""
+
+
+def _split_items(body: list[str]) -> list[list[str]]:
+    parts: list[list[str]] = []
+    cur: list[str] = []
+    i = 0
+    while i < len(body):
+        tok = body[i]
+        if tok == "and":
+            for comp in _COMPOUNDS:
+                k = comp.index("and")
+                if tuple(body[i - k : i - k + len(comp)]) == comp:
+                    cur.append(tok)
+                    break
+            else:
+                parts.append(cur)
+                cur = []
+        elif tok in (",", "&", "plus"):
+            parts.append(cur)
+            cur = []
+        else:
+            cur.append(tok)
+        i += 1
+    parts.append(cur)
+    return [p for p in parts if p]
+
+
+def _parse_item(toks: list[str]) -> Item:
+    qty, used = word_to_int(toks, 0)
+    i = used
+    unit = ""
+    if i < len(toks) and toks[i] in _UNITS and i + 1 < len(toks):
+        unit = _UNITS[toks[i]]
+        i += 1
+        if unit == "dozen":
+            qty, unit = (qty or 1) * 12, ""
+        if i < len(toks) and toks[i] == "of":
+            i += 1
+    if qty == 1 and used and toks[0] in ("a", "an") and not unit:
+        qty = None  # "an apple", "a cake": just the item
+    while i < len(toks) and toks[i] in ("some", "more", "the", "of", "a", "an", "few", "any"):
+        i += 1
+    name = toks[i:]
+    if not name:
+        raise _Escalate("empty item")
+    if len(name) > _MAX_ITEM_WORDS:
+        raise _Escalate("long item")
+    if any(w in _ITEM_STOP or w in _VAGUE_TIME or w.isdigit() for w in name):
+        raise _Escalate("item looks like a sentence")
+    if name[-1].endswith("ed") and not name[-1].endswith("eed"):
+        raise _Escalate("item looks like a sentence")  # "get the car washed"
+    if qty is not None and qty > 99:
+        raise _Escalate("odd quantity")
+    return Item(name=" ".join(name), quantity=qty, unit=unit)
+
+
+def _task_text(body: list[str]) -> str:
+    while body and body[0] in _TASK_LINKS:
+        body = body[1:]
+    while body and body[-1] in _TASK_TRAIL:
+        body = body[:-1]
+    if not body:
+        raise _Escalate("empty task")
+    if any(w in _VAGUE_TIME or w.isdigit() for w in body):
+        raise _Escalate("time words left over")
+    text = " ".join(body).replace(" ,", ",")
+    return text[:1].upper() + text[1:]
+
+
+def _parse_clause(toks: list[str], now: datetime) -> Intent:
+    toks = _strip_affixes(toks)
+    if not toks:
+        raise _Escalate("empty")
+    trig = _trigger_at(toks, 0)
+    if trig is None:
+        raise _Escalate("no command")
+    seq, kind = trig
+    body = toks[len(seq) :]
+    if kind == "need":
+        if body[:1] == ["to"] and body[1:2] not in (["buy"], ["get"], ["pick"]):
+            kind, body = "task", body[1:]
+        else:
+            kind = "shop"
+            if body[:1] == ["to"]:
+                body = body[2:] if body[1:2] != ["pick"] else body[3:]
+    body, when = _strip_time(body, now)
+    if kind == "add":
+        body, target = _list_suffix(body)
+        kind = "task" if target == "todo" else "shop"
+    if kind == "task":
+        text = _task_text(body)
+        return Intent(kind="reminder" if when is not None else "todo", text=text, due=when)
+    body, _ = _list_suffix(body)
+    items = [_parse_item(p) for p in _split_items(body)]
+    if not items:
+        raise _Escalate("no items")
+    if when is not None:
+        # "buy milk tomorrow": a dated errand rather than a list entry.
+        verb = list(seq) if seq[0] in ("buy", "get", "grab", "pick", "purchase", "restock") else ["buy"]
+        text = _task_text(verb + body)
+        return Intent(kind="reminder", text=text, due=when)
+    return Intent(kind="shopping", items=items)
+
+
+def _restore_case(text: str, source: str) -> str:
+    """Put back capitals the speaker used ("call John"); tokens are lowercased."""
+    cased = {w.lower(): w for w in re.findall(r"[A-Za-z]+", source) if not w.islower()}
+    if not cased:
+        return text
+    return re.sub(r"[a-z]+", lambda m: cased.get(m.group(0), m.group(0)), text)
+
+
+def parse_intent(text: str, now: Optional[datetime] = None) -> ParseResult:
+    """Parse a command locally. result.escalate means: ask the remote model instead."""
+    now = now or datetime.now()
+    result = ParseResult(text=text.strip())
+    toks = tokenize(text)
+    try:
+        toks = _strip_affixes(toks)
+        if not toks:
+            raise _Escalate("empty")
+        if "?" in toks or toks[0] in _QUESTION and toks[1:2] != ["not"]:
+            raise _Escalate("question")
+        hits = [w for k, w in enumerate(toks) if w in _ESCALATE_WORDS and toks[k - 1 : k + 2] != ["day", "after", "tomorrow"]]
+        # "don't forget" is a command, not a negation.
+        if hits and not (hits == ["not"] and any(_match_seq(toks, i, ("do", "not", "forget")) for i in range(len(toks)))):
+            raise _Escalate(f"'{hits[0]}'")
+        for clause in _clauses(toks):
+            intent = _parse_clause(clause, now)
+            last = result.intents[-1] if result.intents else None
+            if last is not None and last.kind == intent.kind == "shopping":
+                last.items.extend(intent.items)
+            else:
+                result.intents.append(intent)
+        for intent in result.intents:
+            intent.text = _restore_case(intent.text, text)
+            for item in intent.items:
+                item.name = _restore_case(item.name, text)
+    except _Escalate as exc:
+        result.intents = []
+        result.escalate = True
+        result.reason = str(exc)
+    return result
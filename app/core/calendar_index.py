@@ -0,0 +1,245 @@
+"""Date-indexed view over `DashboardModel.calendar` for the calendar screen.
+
+Events carry real local times (CalendarEvent.start/end, unix seconds). The
+calendar asks
+
+    events_on(day)                 -> occurrences on one day, in time order
+    days_with_events(year, month)  -> day numbers that get an event dot
+
+Both are answered from a month view: day -> occurrences for one month,
+materialized the first time the month is asked for and then cached. A month
+view is built from day buckets of the one-off events (a bisect over the sorted
+event days), the few events longer than MAX_SPAN_DAYS, and the recurring
+events expanded for that month only (app.core.recurrence).
+
+When the calendar changes, the next index is built from the previous one
+(`calendar_index(state)` does this): month views that no changed event touched
+before or touches now are kept, so an edit re-materializes only the months it
+affects. Parsed recurrence rules of unchanged events are reused as well.
+
+Legacy events without a start (`when` text only, e.g. "19:00") are shown on
+the current day, as before real dates existed.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from app.core import clock
+from app.core.recurrence import Recurrence, event_days, event_recurrence
+from app.core.state import AppState, CalendarEvent
+
+# Longer events are not bucketed per day.
+MAX_SPAN_DAYS = 62
+# The agenda panel has room for this many events.
+AGENDA_MAX_EVENTS = 3
+
+# (event position, start day of the instance, or None for the event's own start)
+_Entry = tuple[int, Optional[int]]
+
+
+@dataclass(slots=True)
+class Occurrence:
+    """One event on the calendar, with its (possibly recurring) instance times."""
+
+    event: CalendarEvent
+    start: Optional[datetime] = None  # None: undated legacy event
+    end: Optional[datetime] = None
+
+    @property
+    def label(self) -> str:
+        """Short time text for the agenda pill: "19:00", "ALL DAY" or the legacy `when`."""
+        if self.start is None:
+            return (self.event.when or "08:00").split()[-1]
+        if self.event.all_day:
+            return "ALL DAY"
+        return self.start.strftime("%H:%M")
+
+
+def _month_range(year: int, month: int) -> tuple[int, int]:
+    lo = date(year, month, 1).toordinal()
+    return lo, date(year + month // 12, month % 12 + 1, 1).toordinal() - 1
+
+
+class CalendarIndex:
+    """Month views over one `calendar` list at one `calendar_version` (and one current day)."""
+
+    __slots__ = (
+        "_source", "_size", "version", "today", "_by_eid", "_days", "_sorted", "_long", "_rules",
+        "_undated", "_months", "months_built", "months_kept",
+    )
+
+    def __init__(
+        self,
+        events: list[CalendarEvent],
+        version: int = 0,
+        today: Optional[date] = None,
+        previous: Optional[CalendarIndex] = None,
+    ):
+        self._source = events
+        self._size = len(events)
+        self.version = int(version)
+        self.today = (today or clock.local_now().date()).toordinal()
+        self._by_eid = {ev.eid: i for i, ev in enumerate(events)}
+        self._days: dict[int, list[int]] = {}
+        self._long: list[tuple[int, int, int]] = []  # (pos, first, last)
+        self._rules: list[tuple[int, Recurrence]] = []
+        self._undated: list[int] = []
+        self._months: dict[tuple[int, int], dict[int, list[_Entry]]] = {}
+        self.months_built = 0
+        self.months_kept = 0
+
+        reuse = previous._reusable() if previous is not None else {}
+        for i, ev in enumerate(events):
+            if not ev.start:
+                self._undated.append(i)
+                continue
+            old = reuse.get(ev.eid)
+            rec = old[1] if old is not None and old[0] == ev else event_recurrence(ev)
+            if rec is not None:
+                self._rules.append((i, rec))
+                continue
+            first, last = event_days(ev)
+            if last - first >= MAX_SPAN_DAYS:
+                self._long.append((i, first, last))
+            else:
+                for d in range(first, last + 1):
+                    self._days.setdefault(d, []).append(i)
+        self._sorted = sorted(self._days)
+        if previous is not None and previous._months:
+            self._carry(previous)
+
+    def matches(self, events: list[CalendarEvent], version: int, today: date) -> bool:
+        return (
+            events is self._source
+            and len(events) == self._size
+            and int(version) == self.version
+            and today.toordinal() == self.today
+        )
+
+    # ---- queries ----
+
+    def events_on(self, day: date) -> list[Occurrence]:
+        """Occurrences touching `day`: undated legacy events first (model order), then by start time."""
+        d = day.toordinal()
+        events = self._source
+        out = [Occurrence(events[i]) for i in self._undated] if d == self.today else []
+        dated = [self._occurrence(events[i], s) for i, s in self._month(day.year, day.month).get(d, ())]
+        dated.sort(key=lambda o: (not o.event.all_day, o.start))
+        return out + dated
+
+    def days_with_events(self, year: int, month: int) -> set[int]:
+        """Day-of-month numbers in `year`/`month` that have at least one event."""
+        lo, hi = _month_range(year, month)
+        days = {d - lo + 1 for d in self._month(year, month)}
+        if self._undated and lo <= self.today <= hi:
+            days.add(self.today - lo + 1)
+        return days
+
+    # ---- month views ----
+
+    def _month(self, year: int, month: int) -> dict[int, list[_Entry]]:
+        view = self._months.get((year, month))
+        if view is None:
+            view = self._materialize(year, month)
+            self._months[(year, month)] = view
+            self.months_built += 1
+        return view
+
+    def _materialize(self, year: int, month: int) -> dict[int, list[_Entry]]:
+        lo, hi = _month_range(year, month)
+        view: dict[int, list[_Entry]] = {}
+        for d in self._sorted[bisect_left(self._sorted, lo) : bisect_right(self._sorted, hi)]:
+            view[d] = [(i, None) for i in self._days[d]]
+        for i, first, last in self._long:
+            for d in range(max(first, lo), min(last, hi) + 1):
+                view.setdefault(d, []).append((i, None))
+        for i, rec in self._rules:
+            for s in rec.starts(lo, hi):
+                for d in range(max(s, lo), min(s + rec.span, hi) + 1):
+                    view.setdefault(d, []).append((i, s))
+        return view
+
+    def _reusable(self) -> dict[str, tuple[CalendarEvent, Recurrence]]:
+        """eid -> (event, parsed recurrence) for this index's recurring events."""
+        events = self._source
+        return {events[i].eid: (events[i], rec) for i, rec in self._rules}
+
+    def _carry(self, previous: CalendarIndex) -> None:
+        # A previous month view stays valid when the changed events (added,
+        # removed or edited) have the same instances in that month before and
+        # after; views hold positions, so titles etc. are read fresh anyway.
+        old_events = previous._source
+        if len(previous._by_eid) != previous._size or len(self._by_eid) != self._size:
+            return  # duplicate eids: positions can't be mapped, start over
+        events = self._source
+        changed = {
+            eid
+            for eid in previous._by_eid.keys() | self._by_eid.keys()
+            if eid not in previous._by_eid
+            or eid not in self._by_eid
+            or old_events[previous._by_eid[eid]] != events[self._by_eid[eid]]
+        }
+        new_pos = [self._by_eid.get(ev.eid) for ev in old_events]
+        moved = any(p != i for i, p in enumerate(new_pos))
+        was_at = [previous._by_eid[eid] for eid in changed if eid in previous._by_eid]
+        now_at = [self._by_eid[eid] for eid in changed if eid in self._by_eid]
+        for (year, month), view in previous._months.items():
+            if changed and previous._instances(was_at, year, month) != self._instances(now_at, year, month):
+                continue
+            if moved:
+                view = {d: [(new_pos[i], s) for i, s in entries] for d, entries in view.items()}
+            self._months[(year, month)] = view  # views are never changed once built
+            self.months_kept += 1
+
+    def _instances(self, positions: list[int], year: int, month: int) -> set[tuple[str, int, Optional[int]]]:
+        """(eid, day, instance start) the events at `positions` put into this month's view."""
+        lo, hi = _month_range(year, month)
+        rules = dict(self._rules)
+        out = set()
+        for i in positions:
+            ev = self._source[i]
+            if not ev.start:
+                continue
+            rec = rules.get(i)
+            if rec is not None:
+                for s in rec.starts(lo, hi):
+                    out.update((ev.eid, d, s) for d in range(max(s, lo), min(s + rec.span, hi) + 1))
+                continue
+            first, last = event_days(ev)
+            out.update((ev.eid, d, None) for d in range(max(first, lo), min(last, hi) + 1))
+        return out
+
+    def _occurrence(self, ev: CalendarEvent, start_day: Optional[int]) -> Occurrence:
+        start = datetime.fromtimestamp(ev.start)
+        end = datetime.fromtimestamp(ev.end) if ev.end > ev.start else None
+        if start_day is not None:
+            shift = start_day - start.date().toordinal()
+            start += timedelta(days=shift)
+            end = end + timedelta(days=shift) if end is not None else None
+        return Occurrence(ev, start, end)
+
+
+def calendar_index(state: AppState) -> CalendarIndex:
+    """Current index for `state.model.calendar`, rebuilt from the stale one (edits, or a new day)."""
+    model = state.model
+    version = int(state.ui.calendar_version or 0)
+    today = clock.local_now().date()
+    index = model.calendar_index
+    if index is None or not index.matches(model.calendar, version, today):
+        index = CalendarIndex(model.calendar, version, today, previous=index)
+        model.calendar_index = index
+    return index
+
+
+def cursor_day(state: AppState) -> date:
+    """The day the calendar screen shows: today plus the rotary offset."""
+    return clock.local_now().date() + timedelta(days=int(state.ui.calendar_offset_days or 0))
+
+
+def agenda_events(state: AppState) -> list[Occurrence]:
+    """The events the agenda panel lists for the cursor day (and the reducer can select)."""
+    return calendar_index(state).events_on(cursor_day(state))[:AGENDA_MAX_EVENTS]
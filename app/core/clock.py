@@ -0,0 +1,41 @@
+"""Injectable wall clock.
+
+The reducer and renderers read time through here instead of time.time() /
+datetime.now(), so a recorded session can be replayed with its original
+timestamps (see app.core.trace) and produce the same states and frames.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime
+import time
+from typing import Callable, Iterator, Optional
+
+_source: Callable[[], float] = time.time
+
+
+def now() -> float:
+    return _source()
+
+
+def local_now() -> datetime:
+    return datetime.fromtimestamp(_source())
+
+
+def set_clock(source: Optional[Callable[[], float]]) -> None:
+    """Use `source` as the clock (None restores the system clock)."""
+    global _source
+    _source = source or time.time
+
+
+@contextmanager
+def frozen(ts: float) -> Iterator[None]:
+    """Pin the clock to `ts` for the duration of the block."""
+    global _source
+    prev = _source
+    _source = lambda: ts
+    try:
+        yield
+    finally:
+        _source = prev
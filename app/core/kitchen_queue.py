@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from app.core.reminder_index import reminder_index
 from app.core.state import AppState
 
 
@@ -19,7 +20,12 @@ def kitchen_queue_theme_key(theme: dict | None = None) -> str:
 
 
 def kitchen_visible_task_indices(state: AppState, theme: dict | None = None) -> list[int]:
-    """Visible focus/click queue for kitchen home: fridge first, then shopping."""
+    """Visible focus/click queue for kitchen home: fridge first, then shopping.
+
+    Costs O(visible rows): both the render-time cache and the fallback go
+    through the reminder index rather than scanning the full list.
+    """
+    index = reminder_index(state)
     # Prefer the exact render-time queue when available.
     cached_rids = [str(rid) for rid in getattr(state.ui, "kitchen_visible_rids", []) if rid]
     cached_theme_key = str(getattr(state.ui, "kitchen_visible_theme_key", "") or "")
@@ -30,10 +36,9 @@ def kitchen_visible_task_indices(state: AppState, theme: dict | None = None) ->
         and cached_theme_key == kitchen_queue_theme_key(theme)
         and cached_reminders_version == current_reminders_version
     ):
-        rid_to_idx = {r.rid: i for i, r in enumerate(state.model.reminders)}
         cached_idxs: list[int] = []
         for rid in cached_rids:
-            idx = rid_to_idx.get(rid)
+            idx = index.position(rid)
             if idx is None:
                 continue
             if state.model.reminders[idx].completed:
@@ -47,17 +52,6 @@ def kitchen_visible_task_indices(state: AppState, theme: dict | None = None) ->
     inv_max_rows = _max_rows(theme, "b_inventory_max_rows", 3)
     shop_max_rows = _max_rows(theme, "b_shopping_max_rows", 5)
 
-    fridge: list[int] = []
-    shop: list[int] = []
-
-    for i, r in enumerate(state.model.reminders):
-        if r.completed:
-            continue
-        if (r.category or "") == "fridge":
-            if len(fridge) < inv_max_rows:
-                fridge.append(i)
-        else:
-            if len(shop) < shop_max_rows:
-                shop.append(i)
-
+    fridge = index.head(inv_max_rows, category="fridge")
+    shop = index.head(shop_max_rows, exclude="fridge")
     return fridge + shop
@@ -0,0 +1,214 @@
+"""Recurrence expansion for calendar events (an RRULE subset).
+
+    FREQ      DAILY | WEEKLY | MONTHLY | YEARLY
+    INTERVAL  every n-th period (default 1)
+    BYDAY     weekdays ("MO,WE"); MONTHLY also takes nth ones ("2TU", "-1FR")
+    BYMONTHDAY MONTHLY days of month ("1,15", "-1" = last day)
+    COUNT     number of occurrences (EXDATE ones included, as in RFC 5545)
+    UNTIL     last allowed start day ("20261231" or "20261231T235959Z")
+
+Exceptions are CalendarEvent.exdates: start times of cancelled instances.
+Weeks start on Monday (WKST=MO). Other parts are ignored; an unknown FREQ or a
+malformed value makes the event a one-off (parse_rule() returns None).
+
+Recurrence.starts(lo, hi) jumps straight to the period that holds `lo`, so
+asking for one month far from DTSTART costs that month only. COUNT rules have
+to be counted from the start; they are expanded once and then sliced.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from app.core.state import CalendarEvent
+
+FREQS = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+# COUNT rules are expanded up front; larger counts are clamped.
+MAX_COUNT = 5000
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    freq: str
+    interval: int = 1
+    byday: tuple[tuple[int, int], ...] = ()  # (nth, weekday Mon=0); nth 0 = every such weekday
+    bymonthday: tuple[int, ...] = ()
+    count: int = 0  # 0 = unlimited
+    until: int = 0  # last start day (ordinal); 0 = open-ended
+
+
+def parse_rule(text: str) -> Optional[Rule]:
+    """The Rule for an RRULE string, or None when it is empty, unsupported or malformed."""
+    parts: dict[str, str] = {}
+    for item in (text or "").upper().removeprefix("RRULE:").split(";"):
+        key, sep, value = item.partition("=")
+        if sep:
+            parts[key.strip()] = value.strip()
+    freq = parts.get("FREQ", "")
+    if freq not in FREQS:
+        return None
+    try:
+        interval = max(1, int(parts.get("INTERVAL") or 1))
+        byday = tuple(_byday(v) for v in parts["BYDAY"].split(",") if v) if parts.get("BYDAY") else ()
+        bymonthday = tuple(int(v) for v in parts["BYMONTHDAY"].split(",") if v) if parts.get("BYMONTHDAY") else ()
+        count = min(MAX_COUNT, max(0, int(parts.get("COUNT") or 0)))
+        until = _until(parts["UNTIL"]) if parts.get("UNTIL") else 0
+    except ValueError:
+        return None
+    return Rule(freq, interval, byday, bymonthday, count, until)
+
+
+def _byday(value: str) -> tuple[int, int]:
+    value = value.strip()
+    day = value[-2:]
+    if day not in WEEKDAYS:
+        raise ValueError(value)
+    return (int(value[:-2]) if value[:-2] else 0), WEEKDAYS.index(day)
+
+
+def _until(value: str) -> int:
+    value = value.strip()
+    if "T" in value and value.endswith("Z"):
+        # UTC instant: the local day it falls on.
+        utc = datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+        return utc.astimezone().date().toordinal()
+    return datetime.strptime(value[:8], "%Y%m%d").date().toordinal()
+
+
+def event_days(ev: CalendarEvent) -> tuple[int, int]:
+    """First and last local day (ordinals) a dated event covers; `end` is exclusive."""
+    start = datetime.fromtimestamp(ev.start)
+    first = start.date().toordinal()
+    if ev.end > ev.start:
+        last = (datetime.fromtimestamp(ev.end) - timedelta(microseconds=1)).date().toordinal()
+        return first, max(first, last)
+    return first, first
+
+
+class Recurrence:
+    """Start days of one recurring event: DTSTART day, duration in days, rule and exceptions."""
+
+    __slots__ = ("rule", "first", "span", "skip", "_all")
+
+    def __init__(self, rule: Rule, first: int, span: int = 0, skip: Iterable[int] = ()):
+        self.rule = rule
+        self.first = int(first)
+        self.span = max(0, int(span))
+        self.skip = frozenset(skip)
+        self._all: Optional[list[int]] = None
+
+    def starts(self, lo: int, hi: int) -> list[int]:
+        """Start days (ordinals) of the occurrences that cover any day in [lo, hi]."""
+        lo = max(lo - self.span, self.first)
+        if self.rule.until:
+            hi = min(hi, self.rule.until)
+        if lo > hi:
+            return []
+        if self.rule.count:
+            if self._all is None:
+                self._all = self._expand(self.first, None, self.rule.count)
+            days = self._all[bisect_left(self._all, lo) : bisect_right(self._all, hi)]
+        else:
+            days = self._expand(lo, hi, 0)
+        return [d for d in days if d not in self.skip] if self.skip else days
+
+    def _expand(self, lo: int, hi: Optional[int], count: int) -> list[int]:
+        # Candidates are generated period by period (day, week, month or year),
+        # starting at the period that holds `lo`. COUNT counts every candidate
+        # from DTSTART on, exceptions included.
+        rule = self.rule
+        until = rule.until or None
+        out: list[int] = []
+        p = self._period_of(lo)
+        while True:
+            first_day, candidates = self._period(p)
+            if (hi is not None and first_day > hi) or (until is not None and first_day > until):
+                return out
+            for d in candidates:
+                if d < lo or d < self.first:
+                    continue
+                if (hi is not None and d > hi) or (until is not None and d > until):
+                    return out
+                out.append(d)
+                if count and len(out) >= count:
+                    return out
+            p += 1
+            if count and p > count * 400:
+                return out  # rules that never match (e.g. BYMONTHDAY=31;INTERVAL=12 in April)
+
+    def _period_of(self, day: int) -> int:
+        rule = self.rule
+        first = date.fromordinal(self.first)
+        if day <= self.first:
+            return 0
+        if rule.freq == "DAILY":
+            return (day - self.first) // rule.interval
+        if rule.freq == "WEEKLY":
+            week0 = self.first - first.weekday()
+            return (day - week0) // (7 * rule.interval)
+        d = date.fromordinal(day)
+        if rule.freq == "MONTHLY":
+            return ((d.year - first.year) * 12 + d.month - first.month) // rule.interval
+        return (d.year - first.year) // rule.interval
+
+    def _period(self, p: int) -> tuple[int, list[int]]:
+        """(first day of period `p`, its candidate start days in order)."""
+        rule = self.rule
+        first = date.fromordinal(self.first)
+        wanted = {wd for _, wd in rule.byday}
+        if rule.freq == "DAILY":
+            d = self.first + p * rule.interval
+            return d, ([d] if not wanted or date.fromordinal(d).weekday() in wanted else [])
+        if rule.freq == "WEEKLY":
+            week = self.first - first.weekday() + p * 7 * rule.interval
+            days = sorted(wanted) if wanted else [first.weekday()]
+            return week, [week + wd for wd in days]
+        if rule.freq == "MONTHLY":
+            m = first.month - 1 + p * rule.interval
+            year, month = first.year + m // 12, m % 12 + 1
+            start = date(year, month, 1).toordinal()
+            return start, _month_days(year, month, start, rule, first.day)
+        year = first.year + p * rule.interval
+        start = date(year, 1, 1).toordinal()
+        try:
+            return start, [date(year, first.month, first.day).toordinal()]
+        except ValueError:
+            return start, []  # Feb 29 in a common year
+
+
+def _month_days(year: int, month: int, start: int, rule: Rule, default_day: int) -> list[int]:
+    n_days = calendar.monthrange(year, month)[1]
+    days: Optional[set[int]] = None
+    if rule.bymonthday:
+        days = {d if d > 0 else n_days + 1 + d for d in rule.bymonthday}
+        days = {d for d in days if 1 <= d <= n_days}
+    if rule.byday:
+        first_wd = date(year, month, 1).weekday()
+        matched = set()
+        for nth, wd in rule.byday:
+            hits = list(range((wd - first_wd) % 7 + 1, n_days + 1, 7))
+            if nth == 0:
+                matched.update(hits)
+            elif -len(hits) <= nth <= len(hits):
+                matched.add(hits[nth - 1] if nth > 0 else hits[nth])
+        days = matched if days is None else days & matched
+    if days is None:
+        days = {default_day} if default_day <= n_days else set()
+    return [start + d - 1 for d in sorted(days)]
+
+
+def event_recurrence(ev: CalendarEvent) -> Optional[Recurrence]:
+    """The Recurrence of a dated event with a supported rule, else None (a one-off event)."""
+    if not ev.start or not ev.rrule:
+        return None
+    rule = parse_rule(ev.rrule)
+    if rule is None:
+        return None
+    first, last = event_days(ev)
+    skip = (datetime.fromtimestamp(ts).date().toordinal() for ts in ev.exdates or ())
+    return Recurrence(rule, first, last - first, skip)
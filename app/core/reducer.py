@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import replace
-import time
-from typing import Optional
+from typing import Any, Optional, Sequence
 
+from app.ai.action_router import apply_actions
+from app.core import clock
+from app.core.calendar_index import agenda_events
 from app.core.kitchen_queue import kitchen_visible_task_indices
-from app.core.state import AppState, Screen, Reminder, MenuItemId, WidgetMode
+from app.core.reminder_index import writable_reminder_index
+from app.core.state import AppState, CalendarEvent, Screen, Reminder, MenuItemId, VoicePhase, WidgetMode
 
 
 class Event:
@@ -13,8 +16,14 @@ class Event:
 
 
 class Rotate(Event):
+    """Knob rotation by `delta` detents (negative = counter-clockwise).
+
+    Bursts are usually merged by app.input.coalesce before reaching the reducer,
+    so |delta| > 1 is normal and handled in one step.
+    """
+
     def __init__(self, delta: int):
-        self.delta = 1 if delta >= 0 else -1
+        self.delta = int(delta)
 
 
 class Click(Event):
@@ -40,7 +49,43 @@ class Tick(Event):
     """Periodic tick for idle detection and delayed actions."""
 
     def __init__(self, now: Optional[float] = None):
-        self.now = now if now is not None else time.time()
+        self.now = now if now is not None else clock.now()
+
+
+class VoiceProgress(Event):
+    """Voice worker report: session `session` reached `phase` (UPLOADING..APPLYING or ERROR).
+
+    Reports for another session (cancelled, superseded) are ignored, and
+    phases never move backwards.
+    """
+
+    def __init__(self, session: int, phase: VoicePhase, detail: str = ""):
+        self.session = int(session)
+        self.phase = VoicePhase(phase)
+        self.detail = str(detail or "")
+
+
+class VoiceResult(Event):
+    """Voice worker result: the transcript and what to add to the list.
+
+    `todos` are plain titles; `actions` are structured actions for
+    app.ai.action_router (validated there). Both apply as one batch.
+    """
+
+    def __init__(self, session: int, transcript: str = "", todos: Sequence[str] = (), actions: Sequence[Any] = ()):
+        self.session = int(session)
+        self.transcript = str(transcript or "")
+        self.todos = [str(t) for t in todos]
+        self.actions = list(actions)
+
+
+class CalendarSync(Event):
+    """Calendar import result (app.data.ics.diff_calendar): events to add or replace by eid, eids to drop."""
+
+    def __init__(self, upserts: Sequence[CalendarEvent] = (), removed: Sequence[str] = ()):
+        self.upserts = list(upserts)
+        self.removed = [str(eid) for eid in removed]
+
 
 class MemoDelta(Event):
     """Developer-only: scroll memos when the left panel is focused."""
@@ -100,50 +145,127 @@ def _clamp_focus_kitchen(state: AppState, theme: Optional[dict] = None) -> None:
     state.ui.page = 1
 
 
-def _toggle_task_completed(state: AppState, items_per_page: int) -> None:
+def _toggle_task_completed(state: AppState, items_per_page: int, now: float) -> None:
     if state.ui.focused_index < 2:
         return
-    idx = state.ui.focused_index - 2
-    if idx < 0 or idx >= len(state.model.reminders):
-        return
-
-    r = state.model.reminders[idx]
-    state.model.reminders[idx] = replace(r, completed=not r.completed)
-    state.ui.reminders_version = int(state.ui.reminders_version or 0) + 1
-
-    # Schedule reorder rather than doing it immediately (better UX + better for partial refresh later).
-    state.ui.pending_reorder = True
-    state.ui.reorder_due_at = time.time() + 2.0
+    _toggle_task_completed_by_index(state, state.ui.focused_index - 2, now)
 
 
-def _toggle_task_completed_by_index(state: AppState, idx: int) -> None:
+def _toggle_task_completed_by_index(state: AppState, idx: int, now: float) -> None:
     if idx < 0 or idx >= len(state.model.reminders):
         return
-    r = state.model.reminders[idx]
-    state.model.reminders[idx] = replace(r, completed=not r.completed)
+    # Toggle in place (reminders are slotted); the index moves the item between views.
+    index = writable_reminder_index(state, (idx,))
     state.ui.reminders_version = int(state.ui.reminders_version or 0) + 1
+    index.set_completed(idx, not state.model.reminders[idx].completed, version=state.ui.reminders_version)
 
-    # Keep the same UX as home: reorder later.
+    # Schedule reorder rather than doing it immediately (better UX + better for partial refresh later).
     state.ui.pending_reorder = True
-    state.ui.reorder_due_at = time.time() + 2.0
+    state.ui.reorder_due_at = now + 2.0
 
 
 def _apply_reorder(state: AppState) -> None:
-    # Stable sort: incomplete first, then completed, preserve order within groups.
-    before = list(state.model.reminders)
-    state.model.reminders = sorted(before, key=lambda r: (r.completed, ))
+    # Stable: incomplete first, then completed, preserve order within groups.
+    # Only items toggled since the last reorder move (see ReminderIndex.reorder).
+    index = writable_reminder_index(state)
     state.ui.reminders_version = int(state.ui.reminders_version or 0) + 1
+    state.ui.last_reorder = index.reorder(version=state.ui.reminders_version)
     state.ui.pending_reorder = False
 
 
+_VOICE_ORDER = (VoicePhase.LISTENING, VoicePhase.UPLOADING, VoicePhase.WAITING, VoicePhase.APPLYING)
+_VOICE_ENDED = (VoicePhase.IDLE, VoicePhase.DONE, VoicePhase.ERROR)
+
+
+def _voice_enter(state: AppState, phase: VoicePhase, now: float, theme: dict, detail: Optional[str] = None) -> None:
+    ui = state.ui
+    ui.voice_phase = phase
+    if detail is not None:
+        ui.voice_detail = detail
+    if phase in (VoicePhase.DONE, VoicePhase.ERROR):
+        ui.voice_due_at = now + float(theme.get("voice_result_s", 4.0) or 4.0)
+    else:
+        # Watchdog: a worker that never reports back must not leave the overlay up.
+        ui.voice_due_at = now + float(theme.get("voice_phase_timeout_s", 30.0) or 30.0)
+
+
+def _voice_progress(state: AppState, event: VoiceProgress, now: float, theme: dict) -> None:
+    ui = state.ui
+    if event.session != ui.voice_session or ui.voice_phase in _VOICE_ENDED:
+        return
+    if event.phase == VoicePhase.ERROR:
+        _voice_enter(state, VoicePhase.ERROR, now, theme, event.detail or "Something went wrong")
+    elif event.phase in _VOICE_ORDER and _VOICE_ORDER.index(event.phase) > _VOICE_ORDER.index(ui.voice_phase):
+        _voice_enter(state, event.phase, now, theme, event.detail or None)
+
+
+def _voice_result(state: AppState, event: VoiceResult, now: float, theme: dict) -> None:
+    ui = state.ui
+    if event.session != ui.voice_session or ui.voice_phase in _VOICE_ENDED:
+        return
+    actions = [{"type": "create_todo", "title": t} for t in event.todos if t.strip()] + event.actions
+    summary = apply_actions(state, actions, now=now, source="voice")
+    if summary.ops:
+        ui.last_actions = summary
+    if summary.added or summary.duplicates:
+        detail = summary.detail()
+    else:
+        detail = f"Nothing to add: {event.transcript}" if event.transcript else "Nothing to add"
+    _voice_enter(state, VoicePhase.DONE, now, theme, detail)
+
+
+def _agenda_len(state: AppState) -> int:
+    # Events of the cursor day, then (today only) the tasks.
+    n = len(agenda_events(state))
+    if state.ui.calendar_offset_days == 0:
+        n += len(state.model.reminders)
+    return n
+
+
+def _calendar_sync(state: AppState, event: CalendarSync) -> None:
+    if not event.upserts and not event.removed:
+        return
+    upserts = {ev.eid: ev for ev in event.upserts}
+    drop = set(event.removed)
+    calendar = [upserts.pop(ev.eid, ev) for ev in state.model.calendar if ev.eid not in drop]
+    calendar.extend(upserts.values())
+    # A new list (never edited in place), so snapshots sharing the model keep theirs.
+    if state.model_shared:
+        index = state.model.calendar_index
+        state.model = replace(state.model, calendar=calendar)
+        state.model.calendar_index = index  # rebuilt from, keeping untouched months
+        state.model_shared = False
+    else:
+        state.model.calendar = calendar
+    state.ui.calendar_version = int(state.ui.calendar_version or 0) + 1
+    if state.ui.calendar_mode == "agenda":
+        state.ui.calendar_selected_index = max(0, min(int(state.ui.calendar_selected_index or 0), _agenda_len(state) - 1))
+
+
+def _voice_end(state: AppState) -> None:
+    state.ui.voice_phase = VoicePhase.IDLE
+    state.ui.voice_detail = ""
+
+
+def next_timer_deadline(state: AppState) -> Optional[float]:
+    """When the running countdown next drops a second (a Tick at or after it does), else None."""
+    ui = state.ui
+    if ui.widget_mode != WidgetMode.TIMER or not ui.timer_running or ui.timer_seconds <= 0:
+        return None
+    if ui.timer_last_tick_at is None:
+        return None
+    return float(ui.timer_last_tick_at) + 1.0
+
+
 def reduce(state: AppState, event: Event, *, theme: Optional[dict] = None) -> AppState:
     theme = theme or {}
     variant = _home_variant(theme)
     items_per_page = _items_per_page_for_layout(theme)
-    now = time.time()
+    now = clock.now()
 
-    # Mutate in place (simple, fast); caller can copy if needed.
-    state.ui.last_interaction_at = now if not isinstance(event, Tick) else state.ui.last_interaction_at
+    # Mutate in place (simple, fast); app.core.snapshot.reduce_snapshot() is the persistent variant.
+    if not isinstance(event, (Tick, VoiceProgress, VoiceResult, CalendarSync)):
+        state.ui.last_interaction_at = now
 
     if isinstance(event, Tick):
         now = event.now
@@ -176,13 +298,16 @@ def reduce(state: AppState, event: Event, *, theme: Optional[dict] = None) -> Ap
             else:
                 _clamp_focus_home(state, items_per_page)
 
-        # Voice overlay timeout (stub)
+        # Voice session: dismiss the result, or give up on a phase that stalled.
         if state.ui.voice_active and now >= state.ui.voice_due_at:
-            state.ui.voice_active = False
-            if state.ui.screen == Screen.HOME and variant == "kitchen":
-                _clamp_focus_kitchen(state, theme)
+            if state.ui.voice_phase in (VoicePhase.DONE, VoicePhase.ERROR):
+                _voice_end(state)
+                if state.ui.screen == Screen.HOME and variant == "kitchen":
+                    _clamp_focus_kitchen(state, theme)
+                else:
+                    _clamp_focus_home(state, items_per_page)
             else:
-                _clamp_focus_home(state, items_per_page)
+                _voice_enter(state, VoicePhase.ERROR, now, theme, "Timed out")
 
         # Mood memo auto-rotation (kitchen home only)
         if state.ui.screen == Screen.HOME and variant == "kitchen":
@@ -194,6 +319,21 @@ def reduce(state: AppState, event: Event, *, theme: Optional[dict] = None) -> Ap
 
         return state
 
+    # Voice worker reports and calendar imports are not user input: they don't wake the UI.
+    if isinstance(event, CalendarSync):
+        _calendar_sync(state, event)
+        return state
+    if isinstance(event, VoiceProgress):
+        _voice_progress(state, event, now, theme)
+        return state
+    if isinstance(event, VoiceResult):
+        _voice_result(state, event, now, theme)
+        if state.ui.screen == Screen.HOME and variant == "kitchen":
+            _clamp_focus_kitchen(state, theme)
+        else:
+            _clamp_focus_home(state, items_per_page)
+        return state
+
     # Any non-tick event wakes the UI
     state.ui.idle = False
     state.ui.last_interaction_at = now
@@ -221,16 +361,13 @@ def reduce(state: AppState, event: Event, *, theme: Optional[dict] = None) -> Ap
             state.ui.weather_day_index = (int(state.ui.weather_day_index) + event.delta) % n
         elif state.ui.screen == Screen.CALENDAR:
             if (state.ui.calendar_mode or "date") == "agenda":
-                if state.ui.calendar_offset_days != 0:
+                agenda_len = _agenda_len(state)
+                if agenda_len <= 0:
                     state.ui.calendar_selected_index = 0
                 else:
-                    agenda_len = len(state.model.calendar) + len(state.model.reminders)
-                    if agenda_len <= 0:
-                        state.ui.calendar_selected_index = 0
-                    else:
-                        cur = int(state.ui.calendar_selected_index or 0)
-                        cur = max(0, min(cur + event.delta, agenda_len - 1))
-                        state.ui.calendar_selected_index = cur
+                    cur = int(state.ui.calendar_selected_index or 0)
+                    cur = max(0, min(cur + event.delta, agenda_len - 1))
+                    state.ui.calendar_selected_index = cur
             else:
                 state.ui.calendar_offset_days = int(state.ui.calendar_offset_days or 0) + event.delta
         else:
@@ -245,6 +382,15 @@ def reduce(state: AppState, event: Event, *, theme: Optional[dict] = None) -> Ap
         return state
 
     if isinstance(event, Click):
+        # During a voice session Click ends the recording early or dismisses the result;
+        # while the clip is processed it works as usual.
+        if state.ui.voice_phase == VoicePhase.LISTENING:
+            _voice_enter(state, VoicePhase.UPLOADING, now, theme)
+            return state
+        if state.ui.voice_phase in (VoicePhase.DONE, VoicePhase.ERROR):
+            _voice_end(state)
+            return state
+
         if state.ui.screen == Screen.MENU:
             picked = state.ui.menu_focused
             state.ui.active_menu = picked
@@ -284,7 +430,7 @@ def reduce(state: AppState, event: Event, *, theme: Optional[dict] = None) -> Ap
                     idxs = _kitchen_visible_task_indices(state, theme)
                     pos = int(state.ui.focused_index) - 1
                     if 0 <= pos < len(idxs):
-                        _toggle_task_completed_by_index(state, idxs[pos])
+                        _toggle_task_completed_by_index(state, idxs[pos], now)
                         _clamp_focus_kitchen(state, theme)
                 return state
 
@@ -302,36 +448,41 @@ def reduce(state: AppState, event: Event, *, theme: Optional[dict] = None) -> Ap
                 state.ui.screen = Screen.WEATHER
                 state.ui.weather_day_index = 0
             else:
-                _toggle_task_completed(state, items_per_page)
+                _toggle_task_completed(state, items_per_page, now)
         elif state.ui.screen == Screen.CALENDAR:
             # Click toggles calendar mode (date <-> agenda) or toggles selected task in agenda mode.
             if (state.ui.calendar_mode or "date") == "date":
                 state.ui.calendar_mode = "agenda"
                 state.ui.calendar_selected_index = 0
             else:
+                n_events = len(agenda_events(state))
                 if state.ui.calendar_offset_days != 0:
-                    # Free-day screen: click returns to date mode so user can continue navigating dates.
+                    # Other days list events only: click returns to date mode so user can continue navigating dates.
                     state.ui.calendar_mode = "date"
                 else:
-                    n_events = len(state.model.calendar)
                     idx = int(state.ui.calendar_selected_index or 0)
                     if idx >= n_events:
                         task_idx = idx - n_events
-                        _toggle_task_completed_by_index(state, task_idx)
+                        _toggle_task_completed_by_index(state, task_idx, now)
         else:
             # Detail/placeholder: click does nothing; Back is the exit (TSX).
             pass
         return state
 
     if isinstance(event, LongPress):
-        # Voice overlay stub: show listening overlay briefly, then return.
-        state.ui.voice_active = True
-        state.ui.voice_due_at = now + 2.0
+        # Start a voice session (the worker starts recording when it sees LISTENING);
+        # a second long press ends the recording early.
+        if state.ui.voice_phase == VoicePhase.LISTENING:
+            _voice_enter(state, VoicePhase.UPLOADING, now, theme)
+        elif state.ui.voice_phase in _VOICE_ENDED:
+            state.ui.voice_session = int(state.ui.voice_session or 0) + 1
+            _voice_enter(state, VoicePhase.LISTENING, now, theme, "")
         return state
 
     if isinstance(event, Back):
+        # Back cancels a voice session; the worker drops it and late reports are ignored.
         if state.ui.voice_active:
-            state.ui.voice_active = False
+            _voice_end(state)
             return state
 
         if state.ui.screen == Screen.HOME:
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field, replace
+import heapq
+from itertools import islice
+from typing import Iterable, Optional
+
+from app.core.state import AppState, Reminder
+
+
+@dataclass
+class ReorderResult:
+    """What a reorder changed: list positions [start, stop) and the items that moved."""
+
+    start: int = 0
+    stop: int = 0
+    moved: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return self.stop > self.start
+
+
+class ReminderIndex:
+    """Incrementally maintained views over `DashboardModel.reminders`.
+
+    Keeps rid -> position plus, per category, the ascending positions of
+    incomplete and completed items. Hot paths (focus queue, kitchen rows,
+    badge counts) then cost O(visible rows) instead of a scan of the full list.
+
+    The index describes one list object at one `reminders_version`; use
+    `reminder_index(state)` to get an index that is guaranteed current.
+    """
+
+    __slots__ = ("_source", "_size", "version", "_pos", "_open", "_done", "_dirty", "_partitioned")
+
+    def __init__(self, reminders: list[Reminder], version: int = 0):
+        self.reset(reminders, version)
+
+    def reset(self, reminders: list[Reminder], version: int) -> None:
+        self._source = reminders
+        self._size = len(reminders)
+        self.version = int(version)
+        self._pos: dict[str, int] = {}
+        self._open: dict[str, list[int]] = {}
+        self._done: dict[str, list[int]] = {}
+        # rids toggled/inserted since the last reorder. Every other item is known to
+        # sit in its group (incomplete block, then completed block) while
+        # `_partitioned` holds, which is what lets reorder() touch only a window.
+        self._dirty: set[str] = set()
+        self._partitioned = True
+        seen_completed = False
+        for i, r in enumerate(reminders):
+            self._pos[r.rid] = i
+            views = self._done if r.completed else self._open
+            views.setdefault(r.category or "", []).append(i)
+            if r.completed:
+                seen_completed = True
+            elif seen_completed:
+                self._partitioned = False
+
+    def copy(self, reminders: list[Reminder]) -> ReminderIndex:
+        """This index re-pointed at `reminders`, a shallow copy of its list (copy-on-write forks)."""
+        other = ReminderIndex.__new__(ReminderIndex)
+        other._source = reminders
+        other._size = self._size
+        other.version = self.version
+        other._pos = dict(self._pos)
+        other._open = {k: list(v) for k, v in self._open.items()}
+        other._done = {k: list(v) for k, v in self._done.items()}
+        other._dirty = set(self._dirty)
+        other._partitioned = self._partitioned
+        return other
+
+    def matches(self, reminders: list[Reminder], version: int) -> bool:
+        return reminders is self._source and len(reminders) == self._size and int(version) == self.version
+
+    # ---- queries ----
+
+    def position(self, rid: str) -> Optional[int]:
+        return self._pos.get(rid)
+
+    def first_completed(self) -> int:
+        """Position of the first completed item (the list length when there is none)."""
+        return min((v[0] for v in self._done.values() if v), default=self._size)
+
+    def categories(self) -> list[str]:
+        return sorted(set(self._open) | set(self._done))
+
+    def count(
+        self,
+        category: Optional[str] = None,
+        *,
+        exclude: Optional[str] = None,
+        completed: Optional[bool] = None,
+    ) -> int:
+        total = 0
+        if completed is not True:
+            total += sum(len(v) for v in self._views(self._open, category, exclude))
+        if completed is not False:
+            total += sum(len(v) for v in self._views(self._done, category, exclude))
+        return total
+
+    def head(
+        self,
+        limit: int,
+        *,
+        category: Optional[str] = None,
+        exclude: Optional[str] = None,
+        completed: bool = False,
+    ) -> list[int]:
+        """First `limit` positions (list order) matching the filter."""
+        if limit <= 0:
+            return []
+        views = self._views(self._done if completed else self._open, category, exclude)
+        if not views:
+            return []
+        if len(views) == 1:
+            return views[0][:limit]
+        return list(islice(heapq.merge(*views), limit))
+
+    def grouped(self, limit: int, *, category: Optional[str] = None, exclude: Optional[str] = None) -> list[int]:
+        """First `limit` positions with incomplete items first, then completed (stable)."""
+        out = self.head(limit, category=category, exclude=exclude, completed=False)
+        if len(out) < limit:
+            out += self.head(limit - len(out), category=category, exclude=exclude, completed=True)
+        return out
+
+    def _views(self, views: dict[str, list[int]], category: Optional[str], exclude: Optional[str]) -> list[list[int]]:
+        if category is not None:
+            v = views.get(category)
+            return [v] if v else []
+        return [v for k, v in views.items() if v and k != exclude]
+
+    # ---- incremental updates ----
+
+    def set_completed(self, pos: int, completed: bool, *, version: int) -> None:
+        """Set completion of the item at `pos` (mutates the reminder in place)."""
+        r = self._source[pos]
+        completed = bool(completed)
+        if r.completed != completed:
+            cat = r.category or ""
+            src = (self._open if completed else self._done).get(cat)
+            if src:
+                i = bisect_left(src, pos)
+                if i < len(src) and src[i] == pos:
+                    del src[i]
+            insort((self._done if completed else self._open).setdefault(cat, []), pos)
+            r.completed = completed
+            self._dirty.add(r.rid)
+        self.version = int(version)
+
+    def insert(self, pos: int, reminder: Reminder, *, version: int) -> None:
+        """Insert `reminder` at `pos` (appending is O(log n); middle inserts shift positions)."""
+        pos = max(0, min(int(pos), self._size))
+        if pos < self._size:
+            for views in (self._open, self._done):
+                for lst in views.values():
+                    i = bisect_left(lst, pos)
+                    for j in range(i, len(lst)):
+                        lst[j] += 1
+            for rid, p in self._pos.items():
+                if p >= pos:
+                    self._pos[rid] = p + 1
+        self._source.insert(pos, reminder)
+        self._size += 1
+        self._pos[reminder.rid] = pos
+        views = self._done if reminder.completed else self._open
+        insort(views.setdefault(reminder.category or "", []), pos)
+        self._dirty.add(reminder.rid)
+        self.version = int(version)
+
+    def insert_many(self, pos: int, reminders: list[Reminder], *, version: int) -> None:
+        """Insert a block of reminders at `pos`: positions after it shift once, not once per item."""
+        k = len(reminders)
+        if k == 1:
+            self.insert(pos, reminders[0], version=version)
+            return
+        pos = max(0, min(int(pos), self._size))
+        if k and pos < self._size:
+            for views in (self._open, self._done):
+                for lst in views.values():
+                    i = bisect_left(lst, pos)
+                    lst[i:] = [q + k for q in lst[i:]]
+            for rid, p in self._pos.items():
+                if p >= pos:
+                    self._pos[rid] = p + k
+        self._source[pos:pos] = reminders
+        self._size += k
+        for j, r in enumerate(reminders):
+            self._pos[r.rid] = pos + j
+            insort((self._done if r.completed else self._open).setdefault(r.category or "", []), pos + j)
+            self._dirty.add(r.rid)
+        self.version = int(version)
+
+    def extend(self, reminders: Iterable[Reminder], *, version: int) -> None:
+        for r in reminders:
+            self.insert(self._size, r, version=version)
+        self.version = int(version)
+
+    @property
+    def pending(self) -> bool:
+        """True when reorder() would move something."""
+        return bool(self._dirty) or not self._partitioned
+
+    def reorder(self, *, version: int) -> ReorderResult:
+        """Stable-partition the list (incomplete first, then completed) in place.
+
+        Equivalent to `sorted(reminders, key=lambda r: r.completed)`, but only the
+        items toggled/inserted since the last reorder are moved (each lands on its
+        rank within its group). Clean items between a moved item's old and new
+        slot shift by a constant per run, applied with slice updates, so the cost
+        is O(moved * log n) plus the rows that actually change position.
+        Returns the changed span and the rids whose position changed.
+        """
+        self.version = int(version)
+        reminders = self._source
+        if not self._partitioned:
+            return self._full_reorder()
+
+        dirty = sorted((p, reminders[p]) for p in (self._pos.get(rid) for rid in self._dirty) if p is not None)
+        self._dirty.clear()
+        if not dirty:
+            return ReorderResult()
+
+        # Final slot of a dirty item = its rank among all items of its group.
+        n_open = self.count(completed=False)
+        targets = []
+        for p, r in dirty:
+            if r.completed:
+                targets.append(n_open + sum(bisect_left(v, p) for v in self._done.values()))
+            else:
+                targets.append(sum(bisect_left(v, p) for v in self._open.values()))
+        if all(t == p for (p, _), t in zip(dirty, targets)):
+            return ReorderResult()
+
+        for p, r in dirty:
+            lst = (self._done if r.completed else self._open)[r.category or ""]
+            del lst[bisect_left(lst, p)]
+
+        # Clean item number c (0-based, list order) sits at c + a(c) now and at
+        # c + b(c) afterwards, where a/b count dirty slots before it. Both step
+        # only at dirty old/new slots, so the shift is constant between them.
+        placed = sorted(zip(targets, (r for _, r in dirty)), key=lambda x: x[0])
+        events = sorted([(p - i, 0) for i, (p, _) in enumerate(dirty)] + [(t - j, 1) for j, (t, _) in enumerate(placed)])
+        runs: list[tuple[int, int, int]] = []  # (old_start, old_stop, shift)
+        a = b = c_prev = 0
+        for c, kind in events + [(self._size - len(dirty), 2)]:
+            if c > c_prev and a != b:
+                runs.append((c_prev + a, c + a, b - a))
+            c_prev = max(c_prev, c)
+            if kind == 0:
+                a += 1
+            elif kind == 1:
+                b += 1
+
+        # Slice bounds must come from pre-shift values, then apply.
+        shifts = []
+        for views in (self._open, self._done):
+            for lst in views.values():
+                for lo, hi, shift in runs:
+                    i, j = bisect_left(lst, lo), bisect_left(lst, hi)
+                    if i < j:
+                        shifts.append((lst, i, j, shift))
+        for lst, i, j, shift in shifts:
+            lst[i:j] = [q + shift for q in lst[i:j]]
+
+        for p, _ in reversed(dirty):
+            del reminders[p]
+        for t, r in placed:
+            reminders.insert(t, r)
+
+        pos = self._pos
+        moved: list[str] = []
+        span_lo, span_hi = self._size, 0
+        for lo, hi, shift in runs:
+            rids = [r.rid for r in reminders[lo + shift : hi + shift]]
+            pos.update(zip(rids, range(lo + shift, hi + shift)))
+            moved += rids
+            span_lo = min(span_lo, lo, lo + shift)
+            span_hi = max(span_hi, hi, hi + shift)
+        for (p, _), t in zip(dirty, targets):
+            r = reminders[t]
+            pos[r.rid] = t
+            insort((self._done if r.completed else self._open).setdefault(r.category or "", []), t)
+            if t != p:
+                moved.append(r.rid)
+                span_lo = min(span_lo, p, t)
+                span_hi = max(span_hi, p + 1, t + 1)
+        return ReorderResult(span_lo, span_hi, moved)
+
+    def _full_reorder(self) -> ReorderResult:
+        # Unsettled input (e.g. freshly loaded data): one stable in-place sort.
+        reminders = self._source
+        before = list(reminders)
+        reminders.sort(key=lambda r: r.completed)
+        changed = [i for i, (old, new) in enumerate(zip(before, reminders)) if old is not new]
+        self.reset(reminders, self.version)
+        if not changed:
+            return ReorderResult()
+        return ReorderResult(changed[0], changed[-1] + 1, [reminders[i].rid for i in changed])
+
+
+def reminder_index(state: AppState) -> ReminderIndex:
+    """Current index for `state.model.reminders`, rebuilt only when stale."""
+    model = state.model
+    version = int(state.ui.reminders_version or 0)
+    index = model.reminder_index
+    if index is None or not index.matches(model.reminders, version):
+        index = ReminderIndex(model.reminders, version)
+        model.reminder_index = index
+    return index
+
+
+def writable_reminder_index(state: AppState, positions: Iterable[int] = ()) -> ReminderIndex:
+    """Index for a reducer that is about to mutate `state.model.reminders`.
+
+    When the model is shared with other snapshots (`state.model_shared`), the
+    model, its list and the index are copied first, along with the reminders at
+    `positions` that the caller will change in place. Every other reminder stays
+    shared between the snapshots.
+    """
+    index = reminder_index(state)
+    if not state.model_shared:
+        return index
+    reminders = list(state.model.reminders)
+    for p in positions:
+        reminders[p] = replace(reminders[p])
+    model = replace(state.model, reminders=reminders)
+    model.reminder_index = index.copy(reminders)
+    state.model = model
+    state.model_shared = False
+    return model.reminder_index
@@ -0,0 +1,94 @@
+"""Persistent AppState snapshots with structural sharing.
+
+`reduce()` mutates its state in place. `reduce_snapshot()` leaves the input
+untouched and returns a new frozen snapshot instead:
+- UiState is shallow-copied (a few dozen scalars) and frozen afterwards.
+- DashboardModel is shared and only copied when the reducer writes to it
+  (toggle/reorder); unchanged reminders, weather, calendar and memos stay shared.
+
+A frozen snapshot can be rendered on another thread while the next event is
+reduced, and keeping old snapshots around is cheap (undo, time travel, replay).
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Optional
+
+from app.core.reducer import Event, reduce
+from app.core.state import AppState
+
+
+def fork(state: AppState) -> AppState:
+    """Writable copy of `state` whose model is shared until first write."""
+    return AppState(model=state.model, ui=replace(state.ui), model_shared=True)
+
+
+def freeze(state: AppState) -> AppState:
+    state.ui.freeze()
+    return state
+
+
+def reduce_snapshot(state: AppState, event: Event, *, theme: Optional[dict] = None) -> AppState:
+    """Like reduce(), but returns a new frozen snapshot and leaves `state` as is."""
+    nxt = fork(state)
+    reduce(nxt, event, theme=theme)
+    return freeze(nxt)
+
+
+class SnapshotHistory:
+    """Bounded undo/redo over snapshots.
+
+    Checkpoints (user input) start a new entry and drop the redo tail; other
+    updates (ticks) replace the current entry so idle time does not flood it.
+    """
+
+    def __init__(self, initial: AppState, *, limit: int = 256):
+        self.limit = max(1, int(limit))
+        self._entries: list[AppState] = [freeze(initial)]
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def position(self) -> int:
+        return self._cursor
+
+    @property
+    def current(self) -> AppState:
+        return self._entries[self._cursor]
+
+    @property
+    def can_undo(self) -> bool:
+        return self._cursor > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._cursor < len(self._entries) - 1
+
+    def record(self, state: AppState, *, checkpoint: bool = True) -> AppState:
+        freeze(state)
+        if not checkpoint:
+            self._entries[self._cursor] = state
+            return state
+        del self._entries[self._cursor + 1 :]
+        self._entries.append(state)
+        if len(self._entries) > self.limit:
+            del self._entries[: len(self._entries) - self.limit]
+        self._cursor = len(self._entries) - 1
+        return state
+
+    def undo(self) -> AppState:
+        if self.can_undo:
+            self._cursor -= 1
+        return self.current
+
+    def redo(self) -> AppState:
+        if self.can_redo:
+            self._cursor += 1
+        return self.current
+
+    def seek(self, position: int) -> AppState:
+        self._cursor = max(0, min(int(position), len(self._entries) - 1))
+        return self.current
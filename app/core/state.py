@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError, dataclass, field
 from enum import Enum
-import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+from app.core import clock
+
+if TYPE_CHECKING:
+    from app.ai.action_router import ActionSummary, TitleIndex
+    from app.core.calendar_index import CalendarIndex
+    from app.core.reminder_index import ReminderIndex, ReorderResult
 
 
 class Screen(str, Enum):
@@ -19,6 +25,18 @@ class WidgetMode(str, Enum):
     TIMER = "timer"
 
 
+class VoicePhase(str, Enum):
+    """Voice session phases (see the LongPress/Voice* handling in app.core.reducer)."""
+
+    IDLE = "idle"
+    LISTENING = "listening"  # recording; ends on silence (VAD), Click/LongPress or max length
+    UPLOADING = "uploading"  # sending the clip
+    WAITING = "waiting"  # waiting for the model's reply
+    APPLYING = "applying"  # parsing the reply into items
+    DONE = "done"
+    ERROR = "error"
+
+
 class MenuItemId(str, Enum):
     MEMO = "MEMO"
     LIST = "LIST"
@@ -27,7 +45,10 @@ class MenuItemId(str, Enum):
     SETTINGS = "SETTINGS"
 
 
-@dataclass
+# Model item classes are slotted: shared-household deployments keep thousands of
+# historical reminders/memos resident, and a per-instance __dict__ roughly doubles
+# their footprint. Slots also make in-place field updates (toggles) cheap.
+@dataclass(slots=True)
 class Reminder:
     # Stable identifier (needed so focus can follow the same item after reorder)
     rid: str
@@ -38,7 +59,7 @@ class Reminder:
     created_at: float = 0.0  # unix ts (optional; used for relative badges)
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherDay:
     dow: str
     icon: str
@@ -47,14 +68,25 @@ class WeatherDay:
     humidity: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarEvent:
     eid: str
     title: str
-    when: str
-
-
-@dataclass
+    when: str = ""  # legacy display text ("19:00") for events without `start`
+    start: float = 0.0  # unix ts; 0 = undated (shown on the current day)
+    end: float = 0.0  # unix ts, exclusive; 0 = same as start
+    all_day: bool = False
+    # Recurrence rule (RRULE subset, e.g. "FREQ=WEEKLY;BYDAY=TU,TH"); see app.core.recurrence.
+    rrule: str = ""
+    # Start times (unix ts) of cancelled instances of a recurring event (EXDATE).
+    exdates: list[float] = field(default_factory=list)
+    # Where an imported event came from and its revision there (app.data.ics re-imports).
+    source: str = ""
+    sequence: int = 0
+    modified: float = 0.0
+
+
+@dataclass(slots=True)
 class MemoItem:
     mid: str
     text: str
@@ -69,9 +101,22 @@ class DashboardModel:
     battery: int = 84
     reminders: list[Reminder] = field(default_factory=list)
     weather: list[WeatherDay] = field(default_factory=list)
-    # Minimal calendar dataset for the detail page (mobile app will provide real data later)
+    # Calendar events for the detail page, queried by day through app.core.calendar_index.
     calendar: list[CalendarEvent] = field(default_factory=list)
     memos: list[MemoItem] = field(default_factory=list)
+    # Derived views over `reminders` (see app.core.reminder_index.reminder_index()).
+    reminder_index: Optional[ReminderIndex] = field(default=None, init=False, repr=False, compare=False)
+    # Cached month views over `calendar` (see app.core.calendar_index.calendar_index()).
+    calendar_index: Optional[CalendarIndex] = field(default=None, init=False, repr=False, compare=False)
+    # Open-title dedupe keys (see app.ai.action_router.title_index()).
+    title_index: Optional[TitleIndex] = field(default=None, init=False, repr=False, compare=False)
+
+
+# Render-time caches a renderer may refresh on a frozen snapshot (app.core.snapshot).
+# They are hints keyed by theme/version, so a stale value is only recomputed.
+_UI_RENDER_HINTS = frozenset(
+    {"kitchen_visible_rids", "kitchen_visible_theme_key", "kitchen_visible_reminders_version"}
+)
 
 
 @dataclass
@@ -91,20 +136,22 @@ class UiState:
     widget_mode: WidgetMode = WidgetMode.CLOCK
     timer_seconds: int = 0
     timer_running: bool = False
-    timer_last_tick_at: float = field(default_factory=lambda: time.time())
+    timer_last_tick_at: float = field(default_factory=clock.now)
 
     # Detail-page navigation (rotary-driven).
     # Calendar: rotate changes date; click toggles to agenda mode; rotate selects agenda item; click toggles task.
     calendar_offset_days: int = 0
     calendar_mode: str = "date"  # "date" | "agenda"
     calendar_selected_index: int = 0
+    # Monotonic revision for calendar data changes (imports/edits).
+    calendar_version: int = 0
 
     # Weather detail: rotate cycles days in the forecast.
     weather_day_index: int = 0
 
     # Mood panel memo selection + auto-rotation.
     memo_index: int = 0
-    memo_last_rotated_at: float = field(default_factory=lambda: time.time())
+    memo_last_rotated_at: float = field(default_factory=clock.now)
     # Monotonic revision for reminder list mutations (toggle/reorder/etc.).
     reminders_version: int = 0
     # Last rendered focus queue for kitchen home (left panel excluded).
@@ -117,18 +164,49 @@ class UiState:
     # Delayed reorder: after toggling completion, wait a bit before moving completed to the bottom.
     pending_reorder: bool = False
     reorder_due_at: float = 0.0
-
-    # Voice overlay stub (TSX: long press/Space enters listening overlay on the clock panel).
-    voice_active: bool = False
+    # Span/items moved by the most recent reorder, so renderers can invalidate only those rows.
+    last_reorder: Optional[ReorderResult] = None
+    # Most recent batch applied by app.ai.action_router; the runner persists its ops to the oplog.
+    last_actions: Optional[ActionSummary] = None
+
+    # Voice session (TSX: long press/Space enters the listening overlay on the clock panel).
+    # The slow work runs on app.voice.session.VoiceWorker, which reports back with
+    # VoiceProgress/VoiceResult events tagged with `voice_session`.
+    voice_phase: VoicePhase = VoicePhase.IDLE
+    voice_session: int = 0
+    # Shown under the phase label: transcript / what was added / error text.
+    voice_detail: str = ""
+    # Watchdog for the active phase; auto-dismiss time for DONE/ERROR.
     voice_due_at: float = 0.0
 
-    last_interaction_at: float = field(default_factory=lambda: time.time())
+    last_interaction_at: float = field(default_factory=clock.now)
+
+    def __setattr__(self, name: str, value) -> None:
+        if self.__dict__.get("_frozen") and name not in _UI_RENDER_HINTS:
+            raise FrozenInstanceError(f"cannot assign to field {name!r} of a frozen UiState")
+        object.__setattr__(self, name, value)
+
+    @property
+    def voice_active(self) -> bool:
+        return self.voice_phase != VoicePhase.IDLE
+
+    @property
+    def frozen(self) -> bool:
+        return bool(self.__dict__.get("_frozen"))
+
+    def freeze(self) -> UiState:
+        # Not a dataclass field: dataclasses.replace() yields a writable copy.
+        object.__setattr__(self, "_frozen", True)
+        return self
 
 
 @dataclass
 class AppState:
     model: DashboardModel
     ui: UiState = field(default_factory=UiState)
+    # True when `model` is shared with other snapshots: the reducer must copy it
+    # before writing (see app.core.reminder_index.writable_reminder_index).
+    model_shared: bool = field(default=False, repr=False, compare=False)
 
     def now(self) -> float:
-        return time.time()
+        return clock.now()
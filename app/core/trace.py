@@ -0,0 +1,221 @@
+"""Session traces: record reducer input, replay it deterministically.
+
+A trace is JSON lines (gzip when the path ends in .gz):
+- line 1: header {"trace": 1, "t0", "model", "ui", "meta"}
+- then one compact array per event: [dt, code] or [dt, code, arg], where dt is
+  seconds since t0 (microsecond precision).
+
+Codes: R=Rotate(arg), M=MemoDelta(arg), C=Click, L=LongPress, B=Back, T=Tick,
+V=VoiceProgress [dt, "V", session, phase, detail] and
+A=VoiceResult [dt, "A", session, transcript, todos, actions] and
+S=CalendarSync [dt, "S", upserts, removed]. Voice worker results and calendar
+imports are recorded like input, so replay needs neither the microphone, the
+model nor the .ics files.
+
+The recorder pins app.core.clock to the recorded timestamp while the event is
+reduced, so replaying the same timestamps reproduces the same states.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, fields
+import gzip
+import json
+from typing import IO, Any, Callable, Iterator, Optional
+
+from app.core import clock
+from app.core.reducer import (
+    Back,
+    CalendarSync,
+    Click,
+    Event,
+    LongPress,
+    MemoDelta,
+    Rotate,
+    Tick,
+    VoiceProgress,
+    VoiceResult,
+)
+from app.core.state import (
+    _UI_RENDER_HINTS,
+    AppState,
+    CalendarEvent,
+    DashboardModel,
+    MemoItem,
+    MenuItemId,
+    Reminder,
+    Screen,
+    UiState,
+    VoicePhase,
+    WeatherDay,
+    WidgetMode,
+)
+
+TRACE_VERSION = 1
+
+_CODES: dict[type, str] = {
+    Rotate: "R",
+    MemoDelta: "M",
+    Click: "C",
+    LongPress: "L",
+    Back: "B",
+    Tick: "T",
+    VoiceProgress: "V",
+    VoiceResult: "A",
+    CalendarSync: "S",
+}
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def model_to_dict(model: DashboardModel) -> dict:
+    return {
+        "location": model.location,
+        "battery": model.battery,
+        "reminders": [asdict(r) for r in model.reminders],
+        "weather": [asdict(w) for w in model.weather],
+        "calendar": [asdict(e) for e in model.calendar],
+        "memos": [asdict(m) for m in model.memos],
+    }
+
+
+def model_from_dict(d: dict) -> DashboardModel:
+    return DashboardModel(
+        location=str(d.get("location") or "New York"),
+        battery=int(d.get("battery") or 0),
+        reminders=[Reminder(**r) for r in d.get("reminders") or []],
+        weather=[WeatherDay(**w) for w in d.get("weather") or []],
+        calendar=[CalendarEvent(**e) for e in d.get("calendar") or []],
+        memos=[MemoItem(**m) for m in d.get("memos") or []],
+    )
+
+
+def ui_to_dict(ui: UiState) -> dict:
+    # Render caches and the last reorder span are derived; replay rebuilds them.
+    skip = _UI_RENDER_HINTS | {"last_reorder", "last_actions"}
+    return {f.name: getattr(ui, f.name) for f in fields(UiState) if f.name not in skip}
+
+
+def ui_from_dict(d: dict) -> UiState:
+    known = {f.name for f in fields(UiState)}
+    kw = {k: v for k, v in d.items() if k in known}
+    if "screen" in kw:
+        kw["screen"] = Screen(kw["screen"])
+    if "menu_focused" in kw:
+        kw["menu_focused"] = MenuItemId(kw["menu_focused"])
+    if kw.get("active_menu") is not None:
+        kw["active_menu"] = MenuItemId(kw["active_menu"])
+    if "widget_mode" in kw:
+        kw["widget_mode"] = WidgetMode(kw["widget_mode"])
+    if "voice_phase" in kw:
+        kw["voice_phase"] = VoicePhase(kw["voice_phase"])
+    return UiState(**kw)
+
+
+def encode_event(dt: float, event: Event) -> list:
+    code = _CODES.get(type(event))
+    if code is None:
+        raise ValueError(f"cannot record event type {type(event).__name__}")
+    if code in ("R", "M"):
+        return [dt, code, int(event.delta)]
+    if code == "V":
+        return [dt, code, event.session, event.phase.value, event.detail]
+    if code == "A":
+        return [dt, code, event.session, event.transcript, list(event.todos), list(event.actions)]
+    if code == "S":
+        return [dt, code, [asdict(e) for e in event.upserts], list(event.removed)]
+    return [dt, code]
+
+
+def decode_event(row: list, t0: float) -> tuple[float, Event]:
+    ts = t0 + float(row[0])
+    code = row[1]
+    if code == "T":
+        return ts, Tick(now=ts)
+    if code == "R":
+        return ts, Rotate(int(row[2]))
+    if code == "M":
+        return ts, MemoDelta(int(row[2]))
+    if code == "C":
+        return ts, Click()
+    if code == "L":
+        return ts, LongPress()
+    if code == "B":
+        return ts, Back()
+    if code == "V":
+        return ts, VoiceProgress(int(row[2]), VoicePhase(row[3]), str(row[4]))
+    if code == "A":
+        return ts, VoiceResult(int(row[2]), str(row[3]), list(row[4]), list(row[5]) if len(row) > 5 else ())
+    if code == "S":
+        return ts, CalendarSync([CalendarEvent(**e) for e in row[2]], list(row[3]))
+    raise ValueError(f"unknown trace event code {code!r}")
+
+
+class TraceRecorder:
+    """Logs the initial state plus every event passed through apply()."""
+
+    def __init__(self, path: str, state: AppState, *, meta: Optional[dict] = None):
+        self.path = path
+        self.t0 = float(state.ui.last_interaction_at)
+        self.events = 0
+        self._f = _open(path, "w")
+        header = {
+            "trace": TRACE_VERSION,
+            "t0": self.t0,
+            "model": model_to_dict(state.model),
+            "ui": ui_to_dict(state.ui),
+            "meta": meta or {},
+        }
+        self._f.write(json.dumps(header, separators=(",", ":")) + "\n")
+
+    def apply(
+        self,
+        reducer: Callable[..., AppState],
+        state: AppState,
+        event: Event,
+        *,
+        theme: Optional[dict] = None,
+    ) -> AppState:
+        """Run `reducer(state, event, theme=theme)` with the clock pinned, and record it."""
+        raw = event.now if isinstance(event, Tick) else clock.now()
+        dt = round(float(raw) - self.t0, 6)
+        ts = self.t0 + dt
+        if isinstance(event, Tick):
+            event = Tick(now=ts)
+        with clock.frozen(ts):
+            out = reducer(state, event, theme=theme)
+        self._f.write(json.dumps(encode_event(dt, event), separators=(",", ":")) + "\n")
+        self.events += 1
+        return out
+
+    def flush(self) -> None:
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+
+def read_trace(path: str) -> tuple[dict, Iterator[tuple[float, Event]]]:
+    """Header dict plus a lazy iterator of (timestamp, event)."""
+    f = _open(path, "r")
+    header: dict[str, Any] = json.loads(f.readline())
+    if int(header.get("trace") or 0) != TRACE_VERSION:
+        f.close()
+        raise ValueError(f"unsupported trace version: {header.get('trace')!r}")
+    t0 = float(header["t0"])
+
+    def events() -> Iterator[tuple[float, Event]]:
+        with f:
+            for line in f:
+                if line.strip():
+                    yield decode_event(json.loads(line), t0)
+
+    return header, events()
+
+
+def initial_state(header: dict) -> AppState:
+    return AppState(model=model_from_dict(header.get("model") or {}), ui=ui_from_dict(header.get("ui") or {}))
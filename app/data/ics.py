@@ -0,0 +1,408 @@
+"""Streaming iCalendar (.ics) import for the calendar screen.
+
+    for ev in read_ics("family.ics"):      # IcsEvent, one VEVENT at a time
+        ...
+    feed = IcsFeed(["family.ics"])         # imports, then re-imports on change
+    for sync in feed.poll():               # CalendarSync reducer events
+        state = reduce(state, sync)
+
+The file is read line by line (RFC 5545 folded lines are joined by unfold()),
+and only the VEVENT being read is held in memory, so multi-year exports of
+tens of MB stream through in one pass. Other components (VTIMEZONE, VTODO,
+nested VALARM) are skipped.
+
+Times become unix timestamps: UTC ("...Z"), TZID (zoneinfo, falling back to
+local time for names it doesn't know) and floating times (local). DATE values
+are all-day events from local midnight. RRULE is passed through for
+app.core.recurrence; EXDATE and overridden instances (RECURRENCE-ID) become
+CalendarEvent.exdates of the series, and each override is its own event.
+
+CalendarEvent.eid is "<source>:<UID>" (plus "#<RECURRENCE-ID>"), so feeds
+that happen to share UIDs stay separate events. Re-imports are incremental:
+diff_calendar() matches events by eid and replaces one only when its
+(SEQUENCE, LAST-MODIFIED) is newer than what the calendar holds, or when its
+exdates changed (an override added or dropped without re-issuing the series);
+events gone from the file are removed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+import calendar
+from datetime import datetime, timedelta
+import hashlib
+import os
+import re
+import threading
+from typing import IO, Callable, Iterable, Iterator, Optional, Union
+from zoneinfo import ZoneInfo
+
+from app.core.reducer import CalendarSync, Event
+from app.core.state import CalendarEvent
+
+# Properties read from a VEVENT; everything else is skipped unparsed.
+_WANTED = {
+    "UID", "SUMMARY", "DTSTART", "DTEND", "DURATION", "RRULE", "EXDATE",
+    "RECURRENCE-ID", "SEQUENCE", "LAST-MODIFIED", "STATUS",
+}
+_NAME = re.compile(r"[^;:]*")
+_PARAM = re.compile(r';([^=;]+)=((?:"[^"]*"|[^;])*)')
+_DURATION = re.compile(r"([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+_TZ_TAIL = re.compile(r"([A-Za-z_]+/[A-Za-z_+\-]+(?:/[A-Za-z_+\-]+)?)$")
+_UNESCAPE = {"n": "\n", "N": "\n", ",": ",", ";": ";", "\\": "\\"}
+_ZONES: dict[str, Optional[ZoneInfo]] = {}
+
+
+class IcsError(ValueError):
+    pass
+
+
+@dataclass(slots=True)
+class IcsEvent:
+    uid: str
+    summary: str = ""
+    start: float = 0.0
+    end: float = 0.0
+    all_day: bool = False
+    rrule: str = ""
+    exdates: list[float] = field(default_factory=list)
+    recurrence_id: float = 0.0  # original start of the instance this VEVENT overrides
+    sequence: int = 0
+    modified: float = 0.0  # LAST-MODIFIED (unix ts), 0 when absent
+    cancelled: bool = False
+
+    @property
+    def eid(self) -> str:
+        return f"{self.uid}#{int(self.recurrence_id)}" if self.recurrence_id else self.uid
+
+
+# ---- lines ----
+
+
+def unfold(lines: Iterable[str]) -> Iterator[str]:
+    """Logical content lines: CR/LF stripped, continuation lines (leading space/tab) joined."""
+    parts: list[str] = []
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if parts:
+                parts.append(line[1:])
+            continue
+        if parts:
+            yield parts[0] if len(parts) == 1 else "".join(parts)
+        parts = [line] if line else []
+    if parts:
+        yield "".join(parts)
+
+
+def split_line(line: str) -> tuple[str, str, str]:
+    """(NAME, raw params, value) of a content line; params keep their leading ';'."""
+    colon = line.find(":")
+    if colon < 0:
+        raise IcsError(f"no ':' in {line[:40]!r}")
+    if '"' in line[:colon]:
+        # Quoted parameter values may contain ':' and ';'.
+        quoted = False
+        for colon, ch in enumerate(line):
+            if ch == '"':
+                quoted = not quoted
+            elif ch == ":" and not quoted:
+                break
+    head = line[:colon]
+    semi = head.find(";")
+    if semi < 0:
+        return head.upper(), "", line[colon + 1 :]
+    return head[:semi].upper(), head[semi:], line[colon + 1 :]
+
+
+def parse_params(raw: str) -> dict[str, str]:
+    params: dict[str, str] = {}
+    if not raw:
+        return params
+    for item in _PARAM.findall(raw):
+        params[item[0].strip().upper()] = item[1].strip().strip('"')
+    return params
+
+
+def unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return re.sub(r"\\(.)", lambda m: _UNESCAPE.get(m.group(1), m.group(1)), value)
+
+
+# ---- values ----
+
+
+def _zone(tzid: str) -> Optional[ZoneInfo]:
+    if tzid not in _ZONES:
+        zone = None
+        for name in (tzid, *(_TZ_TAIL.findall(tzid))):
+            try:
+                zone = ZoneInfo(name)
+                break
+            except (KeyError, ValueError, OSError):
+                continue
+        _ZONES[tzid] = zone
+    return _ZONES[tzid]
+
+
+def parse_time(value: str, params: dict[str, str]) -> tuple[float, bool]:
+    """(unix ts, is_date) for a DATE or DATE-TIME value."""
+    value = value.strip()
+    try:
+        # Fixed-width fields: slicing is several times faster than strptime.
+        y, mo, d = int(value[0:4]), int(value[4:6]), int(value[6:8])
+        if len(value) == 8 or params.get("VALUE") == "DATE":
+            return datetime(y, mo, d).timestamp(), True
+        if value[8] != "T":
+            raise ValueError(value)
+        h, mi, sec = int(value[9:11]), int(value[11:13]), int(value[13:15])
+        if value.endswith("Z"):
+            datetime(y, mo, d, h, mi, sec)  # range check
+            return float(calendar.timegm((y, mo, d, h, mi, sec, 0, 0, 0))), False
+        zone = _zone(params["TZID"]) if params.get("TZID") else None
+        return datetime(y, mo, d, h, mi, sec, tzinfo=zone).timestamp(), False
+    except (ValueError, IndexError) as exc:
+        raise IcsError(f"bad date {value!r}") from exc
+
+
+def parse_duration(value: str) -> timedelta:
+    m = _DURATION.match(value.strip())
+    if m is None:
+        raise IcsError(f"bad duration {value!r}")
+    sign, weeks, days, hours, minutes, seconds = m.groups()
+    delta = timedelta(
+        weeks=int(weeks or 0), days=int(days or 0), hours=int(hours or 0), minutes=int(minutes or 0), seconds=int(seconds or 0)
+    )
+    return -delta if sign == "-" else delta
+
+
+def _int(value: str) -> int:
+    try:
+        return int(value.strip())
+    except ValueError:
+        return 0
+
+
+def _event(props: dict[str, list[tuple[str, str]]]) -> Optional[IcsEvent]:
+    def one(name: str) -> Optional[tuple[dict[str, str], str]]:
+        values = props.get(name)
+        return (parse_params(values[0][0]), values[0][1]) if values else None
+
+    dtstart = one("DTSTART")
+    if dtstart is None:
+        return None
+    start, all_day = parse_time(dtstart[1], dtstart[0])
+    dtend = one("DTEND")
+    duration = one("DURATION")
+    if dtend is not None:
+        end = parse_time(dtend[1], dtend[0])[0]
+    elif duration is not None:
+        end = start + parse_duration(duration[1]).total_seconds()
+    else:
+        end = start
+    if all_day and end <= start:
+        # A DATE event with no end lasts the day (via dates: DST days stay whole).
+        end = (datetime.fromtimestamp(start) + timedelta(days=1)).timestamp()
+
+    uid = one("UID")
+    summary = one("SUMMARY")
+    title = unescape(summary[1]).strip() if summary else ""
+    if uid is not None and uid[1].strip():
+        uid_value = uid[1].strip()
+    else:
+        # No UID: derive a stable one so re-imports still match.
+        uid_value = hashlib.sha1(f"{title}|{dtstart[1]}".encode("utf-8")).hexdigest()[:16]
+    exdates = []
+    for raw, value in props.get("EXDATE", ()):
+        params = parse_params(raw)
+        exdates.extend(parse_time(v, params)[0] for v in value.split(",") if v.strip())
+    rid = one("RECURRENCE-ID")
+    sequence = one("SEQUENCE")
+    modified = one("LAST-MODIFIED")
+    status = one("STATUS")
+    rrule = one("RRULE")
+    return IcsEvent(
+        uid=uid_value,
+        summary=title,
+        start=start,
+        end=end,
+        all_day=all_day,
+        rrule=rrule[1].strip() if rrule else "",
+        exdates=exdates,
+        recurrence_id=parse_time(rid[1], rid[0])[0] if rid else 0.0,
+        sequence=_int(sequence[1]) if sequence else 0,
+        modified=parse_time(modified[1], modified[0])[0] if modified else 0.0,
+        cancelled=bool(status and status[1].strip().upper() == "CANCELLED"),
+    )
+
+
+# ---- events ----
+
+
+def iter_events(lines: Iterable[str], errors: Optional[list[str]] = None) -> Iterator[IcsEvent]:
+    """VEVENTs in file order. Malformed events are skipped (and reported in `errors`, if given)."""
+    depth = 0  # > 0 inside a VEVENT: 1 + nesting of its sub-components
+    props: dict[str, list[tuple[str, str]]] = {}
+    for line in unfold(lines):
+        head = line[:6].upper() if line[:1] in "BbEe" else ""
+        if depth == 0:
+            if head == "BEGIN:" and line[6:].strip().upper() == "VEVENT":
+                depth = 1
+                props = {}
+            continue
+        if head == "BEGIN:":
+            depth += 1
+        elif head[:4] == "END:":
+            depth -= 1
+            if depth == 0:
+                try:
+                    ev = _event(props)
+                except (IcsError, ValueError, OverflowError) as exc:
+                    if errors is not None:
+                        errors.append(str(exc))
+                    continue
+                if ev is not None:
+                    yield ev
+        elif depth == 1:
+            # Most lines (DESCRIPTION, ATTENDEE, ...) are skipped by name alone.
+            if _NAME.match(line).group().upper() in _WANTED:
+                try:
+                    name, params, value = split_line(line)
+                except IcsError:
+                    continue
+                props.setdefault(name, []).append((params, value))
+
+
+def read_ics(path_or_file: Union[str, IO[str]], errors: Optional[list[str]] = None) -> Iterator[IcsEvent]:
+    """iter_events() over a file path (opened lazily, read line by line) or an open text file."""
+    if not isinstance(path_or_file, str):
+        yield from iter_events(path_or_file, errors)
+        return
+    with open(path_or_file, "r", encoding="utf-8", errors="replace", newline="") as f:
+        yield from iter_events(f, errors)
+
+
+def calendar_events(events: Iterable[IcsEvent], *, source: str = "") -> list[CalendarEvent]:
+    """CalendarEvents for one import: overrides become exceptions of their series, cancelled ones drop.
+
+    Event ids are prefixed with `source` (when given), see the module docstring.
+    """
+    prefix = f"{source}:" if source else ""
+    out: list[CalendarEvent] = []
+    masters: dict[str, CalendarEvent] = {}
+    overridden: dict[str, list[float]] = {}
+    for ev in events:
+        if ev.recurrence_id:
+            overridden.setdefault(ev.uid, []).append(ev.recurrence_id)
+        if ev.cancelled:
+            continue
+        item = CalendarEvent(
+            eid=prefix + ev.eid,
+            title=ev.summary,
+            start=ev.start,
+            end=ev.end,
+            all_day=ev.all_day,
+            rrule="" if ev.recurrence_id else ev.rrule,
+            exdates=list(ev.exdates),
+            source=source,
+            sequence=ev.sequence,
+            modified=ev.modified,
+        )
+        if ev.rrule and not ev.recurrence_id:
+            masters[ev.uid] = item
+        out.append(item)
+    for uid, starts in overridden.items():
+        master = masters.get(uid)
+        if master is not None:
+            master.exdates.extend(s for s in starts if s not in master.exdates)
+    return out
+
+
+@dataclass
+class CalendarDiff:
+    upserts: list[CalendarEvent] = field(default_factory=list)  # new or newer events
+    removed: list[str] = field(default_factory=list)  # eids of `source` no longer in the import
+    unchanged: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.upserts or self.removed)
+
+
+def _newer(incoming: CalendarEvent, current: CalendarEvent) -> bool:
+    if (incoming.sequence, incoming.modified) != (current.sequence, current.modified):
+        return (incoming.sequence, incoming.modified) > (current.sequence, current.modified)
+    if incoming.modified:
+        # Same revision of the VEVENT itself; overrides (their own VEVENTs)
+        # can still have added or dropped exdates of a series.
+        return set(incoming.exdates) != set(current.exdates)
+    # No LAST-MODIFIED to go by (some exporters): compare content.
+    return replace(incoming, source=current.source) != current
+
+
+def diff_calendar(current: Iterable[CalendarEvent], incoming: Iterable[CalendarEvent], *, source: str) -> CalendarDiff:
+    """What re-importing `incoming` (all events of `source`) changes in the `current` calendar."""
+    known = {ev.eid: ev for ev in current if ev.source == source}
+    diff = CalendarDiff()
+    seen: set[str] = set()
+    for ev in incoming:
+        if ev.eid in seen:
+            continue  # duplicate UID in the file: the first one wins
+        seen.add(ev.eid)
+        old = known.get(ev.eid)
+        if old is None or _newer(ev, old):
+            diff.upserts.append(ev if ev.source == source else replace(ev, source=source))
+        else:
+            diff.unchanged += 1
+    diff.removed = [eid for eid in known if eid not in seen]
+    return diff
+
+
+class IcsFeed:
+    """Imports .ics files and re-imports them when they change (mtime/size), as CalendarSync events.
+
+    Each file is its own `source` (the file name without extension). The feed
+    remembers what it imported last, so a re-import posts only the diff.
+    """
+
+    def __init__(self, paths: Iterable[str], *, interval_s: float = 60.0):
+        self.paths = list(paths)
+        self.interval_s = float(interval_s)
+        self.errors: list[str] = []
+        self._stamps: dict[str, tuple[float, int]] = {}
+        self._known: dict[str, list[CalendarEvent]] = {}
+
+    @staticmethod
+    def source(path: str) -> str:
+        return os.path.splitext(os.path.basename(path))[0]
+
+    def poll(self) -> list[CalendarSync]:
+        """One CalendarSync per file that changed since the last poll (and has a non-empty diff)."""
+        out = []
+        for path in self.paths:
+            try:
+                st = os.stat(path)
+            except OSError as exc:
+                self.errors.append(f"{path}: {exc}")
+                continue
+            stamp = (st.st_mtime, st.st_size)
+            if self._stamps.get(path) == stamp:
+                continue
+            source = self.source(path)
+            try:
+                incoming = calendar_events(read_ics(path, self.errors), source=source)
+            except OSError as exc:
+                self.errors.append(f"{path}: {exc}")
+                continue
+            self._stamps[path] = stamp
+            diff = diff_calendar(self._known.get(source, ()), incoming, source=source)
+            self._known[source] = incoming
+            if diff:
+                out.append(CalendarSync(diff.upserts, diff.removed))
+        return out
+
+    def run(self, post: Callable[[Event], None], stop: threading.Event) -> None:
+        """Poll every `interval_s` until `stop` is set (run on a thread)."""
+        while not stop.wait(self.interval_s):
+            for event in self.poll():
+                post(event)
@@ -0,0 +1 @@
+"""Input layer: turns raw knob/key activity into reducer events."""
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from app.core.reducer import Event, Rotate
+
+
+@dataclass
+class RotaryAcceleration:
+    """Detent-rate based acceleration for fast knob spins.
+
+    Below `slow_hz` detents/s every detent moves one step; at or above `fast_hz`
+    it moves `max_factor` steps, linear in between. `max_factor=1` disables it.
+    """
+
+    slow_hz: float = 12.0
+    fast_hz: float = 40.0
+    max_factor: int = 4
+
+    @classmethod
+    def from_theme(cls, theme: dict) -> RotaryAcceleration:
+        d = cls()
+        try:
+            return cls(
+                slow_hz=float(theme.get("rotary_accel_slow_hz", d.slow_hz)),
+                fast_hz=float(theme.get("rotary_accel_fast_hz", d.fast_hz)),
+                max_factor=max(1, int(theme.get("rotary_accel_max", d.max_factor))),
+            )
+        except Exception:
+            return d
+
+    def factor(self, interval_s: Optional[float]) -> int:
+        if self.max_factor <= 1 or not interval_s or interval_s <= 0:
+            return 1
+        hz = 1.0 / interval_s
+        if hz <= self.slow_hz:
+            return 1
+        if hz >= self.fast_hz or self.fast_hz <= self.slow_hz:
+            return self.max_factor
+        frac = (hz - self.slow_hz) / (self.fast_hz - self.slow_hz)
+        return 1 + int(round(frac * (self.max_factor - 1)))
+
+
+class RotaryCoalescer:
+    """Merges runs of queued Rotate events into one Rotate(net delta).
+
+    Input is (timestamp, event) pairs in arrival order. Consecutive rotations
+    are summed after acceleration (timestamps drive the detent rate); any other
+    event ends the run, so ordering relative to clicks/back is preserved. A run
+    that nets to zero (jitter) is dropped.
+    """
+
+    def __init__(self, accel: Optional[RotaryAcceleration] = None):
+        self.accel = accel or RotaryAcceleration(max_factor=1)
+        self._last_ts: Optional[float] = None
+        self._last_dir = 0
+
+    def step(self, ts: float, delta: int) -> int:
+        """Accelerated steps for `delta` detents arriving at `ts`."""
+        if delta == 0:
+            return 0
+        direction = 1 if delta > 0 else -1
+        interval = None
+        if self._last_ts is not None and direction == self._last_dir:
+            # A multi-detent report spreads its detents over the interval.
+            interval = (ts - self._last_ts) / abs(delta)
+        self._last_ts = ts
+        self._last_dir = direction
+        return delta * self.accel.factor(interval)
+
+    def coalesce(self, items: Iterable[tuple[float, Event]]) -> list[Event]:
+        out: list[Event] = []
+        net = 0
+        pending = False
+        for ts, ev in items:
+            if isinstance(ev, Rotate):
+                net += self.step(ts, ev.delta)
+                pending = True
+                continue
+            if pending and net:
+                out.append(Rotate(net))
+            net = 0
+            pending = False
+            out.append(ev)
+        if pending and net:
+            out.append(Rotate(net))
+        return out
@@ -0,0 +1,255 @@
+"""Linux evdev input (rotary-encoder / gpio-keys overlays, USB HID).
+
+Reads `struct input_event` records from /dev/input/event* without blocking and
+maps them to reducer events. All timing (debounce, long press) uses the
+kernel's event timestamps, not the time the record happened to be read, so a
+busy process does not turn a short press into a long one. Timestamps are on
+the time.monotonic() clock, like every other input source (GpiodRotary, the
+console keyboard), since they all feed one RotaryCoalescer.
+
+Anything that yields raw records can be decoded: a real device, a pipe or
+FIFO fed by a test, or a capture made with `cat /dev/input/eventN > file`
+(see iter_event_file()).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+import struct
+import time
+from typing import Iterator, Optional, Union
+
+from app.core.reducer import Back, Click, Event, LongPress, Rotate
+
+# struct input_event { struct timeval time; __u16 type; __u16 code; __s32 value; }
+INPUT_EVENT = struct.Struct("llHHi")
+
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_REL = 0x02
+
+REL_X = 0x00
+REL_DIAL = 0x07
+REL_WHEEL = 0x08
+
+KEY_ESC = 1
+KEY_BACKSPACE = 14
+KEY_ENTER = 28
+KEY_SPACE = 57
+KEY_KPENTER = 96
+KEY_LEFT = 105
+KEY_RIGHT = 106
+KEY_BACK = 158
+BTN_0 = 0x100
+
+EVIOCGRAB = 0x40044590
+EVIOCSCLOCKID = 0x400445A0
+
+KEY_UP, KEY_DOWN, KEY_REPEAT = 0, 1, 2
+
+
+@dataclass
+class EvdevKeymap:
+    """Which codes mean what, plus timing. Defaults fit the rotary-encoder +
+    gpio-keys device-tree overlays and a plain USB keyboard."""
+
+    rotate_axes: tuple[int, ...] = (REL_X, REL_DIAL, REL_WHEEL)
+    click_keys: tuple[int, ...] = (KEY_ENTER, KEY_KPENTER, BTN_0)
+    back_keys: tuple[int, ...] = (KEY_ESC, KEY_BACK, KEY_BACKSPACE)
+    voice_keys: tuple[int, ...] = (KEY_SPACE,)
+    left_keys: tuple[int, ...] = (KEY_LEFT,)
+    right_keys: tuple[int, ...] = (KEY_RIGHT,)
+    invert_rotation: bool = False
+    # Click keys held this long produce LongPress instead of Click.
+    long_press_s: float = 0.6
+    # Key edges closer than this to the previous accepted edge are contact bounce.
+    key_debounce_s: float = 0.02
+
+
+def pack_input_event(ts: float, type_: int, code: int, value: int) -> bytes:
+    sec = int(ts)
+    return INPUT_EVENT.pack(sec, int(round((ts - sec) * 1e6)), type_, code, value)
+
+
+class InputEventDecoder:
+    """Turns raw (ts, type, code, value) records into (ts, Event) pairs.
+
+    Key debounce keeps the last accepted level per key; an edge inside the
+    debounce window is held as pending and only accepted (by a later record or
+    poll()) if the level still differs once the window has passed.
+    """
+
+    def __init__(self, keymap: Optional[EvdevKeymap] = None):
+        self.keymap = keymap or EvdevKeymap()
+        self._level: dict[int, int] = {}
+        self._accepted_at: dict[int, float] = {}
+        self._pending: dict[int, tuple[float, int]] = {}
+        self._down_at: Optional[float] = None
+        self._long_fired = False
+
+    def feed(self, ts: float, type_: int, code: int, value: int) -> list[tuple[float, Event]]:
+        out = self.poll(ts)
+        km = self.keymap
+        if type_ == EV_REL and code in km.rotate_axes:
+            if value:
+                out.append((ts, Rotate(-value if km.invert_rotation else value)))
+        elif type_ == EV_KEY:
+            if value == KEY_REPEAT:
+                if code in km.left_keys or code in km.right_keys:
+                    out.append((ts, Rotate(-1 if code in km.left_keys else 1)))
+                return out
+            level = 1 if value else 0
+            last = self._accepted_at.get(code)
+            if last is not None and ts - last < km.key_debounce_s:
+                self._pending[code] = (ts, level)
+            else:
+                self._pending.pop(code, None)
+                self._accept(ts, code, level, out)
+        return out
+
+    def poll(self, now: float) -> list[tuple[float, Event]]:
+        """Resolve pending debounced edges and long presses due by `now`."""
+        out: list[tuple[float, Event]] = []
+        km = self.keymap
+        for code, (ts, level) in list(self._pending.items()):
+            due = self._accepted_at.get(code, ts) + km.key_debounce_s
+            if now >= due:
+                del self._pending[code]
+                self._accept(max(ts, due), code, level, out)
+        if self._down_at is not None and not self._long_fired and now - self._down_at >= km.long_press_s:
+            self._long_fired = True
+            out.append((self._down_at + km.long_press_s, LongPress()))
+        return out
+
+    def next_deadline(self) -> Optional[float]:
+        """Earliest time poll() has something to do (None = nothing pending)."""
+        km = self.keymap
+        due = [self._accepted_at.get(code, ts) + km.key_debounce_s for code, (ts, _) in self._pending.items()]
+        if self._down_at is not None and not self._long_fired:
+            due.append(self._down_at + km.long_press_s)
+        return min(due) if due else None
+
+    def _accept(self, ts: float, code: int, level: int, out: list[tuple[float, Event]]) -> None:
+        if self._level.get(code, 0) == level:
+            return
+        self._level[code] = level
+        self._accepted_at[code] = ts
+        km = self.keymap
+        if code in km.click_keys:
+            if level:
+                self._down_at = ts
+                self._long_fired = False
+            else:
+                if self._down_at is not None and not self._long_fired:
+                    if ts - self._down_at >= km.long_press_s:
+                        out.append((self._down_at + km.long_press_s, LongPress()))
+                    else:
+                        out.append((ts, Click()))
+                self._down_at = None
+        elif level:
+            if code in km.back_keys:
+                out.append((ts, Back()))
+            elif code in km.voice_keys:
+                out.append((ts, LongPress()))
+            elif code in km.left_keys:
+                out.append((ts, Rotate(-1)))
+            elif code in km.right_keys:
+                out.append((ts, Rotate(1)))
+
+
+class EvdevDevice:
+    """Non-blocking reader for an evdev node (or any fd carrying input_event records).
+
+    Device nodes are switched to CLOCK_MONOTONIC timestamps (EVIOCSCLOCKID);
+    records from other fds (pipes, captures) are taken as CLOCK_REALTIME
+    stamps and shifted onto the monotonic clock as they are read. now() is
+    time.monotonic(), so `now() - ts` is the detent-to-delivery latency.
+    """
+
+    def __init__(self, source: Union[str, int], keymap: Optional[EvdevKeymap] = None, *, grab: bool = False):
+        if isinstance(source, int):
+            self.path = f"fd:{source}"
+            self._fd = source
+            os.set_blocking(source, False)
+        else:
+            self.path = source
+            self._fd = os.open(source, os.O_RDONLY | os.O_NONBLOCK)
+        import fcntl
+
+        self._realtime = True
+        try:
+            fcntl.ioctl(self._fd, EVIOCSCLOCKID, struct.pack("i", time.CLOCK_MONOTONIC))
+            self._realtime = False
+        except OSError:
+            pass  # not an evdev node (pipe, capture): convert on read
+        if grab:
+            # Exclusive access: keeps the console/X from also seeing the knob's keys.
+            fcntl.ioctl(self._fd, EVIOCGRAB, 1)
+        self.decoder = InputEventDecoder(keymap)
+        self._buf = b""
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def read(self) -> list[tuple[float, Event]]:
+        """Decoded events from what is readable now.
+
+        Raises EOFError once the source has ended (a closed pipe) and OSError
+        when the device is gone (ENODEV after unplugging); InputLoop then drops it.
+        """
+        out: list[tuple[float, Event]] = []
+        eof = False
+        while True:
+            try:
+                chunk = os.read(self._fd, INPUT_EVENT.size * 64)
+            except BlockingIOError:
+                break
+            if not chunk:
+                eof = True
+                break
+            self._buf += chunk
+        n = len(self._buf) - len(self._buf) % INPUT_EVENT.size
+        shift = time.monotonic() - time.time() if self._realtime else 0.0
+        for sec, usec, type_, code, value in INPUT_EVENT.iter_unpack(self._buf[:n]):
+            out += self.decoder.feed(sec + usec / 1e6 + shift, type_, code, value)
+        self._buf = self._buf[n:]
+        if eof and not out:
+            raise EOFError(f"{self.path}: end of input")
+        return out
+
+    def poll(self, now: float) -> list[tuple[float, Event]]:
+        return self.decoder.poll(now)
+
+    def next_deadline(self) -> Optional[float]:
+        return self.decoder.next_deadline()
+
+    def close(self) -> None:
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+
+
+def iter_event_file(path: str) -> Iterator[tuple[float, int, int, int]]:
+    """Raw (ts, type, code, value) records from a captured event stream."""
+    with open(path, "rb") as f:
+        data = f.read()
+    n = len(data) - len(data) % INPUT_EVENT.size
+    for sec, usec, type_, code, value in INPUT_EVENT.iter_unpack(data[:n]):
+        yield sec + usec / 1e6, type_, code, value
+
+
+def decode_event_file(path: str, keymap: Optional[EvdevKeymap] = None) -> list[tuple[float, Event]]:
+    """Decode a captured stream as if it had been read live (timers resolved at the end)."""
+    decoder = InputEventDecoder(keymap)
+    out: list[tuple[float, Event]] = []
+    last = 0.0
+    for ts, type_, code, value in iter_event_file(path):
+        out += decoder.feed(ts, type_, code, value)
+        last = ts
+    out += decoder.poll(last + 3600.0)
+    return out
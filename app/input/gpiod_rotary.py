@@ -0,0 +1,135 @@
+"""Rotary encoder on raw GPIO lines via libgpiod (python3-gpiod >= 2.0).
+
+Use this when the encoder is wired straight to GPIO without the kernel
+rotary-encoder overlay. Edge events carry kernel CLOCK_MONOTONIC timestamps
+(time.monotonic(), the clock of every input source, see app.input.evdev);
+A/B edges go through a quadrature state machine (invalid transitions, i.e.
+contact bounce, are ignored) and the push switch reuses the evdev key logic
+(debounce + long press).
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+from typing import Optional
+
+try:
+    import gpiod  # type: ignore
+    from gpiod.line import Bias, Clock, Edge  # type: ignore
+except Exception:  # pragma: no cover - hardware-only dependency
+    gpiod = None
+    Bias = Clock = Edge = None
+
+from app.core.reducer import Event, Rotate
+from app.input.evdev import EV_KEY, KEY_ENTER, EvdevKeymap, InputEventDecoder
+
+# (previous AB, current AB) -> step for a valid Gray-code transition.
+_STEPS = {
+    (0b00, 0b01): 1,
+    (0b01, 0b11): 1,
+    (0b11, 0b10): 1,
+    (0b10, 0b00): 1,
+    (0b00, 0b10): -1,
+    (0b10, 0b11): -1,
+    (0b11, 0b01): -1,
+    (0b01, 0b00): -1,
+}
+
+
+class QuadratureDecoder:
+    """Counts A/B transitions and reports whole detents."""
+
+    def __init__(self, steps_per_detent: int = 4, *, initial: int = 0b11):
+        self.steps_per_detent = max(1, int(steps_per_detent))
+        self._state = initial & 0b11
+        self._acc = 0
+
+    def feed(self, a: int, b: int) -> int:
+        """New line levels; returns detents completed by this transition (usually 0 or +/-1)."""
+        cur = ((1 if a else 0) << 1) | (1 if b else 0)
+        step = _STEPS.get((self._state, cur), 0)
+        self._state = cur
+        if not step:
+            return 0
+        self._acc += step
+        detents = 0
+        while abs(self._acc) >= self.steps_per_detent:
+            d = 1 if self._acc > 0 else -1
+            self._acc -= d * self.steps_per_detent
+            detents += d
+        return detents
+
+
+class GpiodRotary:
+    """A/B encoder plus optional push switch (active low) on one gpiochip."""
+
+    def __init__(
+        self,
+        chip: str,
+        a: int,
+        b: int,
+        sw: Optional[int] = None,
+        *,
+        steps_per_detent: int = 4,
+        keymap: Optional[EvdevKeymap] = None,
+        invert: bool = False,
+    ):
+        if gpiod is None:
+            raise RuntimeError("python gpiod (libgpiod v2 bindings) is not installed")
+        self.a, self.b, self.sw = int(a), int(b), (int(sw) if sw is not None else None)
+        self.invert = invert
+        km = keymap or EvdevKeymap()
+        settings = {
+            (self.a, self.b): gpiod.LineSettings(edge_detection=Edge.BOTH, bias=Bias.PULL_UP, event_clock=Clock.MONOTONIC),
+        }
+        if self.sw is not None:
+            # Kernel-side debounce where the chip supports it; InputEventDecoder debounces too.
+            settings[self.sw] = gpiod.LineSettings(
+                edge_detection=Edge.BOTH,
+                bias=Bias.PULL_UP,
+                debounce_period=timedelta(seconds=km.key_debounce_s),
+                event_clock=Clock.MONOTONIC,
+            )
+        self._req = gpiod.request_lines(chip, consumer="eink-knob", config=settings)
+        self._levels = {off: int(v.value) for off, v in zip(self._offsets(), self._req.get_values(self._offsets()))}
+        self._quad = QuadratureDecoder(
+            steps_per_detent, initial=(self._levels[self.a] << 1) | self._levels[self.b]
+        )
+        self._keys = InputEventDecoder(km)
+
+    def _offsets(self) -> list[int]:
+        return [self.a, self.b] + ([self.sw] if self.sw is not None else [])
+
+    def fileno(self) -> int:
+        return self._req.fd
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def read(self) -> list[tuple[float, Event]]:
+        out: list[tuple[float, Event]] = []
+        for ev in self._req.read_edge_events():
+            ts = ev.timestamp_ns / 1e9
+            level = 1 if ev.event_type == ev.Type.RISING_EDGE else 0
+            self._levels[ev.line_offset] = level
+            if ev.line_offset == self.sw:
+                out += self._keys.feed(ts, EV_KEY, KEY_ENTER, 0 if level else 1)
+                continue
+            detents = self._quad.feed(self._levels[self.a], self._levels[self.b])
+            if detents:
+                out.append((ts, Rotate(-detents if self.invert else detents)))
+        return out
+
+    def poll(self, now: float) -> list[tuple[float, Event]]:
+        return self._keys.poll(now)
+
+    def next_deadline(self) -> Optional[float]:
+        return self._keys.next_deadline()
+
+    def close(self) -> None:
+        try:
+            self._req.release()
+        except Exception:
+            pass
+
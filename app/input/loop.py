@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections import deque
+import selectors
+import threading
+from typing import Callable, Iterable, Optional, Protocol
+
+from app.core.reducer import Event
+
+
+class InputDevice(Protocol):
+    """What InputLoop needs from a device (EvdevDevice, GpiodRotary)."""
+
+    def fileno(self) -> int: ...
+
+    def now(self) -> float: ...
+
+    def read(self) -> list[tuple[float, Event]]:
+        """Events readable now; raises OSError or EOFError once the device is gone."""
+        ...
+
+    def poll(self, now: float) -> list[tuple[float, Event]]: ...
+
+    def next_deadline(self) -> Optional[float]: ...
+
+    def close(self) -> None: ...
+
+
+class InputLoop:
+    """Selector loop over input devices; hands (kernel_ts, Event) to `sink`.
+
+    Sleeps in select() until a device is readable or a debounce/long-press
+    deadline is due. A device whose read() fails (unplugged, end of input) is
+    unregistered and closed, with the reason appended to `errors`; the other
+    devices keep running. Keeps the last `latency_window` delivery latencies
+    (device now() minus kernel timestamp at the moment the event is handed to
+    the sink) for measurement.
+    """
+
+    def __init__(
+        self,
+        devices: Iterable[InputDevice],
+        sink: Callable[[float, Event], None],
+        *,
+        latency_window: int = 1024,
+    ):
+        self.devices = list(devices)
+        self.sink = sink
+        self.latencies: deque[float] = deque(maxlen=latency_window)
+        self.errors: list[str] = []
+        self._sel = selectors.DefaultSelector()
+        for dev in self.devices:
+            self._sel.register(dev.fileno(), selectors.EVENT_READ, dev)
+
+    def run_once(self, timeout: Optional[float] = 0.1) -> int:
+        wait = timeout
+        for dev in self.devices:
+            # Deadlines are in the devices' clock (time.monotonic()).
+            due = dev.next_deadline()
+            if due is not None:
+                left = max(0.0, due - dev.now())
+                wait = left if wait is None else min(wait, left)
+        delivered = 0
+        for key, _ in self._sel.select(wait):
+            dev = key.data
+            try:
+                items = dev.read()
+            except (OSError, EOFError) as exc:
+                self._drop(dev, exc)
+                continue
+            delivered += self._deliver(dev, items)
+        for dev in self.devices:
+            delivered += self._deliver(dev, dev.poll(dev.now()))
+        return delivered
+
+    def run(self, stop: threading.Event, *, timeout: float = 0.1) -> None:
+        while not stop.is_set():
+            self.run_once(timeout)
+
+    def close(self) -> None:
+        self._sel.close()
+        for dev in self.devices:
+            dev.close()
+
+    def _drop(self, dev: InputDevice, exc: BaseException) -> None:
+        self._sel.unregister(dev.fileno())
+        self.devices.remove(dev)
+        dev.close()
+        self.errors.append(f"{type(dev).__name__} closed: {exc}")
+
+    def _deliver(self, dev: InputDevice, items: list[tuple[float, Event]]) -> int:
+        if not items:
+            return 0
+        for ts, ev in items:
+            self.sink(ts, ev)
+            self.latencies.append(dev.now() - ts)
+        return len(items)
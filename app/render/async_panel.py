@@ -0,0 +1,154 @@
+"""Panel I/O on its own thread.
+
+A refresh keeps the caller blocked for the SPI transfer and then for seconds
+while the driver polls BUSY. AsyncPanel runs a PanelDriver on a dedicated
+thread: submit() queues a frame and returns a Future right away, so the
+caller can keep reducing input and render the next frame meanwhile.
+
+Frames queue in a latest-wins Mailbox. A frame that replaces one the panel
+has not started yet is merged into it (`merge`, e.g.
+app.render.clock_updater.merge_frames), and both Futures resolve when the
+merged frame is shown. Each result reports the queue wait, the SPI transfer
+and the BUSY wait of that refresh.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from app.render.drivers import PanelDriver
+from app.render.pipeline import Closed, Mailbox
+
+
+@dataclass
+class RefreshTiming:
+    kind: str  # "full", "partial" or "none" (nothing changed on screen)
+    queued_s: float  # submit() until the panel thread picked the frame up
+    transfer_s: float  # SPI transfer and command overhead
+    busy_s: float  # waiting for the panel's BUSY line
+    total_s: float  # submit() until the refresh finished
+    frames: int = 1  # submitted frames this refresh covered
+
+
+@dataclass
+class AsyncPanelStats:
+    refreshes: int = 0
+    merged: int = 0
+    transfer_s: float = 0.0
+    busy_s: float = 0.0
+    last: Optional[RefreshTiming] = None
+
+
+@dataclass
+class _Job:
+    frame: Any
+    submitted: float
+    futures: list[Future]
+
+
+class AsyncPanel:
+    """Runs `driver.show(frame)` on a worker thread; see module docstring.
+
+    `on_done(timing)`, if given, is called on the panel thread after every
+    refresh. Driver errors fail the refresh's Futures and are re-raised by
+    later submit() calls.
+    """
+
+    def __init__(
+        self,
+        driver: PanelDriver,
+        *,
+        merge: Optional[Callable[[Any, Any], Any]] = None,
+        on_done: Optional[Callable[[RefreshTiming], None]] = None,
+        name: str = "panel-io",
+    ):
+        self.driver = driver
+        self._merge = merge
+        self._on_done = on_done
+        self._jobs: Mailbox[Any] = Mailbox(merge=self._merge_jobs)
+        self._lock = threading.Lock()  # serializes driver calls (worker vs sleep())
+        self._error: Optional[BaseException] = None
+        self._active = False
+        self.stats = AsyncPanelStats()
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self._thread.start()
+
+    def _merge_jobs(self, old: _Job, new: _Job) -> _Job:
+        self.stats.merged += 1
+        frame = self._merge(old.frame, new.frame) if self._merge is not None else new.frame
+        return _Job(frame, old.submitted, old.futures + new.futures)
+
+    def submit(self, frame: Any) -> Future:
+        """Queue `frame`; the Future's result is its RefreshTiming."""
+        if self._error is not None:
+            raise RuntimeError("panel worker failed") from self._error
+        fut: Future = Future()
+        self._jobs.put(_Job(frame, time.perf_counter(), [fut]))
+        return fut
+
+    def show(self, frame: Any) -> RefreshTiming:
+        """submit() and wait; fits FramePipeline's display stage."""
+        return self.submit(frame).result()
+
+    @property
+    def busy(self) -> bool:
+        """True while a refresh is queued or running."""
+        return self._active or self._jobs.pending
+
+    def sleep(self) -> None:
+        """Put the panel to sleep once the refresh in progress (if any) is done."""
+        with self._lock:
+            self.driver.sleep()
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Finish queued refreshes and stop the worker."""
+        self._jobs.close()
+        self._thread.join(timeout)
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                job = self._jobs.get()
+            except Closed:
+                return
+            self._active = True
+            start = time.perf_counter()
+            try:
+                with self._lock:
+                    st = self.driver.stats
+                    before = (st.full_refreshes, st.partial_refreshes, st.transfer_s, st.busy_s)
+                    self.driver.show(job.frame)
+                    done = time.perf_counter()
+                    if st.full_refreshes != before[0]:
+                        kind = "full"
+                    elif st.partial_refreshes != before[1]:
+                        kind = "partial"
+                    else:
+                        kind = "none"
+                    timing = RefreshTiming(
+                        kind=kind,
+                        queued_s=start - job.submitted,
+                        transfer_s=st.transfer_s - before[2],
+                        busy_s=st.busy_s - before[3],
+                        total_s=done - job.submitted,
+                        frames=len(job.futures),
+                    )
+            except BaseException as exc:
+                self._error = exc
+                for fut in job.futures:
+                    fut.set_exception(exc)
+                continue
+            finally:
+                self._active = False
+            self.stats.refreshes += 1
+            self.stats.transfer_s += timing.transfer_s
+            self.stats.busy_s += timing.busy_s
+            self.stats.last = timing
+            if self._on_done is not None:
+                self._on_done(timing)
+            for fut in job.futures:
+                fut.set_result(timing)
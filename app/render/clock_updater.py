@@ -0,0 +1,257 @@
+"""Minute-boundary clock refresh for an always-on panel.
+
+Between inputs the panel keeps showing one frame, and only the clock on it
+goes stale. ClockUpdater sits in the panel render path (in front of e.g.
+FrameCache.render) and turns MinuteTick jobs into partial frames: it redraws
+just the clock region of its own RGB copy of the frame on screen
+(render_clock_region), re-quantizes, and diffs against the frame on screen so
+the panel refreshes only the changed rect (x aligned to 8 px). The RGB copy is
+rendered in full on the first tick after the frame changed (and when a new
+time string shifts the text around it); other ticks cost a clock-sized redraw.
+Every `full_every` partial updates, and on a new day, the tick becomes a full
+refresh to clear ghosting.
+
+Focus moves take the same path too: a snapshot that differs from the frame on
+screen only in the focus position goes through render_focus_region (e.g. the
+two kitchen rows whose focus changed, or the calendar cursor cells and agenda
+header) and a partial refresh of those rects.
+
+A Preview job (FramePipeline's mid-burst preview) is rendered in full but
+shown as a partial refresh of the changed rect; the frame that ends the burst
+is a full refresh again.
+
+A running timer changes the frame once a second. A snapshot that differs from
+the frame on screen only in the countdown takes the same path through
+render_timer_region, which repaints just the digit cells that changed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass
+import math
+from typing import Any, Callable, ContextManager, Optional
+
+from PIL import Image, ImageChops
+
+from app.core import clock
+from app.core.state import AppState
+from app.ui.app import render_app, render_clock_region, render_focus_region, render_signature, render_timer_region
+
+Rect = tuple[int, int, int, int]
+
+
+@dataclass
+class PanelFrame:
+    image: Image.Image  # 1-bit panel image
+    buf: Any  # what the driver displays (epd.getbuffer(image)); None: the driver packs .image
+    # None: full refresh. Otherwise partial refresh of these (x0, y0, x1, y1)
+    # end-exclusive rects; [] means nothing changed on screen.
+    rects: Optional[list[Rect]] = None
+
+
+@dataclass
+class MinuteTick:
+    """Pipeline job: bring `state`'s frame on screen to the current minute."""
+
+    state: AppState
+
+
+@dataclass
+class Preview:
+    """Pipeline job: show `state` quickly (partial refresh) while input is still arriving."""
+
+    state: AppState
+
+
+def merge_frames(old: PanelFrame, new: PanelFrame) -> PanelFrame:
+    """`new` replacing the undisplayed `old`: keep old's dirty rects, they were diffed against it."""
+    if old.rects is None or new.rects is None:
+        return PanelFrame(new.image, new.buf, rects=None)
+    return PanelFrame(new.image, new.buf, rects=old.rects + new.rects)
+
+
+def next_minute(now: float) -> float:
+    """Timestamp of the next minute boundary strictly after `now`."""
+    return (math.floor(now / 60.0) + 1) * 60.0
+
+
+def diff_rect(old: Image.Image, new: Image.Image) -> Optional[Rect]:
+    """Bounding rect of the pixels that differ, x widened to multiples of 8."""
+    box = ImageChops.difference(old.convert("L"), new.convert("L")).getbbox()
+    if box is None:
+        return None
+    x0, y0, x1, y1 = box
+    return (x0 & ~7, y0, min(new.size[0], (x1 + 7) & ~7), y1)
+
+
+class ClockUpdater:
+    """Render path wrapper: snapshots go to `full`, MinuteTicks become partial frames.
+
+    `full(state)` returns the PanelFrame for a full refresh; `theme` is the
+    theme the frames are rendered with (panel theme). `quantize` and `pack`
+    turn the RGB render into PanelFrame.image and .buf (no `pack`: buf None,
+    the driver packs at display time). `lock` serializes
+    renders with other threads sharing `fonts` (FrameCache.render_lock).
+    With `pointwise=True` only the redrawn rects are quantized and pasted into
+    the frame on screen; use it when `quantize` maps each pixel on its own
+    (threshold, no dithering). Call render() from one thread only (the
+    pipeline's render worker).
+    """
+
+    def __init__(
+        self,
+        full: Callable[[AppState], PanelFrame],
+        fonts,
+        theme: dict,
+        *,
+        quantize: Callable[[Image.Image], Image.Image],
+        pack: Optional[Callable[[Image.Image], Any]] = None,
+        full_every: int = 60,
+        lock: Optional[ContextManager] = None,
+        pointwise: bool = False,
+    ):
+        self._full = full
+        self.fonts = fonts
+        self.theme = theme
+        self._quantize = quantize
+        self._pack = pack
+        self.full_every = max(0, int(full_every))
+        self._lock = lock if lock is not None else contextlib.nullcontext()
+        self.pointwise = bool(pointwise)
+        self._shown: Optional[PanelFrame] = None
+        self._key: Optional[tuple] = None
+        self._frame_key: Optional[tuple] = None  # _key without the focus position / calendar cursor
+        self._timer: Optional[int] = None
+        self._day = ""
+        self._base: Optional[tuple[Image.Image, Any]] = None
+        self._partials = 0
+        self.partial_updates = 0
+        self.full_updates = 0
+
+    def render(self, job: Any) -> PanelFrame:
+        if isinstance(job, Preview):
+            return self._preview(job.state)
+        if isinstance(job, MinuteTick):
+            frame = self._tick(job.state)
+            if frame is not None:
+                return frame
+            job = job.state
+        elif job.ui.timer_seconds != self._timer:
+            frame = self._timer_tick(job)
+            if frame is not None:
+                return frame
+        else:
+            # Also catches a snapshot equal to the frame on screen (a spin back).
+            frame = self._focus_tick(job)
+            if frame is not None:
+                return frame
+        frame = self._full(job)
+        self._shown = frame
+        self._key = self._state_key(job)
+        self._frame_key = self._state_key(job, focus=False)
+        self._timer = job.ui.timer_seconds
+        self._day = self._today()
+        self._base = None
+        self._partials = 0
+        self.full_updates += 1
+        return frame
+
+    def _preview(self, state: AppState) -> PanelFrame:
+        frame = self._full(state)
+        shown = self._shown
+        if shown is not None and shown.image.size == frame.image.size:
+            rect = diff_rect(shown.image, frame.image)
+            frame = PanelFrame(frame.image, frame.buf, rects=[rect] if rect is not None else [])
+        # The next snapshot is rendered in full (and refreshed in full) again.
+        self._shown = frame
+        self._key = self._frame_key = None
+        self._base = None
+        return frame
+
+    @staticmethod
+    def _state_key(state: AppState, *, focus: bool = True) -> tuple:
+        return (id(state.model), render_signature(state, include_timer=False, include_focus=focus))
+
+    @staticmethod
+    def _today() -> str:
+        return clock.local_now().strftime("%Y%m%d")
+
+    def _tick(self, state: AppState) -> Optional[PanelFrame]:
+        if state.ui.timer_seconds != self._timer:
+            return None
+        return self._partial(state, render_clock_region)
+
+    def _timer_tick(self, state: AppState) -> Optional[PanelFrame]:
+        frame = self._partial(state, render_timer_region)
+        if frame is not None:
+            self._timer = state.ui.timer_seconds
+        return frame
+
+    def _focus_tick(self, state: AppState) -> Optional[PanelFrame]:
+        frame = self._partial(state, render_focus_region, focus=False)
+        if frame is not None:
+            self._key = self._state_key(state)
+        return frame
+
+    def _partial(self, state: AppState, region: Callable, *, focus: bool = True) -> Optional[PanelFrame]:
+        """Partial frame for `state` via `region` on the RGB copy; None: full refresh.
+
+        focus=False lets `state` differ from the frame on screen in the focus
+        position (for render_focus_region).
+        """
+        shown = self._shown
+        if shown is None or self._today() != self._day:
+            return None
+        if self._state_key(state, focus=focus) != (self._key if focus else self._frame_key):
+            return None
+        if self.full_every and self._partials >= self.full_every:
+            return None
+        unchanged = PanelFrame(shown.image, shown.buf, rects=[])
+
+        with self._lock:
+            rects = None
+            if self._base is not None:
+                rgb, layout = self._base
+                rects = region(rgb, state, self.fonts, self.theme, layout)
+                if rects == []:
+                    return unchanged
+            if rects is None:
+                # First partial on this frame, or the region moved other text:
+                # redraw the whole frame, the diff still keeps the refresh small.
+                rgb = Image.new("RGB", shown.image.size, self.theme.get("bg", (255, 255, 255)))
+                self._base = (rgb, render_app(rgb, state, self.fonts, self.theme))
+        if rects is not None and self.pointwise:
+            image, rect = self._quantize_rects(shown.image, self._base[0], rects)
+        else:
+            image = self._quantize(self._base[0])
+            rect = diff_rect(shown.image, image)
+        if rect is None:
+            return unchanged
+        frame = PanelFrame(image, self._pack(image) if self._pack is not None else None, rects=[rect])
+        self._shown = frame
+        self._partials += 1
+        self.partial_updates += 1
+        return frame
+
+    def _quantize_rects(
+        self, shown: Image.Image, rgb: Image.Image, rects: list[Rect]
+    ) -> tuple[Image.Image, Optional[Rect]]:
+        """Quantize only `rects` of `rgb` onto a copy of `shown`; (image, changed rect)."""
+        image = shown.copy()
+        boxes = []
+        for x0, y0, x1, y1 in rects:
+            tile = self._quantize(rgb.crop((x0, y0, x1, y1)))
+            box = diff_rect(shown.crop((x0, y0, x1, y1)), tile)
+            if box is None:
+                continue
+            image.paste(tile, (x0, y0))
+            boxes.append((x0 + box[0], y0 + box[1], min(x1, x0 + box[2]), y0 + box[3]))
+        if not boxes:
+            return image, None
+        return image, (
+            min(b[0] for b in boxes),
+            min(b[1] for b in boxes),
+            max(b[2] for b in boxes),
+            max(b[3] for b in boxes),
+        )
@@ -0,0 +1,388 @@
+"""Panel drivers: what the render path needs from an e-paper panel.
+
+PanelDriver keeps the refresh-mode bookkeeping the Waveshare API leaves to the
+caller (init() before full refreshes, init_part() before partial ones, re-init
+after sleep()), aligns partial-refresh windows, and times every call that
+talks to the panel, split into SPI transfer and BUSY wait. Subclasses only
+talk to the hardware:
+
+- WaveshareDriver wraps a waveshare_epd module's EPD object (see
+  app.render.epd.open_driver()).
+- SimulatedDriver models refresh durations and ghosting without a panel, and
+  can write each refresh to disk or to a raw framebuffer file (e.g. in
+  /dev/shm), so the pipeline runs and can be benchmarked on any Linux box.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+import time
+from typing import TYPE_CHECKING, Any, Optional
+
+from PIL import Image
+
+from app.render.packing import FramePacker
+
+if TYPE_CHECKING:
+    from app.render.clock_updater import PanelFrame
+
+Rect = tuple[int, int, int, int]
+
+
+def align_rect(rect: Rect, width: int, height: int) -> Optional[Rect]:
+    """Clip an end-exclusive (x0, y0, x1, y1) rect to the panel, x widened to multiples of 8.
+
+    The controller addresses RAM a byte (8 px) at a time horizontally. None if
+    nothing is left after clipping.
+    """
+    x0, y0, x1, y1 = rect
+    x0 = max(0, int(x0)) & ~7
+    x1 = min(int(width), (int(x1) + 7) & ~7)
+    y0 = max(0, int(y0))
+    y1 = min(int(height), int(y1))
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return (x0, y0, x1, y1)
+
+
+def union_rect(rects: list[Rect]) -> Rect:
+    return (
+        min(r[0] for r in rects),
+        min(r[1] for r in rects),
+        max(r[2] for r in rects),
+        max(r[3] for r in rects),
+    )
+
+
+@dataclass
+class DriverStats:
+    full_refreshes: int = 0
+    partial_refreshes: int = 0
+    clears: int = 0
+    inits: int = 0
+    # Partial windows that had to be widened or clipped by align_rect().
+    realigned: int = 0
+    # Wall time of panel calls, split into waiting for BUSY and the rest
+    # (SPI transfer and command overhead).
+    busy_s: float = 0.0
+    transfer_s: float = 0.0
+    last_busy_s: float = 0.0
+    last_transfer_s: float = 0.0
+
+
+class PanelDriver:
+    """Base driver; subclasses implement the _hw_* methods.
+
+    Not thread-safe: call it from one thread (the pipeline's panel worker).
+    """
+
+    width: int = 800
+    height: int = 480
+
+    def __init__(self):
+        self.stats = DriverStats()
+        self.mode: Optional[str] = None  # "full", "partial" or None (not initialised / asleep)
+        self._waited = 0.0
+
+    # Hardware hooks.
+    def _hw_init(self, partial: bool) -> None:
+        raise NotImplementedError
+
+    def _hw_display(self, buf: Any) -> None:
+        raise NotImplementedError
+
+    def _hw_display_partial(self, buf: Any, rect: Rect) -> None:
+        raise NotImplementedError
+
+    def _hw_clear(self) -> None:
+        raise NotImplementedError
+
+    def _hw_sleep(self) -> None:
+        raise NotImplementedError
+
+    def getbuffer(self, image: Image.Image) -> Any:
+        """Pack a panel-sized image into a new display buffer (safe to keep)."""
+        raise NotImplementedError
+
+    def _pack_shown(self, image: Image.Image) -> Any:
+        """Pack `image` for an immediate refresh; may reuse one buffer for every frame."""
+        return self.getbuffer(image)
+
+    def _note_busy(self, seconds: float) -> None:
+        """Subclasses report time spent waiting for BUSY inside a _hw_* call."""
+        self._waited += seconds
+
+    def _busy(self, fn, *args) -> None:
+        self._waited = 0.0
+        t0 = time.perf_counter()
+        fn(*args)
+        dt = time.perf_counter() - t0
+        busy = min(dt, self._waited)
+        st = self.stats
+        st.last_busy_s, st.last_transfer_s = busy, dt - busy
+        st.busy_s += busy
+        st.transfer_s += dt - busy
+
+    def init(self, *, partial: bool = False) -> None:
+        self._busy(self._hw_init, partial)
+        self.mode = "partial" if partial else "full"
+        self.stats.inits += 1
+
+    def _ensure(self, mode: str) -> None:
+        if self.mode != mode:
+            self.init(partial=mode == "partial")
+
+    def clear(self) -> None:
+        self._ensure("full")
+        self._busy(self._hw_clear)
+        self.stats.clears += 1
+
+    def display(self, buf: Any) -> None:
+        """Full refresh."""
+        self._ensure("full")
+        self._busy(self._hw_display, buf)
+        self.stats.full_refreshes += 1
+
+    def display_partial(self, buf: Any, rect: Rect) -> None:
+        """Partial refresh of `rect` (end-exclusive) from the full-frame `buf`."""
+        aligned = align_rect(rect, self.width, self.height)
+        if aligned is None:
+            return
+        if aligned != tuple(rect):
+            self.stats.realigned += 1
+        self._ensure("partial")
+        self._busy(self._hw_display_partial, buf, aligned)
+        self.stats.partial_refreshes += 1
+
+    def show(self, frame: PanelFrame) -> None:
+        """Display a PanelFrame: full refresh, partial refresh of its rects, or nothing.
+
+        A frame without a buffer (buf None) is packed here, into the driver's
+        reused buffer.
+        """
+        if frame.rects is not None and not frame.rects:
+            return
+        buf = frame.buf if frame.buf is not None else self._pack_shown(frame.image)
+        if frame.rects is None:
+            self.display(buf)
+        else:
+            self.display_partial(buf, union_rect(frame.rects))
+
+    def sleep(self) -> None:
+        self._hw_sleep()
+        self.mode = None
+
+
+class WaveshareDriver(PanelDriver):
+    """Waveshare EPD object (epd7in5_V2.EPD and compatible) as a PanelDriver.
+
+    `packer` replaces epd.getbuffer() (only for panels with the 7.5" V2
+    buffer layout, see app.render.packing); frames shown without a buffer are
+    packed into its preallocated one.
+    """
+
+    def __init__(self, epd, *, packer: Optional[FramePacker] = None):
+        super().__init__()
+        self.epd = epd
+        self.packer = packer
+        self.width = epd.width
+        self.height = epd.height
+        # Every blocking wait in the Waveshare drivers goes through ReadBusy().
+        read_busy = getattr(epd, "ReadBusy", None)
+        if read_busy is not None:
+
+            def timed_read_busy(*args, **kwargs):
+                t0 = time.perf_counter()
+                try:
+                    return read_busy(*args, **kwargs)
+                finally:
+                    self._note_busy(time.perf_counter() - t0)
+
+            epd.ReadBusy = timed_read_busy
+
+    def _hw_init(self, partial: bool) -> None:
+        if partial:
+            self.epd.init_part()
+        else:
+            self.epd.init()
+
+    def _hw_display(self, buf: Any) -> None:
+        self.epd.display(buf)
+
+    def _hw_display_partial(self, buf: Any, rect: Rect) -> None:
+        self.epd.display_Partial(buf, *rect)
+
+    def _hw_clear(self) -> None:
+        self.epd.Clear()
+
+    def _hw_sleep(self) -> None:
+        self.epd.sleep()
+
+    def getbuffer(self, image: Image.Image) -> Any:
+        if self.packer is not None:
+            return self.packer.pack(image)
+        return self.epd.getbuffer(image)
+
+    def _pack_shown(self, image: Image.Image) -> Any:
+        if self.packer is not None:
+            return self.packer.pack_into(image)
+        return self.epd.getbuffer(image)
+
+
+@dataclass
+class SimTimings:
+    """Seconds the simulated panel stays BUSY per operation (7.5" V2 ballpark)."""
+
+    init_s: float = 0.3
+    init_part_s: float = 0.1
+    full_s: float = 4.0
+    partial_s: float = 0.45
+    clear_s: float = 4.0
+    # SPI clock; a 800x480 frame is 48 KB, about 0.1 s at 4 MHz.
+    spi_hz: float = 4_000_000
+
+
+class SimulatedDriver(PanelDriver):
+    """In-memory panel for hardware-free runs and benchmarks.
+
+    - Transfer (buffer size at timings.spi_hz) and busy time follow
+      `timings`, scaled by `speed` (0: don't sleep at all, only account;
+      1: real time). stats are wall time as for real panels; `modeled_s` is
+      the panel time the calls would have taken.
+    - Partial windows must be byte aligned (align_rect() in display_partial()
+      does that; `strict` makes _hw_display_partial check it again).
+    - Ghosting: every partial refresh bumps a counter per 8x8 tile it
+      covers, full refreshes and clears reset them. `ghost_max` is the worst
+      tile, `partials_since_full` the refreshes since the last reset.
+    - `out_dir` gets one PNG per refresh (NNNNNN-full.png / -partial.png);
+      `fb_path` is rewritten with the raw framebuffer (the packed buffer
+      layout of getbuffer()) after every refresh, e.g. /dev/shm/epd.raw for
+      a viewer process.
+    """
+
+    TILE = 8
+
+    def __init__(
+        self,
+        width: int = 800,
+        height: int = 480,
+        *,
+        timings: Optional[SimTimings] = None,
+        speed: float = 0.0,
+        out_dir: str = "",
+        fb_path: str = "",
+        strict: bool = True,
+    ):
+        super().__init__()
+        self.width = int(width)
+        self.height = int(height)
+        self.timings = timings or SimTimings()
+        self.speed = max(0.0, float(speed))
+        self.out_dir = out_dir
+        self.fb_path = fb_path
+        self.strict = strict
+        self.asleep = True
+        self.modeled_s = 0.0
+        self.partials_since_full = 0
+        self._cols = (self.width + self.TILE - 1) // self.TILE
+        self._ghost = bytearray(self._cols * ((self.height + self.TILE - 1) // self.TILE))
+        self._ghost_max = 0
+        self._frame = Image.new("1", (self.width, self.height), 255)
+        self._packer = FramePacker(self.width, self.height)
+        self._seq = 0
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+
+    @property
+    def frame(self) -> Image.Image:
+        """What the panel shows now (1-bit, 255 = white)."""
+        return self._frame
+
+    @property
+    def ghost_max(self) -> int:
+        return self._ghost_max
+
+    def _wait(self, seconds: float, *, busy: bool = True) -> None:
+        self.modeled_s += seconds
+        if self.speed > 0:
+            t0 = time.perf_counter()
+            time.sleep(seconds * self.speed)
+            if busy:
+                self._note_busy(time.perf_counter() - t0)
+
+    def _transfer(self, nbytes: int) -> None:
+        self._wait(nbytes * 8 / max(1.0, self.timings.spi_hz), busy=False)
+
+    def _check_awake(self) -> None:
+        if self.asleep:
+            raise RuntimeError("simulated panel is asleep; init() it first")
+
+    def _hw_init(self, partial: bool) -> None:
+        self.asleep = False
+        self._wait(self.timings.init_part_s if partial else self.timings.init_s)
+
+    def _hw_sleep(self) -> None:
+        self.asleep = True
+
+    def getbuffer(self, image: Image.Image) -> bytearray:
+        # Same layout as the 7.5" V2 driver: 1 bit per pixel, MSB first, 1 = black.
+        return self._packer.pack(image)
+
+    def _pack_shown(self, image: Image.Image) -> bytearray:
+        return self._packer.pack_into(image)
+
+    def _unpack(self, buf) -> Image.Image:
+        return self._packer.unpack(buf)
+
+    def _reset_ghost(self) -> None:
+        self._ghost = bytearray(len(self._ghost))
+        self._ghost_max = 0
+        self.partials_since_full = 0
+
+    def _hw_display(self, buf: Any) -> None:
+        self._check_awake()
+        self._transfer(len(buf))
+        self._frame = self._unpack(buf)
+        self._reset_ghost()
+        self._wait(self.timings.full_s)
+        self._emit("full")
+
+    def _hw_clear(self) -> None:
+        self._check_awake()
+        self._transfer(self.width * self.height // 8)
+        self._frame = Image.new("1", (self.width, self.height), 255)
+        self._reset_ghost()
+        self._wait(self.timings.clear_s)
+        self._emit("clear")
+
+    def _hw_display_partial(self, buf: Any, rect: Rect) -> None:
+        self._check_awake()
+        if self.mode != "partial":
+            raise RuntimeError("partial refresh outside partial mode")
+        if self.strict and align_rect(rect, self.width, self.height) != tuple(rect):
+            raise ValueError(f"partial window {rect} is not byte aligned / inside the panel")
+        x0, y0, x1, y1 = rect
+        self._transfer((x1 - x0) // 8 * (y1 - y0))
+        self._frame.paste(self._unpack(buf).crop(rect), (x0, y0))
+        t = self.TILE
+        for ty in range(y0 // t, (y1 + t - 1) // t):
+            row = ty * self._cols
+            for tx in range(x0 // t, (x1 + t - 1) // t):
+                n = min(255, self._ghost[row + tx] + 1)
+                self._ghost[row + tx] = n
+                if n > self._ghost_max:
+                    self._ghost_max = n
+        self.partials_since_full += 1
+        self._wait(self.timings.partial_s)
+        self._emit("partial")
+
+    def _emit(self, kind: str) -> None:
+        self._seq += 1
+        if self.out_dir:
+            self._frame.save(os.path.join(self.out_dir, f"{self._seq:06d}-{kind}.png"))
+        if self.fb_path:
+            tmp = self.fb_path + ".tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(self._packer.pack_into(self._frame))
+            os.replace(tmp, self.fb_path)
@@ -1,6 +1,7 @@
 import os
 import sys
 
+from app.render.packing import FramePacker
 from app.shared.paths import find_repo_root, get_waveshare_paths
 
 
@@ -26,7 +27,33 @@ def init_epd():
     return epd, picdir
 
 
+_PACKERS = {}
+
+
+def _packer(epd):
+    """The FramePacker (and its preallocated buffer) shared by every use of this panel size."""
+    size = (epd.width, epd.height)
+    packer = _PACKERS.get(size)
+    if packer is None:
+        packer = _PACKERS[size] = FramePacker(*size)
+    return packer
+
+
 def display_image(epd, image, sleep_after=True):
-    epd.display(epd.getbuffer(image))
+    # Same bytes as epd.getbuffer(image), without its per-byte Python loop.
+    epd.display(_packer(epd).pack_into(image))
     if sleep_after:
         epd.sleep()
+
+
+def open_driver(*, clear=True):
+    """The Waveshare panel as an app.render.drivers.PanelDriver, initialised (and cleared)."""
+    from app.render.drivers import WaveshareDriver
+
+    epd7in5_V2, _ = _load_driver()
+    epd = epd7in5_V2.EPD()
+    driver = WaveshareDriver(epd, packer=_packer(epd))
+    driver.init()
+    if clear:
+        driver.clear()
+    return driver
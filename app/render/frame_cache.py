@@ -0,0 +1,166 @@
+"""Speculative frame cache for instant knob response.
+
+From any screen only a handful of frames are one detent away (kitchen home:
+left panel + a few inventory/shopping rows; menu: the neighbouring pill).
+While the pipeline is idle, a background worker reduces the current snapshot
+with the likely next events (Rotate -1/+1 by default), renders those frames
+(including quantize/pack, i.e. whatever `render` returns) and keeps them keyed
+by render revision. When the real event arrives, the frame is served from the
+cache and the panel update can start immediately.
+
+Render revision = (model object, render_signature(), minute shown on screen),
+plus the theme: set_theme() and a minute rollover drop every entry. The model
+object identity works as a revision because snapshots copy the model on write
+(app.core.snapshot).
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any, Callable, Optional, Sequence
+
+from app.core import clock
+from app.core.reducer import Event, Rotate
+from app.core.snapshot import reduce_snapshot
+from app.core.state import AppState
+from app.render.pipeline import Closed, Mailbox
+from app.ui.app import render_signature
+
+
+@dataclass
+class FrameCacheStats:
+    hits: int = 0
+    misses: int = 0
+    speculated: int = 0
+    invalidations: int = 0
+
+
+class FrameCache:
+    """get-or-render front for a frame renderer, plus speculative prefetch.
+
+    `render(snapshot)` must be thread-safe with respect to the caller's own
+    renders (it only reads the frozen snapshot). `idle()` tells the worker when
+    it may use the CPU; speculation pauses while it returns False.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[AppState], Any],
+        theme: dict,
+        *,
+        neighbours: Sequence[Event] = (Rotate(-1), Rotate(1)),
+        capacity: int = 16,
+        idle: Callable[[], bool] = lambda: True,
+    ):
+        self._render = render
+        self.theme = theme
+        self.neighbours = list(neighbours)
+        self.capacity = max(1, int(capacity))
+        self._idle = idle
+        self._lock = threading.Lock()
+        # PIL/FreeType font rendering is not safe to run concurrently on shared
+        # fonts; other renderers sharing them (ClockUpdater) take this lock too.
+        self.render_lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[Any, Any]] = OrderedDict()
+        self._minute = ""
+        self._requests: Mailbox[AppState] = Mailbox()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = FrameCacheStats()
+
+    # ---- lookup ----
+
+    def _key(self, state: AppState) -> tuple:
+        return (id(state.model), render_signature(state))
+
+    def _check_minute(self) -> None:
+        minute = clock.local_now().strftime("%Y%m%d%H%M")
+        if minute != self._minute:
+            if self._entries:
+                self.stats.invalidations += 1
+            self._entries.clear()
+            self._minute = minute
+
+    def get(self, state: AppState) -> Optional[Any]:
+        key = self._key(state)
+        with self._lock:
+            self._check_minute()
+            entry = self._entries.get(key)
+            # The entry holds the model, so its id cannot have been reused.
+            if entry is None or entry[0] is not state.model:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, state: AppState, frame: Any) -> None:
+        key = self._key(state)
+        with self._lock:
+            self._check_minute()
+            self._entries[key] = (state.model, frame)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def render(self, state: AppState) -> Any:
+        """Cached frame for `state`, rendering (and caching) it on a miss."""
+        frame = self.get(state)
+        if frame is not None:
+            self.stats.hits += 1
+            return frame
+        self.stats.misses += 1
+        with self.render_lock:
+            frame = self._render(state)
+        self.put(state, frame)
+        return frame
+
+    def set_theme(self, theme: dict) -> None:
+        with self._lock:
+            self.theme = theme
+            self._entries.clear()
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # ---- speculation ----
+
+    def start(self) -> FrameCache:
+        self._thread = threading.Thread(target=self._worker, name="frame-cache", daemon=True)
+        self._thread.start()
+        return self
+
+    def speculate(self, state: AppState) -> None:
+        """Prefetch frames one event away from `state` (latest request wins)."""
+        self._requests.put(state)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._requests.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _worker(self) -> None:
+        while True:
+            try:
+                state = self._requests.get()
+            except Closed:
+                return
+            for ev in self.neighbours:
+                if not self._wait_idle():
+                    break  # a newer request arrived; start over from it
+                nxt = reduce_snapshot(state, ev, theme=self.theme)
+                if self.get(nxt) is not None:
+                    continue
+                with self.render_lock:
+                    frame = self._render(nxt)
+                self.put(nxt, frame)
+                self.stats.speculated += 1
+
+    def _wait_idle(self) -> bool:
+        while not self._idle():
+            if self._requests.pending:
+                return False
+            time.sleep(0.01)
+        return not self._requests.pending
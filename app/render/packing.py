@@ -0,0 +1,70 @@
+"""Pack 1-bit panel images into the Waveshare 7.5" V2 display buffer.
+
+The driver's getbuffer() converts the image, copies its packed bytes and
+then inverts them in a Python loop (PIL: 1 = white, panel: 1 = black), a few
+ms per frame on a Pi. FramePacker produces the same bytes in C: with NumPy it
+packs the image's unpacked pixel bytes with np.packbits, otherwise it uses
+PIL's inverted raw mode ("1;I"). pack_into() fills a preallocated buffer,
+which the drivers reuse for every frame they display.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PIL import Image
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional speedup
+    np = None
+
+
+class FramePacker:
+    """Byte-exact stand-in for epd7in5_V2.EPD.getbuffer() for a `width` x `height` panel.
+
+    Accepts the same images getbuffer() does: panel-sized, or portrait
+    (height x width, rotated by 90 degrees), in any mode (converted to "1"
+    with PIL's default dithering, as the driver does). Other sizes raise
+    ValueError; the driver would silently return a blank buffer.
+    """
+
+    def __init__(self, width: int, height: int, *, use_numpy: Optional[bool] = None):
+        if width % 8:
+            raise ValueError("panel width must be a multiple of 8")
+        self.width = int(width)
+        self.height = int(height)
+        self.stride = self.width // 8
+        self.use_numpy = (np is not None) if use_numpy is None else (bool(use_numpy) and np is not None)
+        self.buf = bytearray(self.stride * self.height)
+        self._mask = np.empty((self.height, self.width), dtype=bool) if self.use_numpy else None
+
+    def _panel_image(self, image: Image.Image) -> Image.Image:
+        if image.size == (self.height, self.width) and image.size != (self.width, self.height):
+            image = image.rotate(90, expand=True)
+        elif image.size != (self.width, self.height):
+            raise ValueError(f"image is {image.size}, panel is {(self.width, self.height)}")
+        return image if image.mode == "1" else image.convert("1")
+
+    def _packed(self, image: Image.Image):
+        if self.use_numpy:
+            # Mode "1" keeps one byte per pixel (0 / 255); "L" raw mode hands
+            # those out unchanged and packbits does the packing + inversion.
+            pixels = np.frombuffer(image.tobytes("raw", "L"), dtype=np.uint8).reshape(self.height, self.width)
+            np.equal(pixels, 0, out=self._mask)
+            return np.packbits(self._mask, axis=None)
+        return image.tobytes("raw", "1;I")
+
+    def pack(self, image: Image.Image) -> bytearray:
+        """New buffer for `image`, as getbuffer() returns (safe to keep)."""
+        return bytearray(self._packed(self._panel_image(image)))
+
+    def pack_into(self, image: Image.Image, out: Optional[bytearray] = None) -> bytearray:
+        """Pack into `out` (default: this packer's own buffer, overwritten by the next call)."""
+        out = self.buf if out is None else out
+        memoryview(out)[:] = memoryview(self._packed(self._panel_image(image))).cast("B")
+        return out
+
+    def unpack(self, buf) -> Image.Image:
+        """Inverse of pack(): the 1-bit image a buffer shows."""
+        return Image.frombytes("1", (self.width, self.height), bytes(buf), "raw", "1;I")
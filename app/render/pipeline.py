@@ -0,0 +1,244 @@
+"""Staged frame pipeline: reducer -> render worker -> panel worker.
+
+A full panel refresh takes seconds, so the thread that reduces input must never
+wait for it. Stages hand work over through single-slot mailboxes with a
+"latest wins" policy: while the panel is busy, newer snapshots/frames replace
+older unconsumed ones. With `settle_s` the render worker also holds a snapshot
+until input pauses, so a knob spin costs one refresh of the final frame; a
+spin longer than `preview_after_s` additionally gets one quick preview (e.g. a
+partial refresh, app.render.clock_updater.Preview) while it is still going.
+
+Snapshots passed to submit() must not be mutated afterwards (use
+app.core.snapshot.reduce_snapshot on the reducer side).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Closed(Exception):
+    """Raised by Mailbox.get() once the mailbox is closed and drained."""
+
+
+class Mailbox(Generic[T]):
+    """Single-slot, latest-wins handoff between two threads.
+
+    `merge(old, new)`, if given, builds the stored item when `new` replaces an
+    unconsumed `old` (e.g. partial frames whose dirty rects must add up).
+    """
+
+    def __init__(self, merge: Optional[Callable[[T, T], T]] = None):
+        self._merge = merge
+        self._cond = threading.Condition()
+        self._item: Optional[T] = None
+        self._full = False
+        self._closed = False
+        self.replaced = 0
+
+    def put(self, item: T) -> bool:
+        """Store `item`; returns True if it replaced an unconsumed one."""
+        with self._cond:
+            replaced = self._full
+            if replaced:
+                self.replaced += 1
+                if self._merge is not None:
+                    item = self._merge(self._item, item)  # type: ignore[arg-type]
+            self._item = item
+            self._full = True
+            self._cond.notify()
+            return replaced
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._full or self._closed, timeout):
+                raise TimeoutError("mailbox get timed out")
+            if not self._full:
+                raise Closed()
+            item = self._item
+            self._item = None
+            self._full = False
+            return item  # type: ignore[return-value]
+
+    @property
+    def pending(self) -> bool:
+        with self._cond:
+            return self._full
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+@dataclass
+class PipelineStats:
+    submitted: int = 0
+    rendered: int = 0
+    previews: int = 0
+    displayed: int = 0
+    # Snapshots/frames dropped because a newer one arrived first.
+    snapshots_coalesced: int = 0
+    frames_coalesced: int = 0
+    last_render_s: float = 0.0
+    last_display_s: float = 0.0
+
+
+class FramePipeline:
+    """Render and display snapshots on worker threads.
+
+    render(snapshot) -> frame runs on the render worker (RGB render + quantize).
+    display(frame) runs on the panel worker (SPI transfer + refresh).
+    merge_frames(old, new), if given, combines a frame with the undisplayed one
+    it replaces (see app.render.clock_updater.merge_frames).
+    settle_s > 0 makes the render worker wait until no newer snapshot arrived
+    for that long before rendering. If snapshots keep coming for
+    preview_after_s, preview(snapshot) is rendered and displayed once while
+    the worker keeps waiting for the pause.
+    Worker exceptions are re-raised from check()/submit() on the caller thread.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[Any], Any],
+        display: Callable[[Any], None],
+        *,
+        name: str = "panel",
+        merge_frames: Optional[Callable[[Any, Any], Any]] = None,
+        settle_s: float = 0.0,
+        preview_after_s: float = 0.0,
+        preview: Optional[Callable[[Any], Any]] = None,
+    ):
+        self._render = render
+        self._display = display
+        self.settle_s = max(0.0, float(settle_s))
+        self.preview_after_s = max(0.0, float(preview_after_s))
+        self._preview = preview
+        self._snapshots: Mailbox[Any] = Mailbox()
+        self._frames: Mailbox[Any] = Mailbox(merge=merge_frames)
+        self._idle = threading.Condition()
+        self._busy = 0  # items accepted but not yet displayed or coalesced
+        self._error: Optional[BaseException] = None
+        self._rendering = False
+        self.stats = PipelineStats()
+        self._threads = [
+            threading.Thread(target=self._render_loop, name=f"{name}-render", daemon=True),
+            threading.Thread(target=self._display_loop, name=f"{name}-display", daemon=True),
+        ]
+
+    def start(self) -> FramePipeline:
+        for t in self._threads:
+            t.start()
+        return self
+
+    def submit(self, snapshot: Any) -> None:
+        self.check()
+        with self._idle:
+            self._busy += 1
+        self.stats.submitted += 1
+        if self._snapshots.put(snapshot):
+            self.stats.snapshots_coalesced += 1
+            self._done()
+
+    @property
+    def render_idle(self) -> bool:
+        """True when the render worker has nothing queued, held or in progress."""
+        return not self._rendering and not self._snapshots.pending
+
+    @property
+    def idle(self) -> bool:
+        """True when every submitted snapshot was displayed or coalesced."""
+        with self._idle:
+            return self._busy == 0
+
+    def check(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("frame pipeline worker failed") from self._error
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted snapshot was displayed or coalesced."""
+        with self._idle:
+            ok = self._idle.wait_for(lambda: self._busy == 0 or self._error is not None, timeout)
+        self.check()
+        return ok
+
+    def stop(self, timeout: float = 30.0) -> None:
+        self._snapshots.close()
+        self._threads[0].join(timeout)
+        self._frames.close()
+        self._threads[1].join(timeout)
+
+    def _done(self) -> None:
+        with self._idle:
+            self._busy -= 1
+            self._idle.notify_all()
+
+    def _fail(self, exc: BaseException) -> None:
+        self._error = exc
+        with self._idle:
+            self._idle.notify_all()
+
+    def _render_loop(self) -> None:
+        try:
+            while True:
+                try:
+                    snapshot = self._snapshots.get()
+                except Closed:
+                    return
+                self._rendering = True
+                try:
+                    if self.settle_s > 0:
+                        snapshot = self._settle(snapshot)
+                    self._render_one(snapshot)
+                finally:
+                    self._rendering = False
+        except BaseException as exc:  # surfaced via check()
+            self._fail(exc)
+
+    def _settle(self, snapshot: Any) -> Any:
+        """Newest snapshot once none arrived for settle_s (previewing a long burst once)."""
+        start = time.monotonic()
+        previewed = self._preview is None
+        while True:
+            try:
+                newer = self._snapshots.get(timeout=self.settle_s)
+            except (TimeoutError, Closed):
+                return snapshot
+            self.stats.snapshots_coalesced += 1
+            self._done()
+            snapshot = newer
+            if not previewed and time.monotonic() - start >= self.preview_after_s:
+                previewed = True
+                with self._idle:
+                    self._busy += 1
+                self.stats.previews += 1
+                self._render_one(self._preview(snapshot))
+
+    def _render_one(self, job: Any) -> None:
+        t0 = time.perf_counter()
+        frame = self._render(job)
+        self.stats.last_render_s = time.perf_counter() - t0
+        self.stats.rendered += 1
+        if self._frames.put(frame):
+            self.stats.frames_coalesced += 1
+            self._done()
+
+    def _display_loop(self) -> None:
+        try:
+            while True:
+                try:
+                    frame = self._frames.get()
+                except Closed:
+                    return
+                t0 = time.perf_counter()
+                self._display(frame)
+                self.stats.last_display_s = time.perf_counter() - t0
+                self.stats.displayed += 1
+                self._done()
+        except BaseException as exc:
+            self._fail(exc)
@@ -70,7 +70,7 @@ def draw_text_centered(draw, text, cx, cy, font, fill=0):
     draw.text((_snap_px(x), _snap_px(y)), text, font=font, fill=fill)
 
 
-def draw_text_centered_clamped(draw, text, cx, cy, font, xmin, xmax, fill=0):
+def text_origin_centered_clamped(draw, text, cx, cy, font, xmin, xmax):
     bbox = draw.textbbox((0, 0), text, font=font)
     w = bbox[2] - bbox[0]
     h = bbox[3] - bbox[1]
@@ -82,7 +82,13 @@ def draw_text_centered_clamped(draw, text, cx, cy, font, xmin, xmax, fill=0):
     elif right > xmax:
         x -= right - xmax
     y = cy - h / 2 - bbox[1]
-    draw.text((_snap_px(x), _snap_px(y)), text, font=font, fill=fill)
+    return (_snap_px(x), _snap_px(y))
+
+
+def draw_text_centered_clamped(draw, text, cx, cy, font, xmin, xmax, fill=0):
+    xy = text_origin_centered_clamped(draw, text, cx, cy, font, xmin, xmax)
+    draw.text(xy, text, font=font, fill=fill)
+    return xy
 
 
 def truncate_text(draw, text, font, max_width):
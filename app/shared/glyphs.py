@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from PIL import Image, ImageDraw
+
+DIGITS = "0123456789"
+
+
+class DigitGlyphs:
+    """Pre-rendered glyph masks for a countdown/clock string ("0"-"9", ":").
+
+    Digits sit in fixed-width cells (the widest digit's advance), so a string
+    like "MM:SS" keeps its width and no digit moves when another one changes.
+    draw() and redraw() composite the same cached masks, so redrawing only the
+    changed cells gives the same pixels as drawing the whole string.
+    """
+
+    def __init__(self, font, *, antialias: bool = True, chars: str = DIGITS + ":"):
+        self.font = font
+        self.antialias = antialias
+        self._glyphs: dict[str, tuple[Image.Image, int, int, int]] = {}
+        self._advance: dict[str, int] = {}
+        for ch in chars:
+            self._load(ch)
+        self.digit_w = max(self._advance[ch] for ch in DIGITS if ch in self._advance)
+        self.top = min(g[2] for g in self._glyphs.values())
+        self.bottom = max(g[2] + g[0].size[1] for g in self._glyphs.values())
+
+    def _load(self, ch: str) -> None:
+        l, t, r, b = self.font.getbbox(ch)
+        mask = Image.new("L", (max(1, r - l), max(1, b - t)), 0)
+        draw = ImageDraw.Draw(mask)
+        if not self.antialias:
+            draw.fontmode = "1"
+        draw.text((-l, -t), ch, font=self.font, fill=255)
+        self._advance[ch] = int(round(self.font.getlength(ch)))
+        # (mask, x bearing, y offset from the text origin, advance)
+        self._glyphs[ch] = (mask, l, t, self._advance[ch])
+
+    def _cell_w(self, ch: str) -> int:
+        return self.digit_w if ch in DIGITS else self._advance[ch]
+
+    def _cells(self, text: str, x: int) -> list[tuple[str, int, int]]:
+        """(char, glyph x, ink right) per character."""
+        out = []
+        for ch in text:
+            if ch not in self._glyphs:
+                self._load(ch)
+            mask, l, _t, adv = self._glyphs[ch]
+            cw = self._cell_w(ch)
+            gx = x + (cw - adv) // 2 + l
+            out.append((ch, gx, gx + mask.size[0]))
+            x += cw
+        return out
+
+    def width(self, text: str) -> int:
+        return sum(self._cell_w(ch) for ch in text)
+
+    @property
+    def height(self) -> int:
+        return self.bottom - self.top
+
+    def bbox(self, xy: tuple[int, int], text: str) -> tuple[int, int, int, int]:
+        """Ink box of `text` drawn at `xy` (x0, y0, x1, y1), end-exclusive."""
+        cells = self._cells(text, xy[0])
+        if not cells:
+            return (xy[0], xy[1] + self.top, xy[0], xy[1] + self.top)
+        return (min(c[1] for c in cells), xy[1] + self.top, max(c[2] for c in cells), xy[1] + self.bottom)
+
+    def _paste(self, image, ch: str, gx: int, y: int, fill, clip: Optional[tuple[int, int]] = None) -> None:
+        mask, _l, t, _adv = self._glyphs[ch]
+        if clip is not None:
+            # Only inside [clip): pixels outside already hold this glyph.
+            c0 = max(0, clip[0] - gx)
+            c1 = min(mask.size[0], clip[1] - gx)
+            if c1 <= c0:
+                return
+            mask = mask.crop((c0, 0, c1, mask.size[1]))
+            gx += c0
+        image.paste(fill, (gx, y + t, gx + mask.size[0], y + t + mask.size[1]), mask)
+
+    def draw(self, image, xy: tuple[int, int], text: str, fill) -> None:
+        for ch, gx, _x1 in self._cells(text, xy[0]):
+            self._paste(image, ch, gx, xy[1], fill)
+
+    def redraw(
+        self, image, xy: tuple[int, int], old: str, new: str, fill, bg
+    ) -> Optional[tuple[int, int, int, int]]:
+        """Turn `old` (drawn at `xy` on a `bg` background) into `new`.
+
+        Returns the repainted box, None if nothing changed. Strings of a
+        different shape (length or ':' positions) need a full redraw; that
+        raises ValueError.
+        """
+        if len(old) != len(new) or any((a in DIGITS) != (b in DIGITS) for a, b in zip(old, new)):
+            raise ValueError("redraw() needs strings with the same cell layout")
+        old_cells = self._cells(old, xy[0])
+        new_cells = self._cells(new, xy[0])
+        changed = [i for i, (a, b) in enumerate(zip(old, new)) if a != b]
+        if not changed:
+            return None
+        x0 = min(min(old_cells[i][1], new_cells[i][1]) for i in changed)
+        x1 = max(max(old_cells[i][2], new_cells[i][2]) for i in changed)
+        y0, y1 = xy[1] + self.top, xy[1] + self.bottom
+        image.paste(bg, (x0, y0, x1, y1))
+        # Glyphs may overhang their cell; repaint every one touching the box, in order.
+        for ch, gx, gx1 in new_cells:
+            if gx < x1 and gx1 > x0:
+                self._paste(image, ch, gx, xy[1], fill, clip=(x0, x1))
+        return (x0, y0, x1, y1)
+
+
+_CACHE: dict[tuple[int, bool], DigitGlyphs] = {}
+
+
+def digit_glyphs(font, *, antialias: bool = True) -> DigitGlyphs:
+    """Shared DigitGlyphs per (font, antialias); FontBook hands out cached fonts."""
+    key = (id(font), bool(antialias))
+    glyphs = _CACHE.get(key)
+    if glyphs is None or glyphs.font is not font:
+        glyphs = DigitGlyphs(font, antialias=antialias)
+        _CACHE[key] = glyphs
+    return glyphs
+
+
+def format_timer(seconds: int) -> str:
+    seconds = max(0, int(seconds or 0))
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+@dataclass
+class GlyphRun:
+    """A string drawn with DigitGlyphs, kept so later values can be redrawn in place."""
+
+    glyphs: DigitGlyphs
+    xy: tuple[int, int]
+    text: str
+
+    def update(self, image, text: str, fill, bg) -> Optional[list[tuple[int, int, int, int]]]:
+        """Redraw to `text`; dirty rect (x aligned to 8 px), [] if unchanged, None if the shape changed."""
+        try:
+            box = self.glyphs.redraw(image, self.xy, self.text, text, fill, bg)
+        except ValueError:
+            return None
+        self.text = text
+        if box is None:
+            return []
+        x0, y0, x1, y1 = box
+        return [(x0 & ~7, y0, min(image.size[0], (x1 + 7) & ~7), y1)]
@@ -0,0 +1 @@
+"""On-device persistence: the local operation log."""
@@ -0,0 +1,115 @@
+"""Append-only operation log for local mutations (offline-safe, replayable).
+
+The log is JSON lines; one line is one committed batch:
+
+    {"seq": 12, "ts": 1767350400.0, "source": "voice", "ops": [{"op": "add", ...}, ...]}
+
+A batch goes out in a single write() + flush (+ fsync), so a crash leaves the
+whole batch or a torn last line, which read() skips. Opening the log cuts a
+torn tail off, so later batches start on a line of their own. Sync pushes the records
+after the last sequence number the backend acknowledged.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import os
+from typing import IO, Iterator, Optional
+
+
+@dataclass
+class OpLogStats:
+    writes: int = 0
+    ops: int = 0
+    bytes: int = 0
+
+
+class OpLog:
+    def __init__(self, path: str, *, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+        self.stats = OpLogStats()
+        self.seq = 0
+        self._repair_tail()
+        for record in self.read():
+            self.seq = max(self.seq, int(record.get("seq") or 0))
+        self._f: Optional[IO[str]] = None
+
+    def _repair_tail(self) -> None:
+        """Drop a torn last line (no trailing newline) left by a crash mid-write."""
+        try:
+            f = open(self.path, "rb+")
+        except FileNotFoundError:
+            return
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            # Find the start of the last line, reading backwards in blocks.
+            pos = end
+            start = 0
+            while pos > 0:
+                step = min(4096, pos)
+                pos -= step
+                f.seek(pos)
+                nl = f.read(step).rfind(b"\n")
+                if nl >= 0:
+                    start = pos + nl + 1
+                    break
+            f.seek(start)
+            tail = f.read()
+            try:
+                complete = isinstance(json.loads(tail), dict)
+            except ValueError:
+                complete = False
+            if complete:
+                # Only the newline is missing: keep the record.
+                f.seek(end)
+                f.write(b"\n")
+            else:
+                f.truncate(start)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+    def append(self, ops: list[dict], *, ts: float, source: str = "") -> int:
+        """Write `ops` as one batch record; returns its sequence number (0: nothing written)."""
+        if not ops:
+            return 0
+        if self._f is None:
+            parent = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(parent, exist_ok=True)
+            self._f = open(self.path, "a", encoding="utf-8")
+        seq = self.seq + 1
+        line = json.dumps({"seq": seq, "ts": ts, "source": source, "ops": ops}, separators=(",", ":")) + "\n"
+        self._f.write(line)
+        self._f.flush()
+        if self.fsync:
+            os.fsync(self._f.fileno())
+        self.seq = seq
+        self.stats.writes += 1
+        self.stats.ops += len(ops)
+        self.stats.bytes += len(line)
+        return seq
+
+    def read(self, after: int = 0) -> Iterator[dict]:
+        """Records with seq > `after`, oldest first."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn write at the tail
+                if isinstance(record, dict) and int(record.get("seq") or 0) > after:
+                    yield record
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
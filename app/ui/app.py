@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+from typing import Optional, Union
+
 from PIL import ImageDraw
 
+from app.core.reminder_index import reminder_index
 from app.core.state import AppState, Screen, MenuItemId, WidgetMode
-from app.ui.home import render_home
-from app.ui.home_kitchen import render_home_kitchen
-from app.ui.calendar import render_calendar
+from app.ui.home import HomeLayout, render_home, render_home_clock, render_home_timer
+from app.ui.home_kitchen import (
+    KitchenLayout,
+    render_home_kitchen,
+    render_kitchen_clock,
+    render_kitchen_timer,
+    rerender_kitchen_rows,
+)
+from app.ui.calendar import CalendarLayout, render_calendar, rerender_calendar_cursor
 from app.ui.weather_detail import render_weather_detail
 from app.ui.menu import render_menu
 from app.ui.placeholder import render_placeholder
@@ -37,10 +46,12 @@ def _to_render_data(state: AppState) -> dict:
         "page": state.ui.page,
         # totals are derived from full dataset
         "reminder_total": len(state.model.reminders),
-        "reminder_due": sum(1 for r in state.model.reminders if not r.completed),
+        "reminder_due": reminder_index(state).count(completed=False),
         "reminders": reminders,
         "weather": weather,
         "voice_active": bool(state.ui.voice_active),
+        "voice_phase": str(getattr(state.ui.voice_phase, "value", state.ui.voice_phase)),
+        "voice_detail": state.ui.voice_detail,
         "widget_mode": str(state.ui.widget_mode.value if isinstance(state.ui.widget_mode, WidgetMode) else state.ui.widget_mode),
         "timer_seconds": int(state.ui.timer_seconds or 0),
         "timer_running": bool(state.ui.timer_running),
@@ -49,7 +60,8 @@ def _to_render_data(state: AppState) -> dict:
     }
 
 
-def render_app(image, state: AppState, fonts, theme: dict) -> None:
+def render_app(image, state: AppState, fonts, theme: dict) -> Union[KitchenLayout, HomeLayout, CalendarLayout, None]:
+    """Draw the current screen; home variants and the calendar return their layout (see render_clock_region)."""
     if state.ui.screen == Screen.MENU:
         render_menu(image, state, fonts, theme)
         return
@@ -57,8 +69,7 @@ def render_app(image, state: AppState, fonts, theme: dict) -> None:
         render_placeholder(image, state, fonts, theme)
         return
     if state.ui.screen == Screen.CALENDAR:
-        render_calendar(image, state, fonts, theme)
-        return
+        return render_calendar(image, state, fonts, theme)
     if state.ui.screen == Screen.WEATHER:
         render_weather_detail(image, state, fonts, theme)
         return
@@ -66,8 +77,7 @@ def render_app(image, state: AppState, fonts, theme: dict) -> None:
     # HOME: choose renderer variant based on theme (default: kitchen).
     variant = str((theme or {}).get("home_variant") or "kitchen").strip().lower()
     if variant == "kitchen":
-        render_home_kitchen(image, state, fonts, theme)
-        return
+        return render_home_kitchen(image, state, fonts, theme)
 
     data = _to_render_data(state)
 
@@ -82,7 +92,7 @@ def render_app(image, state: AppState, fonts, theme: dict) -> None:
             overlay["focus"] = {"kind": "task", "index": state.ui.focused_index - 2}
         overlay["focus_width"] = int(theme.get("focus_width", 4) or 4)
 
-    render_home(image, data, fonts, theme=theme, overlay=overlay)
+    home_layout = render_home(image, data, fonts, theme=theme, overlay=overlay)
 
     # Draw focus for clock/weather cards here (task focus is handled in home.py).
     focus = overlay.get("focus") or {}
@@ -109,3 +119,83 @@ def render_app(image, state: AppState, fonts, theme: dict) -> None:
             width=int(overlay.get("focus_width", 4) or 4),
             fill=None,
         )
+    return home_layout
+
+
+def render_clock_region(
+    image, state: AppState, fonts, theme: dict, layout: Union[KitchenLayout, HomeLayout, CalendarLayout, None]
+) -> Optional[list[tuple[int, int, int, int]]]:
+    """Update the clock of a frame drawn by render_app() for `state` to the current minute.
+
+    Returns dirty rects, [] if nothing changed, or None when the frame has to be
+    re-rendered (new day, clock layout change). Other screens (CalendarLayout or
+    None) show no time of day; the caller still owes them a full render on a new day.
+    """
+    if isinstance(layout, KitchenLayout):
+        return render_kitchen_clock(image, state, fonts, theme, layout)
+    if isinstance(layout, HomeLayout):
+        return render_home_clock(image, _to_render_data(state), fonts, theme, layout)
+    return []
+
+
+def render_timer_region(
+    image, state: AppState, fonts, theme: dict, layout: Union[KitchenLayout, HomeLayout, CalendarLayout, None]
+) -> Optional[list[tuple[int, int, int, int]]]:
+    """Update the timer countdown of a frame drawn by render_app() to `state.ui.timer_seconds`.
+
+    Returns dirty rects, [] if the countdown text did not change, or None when
+    the frame has to be re-rendered (no countdown on it, or its shape changed).
+    """
+    if isinstance(layout, KitchenLayout):
+        return render_kitchen_timer(image, state, fonts, theme, layout)
+    if isinstance(layout, HomeLayout):
+        return render_home_timer(image, _to_render_data(state), fonts, theme, layout)
+    return None
+
+
+def render_focus_region(
+    image, state: AppState, fonts, theme: dict, layout: Union[KitchenLayout, HomeLayout, CalendarLayout, None]
+) -> Optional[list[tuple[int, int, int, int]]]:
+    """Move the focus of a frame drawn by render_app() to `state.ui.focused_index`
+    (home) or `state.ui.calendar_offset_days` (calendar cursor).
+
+    Returns dirty rects, [] if the focus did not move, or None when the frame
+    has to be re-rendered (no per-row update for this screen, or more changed).
+    """
+    if isinstance(layout, KitchenLayout):
+        return rerender_kitchen_rows(image, state, fonts, theme, layout)
+    if isinstance(layout, CalendarLayout):
+        return rerender_calendar_cursor(image, state, fonts, theme, layout)
+    return None
+
+
+def render_signature(state: AppState, *, include_timer: bool = True, include_focus: bool = True) -> tuple:
+    """State that affects the rendered frame; re-render only when this changes.
+
+    include_timer=False leaves out the countdown value, which
+    render_timer_region() can bring up to date on its own; include_focus=False
+    leaves out the focus position and calendar cursor, which
+    render_focus_region() can.
+    """
+    ui = state.ui
+    return (
+        ui.screen,
+        ui.focused_index if include_focus else None,
+        ui.page,
+        ui.idle,
+        ui.widget_mode,
+        ui.timer_seconds if include_timer else None,
+        ui.timer_running,
+        ui.voice_phase,
+        ui.voice_detail,
+        ui.menu_focused,
+        ui.active_menu,
+        ui.calendar_offset_days if include_focus else None,
+        ui.calendar_mode,
+        ui.calendar_selected_index,
+        ui.calendar_version,
+        ui.weather_day_index,
+        ui.memo_index,
+        # Bumped on every toggle/reorder; cheaper than hashing the list.
+        ui.reminders_version,
+    )
@@ -1,132 +1,174 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Optional
 
-from PIL import ImageDraw
+from PIL import Image, ImageDraw
 
+from app.core import clock
+
+from app.core.calendar_index import agenda_events, calendar_index
+from app.core.reminder_index import reminder_index
 from app.core.state import AppState
 from app.shared.draw import truncate_text, text_size, rounded_rect, draw_checkbox
 
+Rect = tuple[int, int, int, int]
 
-def render_calendar(image, state: AppState, fonts, theme: dict) -> None:
-    """Calendar detail view closely matching TSX CalendarView.tsx."""
-    draw = ImageDraw.Draw(image)
-    w, h = image.size
+# Month grids kept (full frames without cursor and agenda); a knob spin over a
+# few months back and forth stays in the cache.
+GRID_CACHE_SIZE = 6
+_GRIDS: OrderedDict[tuple, Image.Image] = OrderedDict()
+
+_DAY_R = 16
+_DOT_R = 2
+
+
+@dataclass
+class _Geom:
+    w: int
+    h: int
+    left_w: int
+    right_x: int
+    pad: int
+    grid_top: int
+    cell_w: int
+    cell_h: int
+
+
+@dataclass
+class _Palette:
+    ink: Any
+    card: Any
+    muted: Any
+    gray_50: Any
+    gray_200: Any
+    gray_300: Any
+
+
+@dataclass
+class CalendarLayout:
+    """What render_calendar() drew, for cursor moves within the month (rerender_calendar_cursor)."""
+
+    size: tuple[int, int]
+    mode: str
+    # Month grid cache key (month, event days, theme, fonts) and everything
+    # else besides the cursor the frame depends on; see _frame_sig().
+    grid_key: tuple = ()
+    sig: tuple = ()
+    cursor: Optional[date] = None
+    # What the agenda list below the header shows (see _agenda_sig()).
+    agenda: tuple = ()
+
+
+def _geom(size: tuple[int, int]) -> _Geom:
+    w, h = size
+    left_w = int(w * 0.45)
+    pad = 24
+    return _Geom(w, h, left_w, left_w, pad, pad + 76, int((left_w - pad * 2) / 7), 40)
 
+
+def _palette(theme: dict) -> _Palette:
     ink = theme.get("ink", 0)
     card = theme.get("card", 255)
-    muted = theme.get("muted", ink)
-
     # For RGB themes we use light grays similar to TSX; for 1-bit everything becomes white anyway.
-    gray_50 = (249, 250, 251) if isinstance(card, tuple) else 255
-    gray_200 = (229, 231, 235) if isinstance(card, tuple) else 255
-    gray_300 = (209, 213, 219) if isinstance(card, tuple) else ink
-
+    rgb = isinstance(card, tuple)
+    return _Palette(
+        ink=ink,
+        card=card,
+        muted=theme.get("muted", ink),
+        gray_50=(249, 250, 251) if rgb else 255,
+        gray_200=(229, 231, 235) if rgb else 255,
+        gray_300=(209, 213, 219) if rgb else ink,
+    )
+
+
+def _cell_center(g: _Geom, first: date, day: int) -> tuple[int, int]:
+    start_offset = int(first.weekday() + 1) % 7  # Python Mon=0, TSX Sun=0
+    idx = start_offset + (day - 1)
+    cx = g.pad + (idx % 7) * g.cell_w + g.cell_w // 2
+    cy = g.grid_top + 18 + (idx // 7) * g.cell_h + 16
+    return cx, cy
+
+
+def _cell_box(g: _Geom, first: date, day: int) -> Rect:
+    """Pixels a day cell can touch (chip, label, dots); end-exclusive."""
+    cx, cy = _cell_center(g, first, day)
+    return (cx - _DAY_R - 1, cy - _DAY_R - 1, cx + _DAY_R + 2, cy + _DAY_R + 4 + _DOT_R * 2 + 2)
+
+
+def _draw_day(
+    draw, pal: _Palette, font, cx: int, cy: int, day: int, *, selected: bool, today: bool, has_event: bool, has_task: bool
+) -> None:
+    r = _DAY_R
+    # Circle chip (w-8/h-8)
+    if selected:
+        draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=pal.ink, outline=pal.ink, width=2)
+        fill = pal.card
+    else:
+        # hover not applicable; draw only outline ring for today
+        if today:
+            draw.ellipse((cx - r, cy - r, cx + r, cy + r), outline=pal.ink, width=2)
+        fill = pal.ink
+
+    label = str(day)
+    lw, lh = text_size(draw, label, font)
+    draw.text((cx - lw // 2, cy - lh // 2), label, font=font, fill=fill)
+
+    # Dot indicators (events + incomplete tasks) like TSX.
+    dot_y = cy + r + 4
+    dot_r = _DOT_R
+    dx = cx - 4
+    if has_event:
+        draw.ellipse((dx - dot_r, dot_y, dx + dot_r, dot_y + dot_r * 2), fill=pal.card if selected else pal.ink)
+        dx += 6
+    if has_task:
+        # hollow dot
+        outline = pal.card if selected else pal.ink
+        draw.ellipse((dx - dot_r, dot_y, dx + dot_r, dot_y + dot_r * 2), outline=outline, width=1)
+
+
+def _draw_grid(image, g: _Geom, pal: _Palette, fonts, theme: dict, first: date, event_days: set[int]) -> None:
+    """Everything but the cursor cell and the right column: frame, month title, all day cells."""
+    draw = ImageDraw.Draw(image)
+    w, h = g.w, g.h
     border_w = int(theme.get("detail_border_width", 4) or 4)
     divider_w = int(theme.get("detail_divider_width", 4) or 4)
     radius = int(theme.get("card_radius", 12) or 12) + 4
 
     # Outer container
-    draw.rectangle((0, 0, w, h), fill=card)
-    rounded_rect(draw, (0, 0, w - 1, h - 1), radius=radius, outline=ink, width=border_w, fill=card)
-
-    left_w = int(w * 0.45)
-    right_x = left_w
+    draw.rectangle((0, 0, w, h), fill=pal.card)
+    rounded_rect(draw, (0, 0, w - 1, h - 1), radius=radius, outline=pal.ink, width=border_w, fill=pal.card)
 
     # Left column background + divider
-    draw.rectangle((0, 0, left_w, h), fill=gray_50)
-    draw.rectangle((right_x - divider_w // 2, 0, right_x + divider_w // 2, h), fill=ink)
+    draw.rectangle((0, 0, g.left_w, h), fill=pal.gray_50)
+    draw.rectangle((g.right_x - divider_w // 2, 0, g.right_x + divider_w // 2, h), fill=pal.ink)
 
-    pad = 24
+    pad = g.pad
     month_font = fonts.get("inter_black", 30)
     year_font = fonts.get("jet_bold", 18)
     week_font = fonts.get("inter_bold", 12)
     day_font = fonts.get("jet_bold", 12)
 
-    # Date model: cursor follows rotary-driven offset.
-    now_dt = datetime.now()
-    today = now_dt.date()
-    off = int(state.ui.calendar_offset_days or 0)
-    cursor = today + timedelta(days=off)
-    year = cursor.year
-    month = cursor.month
-    month_name = cursor.strftime("%B").upper()
-
-    draw.text((pad, pad), month_name, font=month_font, fill=ink)
-    draw.text((pad, pad + 36), str(year), font=year_font, fill=muted)
-
-    # Calendar grid
-    grid_top = pad + 76
-    cell_h = 40
-    cell_w = int((left_w - pad * 2) / 7)
+    draw.text((pad, pad), first.strftime("%B").upper(), font=month_font, fill=pal.ink)
+    draw.text((pad, pad + 36), str(first.year), font=year_font, fill=pal.muted)
 
     week = ["S", "M", "T", "W", "T", "F", "S"]
     for i, ch in enumerate(week):
         tw, th = text_size(draw, ch, week_font)
-        x = pad + i * cell_w + (cell_w - tw) // 2
-        draw.text((x, grid_top), ch, font=week_font, fill=muted)
+        x = pad + i * g.cell_w + (g.cell_w - tw) // 2
+        draw.text((x, g.grid_top), ch, font=week_font, fill=pal.muted)
 
-    # First day of month
-    first = cursor.replace(day=1)
-    start_offset = int(first.weekday() + 1) % 7  # Python Mon=0, TSX Sun=0
-    # Days in month
     next_month = (first.replace(day=28) + timedelta(days=4)).replace(day=1)
-    days_in_month = (next_month - first).days
-
-    def iso(d):
-        return d.strftime("%Y-%m-%d")
-
-    today_iso = iso(now_dt)
-    cursor_iso = iso(datetime(cursor.year, cursor.month, cursor.day))
-
-    # Place each day
-    x0 = pad
-    y0 = grid_top + 18
-    for day in range(1, days_in_month + 1):
-        idx = start_offset + (day - 1)
-        row = idx // 7
-        col = idx % 7
-        cx = x0 + col * cell_w + cell_w // 2
-        cy = y0 + row * cell_h + 16
-
-        is_selected = (day == cursor.day)
-        is_today = (day == today.day and off == 0 and month == today.month and year == today.year)
-
-        # Circle chip (w-8/h-8)
-        r = 16
-        if is_selected:
-            draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=ink, outline=ink, width=2)
-            fill = card
-        else:
-            # hover not applicable; draw only outline ring for today
-            if is_today:
-                draw.ellipse((cx - r, cy - r, cx + r, cy + r), outline=ink, width=2)
-            fill = ink
-
-        label = str(day)
-        lw, lh = text_size(draw, label, day_font)
-        draw.text((cx - lw // 2, cy - lh // 2), label, font=day_font, fill=fill)
-
-        # Dot indicators (events + incomplete tasks) like TSX
-        # We don't have per-day dates yet in the model; approximate:
-        # Only show dots for the currently-selected cursor day (we don't have real dates yet).
-        has_event = (day == cursor.day and off == 0 and len(state.model.calendar) > 0)
-        has_task = (day == cursor.day and off == 0 and any(not r.completed for r in state.model.reminders))
-        dot_y = cy + r + 4
-        dot_r = 2
-        dx = cx - 4
-        if has_event:
-            draw.ellipse((dx - dot_r, dot_y, dx + dot_r, dot_y + dot_r * 2), fill=card if is_selected else ink)
-            dx += 6
-        if has_task:
-            # hollow dot
-            outline = card if is_selected else ink
-            draw.ellipse((dx - dot_r, dot_y, dx + dot_r, dot_y + dot_r * 2), outline=outline, width=1)
+    for day in range(1, (next_month - first).days + 1):
+        cx, cy = _cell_center(g, first, day)
+        _draw_day(draw, pal, day_font, cx, cy, day, selected=False, today=False, has_event=day in event_days, has_task=False)
 
     # Left footer hints are dev-only; keep them hidden on hardware by default.
     if bool(theme.get("calendar_show_hints", False)):
         footer_y = h - 92
-        draw.line((pad, footer_y, left_w - pad, footer_y), fill=gray_200, width=2)
+        draw.line((pad, footer_y, g.left_w - pad, footer_y), fill=pal.gray_200, width=2)
         hint_font = fonts.get("jet_bold", 10)
         kbd_font = fonts.get("jet_bold", 10)
         lines = [
@@ -141,14 +183,80 @@ def render_calendar(image, state: AppState, fonts, theme: dict) -> None:
             by0 = y - 2
             bx1 = bx0 + kw + 10
             by1 = by0 + kh + 6
-            rounded_rect(draw, (bx0, by0, bx1, by1), radius=4, outline=gray_300, width=1, fill=card)
-            draw.text((bx0 + 5, y + 1), kbd, font=kbd_font, fill=ink)
-            draw.text((bx1 + 10, y + 1), txt, font=hint_font, fill=muted)
+            rounded_rect(draw, (bx0, by0, bx1, by1), radius=4, outline=pal.gray_300, width=1, fill=pal.card)
+            draw.text((bx0 + 5, y + 1), kbd, font=kbd_font, fill=pal.ink)
+            draw.text((bx1 + 10, y + 1), txt, font=hint_font, fill=pal.muted)
             y += 22
 
-    # Right column
+
+def _grid_key(image, state: AppState, fonts, theme: dict, first: date) -> tuple:
+    # Theme values and font objects the grid is drawn with (fonts in the key
+    # stay alive, so their identity can't be reused by other fonts).
+    theme_key = tuple(
+        (k, theme.get(k))
+        for k in ("ink", "card", "muted", "detail_border_width", "detail_divider_width", "card_radius", "calendar_show_hints")
+    )
+    font_key = tuple(fonts.get(*spec) for spec in (("inter_black", 30), ("jet_bold", 18), ("inter_bold", 12), ("jet_bold", 12), ("jet_bold", 10)))
+    event_days = frozenset(calendar_index(state).days_with_events(first.year, first.month))
+    return (image.size, image.mode, first.year, first.month, event_days, theme_key, font_key)
+
+
+def _month_grid(image, key: tuple, g: _Geom, pal: _Palette, fonts, theme: dict, first: date) -> Image.Image:
+    grid = _GRIDS.get(key)
+    if grid is None:
+        grid = Image.new(image.mode, image.size)
+        _draw_grid(grid, g, pal, fonts, theme, first, set(key[4]))
+        _GRIDS[key] = grid
+        while len(_GRIDS) > GRID_CACHE_SIZE:
+            _GRIDS.popitem(last=False)
+    else:
+        _GRIDS.move_to_end(key)
+    return grid
+
+
+def _draw_cursor(image, state: AppState, fonts, g: _Geom, pal: _Palette, key: tuple, cursor: date, today: date) -> None:
+    off = int(state.ui.calendar_offset_days or 0)
+    is_today = cursor.day == today.day and off == 0 and cursor.month == today.month and cursor.year == today.year
+    # Tasks have no dates yet: their dot stays on today's cursor cell.
+    has_task = off == 0 and reminder_index(state).count(completed=False) > 0
+    cx, cy = _cell_center(g, cursor.replace(day=1), cursor.day)
+    _draw_day(
+        ImageDraw.Draw(image),
+        pal,
+        fonts.get("jet_bold", 12),
+        cx,
+        cy,
+        cursor.day,
+        selected=True,
+        today=is_today,
+        has_event=cursor.day in key[4],
+        has_task=has_task,
+    )
+
+
+_HEADER_H = 86
+
+
+def _header_box(g: _Geom) -> Rect:
+    """The agenda column's date header, including its 2 px rule; end-exclusive."""
+    return (g.right_x, 0, g.w, _HEADER_H + 2)
+
+
+def _agenda_sig(state: AppState, events: list) -> tuple:
+    # The list below the header; tasks are shown on today only.
+    return (tuple((occ.event.eid, occ.label) for occ in events), int(state.ui.calendar_offset_days or 0) == 0)
+
+
+def _draw_agenda(image, state: AppState, fonts, theme: dict, g: _Geom, pal: _Palette, cursor: date, *, header_only: bool = False) -> None:
+    """Right column: cursor day header, its events and (today only) the tasks."""
+    draw = ImageDraw.Draw(image)
+    w = g.w
+    ink, card, muted = pal.ink, pal.card, pal.muted
+    gray_50, gray_200, gray_300 = pal.gray_50, pal.gray_200, pal.gray_300
+    off = int(state.ui.calendar_offset_days or 0)
+    right_x = g.right_x
     right_w = w - right_x
-    header_h = 86
+    header_h = _HEADER_H
     header_pad = 26
     draw.rectangle((right_x, 0, w, header_h), fill=card)
     draw.line((right_x, header_h, w, header_h), fill=ink, width=2)
@@ -166,9 +274,12 @@ def render_calendar(image, state: AppState, fonts, theme: dict) -> None:
     esc = "ESC"
     esc_w, esc_h = text_size(draw, esc, weekday_font)
     draw.text((w - header_pad - esc_w, 24), esc, font=weekday_font, fill=muted)
+    if header_only:
+        return
 
-    # Agenda items: only show content for "today" until mobile provides real dates.
-    if off != 0:
+    # Agenda items: the cursor day's events; tasks (undated) only on today.
+    events = agenda_events(state)
+    if off != 0 and not events:
         free = "FREE DAY"
         fw, fh = text_size(draw, free, title_font)
         draw.text((right_x + (right_w - fw) / 2, header_h + 120), free, font=title_font, fill=muted)
@@ -190,8 +301,9 @@ def render_calendar(image, state: AppState, fonts, theme: dict) -> None:
     selected = int(state.ui.calendar_selected_index or 0)
     mode = (state.ui.calendar_mode or "date")
 
-    # Render events (from model)
-    for i, ev in enumerate(state.model.calendar[:3]):
+    # Render events (from the calendar index)
+    for i, occ in enumerate(events):
+        ev = occ.event
         # border-l highlight
         box_h = 62
         is_sel = (mode == "agenda" and selected == i)
@@ -200,7 +312,7 @@ def render_calendar(image, state: AppState, fonts, theme: dict) -> None:
             draw.rectangle((list_x0 + 4, y, list_x1, y + box_h), fill=gray_50)
 
         # time pill
-        time_txt = (ev.when or "08:00").split()[-1]
+        time_txt = occ.label
         pill_w, pill_h = text_size(draw, time_txt, event_time_font)
         pill_box = (list_x0 + 14, y + 6, list_x0 + 14 + pill_w + 10, y + 6 + pill_h + 6)
         rounded_rect(draw, pill_box, radius=4, outline=gray_300, width=1, fill=gray_200)
@@ -210,13 +322,16 @@ def render_calendar(image, state: AppState, fonts, theme: dict) -> None:
 
         y += box_h + gap
 
+    if off != 0:
+        return
+
     # Render a few tasks (reminders)
     for ti, r in enumerate(state.model.reminders[:4]):
         box_h = 62
         box = (list_x0, y, list_x1, y + box_h)
         fill = (243, 244, 246) if (isinstance(card, tuple) and r.completed) else card
         outline = ink if not r.completed else gray_200
-        is_sel = (mode == "agenda" and selected == (len(state.model.calendar) + ti))
+        is_sel = (mode == "agenda" and selected == (len(events) + ti))
         rounded_rect(draw, box, radius=10, outline=outline, width=2, fill=fill)
         if is_sel:
             rounded_rect(draw, box, radius=10, outline=ink, width=3, fill=fill)
@@ -236,3 +351,84 @@ def render_calendar(image, state: AppState, fonts, theme: dict) -> None:
             draw.text((text_x, y + 38), meta.upper(), font=task_meta_font, fill=muted)
 
         y += box_h + 10
+
+
+def _frame_sig(state: AppState, theme: dict, today: date) -> tuple:
+    # Like home_kitchen._layout_sig(): model identity is a revision under snapshots.
+    ui = state.ui
+    return (
+        id(state.model),
+        int(ui.calendar_version or 0),
+        int(ui.reminders_version or 0),
+        ui.calendar_mode,
+        int(ui.calendar_selected_index or 0),
+        id(theme),
+        today,
+    )
+
+
+def render_calendar(image, state: AppState, fonts, theme: dict) -> CalendarLayout:
+    """Calendar detail view closely matching TSX CalendarView.tsx.
+
+    The month grid (frame, month title, day cells with their event dots) comes
+    from a small cache keyed by month, event days, theme and fonts; each frame
+    only adds the cursor cell and draws the agenda column.
+    """
+    g = _geom(image.size)
+    pal = _palette(theme)
+
+    # Date model: cursor follows rotary-driven offset.
+    today = clock.local_now().date()
+    cursor = today + timedelta(days=int(state.ui.calendar_offset_days or 0))
+    first = cursor.replace(day=1)
+
+    key = _grid_key(image, state, fonts, theme, first)
+    image.paste(_month_grid(image, key, g, pal, fonts, theme, first), (0, 0))
+    _draw_cursor(image, state, fonts, g, pal, key, cursor, today)
+    _draw_agenda(image, state, fonts, theme, g, pal, cursor)
+    agenda = _agenda_sig(state, agenda_events(state))
+    return CalendarLayout(image.size, image.mode, key, _frame_sig(state, theme, today), cursor, agenda)
+
+
+def rerender_calendar_cursor(image, state: AppState, fonts, theme: dict, layout: CalendarLayout) -> Optional[list[Rect]]:
+    """Apply a cursor move within the shown month to a frame drawn by render_calendar().
+
+    Restores the old cursor cell from the cached month grid, draws the new one
+    and redraws the agenda header; the list below it only when the new day's
+    agenda differs. Returns their dirty rects (x aligned to 8 px), [] when the
+    cursor did not move, or None when a full render is needed (another month,
+    or anything else changed); `layout` is updated on success.
+    """
+    if layout.size != image.size or layout.mode != image.mode or layout.cursor is None:
+        return None
+    today = clock.local_now().date()
+    if layout.sig != _frame_sig(state, theme, today):
+        return None
+    cursor = today + timedelta(days=int(state.ui.calendar_offset_days or 0))
+    if cursor == layout.cursor:
+        return []
+    first = cursor.replace(day=1)
+    if first != layout.cursor.replace(day=1):
+        return None
+    key = _grid_key(image, state, fonts, theme, first)
+    if key != layout.grid_key:
+        return None
+
+    g = _geom(image.size)
+    pal = _palette(theme)
+    grid = _month_grid(image, key, g, pal, fonts, theme, first)
+    old = _cell_box(g, first, layout.cursor.day)
+    agenda = _agenda_sig(state, agenda_events(state))
+    same = agenda == layout.agenda
+    right = _header_box(g) if same else (g.right_x, 0, g.w, g.h)
+    for box in (old, right):
+        image.paste(grid.crop(box), box[:2])
+    _draw_cursor(image, state, fonts, g, pal, key, cursor, today)
+    _draw_agenda(image, state, fonts, theme, g, pal, cursor, header_only=same)
+    layout.cursor = cursor
+    layout.agenda = agenda
+
+    rects = []
+    for x0, y0, x1, y1 in (old, _cell_box(g, first, cursor.day), right):
+        rects.append((x0 & ~7, y0, min(g.w, (x1 + 7) & ~7), y1))
+    return rects
@@ -1,7 +1,12 @@
-from datetime import datetime
+from dataclasses import dataclass
 import math
+from typing import Optional
+
 from PIL import ImageDraw
 
+from app.core import clock
+
+from app.shared.glyphs import GlyphRun, digit_glyphs, format_timer
 from app.shared.draw import (
     center_text,
     center_text_spaced,
@@ -11,11 +16,45 @@ from app.shared.draw import (
     draw_text_spaced,
     draw_wifi,
     draw_weather_icon,
+    text_origin_centered_clamped,
     text_size,
     text_width_spaced,
+    truncate_text,
 )
 from app.ui.layout import compute_layout
-from app.ui.widgets import draw_card, draw_reminder_item
+from app.ui.widgets import draw_card, draw_reminder_item, draw_voice_glyph, voice_label
+
+
+@dataclass
+class HomeClock:
+    """The clock text as drawn, for minute updates (render_home_clock)."""
+
+    text: str
+    date: str
+    # Drawn text bbox (x0, y0, x1, y1), end-exclusive.
+    box: tuple
+    # (font, text height): the underline and date below move if these change.
+    key: tuple
+    cx: float
+    cy: float
+    xmin: int
+    xmax: int
+
+
+@dataclass
+class HomeLayout:
+    size: tuple
+    mode: str
+    # None while the clock slot shows the timer or the voice overlay.
+    clock: Optional[HomeClock] = None
+    # The countdown in the clock slot while the TIMER widget is active.
+    timer: Optional[GlyphRun] = None
+
+
+def _to_rgb(c):
+    if isinstance(c, int):
+        return (c, c, c)
+    return c
 
 
 def _format_date(now):
@@ -79,15 +118,10 @@ def render_home(image, data, fonts, theme=None, overlay=None):
     pill_radius = theme.get("pill_radius", 11)
 
     if image.mode == "RGB":
-        def to_rgb(c):
-            if isinstance(c, int):
-                return (c, c, c)
-            return c
-
-        ink = to_rgb(ink)
-        card = to_rgb(card)
-        muted = to_rgb(muted)
-        border = to_rgb(border)
+        ink = _to_rgb(ink)
+        card = _to_rgb(card)
+        muted = _to_rgb(muted)
+        border = _to_rgb(border)
 
     draw = ImageDraw.Draw(image)
     layout = compute_layout(image.width, image.height)
@@ -115,7 +149,7 @@ def render_home(image, data, fonts, theme=None, overlay=None):
     draw_card(draw, weather_card, radius=card_radius, outline=border, width=border_width, fill=card)
     draw_card(draw, right_card, radius=card_radius, outline=border, width=border_width, fill=card)
 
-    _draw_left_panel(
+    clock_info, timer_run = _draw_left_panel(
         draw,
         left_card,
         weather_card,
@@ -134,6 +168,7 @@ def render_home(image, data, fonts, theme=None, overlay=None):
         wifi_stroke,
         battery_stroke,
         pill_radius,
+        image=image,
     )
     _draw_right_panel(
         draw,
@@ -152,6 +187,7 @@ def render_home(image, data, fonts, theme=None, overlay=None):
         overlay,
         card_radius,
     )
+    return HomeLayout(size=image.size, mode=image.mode, clock=clock_info, timer=timer_run)
 
 
 def _draw_left_panel(
@@ -173,6 +209,7 @@ def _draw_left_panel(
     wifi_stroke,
     battery_stroke,
     pill_radius,
+    image=None,
 ):
     x0, y0, x1, y1 = left_card
     padding = 20
@@ -198,52 +235,53 @@ def _draw_left_panel(
     pt_w, pt_h = text_size(draw, percent_text, percent_font)
     draw.text((battery_x - pt_w - 6, status_y + 2), percent_text, font=percent_font, fill=ink)
 
-    now = datetime.now()
+    now = clock.local_now()
 
     # TSX parity: the clock panel is a widget slot (CLOCK or TIMER) with a voice overlay.
     voice_active = bool(data.get("voice_active"))
+    voice_phase = str(data.get("voice_phase") or ("listening" if voice_active else ""))
     widget_mode = str(data.get("widget_mode") or "clock").lower()
     timer_seconds = int(data.get("timer_seconds") or 0)
     timer_running = bool(data.get("timer_running"))
 
     if widget_mode == "timer":
-        mm = max(0, timer_seconds) // 60
-        ss = max(0, timer_seconds) % 60
-        time_str = f"{mm:02d}:{ss:02d}"
+        time_str = format_timer(timer_seconds)
         date_str = "TIMER" if timer_running else "PAUSED"
     elif voice_active:
         time_str = ""
-        date_str = "LISTENING..."
+        date_str = voice_label(voice_phase)
     else:
         time_str = data.get("time") or now.strftime("%H:%M")
         date_str = data.get("date") or _format_date(now)
 
-    time_font_key = theme.get("time_font", "jet_extrabold")
     date_font_key = theme.get("date_font", "inter_bold")
     loc_font_key = theme.get("loc_font", "inter_bold")
-    time_size = theme.get("time_size", 112)
-    time_autofit = theme.get("time_autofit", True)
-    if time_autofit:
-        time_font = _fit_text_font(draw, fonts, time_font_key, time_size, time_str, x1 - x0 - 36, min_size=60)
-    else:
-        time_font = fonts.get(time_font_key, time_size)
+    # The countdown is laid out for "00:00" so it does not move while it ticks.
+    time_font = _time_font(draw, fonts, theme, "00:00" if widget_mode == "timer" else time_str, x1 - x0 - 36)
     date_font = fonts.get(date_font_key, 22)
     loc_font = fonts.get(loc_font_key, 12)
 
     clock_center_x = x0 + (x1 - x0) / 2
     clock_center_y = y0 + (y1 - y0) / 2 + theme.get("time_center_y", -20)
+    clock_info = None
+    timer_run = None
     if voice_active:
-        # Minimal mic glyph (robust in 1-bit mode).
+        # Minimal phase glyph (robust in 1-bit mode).
         mic_r = 26
-        cx = int(clock_center_x)
-        cy = int(clock_center_y) - 10
-        draw.ellipse((cx - mic_r, cy - mic_r, cx + mic_r, cy + mic_r), outline=ink, width=3)
-        draw.line((cx, cy + mic_r, cx, cy + mic_r + 18), fill=ink, width=3)
-        draw.line((cx - 18, cy + mic_r + 18, cx + 18, cy + mic_r + 18), fill=ink, width=3)
+        draw_voice_glyph(draw, int(clock_center_x), int(clock_center_y) - 10, mic_r, voice_phase, ink=ink, width=3)
         time_h = mic_r * 2
+    elif widget_mode == "timer" and image is not None:
+        # Fixed-width digit cells from cached glyphs; render_home_timer() redraws changed cells.
+        glyphs = digit_glyphs(time_font)
+        time_h = glyphs.height
+        tx = int(round(clock_center_x - glyphs.width(time_str) / 2))
+        tx = max(x0 + 20, min(x1 - 20 - glyphs.width(time_str), tx))
+        ty = int(round(clock_center_y - glyphs.height / 2)) - glyphs.top
+        timer_run = GlyphRun(glyphs, (tx, ty), time_str)
+        glyphs.draw(image, timer_run.xy, time_str, ink)
     else:
         time_w, time_h = text_size(draw, time_str, time_font)
-        draw_text_centered_clamped(
+        xy = draw_text_centered_clamped(
             draw,
             time_str,
             clock_center_x,
@@ -253,6 +291,17 @@ def _draw_left_panel(
             xmax=x1 - 20,
             fill=ink,
         )
+        if widget_mode != "timer":
+            clock_info = HomeClock(
+                text=time_str,
+                date=date_str,
+                box=_text_box(draw, xy, time_str, time_font),
+                key=(time_font, time_h),
+                cx=clock_center_x,
+                cy=clock_center_y,
+                xmin=x0 + 20,
+                xmax=x1 - 20,
+            )
 
     line_y = clock_center_y + time_h / 2 + theme.get("underline_offset", 8)
     if not voice_active:
@@ -269,6 +318,14 @@ def _draw_left_panel(
     date_y = line_y + 12
     draw_text_spaced(draw, date_str, date_x, date_y, date_font, spacing=2, fill=ink)
 
+    voice_detail = str(data.get("voice_detail") or "") if voice_active and widget_mode != "timer" else ""
+    if voice_detail:
+        # Transcript / what was added / error, in place of the location pill.
+        detail_font = fonts.get("inter_bold", 16)
+        detail = truncate_text(draw, voice_detail, detail_font, x1 - x0 - 32)
+        detail_w = text_size(draw, detail, detail_font)[0]
+        draw.text((x0 + (x1 - x0 - detail_w) // 2, date_y + date_h + 12), detail, font=detail_font, fill=ink)
+
     location = data.get("location", "")
     if location and not (voice_active or widget_mode == "timer"):
         pill_w = max(86, text_size(draw, location, loc_font)[0] + 18)
@@ -292,6 +349,66 @@ def _draw_left_panel(
         )
 
     _draw_weather_strip(draw, weather_card, data, fonts, border, weather_divider_width, icon_stroke, ink, muted, theme)
+    return clock_info, timer_run
+
+
+def _time_font(draw, fonts, theme, time_str, max_width):
+    time_font_key = theme.get("time_font", "jet_extrabold")
+    time_size = theme.get("time_size", 112)
+    if theme.get("time_autofit", True):
+        return _fit_text_font(draw, fonts, time_font_key, time_size, time_str, max_width, min_size=60)
+    return fonts.get(time_font_key, time_size)
+
+
+def _text_box(draw, xy, text, font):
+    x0, y0, x1, y1 = draw.textbbox(xy, text, font=font)
+    return (int(x0), int(y0), int(x1) + 1, int(y1) + 1)
+
+
+def render_home_clock(image, data, fonts, theme, layout):
+    """
+    Bring the clock of a frame drawn by render_home() to the current minute.
+
+    Redraws only the HH:MM text and returns its dirty rect (x aligned to 8 px),
+    [] if nothing on screen depends on the minute, or None when a full render
+    is needed (new day, clock font/height change).
+    """
+    theme = theme or {}
+    if layout.size != image.size or layout.mode != image.mode:
+        return None
+    c = layout.clock
+    if c is None:
+        return [] if layout.timer is not None or data.get("voice_active") else None
+    now = clock.local_now()
+    if (data.get("date") or _format_date(now)) != c.date:
+        return None
+    time_str = data.get("time") or now.strftime("%H:%M")
+    if time_str == c.text:
+        return []
+
+    draw = ImageDraw.Draw(image)
+    x0 = c.xmin - 20
+    time_font = _time_font(draw, fonts, theme, time_str, (c.xmax + 20) - x0 - 36)
+    if (time_font, text_size(draw, time_str, time_font)[1]) != c.key:
+        return None
+    ink = theme.get("ink", 0)
+    card = theme.get("card", 255)
+    if image.mode == "RGB":
+        ink = _to_rgb(ink)
+        card = _to_rgb(card)
+
+    xy = text_origin_centered_clamped(draw, time_str, c.cx, c.cy, time_font, c.xmin, c.xmax)
+    box = _text_box(draw, xy, time_str, time_font)
+    bx0, by0 = min(c.box[0], box[0]), min(c.box[1], box[1])
+    bx1, by1 = max(c.box[2], box[2]), max(c.box[3], box[3])
+    draw.rectangle((bx0, by0, bx1 - 1, by1 - 1), fill=card)
+    draw.text(xy, time_str, font=time_font, fill=ink)
+
+    c.text = time_str
+    c.box = box
+    ax0 = bx0 & ~7
+    ax1 = min(image.size[0], (bx1 + 7) & ~7)
+    return [(ax0, by0, ax1, by1)]
 
 
 def _draw_weather_strip(draw, weather_card, data, fonts, border, divider_width, icon_stroke, ink, muted, theme):
@@ -465,3 +582,25 @@ def _draw_right_panel(
 
     # Focus ring for header sections (clock / weather) is drawn by caller (render_app),
     # because home.py doesn't know the global focused_index mapping.
+
+
+def render_home_timer(image, data, fonts, theme, layout):
+    """
+    Redraw the countdown of a frame drawn by render_home() to data["timer_seconds"].
+
+    Only digit cells that changed are repainted. Returns the dirty rect (x
+    aligned to 8 px), [] if the text did not change, or None when a full
+    render is needed.
+    """
+    theme = theme or {}
+    run = layout.timer
+    if run is None or layout.size != image.size or layout.mode != image.mode:
+        return None
+    if str(data.get("widget_mode") or "clock").lower() != "timer":
+        return None
+    ink = theme.get("ink", 0)
+    card = theme.get("card", 255)
+    if image.mode == "RGB":
+        ink = _to_rgb(ink)
+        card = _to_rgb(card)
+    return run.update(image, format_timer(data.get("timer_seconds")), ink, card)
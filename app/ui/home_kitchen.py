@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
 import time
+from typing import Any, Optional
 
 from PIL import ImageDraw
 
+from app.core import clock
 from app.core.kitchen_queue import kitchen_queue_theme_key, kitchen_visible_task_indices
-from app.core.state import AppState
+from app.core.reminder_index import reminder_index
+from app.core.state import AppState, WidgetMode
+from app.shared.glyphs import GlyphRun, digit_glyphs, format_timer
 from app.shared.draw import draw_text_spaced, draw_weather_icon, rounded_rect, text_size, text_width_spaced, truncate_text
+from app.ui.widgets import voice_label
 
 
 def _to_rgb(c):
@@ -250,13 +256,12 @@ def _weather_word(icon_name: str) -> str:
     return mapping.get(parts[0], parts[0].upper())
 
 
-def _group_tasks(state: AppState):
-    fridge = [r for r in state.model.reminders if (r.category or "") == "fridge"]
-    shop = [r for r in state.model.reminders if (r.category or "") != "fridge"]
-
-    # Keep incomplete first, then completed (stable within each group).
-    fridge = sorted(fridge, key=lambda r: (r.completed,))
-    shop = sorted(shop, key=lambda r: (r.completed,))
+def _group_tasks(state: AppState, fridge_limit: int, shop_limit: int):
+    """Rows for both sections (incomplete first, then completed; stable within each group)."""
+    index = reminder_index(state)
+    reminders = state.model.reminders
+    fridge = [reminders[i] for i in index.grouped(fridge_limit, category="fridge")]
+    shop = [reminders[i] for i in index.grouped(shop_limit, exclude="fridge")]
     return fridge, shop
 
 
@@ -342,16 +347,150 @@ def _compact_badge_text(text: str) -> str:
     return min(variants, key=lambda v: (len(v.replace(" ", "")), len(v)))
 
 
-def render_home_kitchen(image, state: AppState, fonts, theme: dict) -> None:
-    t = _theme(theme)
-    draw = ImageDraw.Draw(image)
-    if not bool(t.get("b_text_antialias", False)):
-        try:
-            draw.fontmode = "1"
-        except Exception:
-            pass
-    w, h = image.size
+@dataclass
+class _RowCtx:
+    """What the right-panel row drawers need; shared by full render and row re-render."""
+
+    draw: ImageDraw.ImageDraw
+    fonts: Any
+    t: dict
+    ink: Any
+    card: Any
+    panel_mode: bool
+    double_pass: bool
+    double_pass_shift: int
+    split_x: int
+    inner_x0: int
+    inner_x1: int
+    inv_row_h: int
+    shop_row_h: int
+    badge_key: str
+    badge_size: int
+    f_inv_item: Any
+    f_inv_item_focus: Any
+    f_shop_item: Any
+    f_shop_item_focus: Any
+    focus_style: str
+    focus_pad_x: int
+    focus_pad_y: int
+    focus_right_trim: int
+    focus_radius: int
+    focus_w: int
+
+
+@dataclass
+class KitchenRow:
+    rid: str
+    kind: str  # "inventory" | "shopping"
+    y: int
+    # Pixels owned by the row (x0, y0, x1, y1), end-exclusive: repainting this
+    # band with the card color and redrawing the row reproduces a full render.
+    box: tuple[int, int, int, int]
+
+
+@dataclass
+class KitchenClock:
+    """The clock text as drawn, for minute updates (render_kitchen_clock)."""
+
+    text: str
+    date: tuple[str, str]
+    # Drawn text bbox (x0, y0, x1, y1), end-exclusive.
+    box: tuple[int, int, int, int]
+    # Flow font size + baseline; if a new time string changes these the
+    # weekday/date below move too, which needs a full render.
+    key: tuple
+    lx0: int
+    top_y: int
+    weather_left: int
+    # Top of the weekday line; the clock may be repainted only above it.
+    floor_y: int
+
+
+@dataclass
+class KitchenLayout:
+    """What render_home_kitchen() drew, for incremental focus updates."""
+
+    size: tuple[int, int]
+    mode: str
+    rows: list[KitchenRow] = field(default_factory=list)
+    focus_rid: str = ""
+    left_focus: bool = False
+    # Everything besides focus/idle/clock that the frame depends on; see _layout_sig().
+    sig: tuple = ()
+    minute: str = ""
+    clock: Optional[KitchenClock] = None
+    # The countdown in the clock slot while the TIMER widget is active.
+    timer: Optional[GlyphRun] = None
+
+
+@dataclass
+class _ClockGeom:
+    font: Any
+    x: int
+    y: int
+    flow_box: tuple[int, int, int, int]
+    key: tuple
+
+
+def _kitchen_clock_geom(draw, t: dict, fonts, time_str: str, lx0: int, top_y: int, weather_left: int) -> _ClockGeom:
+    # Keep clock clear of the weather stack on the right.
+    time_font_size = int(t["b_time_size"])
+    time_min_size = int(t["b_time_min_size"])
+    while time_font_size > time_min_size:
+        f_probe = fonts.get("inter_black", _font_px(time_font_size))
+        tw_probe, _ = text_size(draw, time_str, f_probe)
+        if tw_probe <= (weather_left - lx0 - int(t["b_time_weather_gap"])):
+            break
+        time_font_size -= 2
+    f_time = fonts.get("inter_black", _font_px(time_font_size))
+
+    # Keep downstream text anchors stable: weekday/date continue to flow from the
+    # legacy clock baseline, while the visible clock can be shifted and enlarged.
+    time_flow_box = draw.textbbox((lx0, top_y), time_str, font=f_time)
+
+    clock_x = lx0 + int(t.get("b_time_display_x_offset", -10))
+    clock_y = top_y + int(t.get("b_time_display_y_offset", -12))
+    display_scale = max(1.0, float(t.get("b_time_display_scale", 1.18)))
+    display_size = max(time_font_size, int(round(time_font_size * display_scale)))
+    display_font = fonts.get("inter_black", _font_px(display_size))
+    while display_size > time_font_size:
+        dw, _ = text_size(draw, time_str, display_font)
+        if dw <= (weather_left - clock_x - int(t["b_time_weather_gap"])):
+            break
+        display_size -= 2
+        display_font = fonts.get("inter_black", _font_px(display_size))
 
+    return _ClockGeom(
+        font=display_font,
+        x=clock_x,
+        y=clock_y,
+        flow_box=tuple(time_flow_box),
+        key=(time_font_size, time_flow_box[3]),
+    )
+
+
+def _kitchen_timer_text(state: AppState) -> Optional[str]:
+    if state.ui.widget_mode != WidgetMode.TIMER:
+        return None
+    return format_timer(state.ui.timer_seconds)
+
+
+def _kitchen_date(now) -> tuple[str, str, str]:
+    time_str = now.strftime("%H:%M")
+    weekday = now.strftime("%A").upper()
+    try:
+        month_day = now.strftime("%B %-d, %Y")
+    except Exception:
+        month_day = now.strftime("%B %d, %Y")
+    return time_str, weekday, month_day
+
+
+def _text_box(draw, xy: tuple[int, int], text: str, font) -> tuple[int, int, int, int]:
+    x0, y0, x1, y1 = draw.textbbox(xy, text, font=font)
+    return (int(x0), int(y0), int(x1) + 1, int(y1) + 1)
+
+
+def _colors(image, theme: dict):
     card = theme.get("card", (252, 252, 252))
     ink = theme.get("ink", (17, 17, 17))
     if image.mode == "RGB":
@@ -362,6 +501,340 @@ def render_home_kitchen(image, state: AppState, fonts, theme: dict) -> None:
             card = 255
         if not isinstance(ink, int):
             ink = 0
+    return card, ink
+
+
+def _new_draw(image, t: dict):
+    draw = ImageDraw.Draw(image)
+    if not bool(t.get("b_text_antialias", False)):
+        try:
+            draw.fontmode = "1"
+        except Exception:
+            pass
+    return draw
+
+
+def _row_ctx(draw, image, fonts, theme: dict, t: dict, card, ink) -> _RowCtx:
+    w, _h = image.size
+    m = int(t["b_margin"])
+    ox0, ox1 = m, w - m
+    split_x = ox0 + int((ox1 - ox0) * float(t["b_split_ratio"]))
+    rp = int(t["b_right_pad"])
+
+    panel_mode = bool(theme.get("panel_mode", False))
+    inv_item_key = "inter_semibold"
+    inv_item_focus_key = "inter_black"
+    badge_key = "inter_bold"
+    inv_item_size = int(t["b_inventory_item_size"])
+    badge_size = int(t["b_badge_size"])
+    if panel_mode:
+        inv_item_key = str(t.get("b_panel_inventory_item_font") or inv_item_key)
+        inv_item_focus_key = str(t.get("b_panel_inventory_item_focus_font") or inv_item_focus_key)
+        badge_key = str(t.get("b_panel_badge_font") or badge_key)
+        inv_item_size = int(t.get("b_panel_inventory_item_size", inv_item_size))
+        badge_size = int(t.get("b_panel_badge_size", badge_size))
+    shop_item_key = "inter_semibold"
+    shop_item_focus_key = "inter_bold"
+    shop_item_size = int(t["b_shopping_item_size"])
+    if panel_mode:
+        shop_item_key = str(t.get("b_panel_shopping_item_font") or shop_item_key)
+        shop_item_focus_key = str(t.get("b_panel_shopping_item_focus_font") or shop_item_focus_key)
+        shop_item_size = int(t.get("b_panel_shopping_item_size", shop_item_size))
+
+    return _RowCtx(
+        draw=draw,
+        fonts=fonts,
+        t=t,
+        ink=ink,
+        card=card,
+        panel_mode=panel_mode,
+        double_pass=panel_mode and bool(t.get("b_panel_right_item_double_pass", True)),
+        double_pass_shift=max(1, int(t.get("b_panel_right_item_double_pass_shift", 1))),
+        split_x=split_x,
+        inner_x0=split_x + 1 + rp,
+        inner_x1=ox1 - rp,
+        inv_row_h=int(t["b_inventory_row_h"]) + 4,
+        shop_row_h=int(t["b_shopping_row_h"]) + 4,
+        badge_key=badge_key,
+        badge_size=badge_size,
+        f_inv_item=fonts.get(inv_item_key, _font_px(inv_item_size)),
+        f_inv_item_focus=fonts.get(inv_item_focus_key, _font_px(inv_item_size)),
+        f_shop_item=fonts.get(shop_item_key, _font_px(shop_item_size)),
+        f_shop_item_focus=fonts.get(shop_item_focus_key, _font_px(shop_item_size)),
+        focus_style=str(t.get("b_right_focus_style", "row_box")).strip().lower(),
+        focus_pad_x=int(t.get("b_right_focus_pad_x", 6)),
+        focus_pad_y=int(t.get("b_right_focus_pad_y", 3)),
+        focus_right_trim=int(t.get("b_right_focus_right_trim", 2)),
+        focus_radius=int(t.get("b_right_focus_radius", 5)),
+        focus_w=max(1, int(t.get("b_right_focus_w", 1))),
+    )
+
+
+def _row_box(c: _RowCtx, y: int, row_h: int, image_w: int) -> tuple[int, int, int, int]:
+    t = c.t
+    rail_x0 = c.inner_x0 - int(t.get("b_right_focus_rail_gap", 6)) - int(t.get("b_right_focus_rail_w", 3))
+    x0 = min(c.inner_x0 - c.focus_pad_x, rail_x0)
+    # Stay clear of the panel divider.
+    x0 = max(x0, c.split_x + (int(t["b_divider_w"]) + 1) // 2 + 1)
+    x1 = min(image_w - int(t["b_margin"]), c.inner_x1 + max(c.focus_pad_x - c.focus_right_trim, 0) + 1)
+    return (x0, y, x1, y + row_h)
+
+
+def _draw_row_focus(c: _RowCtx, y: int, row_h: int) -> None:
+    draw, t, ink = c.draw, c.t, c.ink
+    inner_x0, inner_x1 = c.inner_x0, c.inner_x1
+    if c.focus_style == "rail":
+        rail_w = int(t.get("b_right_focus_rail_w", 3))
+        rail_gap = int(t.get("b_right_focus_rail_gap", 6))
+        rail_vpad = int(t.get("b_right_focus_rail_vpad", 5))
+        rx1 = inner_x0 - rail_gap
+        rx0 = rx1 - rail_w
+        ry0 = y + rail_vpad
+        ry1 = y + row_h - rail_vpad
+        if ry1 > ry0:
+            draw.rectangle((rx0, ry0, rx1, ry1), fill=ink)
+    else:
+        fx0 = inner_x0 - c.focus_pad_x
+        fx1 = inner_x1 + c.focus_pad_x - c.focus_right_trim
+        fy0 = y + c.focus_pad_y
+        fy1 = y + row_h - c.focus_pad_y
+        if fy1 > fy0 and fx1 > fx0:
+            rounded_rect(
+                draw,
+                (fx0, fy0, fx1, fy1),
+                radius=max(0, min(c.focus_radius, (fy1 - fy0) // 2)),
+                outline=ink,
+                width=c.focus_w,
+                fill=None,
+            )
+
+
+def _draw_inventory_row(c: _RowCtx, item, y: int, is_focus: bool) -> None:
+    draw, t, fonts = c.draw, c.t, c.fonts
+    ink, card = c.ink, c.card
+    inner_x0, inner_x1 = c.inner_x0, c.inner_x1
+    inv_row_h = c.inv_row_h
+    panel_mode = c.panel_mode
+    badge_key, badge_size = c.badge_key, c.badge_size
+
+    text_fill = ink
+    badge_text = ink
+    badge_fill = card
+    badge_outline = ink
+
+    if is_focus:
+        _draw_row_focus(c, y, inv_row_h)
+
+    badge_text_raw = (item.right or ("OUT" if item.completed else "STOCKED")).upper()
+    if panel_mode and bool(t.get("b_panel_badge_force_compact", True)):
+        badge_text_raw = _compact_badge_text(badge_text_raw)
+    badge_style = str(t.get("b_badge_style", "text")).strip().lower()
+    text_style = badge_style in ("text", "text_focus_invert")
+    badge_px = int(t["b_badge_px"]) if not text_style else int(t.get("b_badge_text_px", 0))
+    badge_py = int(t["b_badge_py"]) if not text_style else int(t.get("b_badge_text_py", 0))
+    badge_text_spacing = int(t.get("b_badge_text_spacing", -1))
+    if panel_mode:
+        badge_text_spacing = int(t.get("b_panel_badge_spacing", badge_text_spacing))
+    row_w = inner_x1 - inner_x0
+    title_gap = int(t.get("b_inventory_title_badge_gap", 10))
+    min_title_w = int(t.get("b_inventory_min_title_w", 104))
+    badge_min_w = int(t.get("b_badge_min_w", 44))
+    if text_style:
+        badge_min_w = int(t.get("b_badge_text_min_w", 20))
+    max_badge_w = min(int(t["b_badge_max_w"]), max(badge_min_w, row_w - 72))
+
+    # Dynamic budget: protect minimum title width first, then allocate badge.
+    badge_budget_w = max(
+        badge_min_w,
+        min(max_badge_w, row_w - title_gap - min_title_w),
+    )
+    badge_text_fit, f_badge_fit = _fit_badge_text(
+        draw,
+        fonts,
+        badge_text_raw,
+        max(20, badge_budget_w - badge_px * 2),
+        badge_size,
+        int(t.get("b_badge_min_size", 9)),
+        font_key=badge_key,
+    )
+    bw = int(round(text_width_spaced(draw, badge_text_fit, f_badge_fit, spacing=badge_text_spacing)))
+    bh = text_size(draw, badge_text_fit, f_badge_fit)[1]
+    bx1 = inner_x1
+    bx0 = bx1 - (bw + badge_px * 2)
+    min_bx0 = inner_x0 + (badge_min_w if not text_style else 0)
+    if bx0 < min_bx0:
+        bx0 = min_bx0
+
+    by0 = y + (inv_row_h - (bh + badge_py * 2)) // 2
+    by1 = by0 + bh + badge_py * 2
+
+    title_max_w = max(56, (bx0 - title_gap) - inner_x0)
+    if title_max_w < min_title_w:
+        # Re-fit badge tighter to preserve minimum title readability.
+        rebudget_w = max(badge_min_w, row_w - title_gap - min_title_w)
+        badge_text_fit, f_badge_fit = _fit_badge_text(
+            draw,
+            fonts,
+            badge_text_raw,
+            max(20, rebudget_w - badge_px * 2),
+            badge_size,
+            int(t.get("b_badge_min_size", 9)),
+            font_key=badge_key,
+        )
+        bw = int(round(text_width_spaced(draw, badge_text_fit, f_badge_fit, spacing=badge_text_spacing)))
+        bh = text_size(draw, badge_text_fit, f_badge_fit)[1]
+        bx0 = bx1 - (bw + badge_px * 2)
+        if bx0 < min_bx0:
+            bx0 = min_bx0
+        by0 = y + (inv_row_h - (bh + badge_py * 2)) // 2
+        by1 = by0 + bh + badge_py * 2
+        title_max_w = max(56, (bx0 - title_gap) - inner_x0)
+
+    title = truncate_text(draw, item.title, c.f_inv_item, title_max_w)
+
+    title_font = c.f_inv_item_focus if is_focus else c.f_inv_item
+    th = text_size(draw, "Ag", title_font)[1]
+    ty = y + (inv_row_h - th) // 2
+    draw.text((inner_x0, ty), title, font=title_font, fill=text_fill)
+    if c.double_pass:
+        draw.text((inner_x0 + c.double_pass_shift, ty), title, font=title_font, fill=text_fill)
+
+    if text_style:
+        # Default e-ink style: status is plain text (no persistent box).
+        # Optional focus treatment only on selected row.
+        if badge_style == "text_focus_invert" and is_focus:
+            fx = max(1, int(t.get("b_badge_focus_px", 4)))
+            fy = max(0, int(t.get("b_badge_focus_py", 1)))
+            fbx0, fby0 = bx0 - fx, by0 - fy
+            fbx1, fby1 = bx1 + fx, by1 + fy
+            fr = max(0, int(t.get("b_badge_focus_radius", 2)))
+            fr = min(fr, max(0, (fby1 - fby0) // 2))
+            rounded_rect(
+                draw,
+                (fbx0, fby0, fbx1, fby1),
+                radius=fr,
+                outline=ink,
+                width=1,
+                fill=ink,
+            )
+            draw_text_spaced(
+                draw,
+                badge_text_fit,
+                bx0,
+                by0,
+                f_badge_fit,
+                spacing=badge_text_spacing,
+                fill=card,
+            )
+        else:
+            draw_text_spaced(
+                draw,
+                badge_text_fit,
+                bx0,
+                by0,
+                f_badge_fit,
+                spacing=badge_text_spacing,
+                fill=ink,
+            )
+    else:
+        # Legacy chip styles for A/B compare.
+        if badge_style == "invert":
+            badge_fill = ink
+            badge_text = card
+            badge_outline = ink
+        elif badge_style == "focus_invert" and is_focus:
+            badge_fill = ink
+            badge_text = card
+            badge_outline = ink
+
+        badge_radius = max(0, int(t.get("b_badge_radius", 3)))
+        badge_radius = min(badge_radius, max(0, (by1 - by0) // 2))
+        rounded_rect(
+            draw,
+            (bx0, by0, bx1, by1),
+            radius=badge_radius,
+            outline=badge_outline,
+            width=max(1, int(t.get("b_badge_border_w", 1))),
+            fill=badge_fill,
+        )
+
+        draw_text_spaced(
+            draw,
+            badge_text_fit,
+            bx0 + badge_px,
+            by0 + badge_py,
+            f_badge_fit,
+            spacing=badge_text_spacing,
+            fill=badge_text,
+        )
+
+    if item.completed:
+        # [E-INK] Strikethrough
+        tw = text_size(draw, title, title_font)[0]
+        sy = ty + th // 2 + 1
+        draw.line((inner_x0, sy, inner_x0 + tw, sy), fill=ink, width=2)
+
+
+
+def _draw_shopping_row(c: _RowCtx, item, y: int, is_focus: bool) -> None:
+    draw, t = c.draw, c.t
+    ink = c.ink
+    inner_x0, inner_x1 = c.inner_x0, c.inner_x1
+    shop_row_h = c.shop_row_h
+
+    text_fill = ink
+    box_outline = ink
+
+    if is_focus:
+        _draw_row_focus(c, y, shop_row_h)
+
+    # checkbox
+    cb = int(t["b_shop_checkbox_size"])
+    cbx = inner_x0
+    cby = y + (shop_row_h - cb) // 2
+
+    rounded_rect(
+        draw,
+        (cbx, cby, cbx + cb, cby + cb),
+        radius=int(t["b_shop_checkbox_radius"]),
+        outline=box_outline,
+        width=int(t["b_shop_checkbox_w"]),
+        fill=None,
+    )
+
+    if item.completed:
+        # Checkmark
+        cx, cy = cbx + cb // 2, cby + cb // 2
+        points = [
+            (cbx + 3, cy),
+            (cbx + 5, cy + 3),
+            (cbx + 10, cby + 3)
+        ]
+        draw.line(points, fill=box_outline, width=2, joint="curve")
+
+    text_x = cbx + cb + 14 + int(t.get("b_shop_text_left_pad", 2))
+    title = truncate_text(draw, item.title, c.f_shop_item, max(80, inner_x1 - text_x - 8))
+
+    title_font = c.f_shop_item_focus if is_focus else c.f_shop_item
+    th = text_size(draw, "Ag", title_font)[1]
+    ty = y + (shop_row_h - th) // 2
+    draw.text((text_x, ty), title, font=title_font, fill=text_fill)
+    if c.double_pass:
+        draw.text((text_x + c.double_pass_shift, ty), title, font=title_font, fill=text_fill)
+
+    if item.completed:
+        # [E-INK] Strikethrough
+        tw = text_size(draw, title, title_font)[0]
+        sy = ty + th // 2 + 1
+        draw.line((text_x, sy, text_x + tw, sy), fill=text_fill, width=2)
+
+
+
+def render_home_kitchen(image, state: AppState, fonts, theme: dict) -> KitchenLayout:
+    t = _theme(theme)
+    draw = _new_draw(image, t)
+    w, h = image.size
+    card, ink = _colors(image, theme)
 
     muted = _gray_like(int(t["b_muted_gray"]), ink)
     date_muted = _gray_like(int(t["b_date_gray"]), ink)
@@ -388,7 +861,7 @@ def render_home_kitchen(image, state: AppState, fonts, theme: dict) -> None:
 
     # Focus on left panel (index 0)
     focus_idx = int(state.ui.focused_index or 0)
-    if bool(t.get("b_show_focus_ring")) and not state.ui.idle and focus_idx == 0:
+    if _left_focus(state, t):
         rounded_rect(
             draw,
             (ox0 + 2, oy0 + 2, split_x - 2, oy1 - 2),
@@ -399,10 +872,6 @@ def render_home_kitchen(image, state: AppState, fonts, theme: dict) -> None:
         )
 
     # Fonts
-    panel_mode = bool(theme.get("panel_mode", False))
-    panel_item_double_pass = panel_mode and bool(t.get("b_panel_right_item_double_pass", True))
-    panel_item_shift = max(1, int(t.get("b_panel_right_item_double_pass_shift", 1)))
-    f_time = fonts.get("inter_black", _font_px(t["b_time_size"]))
     f_weekday = fonts.get("inter_semibold", _font_px(t["b_weekday_size"]))
     f_date = fonts.get("inter_bold", _font_px(t["b_date_size"]))
     f_temp = fonts.get("inter_black", _font_px(t["b_temp_size"]))
@@ -419,75 +888,43 @@ def render_home_kitchen(image, state: AppState, fonts, theme: dict) -> None:
     f_posted = fonts.get("jet_extrabold", _font_px(posted_size))
 
     f_inv_title = fonts.get("inter_bold", _font_px(t["b_inventory_title_size"]))
-    inv_item_key = "inter_semibold"
-    inv_item_focus_key = "inter_black"
-    badge_key = "inter_bold"
-    inv_item_size = int(t["b_inventory_item_size"])
-    badge_size = int(t["b_badge_size"])
-    if panel_mode:
-        inv_item_key = str(t.get("b_panel_inventory_item_font") or inv_item_key)
-        inv_item_focus_key = str(t.get("b_panel_inventory_item_focus_font") or inv_item_focus_key)
-        badge_key = str(t.get("b_panel_badge_font") or badge_key)
-        inv_item_size = int(t.get("b_panel_inventory_item_size", inv_item_size))
-        badge_size = int(t.get("b_panel_badge_size", badge_size))
-    f_inv_item = fonts.get(inv_item_key, _font_px(inv_item_size))
-    f_inv_item_focus = fonts.get(inv_item_focus_key, _font_px(inv_item_size))
-    f_badge = fonts.get(badge_key, _font_px(badge_size))
     f_shop_title = fonts.get("inter_bold", _font_px(t["b_shopping_title_size"]))
-    shop_item_key = "inter_semibold"
-    shop_item_focus_key = "inter_bold"
-    shop_item_size = int(t["b_shopping_item_size"])
-    if panel_mode:
-        shop_item_key = str(t.get("b_panel_shopping_item_font") or shop_item_key)
-        shop_item_focus_key = str(t.get("b_panel_shopping_item_focus_font") or shop_item_focus_key)
-        shop_item_size = int(t.get("b_panel_shopping_item_size", shop_item_size))
-    f_shop_item = fonts.get(shop_item_key, _font_px(shop_item_size))
-    f_shop_item_focus = fonts.get(shop_item_focus_key, _font_px(shop_item_size))
 
     # ---------------- Left Panel ----------------
     lx0, lx1 = ox0 + int(t["b_left_pad"]), split_x - int(t["b_left_pad"])
     top_y = oy0 + int(t["b_left_pad"])
 
-    now = datetime.now()
-    time_str = now.strftime("%H:%M")
-    weekday = now.strftime("%A").upper()
-    try:
-        month_day = now.strftime("%B %-d, %Y")
-    except Exception:
-        month_day = now.strftime("%B %d, %Y")
+    now = clock.local_now()
+    time_str, weekday, month_day = _kitchen_date(now)
+    # TIMER widget: the countdown takes the clock slot (fixed-width digit cells,
+    # laid out for "00:00" so the flow below does not move while it ticks).
+    timer_text = _kitchen_timer_text(state)
+    if timer_text is not None:
+        time_str = "00:00"
+        weekday = "TIMER" if state.ui.timer_running else "PAUSED"
+    date_key = (weekday, month_day)
 
     weather_col_w = int(t["b_weather_col_w"])
     weather_right = lx1 - 2
     weather_left = weather_right - weather_col_w
 
-    # Keep clock clear of the weather stack on the right.
-    time_font_size = int(t["b_time_size"])
-    time_min_size = int(t["b_time_min_size"])
-    while time_font_size > time_min_size:
-        f_probe = fonts.get("inter_black", _font_px(time_font_size))
-        tw_probe, _ = text_size(draw, time_str, f_probe)
-        if tw_probe <= (weather_left - lx0 - int(t["b_time_weather_gap"])):
-            break
-        time_font_size -= 2
-    f_time = fonts.get("inter_black", _font_px(time_font_size))
-
-    # Keep downstream text anchors stable: weekday/date continue to flow from the
-    # legacy clock baseline, while the visible clock can be shifted and enlarged.
-    time_flow_box = draw.textbbox((lx0, top_y), time_str, font=f_time)
-
-    clock_x = lx0 + int(t.get("b_time_display_x_offset", -10))
-    clock_y = top_y + int(t.get("b_time_display_y_offset", -12))
-    display_scale = max(1.0, float(t.get("b_time_display_scale", 1.18)))
-    display_size = max(time_font_size, int(round(time_font_size * display_scale)))
-    display_font = fonts.get("inter_black", _font_px(display_size))
-    while display_size > time_font_size:
-        dw, _ = text_size(draw, time_str, display_font)
-        if dw <= (weather_left - clock_x - int(t["b_time_weather_gap"])):
-            break
-        display_size -= 2
-        display_font = fonts.get("inter_black", _font_px(display_size))
-
-    draw.text((clock_x, clock_y), time_str, font=display_font, fill=ink)
+    # Voice session: the weekday/date lines show the phase and its detail. The
+    # clock slot is left alone, so minute/timer updates stay partial.
+    if state.ui.voice_active:
+        weekday = voice_label(state.ui.voice_phase)
+        if state.ui.voice_detail:
+            max_w = weather_left - lx0 - int(t["b_time_weather_gap"])
+            month_day = truncate_text(draw, state.ui.voice_detail, f_date, max_w)
+
+    clock_geom = _kitchen_clock_geom(draw, t, fonts, time_str, lx0, top_y, weather_left)
+    timer_run = None
+    if timer_text is not None:
+        glyphs = digit_glyphs(clock_geom.font, antialias=bool(t.get("b_text_antialias", False)))
+        timer_run = GlyphRun(glyphs, (clock_geom.x, clock_geom.y), timer_text)
+        glyphs.draw(image, timer_run.xy, timer_text, ink)
+    else:
+        draw.text((clock_geom.x, clock_geom.y), time_str, font=clock_geom.font, fill=ink)
+    time_flow_box = clock_geom.flow_box
 
     wy = time_flow_box[3] + int(t["b_time_weekday_gap"])
     w_spacing = int(t["b_weekday_spacing"])
@@ -742,18 +1179,21 @@ def render_home_kitchen(image, state: AppState, fonts, theme: dict) -> None:
         draw.text((posted_x, posted_text_y), posted_label, font=f_posted, fill=ink)
 
     # ---------------- Right Panel ----------------
-    rx0 = split_x + 1
+    rc = _row_ctx(draw, image, fonts, theme, t, card, ink)
     rp = int(t["b_right_pad"])
-    inner_x0 = rx0 + rp
-    inner_x1 = ox1 - rp
+    inner_x0, inner_x1 = rc.inner_x0, rc.inner_x1
 
     mid_y = oy0 + int((oy1 - oy0) * float(t["b_mid_split_ratio"]))
 
     # Focus lookup by task id (incomplete order from reducer)
     focus_rid = _kitchen_focus_rid(state, focus_idx, t)
     rendered_focus_rids: list[str] = []
+    rows: list[KitchenRow] = []
 
-    fridge, shop = _group_tasks(state)
+    inv_max_rows = max(1, int(t.get("b_inventory_max_rows", 4)))
+    shop_max_rows = max(1, int(t.get("b_shopping_max_rows", 5)))
+    fridge, shop = _group_tasks(state, inv_max_rows, shop_max_rows)
+    index = reminder_index(state)
 
     # [ARTISTIC POLISH] Inventory Header
     inv_y = oy0 + max(8, rp - 6)
@@ -761,209 +1201,23 @@ def render_home_kitchen(image, state: AppState, fonts, theme: dict) -> None:
     inv_title_spacing = int(t.get("b_inventory_title_spacing", 1))
     draw_text_spaced(draw, "INVENTORY", inner_x0, inv_y, f_inv_title, spacing=inv_title_spacing, fill=ink)
 
-    fridge_due = sum(1 for r in fridge if not r.completed)
+    fridge_due = index.count("fridge", completed=False)
     if fridge_due > 0:
         cnt = str(fridge_due)
         cw = text_width_spaced(draw, cnt, f_inv_title, spacing=inv_title_spacing)
         draw_text_spaced(draw, cnt, inner_x1 - cw, inv_y, f_inv_title, spacing=inv_title_spacing, fill=ink)
 
-    inv_row_h = int(t["b_inventory_row_h"]) + 4
+    inv_row_h = rc.inv_row_h
     y = inv_y + int(t["b_inventory_header_gap"])
-    right_focus_style = str(t.get("b_right_focus_style", "row_box")).strip().lower()
-    focus_pad_x = int(t.get("b_right_focus_pad_x", 6))
-    focus_pad_y = int(t.get("b_right_focus_pad_y", 3))
-    focus_right_trim = int(t.get("b_right_focus_right_trim", 2))
-    focus_radius = int(t.get("b_right_focus_radius", 5))
-    focus_w = max(1, int(t.get("b_right_focus_w", 1)))
 
-    inv_max_rows = max(1, int(t.get("b_inventory_max_rows", 4)))
-    for item in fridge[:inv_max_rows]:
+    for item in fridge:
         if y + inv_row_h > mid_y - 8:
             break
         is_focus = (not state.ui.idle) and (focus_rid == item.rid and not item.completed)
         if not item.completed:
             rendered_focus_rids.append(item.rid)
-
-        text_fill = ink 
-        badge_text = ink
-        badge_fill = card
-        badge_outline = ink
-
-        if is_focus:
-            if right_focus_style == "rail":
-                rail_w = int(t.get("b_right_focus_rail_w", 3))
-                rail_gap = int(t.get("b_right_focus_rail_gap", 6))
-                rail_vpad = int(t.get("b_right_focus_rail_vpad", 5))
-                rx1 = inner_x0 - rail_gap
-                rx0 = rx1 - rail_w
-                ry0 = y + rail_vpad
-                ry1 = y + inv_row_h - rail_vpad
-                if ry1 > ry0:
-                    draw.rectangle((rx0, ry0, rx1, ry1), fill=ink)
-            else:
-                fx0 = inner_x0 - focus_pad_x
-                fx1 = inner_x1 + focus_pad_x - focus_right_trim
-                fy0 = y + focus_pad_y
-                fy1 = y + inv_row_h - focus_pad_y
-                if fy1 > fy0 and fx1 > fx0:
-                    rounded_rect(
-                        draw,
-                        (fx0, fy0, fx1, fy1),
-                        radius=max(0, min(focus_radius, (fy1 - fy0) // 2)),
-                        outline=ink,
-                        width=focus_w,
-                        fill=None,
-                    )
-
-        badge_text_raw = (item.right or ("OUT" if item.completed else "STOCKED")).upper()
-        if panel_mode and bool(t.get("b_panel_badge_force_compact", True)):
-            badge_text_raw = _compact_badge_text(badge_text_raw)
-        badge_style = str(t.get("b_badge_style", "text")).strip().lower()
-        text_style = badge_style in ("text", "text_focus_invert")
-        badge_px = int(t["b_badge_px"]) if not text_style else int(t.get("b_badge_text_px", 0))
-        badge_py = int(t["b_badge_py"]) if not text_style else int(t.get("b_badge_text_py", 0))
-        badge_text_spacing = int(t.get("b_badge_text_spacing", -1))
-        if panel_mode:
-            badge_text_spacing = int(t.get("b_panel_badge_spacing", badge_text_spacing))
-        row_w = inner_x1 - inner_x0
-        title_gap = int(t.get("b_inventory_title_badge_gap", 10))
-        min_title_w = int(t.get("b_inventory_min_title_w", 104))
-        badge_min_w = int(t.get("b_badge_min_w", 44))
-        if text_style:
-            badge_min_w = int(t.get("b_badge_text_min_w", 20))
-        max_badge_w = min(int(t["b_badge_max_w"]), max(badge_min_w, row_w - 72))
-
-        # Dynamic budget: protect minimum title width first, then allocate badge.
-        badge_budget_w = max(
-            badge_min_w,
-            min(max_badge_w, row_w - title_gap - min_title_w),
-        )
-        badge_text_fit, f_badge_fit = _fit_badge_text(
-            draw,
-            fonts,
-            badge_text_raw,
-            max(20, badge_budget_w - badge_px * 2),
-            badge_size,
-            int(t.get("b_badge_min_size", 9)),
-            font_key=badge_key,
-        )
-        bw = int(round(text_width_spaced(draw, badge_text_fit, f_badge_fit, spacing=badge_text_spacing)))
-        bh = text_size(draw, badge_text_fit, f_badge_fit)[1]
-        bx1 = inner_x1
-        bx0 = bx1 - (bw + badge_px * 2)
-        min_bx0 = inner_x0 + (badge_min_w if not text_style else 0)
-        if bx0 < min_bx0:
-            bx0 = min_bx0
-
-        by0 = y + (inv_row_h - (bh + badge_py * 2)) // 2
-        by1 = by0 + bh + badge_py * 2
-
-        title_max_w = max(56, (bx0 - title_gap) - inner_x0)
-        if title_max_w < min_title_w:
-            # Re-fit badge tighter to preserve minimum title readability.
-            rebudget_w = max(badge_min_w, row_w - title_gap - min_title_w)
-            badge_text_fit, f_badge_fit = _fit_badge_text(
-                draw,
-                fonts,
-                badge_text_raw,
-                max(20, rebudget_w - badge_px * 2),
-                badge_size,
-                int(t.get("b_badge_min_size", 9)),
-                font_key=badge_key,
-            )
-            bw = int(round(text_width_spaced(draw, badge_text_fit, f_badge_fit, spacing=badge_text_spacing)))
-            bh = text_size(draw, badge_text_fit, f_badge_fit)[1]
-            bx0 = bx1 - (bw + badge_px * 2)
-            if bx0 < min_bx0:
-                bx0 = min_bx0
-            by0 = y + (inv_row_h - (bh + badge_py * 2)) // 2
-            by1 = by0 + bh + badge_py * 2
-            title_max_w = max(56, (bx0 - title_gap) - inner_x0)
-
-        title = truncate_text(draw, item.title, f_inv_item, title_max_w)
-        
-        title_font = f_inv_item_focus if is_focus else f_inv_item
-        th = text_size(draw, "Ag", title_font)[1]
-        ty = y + (inv_row_h - th) // 2
-        draw.text((inner_x0, ty), title, font=title_font, fill=text_fill)
-        if panel_item_double_pass:
-            draw.text((inner_x0 + panel_item_shift, ty), title, font=title_font, fill=text_fill)
-
-        if text_style:
-            # Default e-ink style: status is plain text (no persistent box).
-            # Optional focus treatment only on selected row.
-            if badge_style == "text_focus_invert" and is_focus:
-                fx = max(1, int(t.get("b_badge_focus_px", 4)))
-                fy = max(0, int(t.get("b_badge_focus_py", 1)))
-                fbx0, fby0 = bx0 - fx, by0 - fy
-                fbx1, fby1 = bx1 + fx, by1 + fy
-                fr = max(0, int(t.get("b_badge_focus_radius", 2)))
-                fr = min(fr, max(0, (fby1 - fby0) // 2))
-                rounded_rect(
-                    draw,
-                    (fbx0, fby0, fbx1, fby1),
-                    radius=fr,
-                    outline=ink,
-                    width=1,
-                    fill=ink,
-                )
-                draw_text_spaced(
-                    draw,
-                    badge_text_fit,
-                    bx0,
-                    by0,
-                    f_badge_fit,
-                    spacing=badge_text_spacing,
-                    fill=card,
-                )
-            else:
-                draw_text_spaced(
-                    draw,
-                    badge_text_fit,
-                    bx0,
-                    by0,
-                    f_badge_fit,
-                    spacing=badge_text_spacing,
-                    fill=ink,
-                )
-        else:
-            # Legacy chip styles for A/B compare.
-            if badge_style == "invert":
-                badge_fill = ink
-                badge_text = card
-                badge_outline = ink
-            elif badge_style == "focus_invert" and is_focus:
-                badge_fill = ink
-                badge_text = card
-                badge_outline = ink
-
-            badge_radius = max(0, int(t.get("b_badge_radius", 3)))
-            badge_radius = min(badge_radius, max(0, (by1 - by0) // 2))
-            rounded_rect(
-                draw,
-                (bx0, by0, bx1, by1),
-                radius=badge_radius,
-                outline=badge_outline,
-                width=max(1, int(t.get("b_badge_border_w", 1))),
-                fill=badge_fill,
-            )
-
-            draw_text_spaced(
-                draw,
-                badge_text_fit,
-                bx0 + badge_px,
-                by0 + badge_py,
-                f_badge_fit,
-                spacing=badge_text_spacing,
-                fill=badge_text,
-            )
-
-        if item.completed:
-            # [E-INK] Strikethrough
-            tw = text_size(draw, title, title_font)[0]
-            sy = ty + th // 2 + 1
-            draw.line((inner_x0, sy, inner_x0 + tw, sy), fill=ink, width=2) 
-
+        _draw_inventory_row(rc, item, y, is_focus)
+        rows.append(KitchenRow(item.rid, "inventory", y, _row_box(rc, y, inv_row_h, w)))
         y += inv_row_h
 
     # Shopping header
@@ -987,7 +1241,7 @@ def render_home_kitchen(image, state: AppState, fonts, theme: dict) -> None:
     shop_title_x = inner_x0
     draw_text_spaced(draw, shop_label, shop_title_x, shop_title_y, f_shop_title, spacing=shop_title_spacing, fill=ink)
 
-    shop_cnt = str(len(shop))
+    shop_cnt = str(index.count(exclude="fridge"))
     shop_cnt_spacing = max(0, shop_title_spacing - 1)
     shop_cnt_w = text_width_spaced(draw, shop_cnt, f_shop_title, spacing=shop_cnt_spacing)
     shop_cnt_x = inner_x1 - shop_cnt_w
@@ -998,87 +1252,18 @@ def render_home_kitchen(image, state: AppState, fonts, theme: dict) -> None:
     if shop_rule_right > shop_rule_left:
         draw.line((shop_rule_left, shop_rule_y, shop_rule_right, shop_rule_y), fill=ink, width=shop_rule_w)
     
-    shop_row_h = int(t["b_shopping_row_h"]) + 4
+    shop_row_h = rc.shop_row_h
     y = max(shop_title_y + int(t["b_shopping_header_gap"]), shop_rule_y + 10)
     shop_bottom = oy1 - int(t["b_bottom_pad"])
 
-    shop_max_rows = max(1, int(t.get("b_shopping_max_rows", 5)))
-    for item in shop[:shop_max_rows]:
+    for item in shop:
         if y + shop_row_h > shop_bottom:
             break
         is_focus = (not state.ui.idle) and (focus_rid == item.rid and not item.completed)
         if not item.completed:
             rendered_focus_rids.append(item.rid)
-        
-        text_fill = ink
-        box_outline = ink
-
-        if is_focus:
-            if right_focus_style == "rail":
-                rail_w = int(t.get("b_right_focus_rail_w", 3))
-                rail_gap = int(t.get("b_right_focus_rail_gap", 6))
-                rail_vpad = int(t.get("b_right_focus_rail_vpad", 5))
-                rx1 = inner_x0 - rail_gap
-                rx0 = rx1 - rail_w
-                ry0 = y + rail_vpad
-                ry1 = y + shop_row_h - rail_vpad
-                if ry1 > ry0:
-                    draw.rectangle((rx0, ry0, rx1, ry1), fill=ink)
-            else:
-                fx0 = inner_x0 - focus_pad_x
-                fx1 = inner_x1 + focus_pad_x - focus_right_trim
-                fy0 = y + focus_pad_y
-                fy1 = y + shop_row_h - focus_pad_y
-                if fy1 > fy0 and fx1 > fx0:
-                    rounded_rect(
-                        draw,
-                        (fx0, fy0, fx1, fy1),
-                        radius=max(0, min(focus_radius, (fy1 - fy0) // 2)),
-                        outline=ink,
-                        width=focus_w,
-                        fill=None,
-                    )
-
-        # checkbox
-        cb = int(t["b_shop_checkbox_size"])
-        cbx = inner_x0
-        cby = y + (shop_row_h - cb) // 2
-
-        rounded_rect(
-            draw,
-            (cbx, cby, cbx + cb, cby + cb),
-            radius=int(t["b_shop_checkbox_radius"]),
-            outline=box_outline,
-            width=int(t["b_shop_checkbox_w"]),
-            fill=None,
-        )
-        
-        if item.completed:
-            # Checkmark
-            cx, cy = cbx + cb // 2, cby + cb // 2
-            points = [
-                (cbx + 3, cy),
-                (cbx + 5, cy + 3),
-                (cbx + 10, cby + 3)
-            ]
-            draw.line(points, fill=box_outline, width=2, joint="curve")
-
-        text_x = cbx + cb + 14 + int(t.get("b_shop_text_left_pad", 2))
-        title = truncate_text(draw, item.title, f_shop_item, max(80, inner_x1 - text_x - 8))
-
-        title_font = f_shop_item_focus if is_focus else f_shop_item
-        th = text_size(draw, "Ag", title_font)[1]
-        ty = y + (shop_row_h - th) // 2
-        draw.text((text_x, ty), title, font=title_font, fill=text_fill)
-        if panel_item_double_pass:
-            draw.text((text_x + panel_item_shift, ty), title, font=title_font, fill=text_fill)
-
-        if item.completed:
-            # [E-INK] Strikethrough
-            tw = text_size(draw, title, title_font)[0]
-            sy = ty + th // 2 + 1
-            draw.line((text_x, sy, text_x + tw, sy), fill=text_fill, width=2)
-
+        _draw_shopping_row(rc, item, y, is_focus)
+        rows.append(KitchenRow(item.rid, "shopping", y, _row_box(rc, y, shop_row_h, w)))
         y += shop_row_h
 
     # Sync reducer focus/click queue with the exact rows currently rendered.
@@ -1086,6 +1271,26 @@ def render_home_kitchen(image, state: AppState, fonts, theme: dict) -> None:
     state.ui.kitchen_visible_theme_key = kitchen_queue_theme_key(t)
     state.ui.kitchen_visible_reminders_version = int(state.ui.reminders_version or 0)
 
+    return KitchenLayout(
+        size=image.size,
+        mode=image.mode,
+        rows=rows,
+        focus_rid="" if state.ui.idle else focus_rid,
+        left_focus=_left_focus(state, t),
+        sig=_layout_sig(state, theme),
+        minute=now.strftime("%Y%m%d%H%M"),
+        timer=timer_run,
+        clock=None if timer_run is not None else KitchenClock(
+            text=time_str,
+            date=date_key,
+            box=_text_box(draw, (clock_geom.x, clock_geom.y), time_str, clock_geom.font),
+            key=clock_geom.key,
+            lx0=lx0,
+            top_y=top_y,
+            weather_left=weather_left,
+            floor_y=wy,
+        ),
+    )
 
 
 def _kitchen_focus_rid(state: AppState, focused_index: int, theme: dict | None = None) -> str:
@@ -1097,3 +1302,137 @@ def _kitchen_focus_rid(state: AppState, focused_index: int, theme: dict | None =
     if 0 <= pos < len(visible_idxs):
         return state.model.reminders[visible_idxs[pos]].rid
     return ""
+
+
+def _left_focus(state: AppState, t: dict) -> bool:
+    return bool(t.get("b_show_focus_ring")) and not state.ui.idle and int(state.ui.focused_index or 0) == 0
+
+
+def _layout_sig(state: AppState, theme: dict) -> tuple:
+    # Model identity is a revision under snapshots (copy on write); the theme
+    # dict must not be edited in place between a render and its row updates.
+    return (
+        id(state.model),
+        int(state.ui.reminders_version or 0),
+        int(state.ui.memo_index or 0),
+        state.ui.voice_phase,
+        state.ui.voice_detail,
+        id(theme),
+    )
+
+
+def _align8(x0: int, x1: int, w: int) -> tuple[int, int]:
+    return x0 & ~7, min(w, (x1 + 7) & ~7)
+
+
+def rerender_kitchen_rows(
+    image, state: AppState, fonts, theme: dict, layout: KitchenLayout
+) -> Optional[list[tuple[int, int, int, int]]]:
+    """Apply a right-panel focus move to a frame drawn by render_home_kitchen().
+
+    Redraws only the previously and newly focused rows into `image` and
+    returns their dirty rects (x0, y0, x1, y1; end-exclusive, x aligned to 8
+    px for partial panel refresh). Returns None when anything else changed
+    and a full render is needed; `layout` is updated in place on success.
+    """
+    if layout.size != image.size or layout.mode != image.mode or layout.sig != _layout_sig(state, theme):
+        return None
+    if layout.minute != clock.local_now().strftime("%Y%m%d%H%M"):
+        return None
+    t = _theme(theme)
+    if _left_focus(state, t) != layout.left_focus:
+        return None
+    focus_rid = "" if state.ui.idle else _kitchen_focus_rid(state, int(state.ui.focused_index or 0), t)
+    if focus_rid == layout.focus_rid:
+        return []
+
+    rows = {row.rid: row for row in layout.rows}
+    changed = [rid for rid in (layout.focus_rid, focus_rid) if rid]
+    if any(rid not in rows for rid in changed):
+        return None
+
+    draw = _new_draw(image, t)
+    card, ink = _colors(image, theme)
+    rc = _row_ctx(draw, image, fonts, theme, t, card, ink)
+    index = reminder_index(state)
+    rects: list[tuple[int, int, int, int]] = []
+    for rid in changed:
+        pos = index.position(rid)
+        if pos is None:
+            return None
+        item = state.model.reminders[pos]
+        row = rows[rid]
+        x0, y0, x1, y1 = row.box
+        draw.rectangle((x0, y0, x1 - 1, y1 - 1), fill=card)
+        is_focus = rid == focus_rid and not item.completed
+        if row.kind == "inventory":
+            _draw_inventory_row(rc, item, row.y, is_focus)
+        else:
+            _draw_shopping_row(rc, item, row.y, is_focus)
+        ax0, ax1 = _align8(x0, x1, image.size[0])
+        rects.append((ax0, y0, ax1, y1))
+    layout.focus_rid = focus_rid
+    return rects
+
+
+def render_kitchen_clock(
+    image, state: AppState, fonts, theme: dict, layout: KitchenLayout
+) -> Optional[list[tuple[int, int, int, int]]]:
+    """Bring the clock of a frame drawn by render_home_kitchen() to the current minute.
+
+    Redraws only the HH:MM text and returns its dirty rect (x aligned to 8 px),
+    [] if the minute did not change, or None when a full render is needed (new
+    day, clock font/flow change, or any other state change).
+    """
+    if layout.size != image.size or layout.mode != image.mode or layout.sig != _layout_sig(state, theme):
+        return None
+    c = layout.clock
+    if c is None:
+        # Timer in the clock slot: nothing on screen follows the minute.
+        return [] if layout.timer is not None else None
+    now = clock.local_now()
+    time_str, weekday, month_day = _kitchen_date(now)
+    if (weekday, month_day) != c.date:
+        return None
+    if time_str == c.text:
+        layout.minute = now.strftime("%Y%m%d%H%M")
+        return []
+
+    t = _theme(theme)
+    draw = _new_draw(image, t)
+    geom = _kitchen_clock_geom(draw, t, fonts, time_str, c.lx0, c.top_y, c.weather_left)
+    if geom.key != c.key:
+        return None
+    card, ink = _colors(image, theme)
+    box = _text_box(draw, (geom.x, geom.y), time_str, geom.font)
+    x0, y0 = min(c.box[0], box[0]), min(c.box[1], box[1])
+    x1, y1 = max(c.box[2], box[2]), max(c.box[3], box[3])
+    if y1 > c.floor_y or x1 > c.weather_left:
+        return None
+    draw.rectangle((x0, y0, x1 - 1, y1 - 1), fill=card)
+    draw.text((geom.x, geom.y), time_str, font=geom.font, fill=ink)
+
+    c.text = time_str
+    c.box = box
+    layout.minute = now.strftime("%Y%m%d%H%M")
+    ax0, ax1 = _align8(x0, x1, image.size[0])
+    return [(ax0, y0, ax1, y1)]
+
+
+def render_kitchen_timer(
+    image, state: AppState, fonts, theme: dict, layout: KitchenLayout
+) -> Optional[list[tuple[int, int, int, int]]]:
+    """Redraw the countdown of a frame drawn by render_home_kitchen() to `state.ui.timer_seconds`.
+
+    Only digit cells that changed are repainted. Returns the dirty rect (x
+    aligned to 8 px), [] if the text did not change, or None when a full
+    render is needed.
+    """
+    run = layout.timer
+    if run is None or layout.size != image.size or layout.mode != image.mode or layout.sig != _layout_sig(state, theme):
+        return None
+    text = _kitchen_timer_text(state)
+    if text is None:
+        return None
+    card, ink = _colors(image, theme)
+    return run.update(image, text, ink, card)
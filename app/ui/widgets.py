@@ -56,3 +56,40 @@ def draw_reminder_item(
         rt_x = divider_x + (x1 - divider_x - rt_w) // 2
         rt_y = y0 + (y1 - y0 - rt_h) // 2
         draw.text((rt_x, rt_y), right_text, font=font_right, fill=ink)
+
+
+# Voice overlay label per app.core.state.VoicePhase value.
+VOICE_LABELS = {
+    "listening": "LISTENING...",
+    "uploading": "SENDING...",
+    "waiting": "THINKING...",
+    "applying": "ADDING...",
+    "done": "DONE",
+    "error": "TRY AGAIN",
+}
+
+
+def voice_label(phase):
+    return VOICE_LABELS.get(str(getattr(phase, "value", phase) or ""), "")
+
+
+def draw_voice_glyph(draw, cx, cy, r, phase, ink=0, width=3):
+    """Mic while listening, dots while the clip is processed, check/cross when done/failed."""
+    phase = str(getattr(phase, "value", phase) or "")
+    if phase == "listening":
+        draw.ellipse((cx - r, cy - r, cx + r, cy + r), outline=ink, width=width)
+        draw.line((cx, cy + r, cx, cy + r + 18), fill=ink, width=width)
+        draw.line((cx - 18, cy + r + 18, cx + 18, cy + r + 18), fill=ink, width=width)
+        return
+    draw.ellipse((cx - r, cy - r, cx + r, cy + r), outline=ink, width=width)
+    if phase == "done":
+        draw.line((cx - r // 2, cy, cx - r // 8, cy + r // 3, cx + r // 2, cy - r // 3), fill=ink, width=width + 1, joint="curve")
+    elif phase == "error":
+        d = r // 3
+        draw.line((cx - d, cy - d, cx + d, cy + d), fill=ink, width=width + 1)
+        draw.line((cx - d, cy + d, cx + d, cy - d), fill=ink, width=width + 1)
+    else:
+        dot = max(2, r // 8)
+        for i in (-1, 0, 1):
+            x = cx + i * r // 2
+            draw.ellipse((x - dot, cy - dot, x + dot, cy + dot), fill=ink)
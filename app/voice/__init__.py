@@ -0,0 +1 @@
+"""Voice input: audio capture and the voice command flow."""
@@ -0,0 +1,386 @@
+"""Streaming audio capture into memory.
+
+The hardware demos recorded with `arecord ... file.wav`, waited for the
+process to exit and then uploaded the finished file: every voice command
+paid an SD-card write + read and a whole-clip upload after the button was
+released. VoiceCapture instead reads raw PCM from a pipe (`arecord -t raw`
+on stdout, see arecord_source()) on a reader thread into a PcmRing, hands
+every chunk to `on_chunk` while recording (so a recognizer can consume audio
+as it arrives), and on stop() returns the clip from memory; wav_bytes()
+wraps it in a WAV header for APIs that want a container.
+
+With a VAD (app.voice.vad.EnergyVad) the capture knows where speech is:
+on_chunk only gets audio from just before the first speech on, the clip
+can be trimmed to it (CapturedAudio.trimmed()), and `auto_stop` ends a
+hands-free recording after trailing silence.
+
+FileSource replays a WAV/raw file at real-time pace as a stand-in for a
+microphone (benchmarks, machines without ALSA).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+import io
+import os
+import signal
+import subprocess
+import threading
+import time
+from typing import Callable, Optional, Protocol, Sequence
+import wave
+
+
+@dataclass(frozen=True)
+class AudioFormat:
+    rate: int = 16000
+    channels: int = 1
+    sample_width: int = 2  # bytes; 2 = S16_LE
+
+    @property
+    def frame_bytes(self) -> int:
+        return self.channels * self.sample_width
+
+    @property
+    def bytes_per_second(self) -> int:
+        return self.rate * self.frame_bytes
+
+    def bytes_for(self, seconds: float) -> int:
+        """Whole frames covering `seconds` of audio."""
+        return max(1, int(self.rate * seconds)) * self.frame_bytes
+
+    def seconds(self, nbytes: int) -> float:
+        return nbytes / float(self.bytes_per_second)
+
+    def arecord_args(self) -> list[str]:
+        fmt = {1: "U8", 2: "S16_LE", 4: "S32_LE"}[self.sample_width]
+        return ["-f", fmt, "-r", str(self.rate), "-c", str(self.channels)]
+
+
+class PcmRing:
+    """The last `capacity` bytes of a PCM stream in one preallocated buffer.
+
+    Positions are absolute byte offsets since the stream started (`total` is
+    the write position), so readers can keep a cursor while the writer wraps.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, int(capacity))
+        self._buf = bytearray(self.capacity)
+        self.total = 0
+
+    def write(self, data) -> None:
+        data = memoryview(data).cast("B")
+        n = len(data)
+        if n >= self.capacity:
+            data = data[n - self.capacity :]
+            self.total += n - self.capacity
+            n = self.capacity
+        at = self.total % self.capacity
+        first = min(n, self.capacity - at)
+        self._buf[at : at + first] = data[:first]
+        if first < n:
+            self._buf[: n - first] = data[first:]
+        self.total += n
+
+    @property
+    def start(self) -> int:
+        """Oldest position still held."""
+        return max(0, self.total - self.capacity)
+
+    def read(self, start: int, end: Optional[int] = None) -> bytes:
+        end = self.total if end is None else min(int(end), self.total)
+        if start < self.start:
+            raise ValueError(f"bytes {start}..{self.start} were overwritten")
+        if end <= start:
+            return b""
+        a = start % self.capacity
+        n = end - start
+        if a + n <= self.capacity:
+            return bytes(self._buf[a : a + n])
+        return bytes(self._buf[a:]) + bytes(self._buf[: a + n - self.capacity])
+
+
+class AudioSource(Protocol):
+    """A PCM stream: read() returns b"" at the end, stop() asks it to end soon."""
+
+    fmt: AudioFormat
+
+    def start(self) -> None: ...
+
+    def read(self, n: int) -> bytes: ...
+
+    def stop(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class PipeSource:
+    """Raw PCM from a subprocess' stdout; stop() sends SIGINT (arecord flushes and exits)."""
+
+    def __init__(self, cmd: Sequence[str], fmt: AudioFormat = AudioFormat()):
+        self.cmd = list(cmd)
+        self.fmt = fmt
+        self._proc: Optional[subprocess.Popen] = None
+
+    def start(self) -> None:
+        self._proc = subprocess.Popen(
+            self.cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            bufsize=0,
+            start_new_session=True,
+        )
+
+    def read(self, n: int) -> bytes:
+        # os.read returns what is buffered (up to n) instead of waiting for all n.
+        return os.read(self._proc.stdout.fileno(), n) if self._proc is not None else b""
+
+    def stop(self) -> None:
+        if self._proc is not None and self._proc.poll() is None:
+            try:
+                os.killpg(self._proc.pid, signal.SIGINT)
+            except Exception:
+                self._proc.terminate()
+
+    def close(self) -> None:
+        if self._proc is None:
+            return
+        self.stop()
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc.stdout.close()
+        self._proc = None
+
+
+def arecord_source(device: str = "default", fmt: AudioFormat = AudioFormat()) -> PipeSource:
+    """`arecord` writing raw PCM to stdout (use `arecord -l` to find e.g. "plughw:1,0")."""
+    return PipeSource(["arecord", "-q", "-D", device, *fmt.arecord_args(), "-t", "raw"], fmt)
+
+
+class FileSource:
+    """PCM from a WAV or raw file, paced like a live microphone unless `realtime=False`."""
+
+    def __init__(self, path: str, fmt: Optional[AudioFormat] = None, *, realtime: bool = True, loop: bool = False):
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        if path.lower().endswith(".wav"):
+            with wave.open(path, "rb") as w:
+                self.fmt = AudioFormat(w.getframerate(), w.getnchannels(), w.getsampwidth())
+                self._pcm = w.readframes(w.getnframes())
+        else:
+            self.fmt = fmt or AudioFormat()
+            with open(path, "rb") as fh:
+                self._pcm = fh.read()
+        self._pos = 0
+        self._t0 = 0.0
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        self._pos = 0
+        self._t0 = time.perf_counter()
+        self._stopped.clear()
+
+    def read(self, n: int) -> bytes:
+        if self._stopped.is_set() or not self._pcm:
+            return b""
+        n -= n % self.fmt.frame_bytes
+        if self.realtime:
+            # Wait until the audio up to pos + n would have been spoken.
+            due = self._t0 + self.fmt.seconds(self._pos + n)
+            if self._stopped.wait(max(0.0, due - time.perf_counter())):
+                return b""
+        at = self._pos % len(self._pcm) if self.loop else self._pos
+        chunk = self._pcm[at : at + n]
+        if self.loop and len(chunk) < n:
+            chunk += self._pcm[: n - len(chunk)]
+        self._pos += len(chunk)
+        return chunk
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def close(self) -> None:
+        self.stop()
+
+
+@dataclass
+class CapturedAudio:
+    pcm: bytes
+    fmt: AudioFormat
+    # perf_counter() times: capture start, stop() call (button release), clip ready.
+    started_at: float = 0.0
+    released_at: float = 0.0
+    ready_at: float = 0.0
+    truncated: bool = False  # hit max_s
+    # Why recording ended: "stop" (stop() call), "max", "silence" (VAD auto-stop) or "eof".
+    reason: str = "stop"
+    # Byte range of detected speech (with padding); None without a VAD or without speech.
+    speech: Optional[tuple[int, int]] = None
+
+    @property
+    def duration_s(self) -> float:
+        return self.fmt.seconds(len(self.pcm))
+
+    def trimmed(self) -> CapturedAudio:
+        """The clip cut to `speech` (unchanged when there is no VAD result)."""
+        if self.speech is None:
+            return self
+        a, b = self.speech
+        return replace(self, pcm=self.pcm[a:b], speech=(0, b - a))
+
+    def wav_bytes(self) -> bytes:
+        """The clip as an in-memory WAV file."""
+        out = io.BytesIO()
+        with wave.open(out, "wb") as w:
+            w.setnchannels(self.fmt.channels)
+            w.setsampwidth(self.fmt.sample_width)
+            w.setframerate(self.fmt.rate)
+            w.writeframes(self.pcm)
+        return out.getvalue()
+
+
+@dataclass
+class CaptureStats:
+    chunks: int = 0
+    bytes: int = 0
+    # Longest on_chunk call; a slow consumer delays reading the pipe.
+    max_sink_s: float = 0.0
+    first_chunk_at: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+
+class VoiceCapture:
+    """Reads `source` on a thread into a ring buffer until stop() or `max_s`.
+
+    on_chunk(chunk) runs on the reader thread for every chunk as it arrives;
+    with a `vad`, leading silence is held back and the first chunk starts
+    pad_ms before the speech onset. `auto_stop` (needs `vad`) ends the
+    recording once vad.should_stop. stop() asks the source to end, drains
+    what it still delivers and returns the clip; it does not touch the
+    filesystem.
+    """
+
+    def __init__(
+        self,
+        source: AudioSource,
+        *,
+        chunk_ms: int = 20,
+        max_s: float = 8.0,
+        on_chunk: Optional[Callable[[bytes], None]] = None,
+        vad=None,
+        auto_stop: bool = False,
+    ):
+        if auto_stop and vad is None:
+            raise ValueError("auto_stop needs a vad")
+        self.source = source
+        self.fmt = source.fmt
+        self.chunk_bytes = self.fmt.bytes_for(chunk_ms / 1000.0)
+        self.max_bytes = self.fmt.bytes_for(max_s)
+        self.on_chunk = on_chunk
+        self.vad = vad
+        self.auto_stop = auto_stop
+        self.ring = PcmRing(self.max_bytes)
+        self.stats = CaptureStats()
+        self._done = threading.Event()
+        self._sent = 0  # on_chunk cursor (ring position)
+        self._reason = ""
+        self._truncated = False
+        self._started_at = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> VoiceCapture:
+        self._started_at = time.perf_counter()
+        self.source.start()
+        self._thread = threading.Thread(target=self._read_loop, name="voice-capture", daemon=True)
+        self._thread.start()
+        return self
+
+    @property
+    def done(self) -> bool:
+        """True once the source ended on its own, max_s was reached or the VAD auto-stopped."""
+        return self._done.is_set()
+
+    @property
+    def elapsed_s(self) -> float:
+        return self.fmt.seconds(self.ring.total)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until done (see `done`) or timeout."""
+        return self._done.wait(timeout)
+
+    def stop(self, timeout: float = 2.0) -> CapturedAudio:
+        released = time.perf_counter()
+        self._reason = self._reason or "stop"
+        self.source.stop()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.source.close()
+        pcm = self.ring.read(0)
+        return CapturedAudio(
+            pcm=pcm,
+            fmt=self.fmt,
+            started_at=self._started_at,
+            released_at=released,
+            ready_at=time.perf_counter(),
+            truncated=self._truncated,
+            reason=self._reason,
+            speech=self.vad.bounds(len(pcm)) if self.vad is not None else None,
+        )
+
+    def _emit(self) -> None:
+        start = self._sent
+        if self.vad is not None:
+            bounds = self.vad.bounds(self.ring.total)
+            if bounds is None:
+                return  # still leading silence
+            start = max(start, bounds[0])
+        if start >= self.ring.total:
+            return
+        chunk = self.ring.read(start)
+        self._sent = self.ring.total
+        t0 = time.perf_counter()
+        self.on_chunk(chunk)
+        self.stats.max_sink_s = max(self.stats.max_sink_s, time.perf_counter() - t0)
+
+    def _read_loop(self) -> None:
+        pending = b""  # a partial frame left over from the last read
+        try:
+            while self.ring.total < self.max_bytes:
+                data = self.source.read(min(self.chunk_bytes, self.max_bytes - self.ring.total))
+                if not data:
+                    break
+                data = pending + data
+                cut = len(data) - len(data) % self.fmt.frame_bytes
+                chunk, pending = data[:cut], data[cut:]
+                if not chunk:
+                    continue
+                self.ring.write(chunk)
+                st = self.stats
+                if not st.chunks:
+                    st.first_chunk_at = time.perf_counter()
+                st.chunks += 1
+                st.bytes += len(chunk)
+                if self.vad is not None:
+                    self.vad.feed(chunk)
+                if self.on_chunk is not None:
+                    self._emit()
+                if self.auto_stop and self.vad.should_stop:
+                    self._reason = "silence"
+                    self.source.stop()
+                    break
+            else:
+                self._truncated = True
+                self._reason = "max"
+                self.source.stop()
+            if not self._reason:
+                self._reason = "eof"
+        except Exception as exc:  # surfaced through stats; the clip so far is kept
+            self.stats.errors.append(repr(exc))
+        finally:
+            self._done.set()
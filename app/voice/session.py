@@ -0,0 +1,207 @@
+"""Voice sessions: recording, upload and reply parsing off the UI thread.
+
+The reducer owns the session (UiState.voice_phase / voice_session, see
+app.core.reducer): LongPress starts one in LISTENING, Click or a second
+LongPress ends the recording early, Back cancels. VoiceWorker follows the
+snapshots the runner produces (sync()) and does the slow parts on its own
+thread, reporting back through `post` with VoiceProgress/VoiceResult events:
+
+    LISTENING -> UPLOADING -> WAITING -> APPLYING -> DONE (VoiceResult) | ERROR
+
+Recording is hands-free: it ends after a pause (EnergyVad auto-stop), and only
+the speech is sent. Every report carries the session number, so a cancelled
+or superseded session never reaches the UI.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any, Callable, Optional, Protocol
+
+from app.ai.client import VOICE_PROMPT, AiClient, GenaiBackend, parse_reply
+from app.ai.intents import parse_intent
+from app.core import clock
+from app.core.reducer import Event, VoiceProgress, VoiceResult
+from app.core.state import AppState, VoicePhase
+from app.voice.capture import AudioFormat, AudioSource, CapturedAudio, VoiceCapture
+from app.voice.vad import EnergyVad, VadConfig
+
+
+class Recognizer(Protocol):
+    """Speech-to-items backend, in two steps so the overlay can show both."""
+
+    def send(self, audio: CapturedAudio) -> Any: ...
+
+    def reply(self, pending: Any) -> str: ...
+
+
+class GeminiRecognizer:
+    """google-genai backend: the clip goes inline with the request for the JSON reply.
+
+    No separate upload round trip (Files API): send() only wraps the WAV as a
+    request part, and the model call gets AiClient's timeout and retries.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash", *, timeout_s: float = 20.0):
+        self.model = model
+        self._ai = AiClient(GenaiBackend(api_key, model), timeout_s=timeout_s)
+
+    def send(self, audio: CapturedAudio) -> Any:
+        return self._ai.backend.audio_part(audio.wav_bytes())
+
+    def reply(self, pending: Any) -> str:
+        prompt = VOICE_PROMPT + clock.local_now().strftime("%Y-%m-%d %H:%M:%S")
+        return self._ai.generate([prompt, pending])
+
+
+class CannedRecognizer:
+    """Offline stand-in: a fixed reply after modelled upload/model delays."""
+
+    def __init__(self, reply: str = "", *, upload_s: float = 0.5, think_s: float = 1.5, bytes_per_s: float = 0.0):
+        self.text = reply or '{"transcript": "add milk and eggs", "todos": ["Milk", "Eggs"]}'
+        self.upload_s = upload_s
+        self.think_s = think_s
+        # Upload time per byte on top of upload_s (0: flat).
+        self.bytes_per_s = bytes_per_s
+
+    def send(self, audio: CapturedAudio) -> Any:
+        time.sleep(self.upload_s + (len(audio.pcm) / self.bytes_per_s if self.bytes_per_s > 0 else 0.0))
+        return None
+
+    def reply(self, pending: Any) -> str:
+        time.sleep(self.think_s)
+        return self.text
+
+
+@dataclass
+class _Job:
+    session: int
+    finish: threading.Event = field(default_factory=threading.Event)
+    cancel: threading.Event = field(default_factory=threading.Event)
+    thread: Optional[threading.Thread] = None
+
+
+@dataclass
+class VoiceStats:
+    sessions: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    # Seconds spent per phase, summed over sessions.
+    phase_s: dict = field(default_factory=dict)
+
+
+class VoiceWorker:
+    """Runs voice sessions for the reducer's state on a thread (one session at a time).
+
+    `open_source` makes a fresh AudioSource per session (arecord_source,
+    FileSource, ...); `post` delivers events to the input queue and must be
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        open_source: Callable[[], AudioSource],
+        recognizer: Recognizer,
+        post: Callable[[Event], None],
+        *,
+        fmt: AudioFormat = AudioFormat(),
+        max_s: float = 8.0,
+        vad_config: Optional[VadConfig] = None,
+    ):
+        self.open_source = open_source
+        self.recognizer = recognizer
+        self.post = post
+        self.fmt = fmt
+        self.max_s = max_s
+        self.vad_config = vad_config
+        self.stats = VoiceStats()
+        self._lock = threading.Lock()
+        self._job: Optional[_Job] = None
+
+    def sync(self, state: AppState) -> None:
+        """Follow the session in `state`: start, finish recording or cancel. Cheap; call after every reduce."""
+        ui = state.ui
+        with self._lock:
+            job = self._job
+            if job is not None and (job.session != ui.voice_session or ui.voice_phase == VoicePhase.IDLE):
+                # Cancelled (Back), superseded, or dismissed.
+                if not job.cancel.is_set() and job.thread is not None and job.thread.is_alive():
+                    self.stats.cancelled += 1
+                job.cancel.set()
+                job.finish.set()
+                self._job = job = None
+            if ui.voice_phase == VoicePhase.LISTENING and job is None:
+                job = _Job(ui.voice_session)
+                job.thread = threading.Thread(target=self._run, args=(job,), name="voice", daemon=True)
+                self._job = job
+                self.stats.sessions += 1
+                job.thread.start()
+            elif job is not None and ui.voice_phase != VoicePhase.LISTENING:
+                # Click/LongPress ended the recording, or the watchdog gave up.
+                job.finish.set()
+                if ui.voice_phase in (VoicePhase.DONE, VoicePhase.ERROR):
+                    job.cancel.set()
+
+    def close(self) -> None:
+        with self._lock:
+            job, self._job = self._job, None
+        if job is not None:
+            job.cancel.set()
+            job.finish.set()
+            if job.thread is not None:
+                job.thread.join(timeout=2.0)
+
+    def _post(self, job: _Job, event: Event) -> bool:
+        if job.cancel.is_set():
+            return False
+        self.post(event)
+        return True
+
+    def _phase(self, name: str, t0: float) -> float:
+        now = time.perf_counter()
+        self.stats.phase_s[name] = self.stats.phase_s.get(name, 0.0) + (now - t0)
+        return now
+
+    def _run(self, job: _Job) -> None:
+        t0 = time.perf_counter()
+        try:
+            capture = VoiceCapture(
+                self.open_source(),
+                max_s=self.max_s,
+                vad=EnergyVad(self.fmt, self.vad_config),
+                auto_stop=True,
+            ).start()
+            while not capture.wait(0.05):
+                if job.finish.is_set():
+                    break
+            audio = capture.stop()
+            t0 = self._phase("listening", t0)
+            if audio.speech is None:
+                if self._post(job, VoiceProgress(job.session, VoicePhase.ERROR, "No speech heard")):
+                    self.stats.failed += 1
+                return
+            if not self._post(job, VoiceProgress(job.session, VoicePhase.UPLOADING)):
+                return
+            pending = self.recognizer.send(audio.trimmed())
+            t0 = self._phase("uploading", t0)
+            if not self._post(job, VoiceProgress(job.session, VoicePhase.WAITING)):
+                return
+            text = self.recognizer.reply(pending)
+            t0 = self._phase("waiting", t0)
+            if not self._post(job, VoiceProgress(job.session, VoicePhase.APPLYING)):
+                return
+            reply = parse_reply(text)
+            if reply.transcript and not reply.todos and not reply.actions:
+                # Plain transcript back (no JSON): the local grammar may still read it.
+                local = parse_intent(reply.transcript)
+                if not local.escalate:
+                    reply.actions = local.actions()
+            self._phase("applying", t0)
+            if self._post(job, VoiceResult(job.session, reply.transcript, reply.todos, reply.actions)):
+                self.stats.completed += 1
+        except Exception as exc:
+            if self._post(job, VoiceProgress(job.session, VoicePhase.ERROR, str(exc) or type(exc).__name__)):
+                self.stats.failed += 1
@@ -0,0 +1,175 @@
+"""Energy + zero-crossing voice activity detection for 16-bit PCM.
+
+Frames (default 20 ms) count as speech when their energy is well above an
+adaptive noise floor, or moderately above it with a high zero-crossing rate
+(unvoiced consonants like "s"/"f" are quiet but crossing-rich). A run of
+`onset_frames` speech frames starts speech; after the last speech frame it
+lasts `hangover_ms` more so short pauses between words don't end it.
+
+EnergyVad is incremental: feed() it chunks as they are captured (VoiceCapture
+does, see app.voice.capture) and it tracks the speech bounds for trimming
+and whether the trailing silence is long enough to end a hands-free
+recording. trim_silence() runs it over a finished clip.
+
+Uses NumPy when available, else the array module (fine at 50 frames/s).
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+import math
+import sys
+from typing import Optional
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional speedup
+    np = None
+
+from app.voice.capture import AudioFormat
+
+_FULL_SCALE = 32768.0
+
+
+@dataclass
+class VadConfig:
+    frame_ms: int = 20
+    # Speech: energy this far above the noise floor (dB) ...
+    margin_db: float = 12.0
+    # ... or this far above it with a zero-crossing rate of at least zcr_unvoiced.
+    weak_margin_db: float = 6.0
+    zcr_unvoiced: float = 0.25
+    # Never call anything below this speech (dBFS), however quiet the room.
+    min_speech_db: float = -50.0
+    # Starting noise floor (dBFS); None takes the first frame's energy (the
+    # recorder starts before the user speaks). Tracked down fast, up slowly.
+    floor_db: Optional[float] = None
+    floor_rise: float = 0.05
+    onset_frames: int = 3
+    hangover_ms: int = 300
+    # Kept before/after the detected speech when trimming.
+    pad_ms: int = 150
+    # Hands-free sessions end after this much silence following speech ...
+    end_silence_ms: int = 900
+    # ... or this long without any speech at all.
+    no_speech_ms: int = 4000
+
+
+def frame_features(frame: bytes) -> tuple[float, float]:
+    """(energy dBFS, zero-crossing rate) of one mono S16_LE frame."""
+    if np is not None:
+        x = np.frombuffer(frame, dtype="<i2").astype(np.float32)
+        if not len(x):
+            return (-120.0, 0.0)
+        rms = float(np.sqrt(np.mean(x * x)))
+        zc = int(np.count_nonzero(np.signbit(x[1:]) != np.signbit(x[:-1])))
+    else:
+        x = array("h", frame)
+        if sys.byteorder == "big":
+            x.byteswap()
+        if not len(x):
+            return (-120.0, 0.0)
+        rms = math.sqrt(sum(v * v for v in x) / len(x))
+        zc = sum(1 for a, b in zip(x, x[1:]) if (a < 0) != (b < 0))
+    db = 20.0 * math.log10(max(rms, 1e-3) / _FULL_SCALE)
+    return (db, zc / max(1, len(x) - 1))
+
+
+class EnergyVad:
+    """Incremental VAD over a PCM stream; positions are byte offsets into it."""
+
+    def __init__(self, fmt: AudioFormat = AudioFormat(), config: Optional[VadConfig] = None):
+        if fmt.channels != 1 or fmt.sample_width != 2:
+            raise ValueError("EnergyVad expects mono S16_LE audio")
+        self.fmt = fmt
+        self.cfg = config or VadConfig()
+        self.frame_bytes = fmt.bytes_for(self.cfg.frame_ms / 1000.0)
+        self._hang_frames = max(0, round(self.cfg.hangover_ms / self.cfg.frame_ms))
+        self.floor_db = self.cfg.floor_db
+        self.pos = 0  # bytes consumed (whole frames)
+        self.in_speech = False
+        self.speech_start: Optional[int] = None  # first speech frame ever
+        self.speech_end: Optional[int] = None  # end of the last speech frame
+        self.frames = 0
+        self.speech_frames = 0
+        self._run = 0  # consecutive speech frames (onset)
+        self._hang = 0
+        self._pending = b""
+
+    def _is_speech(self, db: float, zcr: float) -> bool:
+        c = self.cfg
+        if db < c.min_speech_db:
+            return False
+        return db >= self.floor_db + c.margin_db or (db >= self.floor_db + c.weak_margin_db and zcr >= c.zcr_unvoiced)
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume PCM; returns True if speech is active after it."""
+        data = self._pending + bytes(chunk)
+        fb = self.frame_bytes
+        whole = len(data) - len(data) % fb
+        for at in range(0, whole, fb):
+            self._frame(data[at : at + fb])
+        self._pending = data[whole:]
+        return self.in_speech
+
+    def _frame(self, frame: bytes) -> None:
+        c = self.cfg
+        db, zcr = frame_features(frame)
+        start = self.pos
+        self.pos += len(frame)
+        self.frames += 1
+        if self.floor_db is None:
+            self.floor_db = db
+        if self._is_speech(db, zcr):
+            self._run += 1
+            if self._run >= c.onset_frames:
+                if not self.in_speech:
+                    onset = start - (c.onset_frames - 1) * self.frame_bytes
+                    if self.speech_start is None:
+                        self.speech_start = onset
+                    self.in_speech = True
+                self.speech_frames += 1
+                self.speech_end = self.pos
+                self._hang = self._hang_frames
+            return
+        self._run = 0
+        # Track the floor on non-speech frames only: down quickly, up slowly.
+        if db < self.floor_db:
+            self.floor_db = db
+        else:
+            self.floor_db += (db - self.floor_db) * c.floor_rise
+        if self.in_speech:
+            if self._hang > 0:
+                self._hang -= 1
+            else:
+                self.in_speech = False
+
+    @property
+    def trailing_silence_ms(self) -> float:
+        """Silence since the last speech frame (since the start if there was none)."""
+        since = self.speech_end if self.speech_end is not None else 0
+        return self.fmt.seconds(self.pos - since) * 1000.0
+
+    @property
+    def should_stop(self) -> bool:
+        """Hands-free end: enough silence after speech, or no speech for too long."""
+        if self.speech_end is None:
+            return self.trailing_silence_ms >= self.cfg.no_speech_ms
+        return not self.in_speech and self.trailing_silence_ms >= self.cfg.end_silence_ms
+
+    def bounds(self, total: Optional[int] = None) -> Optional[tuple[int, int]]:
+        """Byte range to keep (speech plus pad_ms each side), or None if no speech."""
+        if self.speech_start is None or self.speech_end is None:
+            return None
+        total = self.pos if total is None else total
+        pad = self.fmt.bytes_for(self.cfg.pad_ms / 1000.0)
+        return (max(0, self.speech_start - pad), min(total, self.speech_end + pad))
+
+
+def trim_silence(pcm: bytes, fmt: AudioFormat = AudioFormat(), config: Optional[VadConfig] = None) -> bytes:
+    """`pcm` without leading/trailing silence; b"" if it holds no speech."""
+    vad = EnergyVad(fmt, config)
+    vad.feed(pcm)
+    b = vad.bounds(len(pcm))
+    return pcm[b[0] : b[1]] if b is not None else b""
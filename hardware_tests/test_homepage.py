@@ -11,8 +11,6 @@ import termios
 import tty
 import urllib.request
 import urllib.parse
-import subprocess
-import signal
 import threading
 import re
 from datetime import datetime, timedelta
@@ -44,6 +42,12 @@ def _detect_repo_root(start_dir):
 
 
 repo_root = _detect_repo_root(base_dir)
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+from app.ai.client import VOICE_PROMPT, AiClient, GenaiBackend, VoiceReply, genai_client, parse_reply  # noqa: E402
+from app.ai.intents import parse_intent  # noqa: E402
+from app.voice.capture import AudioFormat, VoiceCapture, arecord_source  # noqa: E402
+from app.voice.vad import EnergyVad  # noqa: E402
 default_root = repo_root
 picdir = os.path.join(default_root, 'pic')
 libdir = os.path.join(default_root, 'lib')
@@ -123,7 +127,6 @@ AUDIO_DEVICE = "default"  # use `arecord -l` to find, e.g., "plughw:1,0"
 AUDIO_RATE = 16000
 AUDIO_CHANNELS = 1
 RECORD_MAX_SEC = 8
-AUDIO_PATH = "/tmp/voice_todo.wav"
 
 GEMINI_MODEL = "gemini-2.5-flash"
 API_KEY_ENV = "GOOGLE_API_KEY"
@@ -661,40 +664,20 @@ def analyze_text(text):
     text = text.strip()
     if not text:
         return "", [], []
+    # Common commands ("buy milk and eggs", "remind me at 5 to ...") need no round trip.
+    local = parse_intent(text, datetime.now())
+    if not local.escalate:
+        return text, local.todos(), local.reminders()
     api_key = os.environ.get(API_KEY_ENV)
     if api_key and genai is not None:
         try:
-            client = genai.Client(api_key=api_key)
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            prompt = (
-                "Parse the input into todos or reminders."
-                "Return JSON:"
-                "{\"transcript\":\"...\",\"todos\":[\"...\"],\"reminders\":[{\"text\":\"...\",\"due\":\"YYYY-MM-DD HH:MM\"}]}\n"
-                "If a relative time is mentioned, convert it to an absolute datetime."
-                "Current time: " + now
-            )
-            resp = client.models.generate_content(model=GEMINI_MODEL, contents=[prompt, text])
-            raw = (resp.text or "").strip()
-            payload = _extract_json(raw)
-            if payload:
-                data = json.loads(payload)
-                transcript = data.get("transcript", text)
-                todos = data.get("todos", []) or []
-                reminders = []
-                for r in data.get("reminders", []) or []:
-                    due = r.get("due")
-                    due_ts = None
-                    try:
-                        due_ts = int(datetime.fromisoformat(due).timestamp())
-                    except Exception:
-                        pass
-                    if due_ts:
-                        reminders.append({"text": r.get("text", ""), "due_ts": due_ts})
-                # If model didn't return reminder but text contains time, add local reminder
-                due = parse_due_datetime(text, datetime.now())
-                if due and not reminders:
-                    reminders.append({"text": extract_reminder_text(text), "due_ts": int(due.timestamp())})
-                return transcript, todos, reminders
+            reply = _ai_client().analyze_text(text)
+            reminders = _reply_reminders(reply)
+            # If model didn't return reminder but text contains time, add local reminder
+            due = parse_due_datetime(text, datetime.now())
+            if due and not reminders:
+                reminders.append({"text": extract_reminder_text(text), "due_ts": int(due.timestamp())})
+            return reply.transcript or text, reply.todos, reminders
         except Exception:
             pass
 
@@ -727,138 +710,95 @@ def _draw_page(title, subtitle, lines, font_title, font_sub, font_body, w, h):
 
 
 def _record_audio_fixed():
-    if os.path.exists(AUDIO_PATH):
-        try:
-            os.remove(AUDIO_PATH)
-        except Exception:
-            pass
+    capture = _start_capture(auto_stop=True)
+    capture.wait(RECORD_MAX_SEC + 1)
+    return _finish_capture(capture)
+
+
+def _start_capture(auto_stop=False):
+    # Raw PCM from arecord's stdout into memory: nothing is written to the SD card.
+    # The VAD finds the speech so silence isn't uploaded; with auto_stop it
+    # also ends the recording once the speaker pauses.
+    fmt = AudioFormat(rate=AUDIO_RATE, channels=AUDIO_CHANNELS)
+    capture = VoiceCapture(
+        arecord_source(AUDIO_DEVICE, fmt),
+        max_s=RECORD_MAX_SEC,
+        vad=EnergyVad(fmt),
+        auto_stop=auto_stop,
+    )
+    logging.info("recording: %s", " ".join(capture.source.cmd))
+    return capture.start()
 
-    cmd = [
-        "arecord",
-        "-D",
-        AUDIO_DEVICE,
-        "-f",
-        "S16_LE",
-        "-r",
-        str(AUDIO_RATE),
-        "-c",
-        str(AUDIO_CHANNELS),
-        "-d",
-        str(RECORD_MAX_SEC),
-        "-t",
-        "wav",
-        AUDIO_PATH,
-    ]
-    logging.info("recording: %s", " ".join(cmd))
-    subprocess.call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-    if os.path.exists(AUDIO_PATH) and os.path.getsize(AUDIO_PATH) > 0:
-        return AUDIO_PATH
-    return None
+def _finish_capture(capture):
+    audio = capture.stop()
+    logging.info(
+        "recorded %.1fs (%s), clip ready %.0f ms after stop",
+        audio.duration_s,
+        audio.reason,
+        (audio.ready_at - audio.released_at) * 1e3,
+    )
+    if audio.speech is None:
+        logging.info("no speech detected")
+        return None
+    trimmed = audio.trimmed()
+    logging.info("trimmed to %.1fs of speech", trimmed.duration_s)
+    return trimmed
 
 
 def _record_audio_until_release(pin):
-    if os.path.exists(AUDIO_PATH):
-        try:
-            os.remove(AUDIO_PATH)
-        except Exception:
-            pass
-
-    cmd = [
-        "arecord",
-        "-D",
-        AUDIO_DEVICE,
-        "-f",
-        "S16_LE",
-        "-r",
-        str(AUDIO_RATE),
-        "-c",
-        str(AUDIO_CHANNELS),
-        "-t",
-        "wav",
-        AUDIO_PATH,
-    ]
-    logging.info("recording: %s", " ".join(cmd))
-    proc = subprocess.Popen(cmd, preexec_fn=os.setsid, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-
-    start = time.time()
-    while True:
+    capture = _start_capture()
+    while not capture.done:
         if BUTTON_ACTIVE_LOW:
             pressed = GPIO.input(pin) == GPIO.LOW
         else:
             pressed = GPIO.input(pin) == GPIO.HIGH
         if not pressed:
             break
-        if time.time() - start >= RECORD_MAX_SEC:
-            break
-        time.sleep(0.05)
+        time.sleep(0.02)
+    return _finish_capture(capture)
 
-    try:
-        os.killpg(proc.pid, signal.SIGINT)
-        proc.wait(timeout=2)
-    except Exception:
-        try:
-            proc.terminate()
-        except Exception:
-            pass
 
-    if os.path.exists(AUDIO_PATH) and os.path.getsize(AUDIO_PATH) > 0:
-        return AUDIO_PATH
-    return None
+_AI_CLIENT = None
 
 
-def _extract_json(text):
-    text = text.strip()
-    if text.startswith("{") and text.endswith("}"):
-        return text
-    start = text.find("{")
-    end = text.rfind("}")
-    if start != -1 and end != -1 and end > start:
-        return text[start:end + 1]
-    return None
+def _ai_client():
+    # One client per process: cached text replies, coalescing, timeouts/retries.
+    global _AI_CLIENT
+    if _AI_CLIENT is None:
+        _AI_CLIENT = AiClient(GenaiBackend(os.environ.get(API_KEY_ENV), GEMINI_MODEL))
+    return _AI_CLIENT
+
+
+def _reply_reminders(reply: VoiceReply):
+    reminders = []
+    for a in reply.actions:
+        due = a.get("due")
+        due_ts = None
+        try:
+            due_ts = int(datetime.fromisoformat(due).timestamp())
+        except Exception:
+            pass
+        if due_ts:
+            reminders.append({"text": a.get("title", ""), "due_ts": due_ts})
+    return reminders
 
 
-def transcribe_and_extract(audio_path):
+def transcribe_and_extract(audio):
     api_key = os.environ.get(API_KEY_ENV)
     if not api_key:
         raise RuntimeError("missing API key env: %s" % API_KEY_ENV)
     if genai is None:
         raise RuntimeError("google-genai not installed. pip install google-genai")
 
-    client = genai.Client(api_key=api_key)
-    myfile = client.files.upload(file=audio_path)
-
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    prompt = (
-        "Transcribe the audio into English text and extract todos/reminders."
-        "Output JSON only, format:"
-        "{\"transcript\":\"...\",\"todos\":[\"...\"],\"reminders\":[{\"text\":\"...\",\"due\":\"YYYY-MM-DD HH:MM\"}]}"
-        "If a relative time is mentioned, convert it to an absolute datetime."
-        "Current time: " + now
-    )
-    response = client.models.generate_content(
-        model=GEMINI_MODEL,
-        contents=[prompt, myfile],
-    )
-    text = (response.text or "").strip()
-    payload = _extract_json(text)
-    if payload:
-        data = json.loads(payload)
-        transcript = data.get("transcript", "")
-        todos = data.get("todos", [])
-        reminders = []
-        for r in data.get("reminders", []) or []:
-            due = r.get("due")
-            due_ts = None
-            try:
-                due_ts = int(datetime.fromisoformat(due).timestamp())
-            except Exception:
-                pass
-            if due_ts:
-                reminders.append({"text": r.get("text", ""), "due_ts": due_ts})
-        return transcript, [t for t in todos if isinstance(t, str) and t.strip()], reminders
-
-    return text, [], []
+    if isinstance(audio, str):
+        myfile = genai_client(api_key).files.upload(file=audio)
+        prompt = VOICE_PROMPT + datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        reply = parse_reply(_ai_client().generate([prompt, myfile]))
+    else:
+        # In-memory clips go inline with the request; no separate file upload.
+        reply = _ai_client().transcribe(audio.wav_bytes())
+    return reply.transcript, reply.todos, _reply_reminders(reply)
 
 
 try:
@@ -1425,7 +1365,7 @@ try:
     def voice_flow(use_button=False):
         global todo_items, todo_mtime, reminders, reminder_mtime
         while True:
-            subtitle = "Release button to stop" if use_button else ("Speak within %d seconds" % RECORD_MAX_SEC)
+            subtitle = "Release button to stop" if use_button else ("Speak now, pause when done (max %ds)" % RECORD_MAX_SEC)
             recording = _draw_page("Recording...", subtitle, [], font_title_big, font_sub, font_small, w, h)
             _display_full_partial(epd, recording, w, h)
             if use_button and GPIO is not None:
@@ -3,11 +3,8 @@
 import sys
 import os
 import time
-import json
 import logging
 import glob
-import subprocess
-import signal
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 
@@ -38,6 +35,11 @@ def _detect_repo_root(start_dir):
 
 
 repo_root = _detect_repo_root(base_dir)
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+from app.ai.client import AiClient, GenaiBackend, genai_client, parse_reply  # noqa: E402
+from app.voice.capture import AudioFormat, VoiceCapture, arecord_source  # noqa: E402
+from app.voice.vad import EnergyVad  # noqa: E402
 default_root = repo_root
 picdir = os.path.join(default_root, 'pic')
 libdir = os.path.join(default_root, 'lib')
@@ -102,7 +104,6 @@ AUDIO_DEVICE = "default"  # use `arecord -l` to find, e.g., "plughw:1,0"
 AUDIO_RATE = 16000
 AUDIO_CHANNELS = 1
 RECORD_MAX_SEC = 8
-AUDIO_PATH = "/tmp/voice_todo.wav"
 
 GEMINI_MODEL = "gemini-2.5-flash"
 API_KEY_ENV = "GOOGLE_API_KEY"
@@ -162,95 +163,81 @@ def _draw_page(title, subtitle, lines, font_title, font_sub, font_body, w, h):
     return image
 
 
-def _record_audio_until_release(pin):
-    if os.path.exists(AUDIO_PATH):
-        try:
-            os.remove(AUDIO_PATH)
-        except Exception:
-            pass
-
-    cmd = [
-        "arecord",
-        "-D",
-        AUDIO_DEVICE,
-        "-f",
-        "S16_LE",
-        "-r",
-        str(AUDIO_RATE),
-        "-c",
-        str(AUDIO_CHANNELS),
-        "-t",
-        "wav",
-        AUDIO_PATH,
-    ]
-    logging.info("recording: %s", " ".join(cmd))
-    proc = subprocess.Popen(cmd, preexec_fn=os.setsid, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+def _start_capture(auto_stop=False):
+    # Raw PCM from arecord's stdout into memory: nothing is written to the SD card.
+    # The VAD finds the speech so silence isn't uploaded; with auto_stop it
+    # also ends the recording once the speaker pauses.
+    fmt = AudioFormat(rate=AUDIO_RATE, channels=AUDIO_CHANNELS)
+    capture = VoiceCapture(
+        arecord_source(AUDIO_DEVICE, fmt),
+        max_s=RECORD_MAX_SEC,
+        vad=EnergyVad(fmt),
+        auto_stop=auto_stop,
+    )
+    logging.info("recording: %s", " ".join(capture.source.cmd))
+    return capture.start()
+
+
+def _finish_capture(capture):
+    audio = capture.stop()
+    logging.info(
+        "recorded %.1fs (%s), clip ready %.0f ms after stop",
+        audio.duration_s,
+        audio.reason,
+        (audio.ready_at - audio.released_at) * 1e3,
+    )
+    if audio.speech is None:
+        logging.info("no speech detected")
+        return None
+    trimmed = audio.trimmed()
+    logging.info("trimmed to %.1fs of speech", trimmed.duration_s)
+    return trimmed
+
 
-    start = time.time()
-    while True:
+def _record_audio_until_release(pin):
+    capture = _start_capture()
+    while not capture.done:
         if BUTTON_ACTIVE_LOW:
             pressed = GPIO.input(pin) == GPIO.LOW
         else:
             pressed = GPIO.input(pin) == GPIO.HIGH
         if not pressed:
             break
-        if time.time() - start >= RECORD_MAX_SEC:
-            break
-        time.sleep(0.05)
+        time.sleep(0.02)
+    return _finish_capture(capture)
 
-    try:
-        os.killpg(proc.pid, signal.SIGINT)
-        proc.wait(timeout=2)
-    except Exception:
-        try:
-            proc.terminate()
-        except Exception:
-            pass
-
-    if os.path.exists(AUDIO_PATH) and os.path.getsize(AUDIO_PATH) > 0:
-        return AUDIO_PATH
-    return None
-
-
-def _extract_json(text):
-    text = text.strip()
-    if text.startswith("{") and text.endswith("}"):
-        return text
-    start = text.find("{")
-    end = text.rfind("}")
-    if start != -1 and end != -1 and end > start:
-        return text[start:end + 1]
-    return None
-
-
-def transcribe_and_extract(audio_path):
+
+_AI_CLIENT = None
+TODO_PROMPT = (
+    "Transcribe the audio into English text and extract todos."
+    "Output JSON only, format:"
+    "{\"transcript\":\"...\",\"todos\":[\"...\",\"...\"]}"
+)
+
+
+def _ai_client():
+    # One client per process, with timeouts/retries.
+    global _AI_CLIENT
+    if _AI_CLIENT is None:
+        _AI_CLIENT = AiClient(GenaiBackend(os.environ.get(API_KEY_ENV), GEMINI_MODEL))
+    return _AI_CLIENT
+
+
+def transcribe_and_extract(audio):
     api_key = os.environ.get(API_KEY_ENV)
     if not api_key:
         raise RuntimeError("missing API key env: %s" % API_KEY_ENV)
     if genai is None:
         raise RuntimeError("google-genai not installed. pip install google-genai")
 
-    client = genai.Client(api_key=api_key)
-    myfile = client.files.upload(file=audio_path)
-
-    prompt = (
-        "Transcribe the audio into English text and extract todos."
-        "Output JSON only, format:"
-        "{\"transcript\":\"...\",\"todos\":[\"...\",\"...\"]}"
-    )
-    response = client.models.generate_content(
-        model=GEMINI_MODEL,
-        contents=[prompt, myfile],
-    )
-    text = (response.text or "").strip()
-    payload = _extract_json(text)
-    if payload:
-        data = json.loads(payload)
-        transcript = data.get("transcript", "")
-        todos = data.get("todos", [])
-        return transcript, [t for t in todos if isinstance(t, str) and t.strip()]
-
-    return text, []
+    client = _ai_client()
+    # In-memory clips go inline with the request; no separate file upload.
+    if isinstance(audio, str):
+        myfile = genai_client(api_key).files.upload(file=audio)
+    else:
+        myfile = client.backend.audio_part(audio.wav_bytes())
+    reply = parse_reply(client.generate([TODO_PROMPT, myfile]))
+    return reply.transcript, reply.todos
 
 
 def append_todos(todos):
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Applying a batch of AI actions: one transaction vs one mutation per item.
+
+Builds a reminder list of --size items, then adds a --batch of shopping items
+(some already on the list, some repeated in the batch) two ways:
+- per-item: one apply_actions() call per item, as the prototypes appended one
+  line at a time: a reminders_version bump, a list insert and an oplog write each
+- batched:  one apply_actions() call for the whole batch
+
+Each version bump is a re-render of the list, so the bump count is the number
+of frames the panel would be asked for. Both paths go through reduce_snapshot
+(copy-on-write model) like the runner, and write a real, fsync'ed oplog.
+
+Example:
+  python tools/bench_action_router.py --size 2000 --batch 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from app.ai.action_router import apply_actions
+from app.core.snapshot import fork, freeze
+from app.core.state import AppState, DashboardModel, Reminder
+from app.storage.oplog import OpLog
+
+_WORDS = ("milk", "eggs", "bread", "apples", "rice", "coffee", "butter", "tea", "pasta", "beans", "soap", "salt")
+
+
+def _build_state(n: int, rng: random.Random) -> AppState:
+    reminders = [
+        Reminder(rid=f"r{i}", title=f"{rng.choice(_WORDS).title()} {i}", completed=i >= n * 2 // 3, category="shopping")
+        for i in range(n)
+    ]
+    return freeze(AppState(model=DashboardModel(reminders=reminders)))
+
+
+def _batch(state: AppState, n: int, rng: random.Random) -> list[str]:
+    items = [f"{rng.choice(_WORDS).title()} {1000000 + k}" for k in range(n)]
+    # A few already open on the list and a few said twice.
+    for k in range(0, n, 10):
+        items[k] = state.model.reminders[k].title
+    for k in range(5, n, 10):
+        items[k] = items[k - 1]
+    return items
+
+
+def _run(state: AppState, groups: list[list[str]], oplog: OpLog) -> tuple[AppState, float, int]:
+    t0 = time.perf_counter()
+    v0 = state.ui.reminders_version
+    for group in groups:
+        nxt = fork(state)
+        apply_actions(nxt, [{"type": "add_shopping_items", "items": group}], now=1.0e9, source="bench", oplog=oplog)
+        state = freeze(nxt)
+    return state, time.perf_counter() - t0, state.ui.reminders_version - v0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Batched vs per-item action application")
+    parser.add_argument("--size", type=int, default=2000, help="Reminders already on the list")
+    parser.add_argument("--batch", type=int, default=50, help="Items in the AI reply")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--no-fsync", action="store_true", help="Skip fsync on oplog writes")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results: dict[str, list[tuple[float, int, int, int]]] = {"per-item": [], "batched": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        for r in range(args.rounds):
+            base = _build_state(args.size, rng)
+            items = _batch(base, args.batch, rng)
+            for mode, groups in (("per-item", [[it] for it in items]), ("batched", [items])):
+                oplog = OpLog(os.path.join(tmp, f"{mode}-{r}.jsonl"), fsync=not args.no_fsync)
+                state, dt, bumps = _run(base, groups, oplog)
+                oplog.close()
+                results[mode].append((dt, bumps, oplog.stats.writes, len(state.model.reminders) - args.size))
+
+    final = {mode: rows[-1][3] for mode, rows in results.items()}
+    for mode, rows in results.items():
+        dt = sum(row[0] for row in rows) / len(rows)
+        _, bumps, writes, added = rows[-1]
+        print(
+            f"  {mode:<9} {dt * 1e3:7.2f} ms per reply  re-renders {bumps:3d}  oplog writes {writes:3d}  "
+            f"added {added}/{args.batch} (rest duplicates)"
+        )
+    ok = final["per-item"] == final["batched"] and results["batched"][-1][1] <= 1 and results["batched"][-1][2] <= 1
+    print(f"  same items added: {final['per-item'] == final['batched']}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+AI client wrapper (app.ai.client.AiClient) against the fake model server.
+
+Sends --requests text commands from --threads concurrent callers. Commands
+come from data/intent_corpus.jsonl with a skewed (Zipf-like) popularity and
+random case/punctuation changes, and some are fired twice at the same moment
+(two screens, an impatient double press). Two configurations:
+- plain:   no cache, no coalescing, no retries (a fresh request per call, as
+           the hardware demos did)
+- wrapped: TTL cache + coalescing + timeout/retries with backoff
+
+Reports hit rate, coalesced requests, backend calls, failures and latency
+percentiles per configuration. The server runs in-process unless --url is set.
+
+Example:
+  python tools/bench_ai_client.py --requests 200 --fail-rate 0.05 --hang-rate 0.02
+  python tools/bench_ai_client.py --url http://127.0.0.1:8765/generate
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import json
+import os
+import random
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+for p in (REPO_ROOT, TOOLS_DIR):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from app.ai.client import AiClient, HttpBackend
+from fake_model_server import FakeConfig, start_server
+
+NOW = datetime(2026, 3, 2, 10, 0)
+
+
+def _workload(n: int, rng: random.Random) -> list[list[str]]:
+    """Groups of texts sent at the same moment (mostly one, sometimes a duplicate pair)."""
+    with open(os.path.join(REPO_ROOT, "data", "intent_corpus.jsonl"), "r", encoding="utf-8") as f:
+        texts = [t for t in (json.loads(line)["text"] for line in f if line.strip()) if t]
+    rng.shuffle(texts)
+    weights = [1.0 / (k + 1) for k in range(len(texts))]
+    groups: list[list[str]] = []
+    while sum(len(g) for g in groups) < n:
+        text = rng.choices(texts, weights)[0]
+        if rng.random() < 0.3:
+            text = text.capitalize() + rng.choice(["", ".", "!", " "])
+        groups.append([text, text] if rng.random() < 0.15 else [text])
+    return groups
+
+
+def _run(client: AiClient, groups: list[list[str]], threads: int) -> tuple[int, float]:
+    failed = 0
+
+    def one(text: str) -> bool:
+        try:
+            client.analyze_text(text, NOW)
+            return True
+        except Exception:
+            return False
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        pending = []
+        for group in groups:
+            pending += [pool.submit(one, text) for text in group]
+            time.sleep(0.002)
+        failed = sum(not f.result() for f in pending)
+    return failed, time.perf_counter() - t0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="AiClient cache/coalescing/retry bench")
+    parser.add_argument("--url", default="", help="Model endpoint (default: in-process fake server)")
+    parser.add_argument("--requests", type=int, default=160)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--fail-rate", type=float, default=0.05)
+    parser.add_argument("--hang-rate", type=float, default=0.02)
+    parser.add_argument("--timeout-s", type=float, default=1.5)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    url = args.url
+    server = None
+    if not url:
+        config = FakeConfig(latency_ms=args.latency_ms, jitter_ms=args.latency_ms / 3, fail_rate=args.fail_rate,
+                            hang_rate=args.hang_rate, hang_s=args.timeout_s * 3, seed=args.seed)
+        server, _ = start_server(config=config)
+        url = f"http://127.0.0.1:{server.server_address[1]}/generate"
+
+    groups = _workload(args.requests, random.Random(args.seed))
+    configs = {
+        "plain": dict(ttl_s=0.0, coalesce=False, retries=0),
+        "wrapped": dict(ttl_s=600.0, coalesce=True, retries=2, backoff_s=0.05),
+    }
+    for name, kw in configs.items():
+        client = AiClient(HttpBackend(url), timeout_s=args.timeout_s, **kw)
+        failed, wall = _run(client, groups, args.threads)
+        s = client.stats
+        print(
+            f"  {name:<8} {s.requests} requests in {wall:5.1f}s  hit rate {s.hit_rate * 100:4.1f}%  "
+            f"coalesced {s.coalesced:3d}  backend calls {s.calls:3d} (retries {s.retries})  failed {failed:2d}\n"
+            f"           latency p50 {s.percentile(0.5) * 1e3:6.0f} ms  p95 {s.percentile(0.95) * 1e3:6.0f} ms  "
+            f"p99 {s.percentile(0.99) * 1e3:6.0f} ms  max {max(s.latency_s) * 1e3:6.0f} ms"
+        )
+    if server is not None:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
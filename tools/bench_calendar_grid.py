@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Calendar date scrolling: uncached render vs cached month grid vs cursor re-render.
+
+Scrolls the calendar cursor with Rotate(+1)/Rotate(-1) in date mode over
+--days either side of today (so the walk crosses month boundaries) and, for
+each move, compares
+- uncached: render_calendar() with the month grid cache cleared, i.e. every
+            day cell drawn again (the cost before the cache)
+- cached:   render_calendar() into a fresh image from the cached month grid
+- cursor:   rerender_calendar_cursor() into the previous frame (old cell, new
+            cell, the agenda header, and the agenda list when the new day's
+            differs); a month change falls back to a full render
+
+Every incremental frame is checked pixel-for-pixel against the full render,
+for the RGB and panel themes. Also prints the dirty rect area, which is what
+a partial panel refresh sends.
+
+Example:
+  python tools/bench_calendar_grid.py --days 45
+  python tools/bench_calendar_grid.py --panel --moves 400
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+import os
+import sys
+import time
+
+from PIL import Image, ImageChops
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from app.core import clock
+from app.core.reducer import Rotate
+from app.core.snapshot import freeze, reduce_snapshot
+from app.core.state import AppState, Screen
+from app.render.panel import build_panel_theme
+from app.ui import calendar as calendar_ui
+from app.ui.calendar import render_calendar, rerender_calendar_cursor
+from run_epaper_console import _build_fonts, _load_model, _load_theme
+
+NOW = datetime(2026, 3, 14, 9, 30)
+
+
+def _ms(samples: list[float]) -> str:
+    if not samples:
+        return "     -"
+    s = sorted(samples)
+    return f"{s[len(s) // 2] * 1e3:6.2f}"
+
+
+def _run(theme: dict, fonts, args) -> bool:
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    state = AppState(model=_load_model(REPO_ROOT))
+    state.ui.screen = Screen.CALENDAR
+    state = freeze(state)
+    bg = theme.get("bg", (255, 255, 255))
+
+    frame = Image.new("RGB", (w, h), bg)
+    layout = render_calendar(frame, state, fonts, theme)
+    uncached_t: list[float] = []
+    cached_t: list[float] = []
+    cursor_t: list[float] = []
+    area = 0
+    fallbacks = 0
+    ok = True
+    step = 1
+    for i in range(args.moves):
+        off = int(state.ui.calendar_offset_days or 0)
+        if abs(off + step) > args.days:
+            step = -step
+        state = reduce_snapshot(state, Rotate(step), theme=theme)
+
+        t0 = time.perf_counter()
+        rects = rerender_calendar_cursor(frame, state, fonts, theme, layout)
+        t1 = time.perf_counter()
+        if rects is None:
+            fallbacks += 1
+            frame = Image.new("RGB", (w, h), bg)
+            layout = render_calendar(frame, state, fonts, theme)
+        else:
+            cursor_t.append(t1 - t0)
+            area += sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in rects)
+            if any(x0 % 8 or (x1 % 8 and x1 != w) for x0, _y0, x1, _y1 in rects):
+                print(f"    move {i}: dirty rect not 8-px aligned: {rects}")
+                ok = False
+
+        t2 = time.perf_counter()
+        ref = Image.new("RGB", (w, h), bg)
+        render_calendar(ref, state, fonts, theme)
+        cached_t.append(time.perf_counter() - t2)
+
+        grids = dict(calendar_ui._GRIDS)
+        calendar_ui._GRIDS.clear()
+        t3 = time.perf_counter()
+        render_calendar(Image.new("RGB", (w, h), bg), state, fonts, theme)
+        uncached_t.append(time.perf_counter() - t3)
+        calendar_ui._GRIDS.clear()
+        calendar_ui._GRIDS.update(grids)
+
+        diff = ImageChops.difference(frame, ref).getbbox()
+        if diff is not None:
+            print(f"    move {i}: offset={state.ui.calendar_offset_days} differs from full render in {diff}")
+            ok = False
+            frame = Image.new("RGB", (w, h), bg)
+            layout = render_calendar(frame, state, fonts, theme)
+
+    n = max(1, len(cursor_t))
+    print(
+        f"    uncached p50={_ms(uncached_t)} ms  cached p50={_ms(cached_t)} ms  cursor p50={_ms(cursor_t)} ms  "
+        f"dirty={area / n / (w * h) * 100:5.1f}% of frame/move  month changes={fallbacks}  {'ok' if ok else 'MISMATCH'}"
+    )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the calendar month grid cache and cursor re-render")
+    parser.add_argument("--size", default="800x480", help="Frame size WxH")
+    parser.add_argument("--moves", type=int, default=200, help="Cursor moves per theme")
+    parser.add_argument("--days", type=int, default=45, help="Scroll this many days either side of today")
+    parser.add_argument("--panel", action="store_true", help="Only test the panel (1-bit) theme")
+    args = parser.parse_args()
+
+    fonts = _build_fonts(REPO_ROOT)
+    base = _load_theme(os.path.join(REPO_ROOT, "ui_tuner_theme.json"))
+    ok = True
+    with clock.frozen(NOW.timestamp()):
+        for panel in ((True,) if args.panel else (False, True)):
+            theme = build_panel_theme(base) if panel else base
+            print(f"  {'panel' if panel else 'rgb  '}")
+            ok = _run(theme, fonts, args) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Calendar day queries on large calendars: scan vs app.core.calendar_index.
+
+Builds --events one-off events spread over three years plus --rules weekly /
+monthly recurring ones, then rotates the calendar cursor over --days days.
+Each step asks what render_calendar needs: the events on the cursor day and
+the days with events in the cursor month. Compares:
+- scan:  test every event against every day of the month (what per-day
+         dots would cost without an index)
+- index: CalendarIndex month views (built once per month, then reused
+         while the calendar does not change)
+
+Example:
+  python tools/bench_calendar_index.py --events 5000 --rules 200 --days 730
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import date, datetime, timedelta
+import os
+import random
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from app.core.calendar_index import CalendarIndex
+from app.core.recurrence import event_days, event_recurrence
+from app.core.state import CalendarEvent
+
+TODAY = date(2026, 3, 14)
+
+
+def _build(n: int, rules: int, rng: random.Random) -> list[CalendarEvent]:
+    base = datetime(2025, 1, 1)
+    events = []
+    for i in range(n):
+        start = base + timedelta(days=rng.randrange(365 * 3), hours=rng.randrange(7, 21))
+        length = timedelta(hours=1) if rng.random() < 0.95 else timedelta(days=rng.randint(1, 5))
+        events.append(CalendarEvent(f"e{i}", f"Event {i}", start=start.timestamp(), end=(start + length).timestamp()))
+    for i in range(rules):
+        start = base + timedelta(days=rng.randrange(365), hours=rng.randrange(7, 21))
+        rule = rng.choice(["FREQ=WEEKLY", "FREQ=WEEKLY;INTERVAL=2", "FREQ=MONTHLY", "FREQ=DAILY;INTERVAL=3"])
+        events.append(CalendarEvent(f"r{i}", f"Rule {i}", start=start.timestamp(), end=(start + timedelta(hours=1)).timestamp(), rrule=rule))
+    return events
+
+
+def _scan(events: list[CalendarEvent], day: date) -> tuple[int, int]:
+    first = day.replace(day=1).toordinal()
+    last = (day.replace(day=28) + timedelta(days=4)).replace(day=1).toordinal() - 1
+    on_day = 0
+    month_days = set()
+    d = day.toordinal()
+    for ev in events:
+        lo, hi = event_days(ev)
+        rec = event_recurrence(ev)
+        if rec is not None:
+            spans = [(s, s + hi - lo) for s in rec.starts(first, last)]
+        else:
+            spans = [(lo, hi)]
+        for s, e in spans:
+            if s <= d <= e:
+                on_day += 1
+            for k in range(max(s, first), min(e, last) + 1):
+                month_days.add(k)
+    return on_day, len(month_days)
+
+
+def _timed(fn, days: list[date]) -> tuple[list[float], list]:
+    samples, results = [], []
+    for day in days:
+        t0 = time.perf_counter()
+        results.append(fn(day))
+        samples.append(time.perf_counter() - t0)
+    return samples, results
+
+
+def _report(label: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    print(
+        f"  {label:<6} p50={statistics.median(samples) * 1e3:8.3f} ms  "
+        f"p95={samples[int(len(samples) * 0.95) - 1] * 1e3:8.3f} ms  max={samples[-1] * 1e3:8.3f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Calendar day/month queries: scan vs index")
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--rules", type=int, default=200)
+    parser.add_argument("--days", type=int, default=730, help="Cursor steps (one per rotary detent)")
+    parser.add_argument("--seed", type=int, default=17)
+    args = parser.parse_args()
+
+    events = _build(args.events, args.rules, random.Random(args.seed))
+    days = [TODAY + timedelta(days=k - args.days // 2) for k in range(args.days)]
+
+    t0 = time.perf_counter()
+    index = CalendarIndex(events, 0, TODAY)
+    build = time.perf_counter() - t0
+
+    def indexed(day: date) -> tuple[int, int]:
+        return len(index.events_on(day)), len(index.days_with_events(day.year, day.month))
+
+    print(f"events={args.events} rules={args.rules} steps={args.days}  (index build {build * 1e3:.1f} ms, once)")
+    scan_s, scan_r = _timed(lambda d: _scan(events, d), days)
+    _report("scan", scan_s)
+    index_s, index_r = _timed(indexed, days)
+    _report("index", index_s)
+    same = scan_r == index_r
+    print(f"  same answers: {same}  speedup (p50) {statistics.median(scan_s) / max(1e-9, statistics.median(index_s)):.0f}x")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
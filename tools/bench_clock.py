@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Minute clock refresh: ClockUpdater partial frames vs full renders.
+
+Steps the (pinned) clock minute by minute from --start and, for each minute,
+compares the frame ClockUpdater produces for a MinuteTick against a full
+render + quantize at that minute. Reports how many ticks became partial
+refreshes, the refreshed area and the CPU time per tick.
+
+Example:
+  python tools/bench_clock.py --start "2026-03-14 23:30" --minutes 60
+  python tools/bench_clock.py --variants classic --no-panel
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+import os
+import sys
+import time
+
+from PIL import Image, ImageChops
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from app.core import clock
+from app.core.snapshot import freeze
+from app.core.state import AppState
+from app.render.clock_updater import ClockUpdater, MinuteTick, PanelFrame
+from app.render.panel import build_panel_theme, quantize_for_panel
+from app.ui.app import render_app
+from run_epaper_console import _build_fonts, _load_model, _load_theme
+
+
+def _ms(samples: list[float]) -> str:
+    if not samples:
+        return "     -"
+    s = sorted(samples)
+    return f"{s[len(s) // 2] * 1e3:6.2f}"
+
+
+def _run(theme: dict, fonts, args) -> bool:
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    t0 = datetime.strptime(args.start, "%Y-%m-%d %H:%M").timestamp()
+
+    def full(state: AppState) -> PanelFrame:
+        rgb = Image.new("RGB", (w, h), theme.get("bg", (255, 255, 255)))
+        render_app(rgb, state, fonts, theme)
+        image = quantize_for_panel(rgb)
+        return PanelFrame(image, image.tobytes())
+
+    updater = ClockUpdater(full, fonts, theme, quantize=quantize_for_panel, pack=lambda im: im.tobytes())
+    with clock.frozen(t0):
+        state = freeze(AppState(model=_load_model(REPO_ROOT)))
+        updater.render(state)
+
+    tick_t: list[float] = []
+    area = 0
+    partial = 0
+    ok = True
+    for m in range(1, args.minutes + 1):
+        with clock.frozen(t0 + 60.0 * m):
+            c0 = time.perf_counter()
+            frame = updater.render(MinuteTick(state))
+            tick_t.append(time.perf_counter() - c0)
+            ref = full(state)
+        if frame.rects:
+            partial += 1
+            area += sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in frame.rects)
+        diff = ImageChops.difference(frame.image.convert("L"), ref.image.convert("L")).getbbox()
+        if diff is not None:
+            print(f"    minute {m}: differs from full render in {diff}")
+            ok = False
+
+    n = max(1, partial)
+    print(
+        f"    ticks={args.minutes} partial={partial} full={updater.full_updates - 1}  tick p50={_ms(tick_t)} ms  "
+        f"area={area / n / (w * h) * 100:5.2f}% of frame/partial  {'ok' if ok else 'MISMATCH'}"
+    )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check and time minute clock partial refreshes")
+    parser.add_argument("--size", default="800x480", help="Frame size WxH")
+    parser.add_argument("--start", default="2026-03-14 23:50", help="Local start time YYYY-MM-DD HH:MM")
+    parser.add_argument("--minutes", type=int, default=30, help="Minute ticks to simulate")
+    parser.add_argument("--variants", default="kitchen,classic", help="home_variant values")
+    parser.add_argument("--no-panel", action="store_true", help="Use the RGB theme instead of the panel theme")
+    args = parser.parse_args()
+
+    fonts = _build_fonts(REPO_ROOT)
+    base = _load_theme(os.path.join(REPO_ROOT, "ui_tuner_theme.json"))
+    ok = True
+    for variant in args.variants.split(","):
+        theme = dict(base, home_variant=variant)
+        if not args.no_panel:
+            theme = build_panel_theme(theme)
+        print(f"  {variant}")
+        ok = _run(theme, fonts, args) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Kitchen home focus moves: full re-render vs per-row re-render.
+
+Walks the focus through the right panel with Rotate(+1)/Rotate(-1) and, for
+each move, compares
+- full: render_home_kitchen() into a fresh image
+- rows: rerender_kitchen_rows() into the previous frame (old + new focused row)
+
+Every incremental frame is checked pixel-for-pixel against the full render,
+for the RGB and panel themes across focus/badge styles. Also prints the dirty
+rect area, which is what a partial panel refresh sends.
+
+Example:
+  python tools/bench_focus_rows.py --moves 200
+  python tools/bench_focus_rows.py --panel --styles rail --badges text
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from PIL import Image, ImageChops
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from app.core.reducer import Rotate
+from app.core.snapshot import freeze, reduce_snapshot
+from app.core.state import AppState
+from app.render.panel import build_panel_theme
+from app.ui.home_kitchen import render_home_kitchen, rerender_kitchen_rows
+from run_epaper_console import _build_fonts, _load_model, _load_theme
+
+
+def _ms(samples: list[float]) -> str:
+    if not samples:
+        return "     -"
+    s = sorted(samples)
+    return f"{s[len(s) // 2] * 1e3:6.2f}"
+
+
+def _run(theme: dict, fonts, args) -> bool:
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    state = freeze(AppState(model=_load_model(REPO_ROOT)))
+    bg = theme.get("bg", (255, 255, 255))
+
+    frame = Image.new("RGB", (w, h), bg)
+    layout = render_home_kitchen(frame, state, fonts, theme)
+    full_t: list[float] = []
+    rows_t: list[float] = []
+    area = 0
+    fallbacks = 0
+    ok = True
+    step = 1
+    for i in range(args.moves):
+        nxt = reduce_snapshot(state, Rotate(step), theme=theme)
+        if nxt.ui.focused_index == state.ui.focused_index:
+            step = -step  # bounced off an end of the queue
+            nxt = reduce_snapshot(state, Rotate(step), theme=theme)
+        state = nxt
+
+        t0 = time.perf_counter()
+        rects = rerender_kitchen_rows(frame, state, fonts, theme, layout)
+        t1 = time.perf_counter()
+        if rects is None:
+            fallbacks += 1
+            frame = Image.new("RGB", (w, h), bg)
+            layout = render_home_kitchen(frame, state, fonts, theme)
+        else:
+            rows_t.append(t1 - t0)
+            area += sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in rects)
+            if any(x0 % 8 or (x1 % 8 and x1 != w) for x0, _y0, x1, _y1 in rects):
+                print(f"    move {i}: dirty rect not 8-px aligned: {rects}")
+                ok = False
+
+        t2 = time.perf_counter()
+        ref = Image.new("RGB", (w, h), bg)
+        render_home_kitchen(ref, state, fonts, theme)
+        full_t.append(time.perf_counter() - t2)
+
+        diff = ImageChops.difference(frame, ref).getbbox()
+        if diff is not None:
+            print(f"    move {i}: focus={state.ui.focused_index} differs from full render in {diff}")
+            ok = False
+            frame = Image.new("RGB", (w, h), bg)
+            layout = render_home_kitchen(frame, state, fonts, theme)
+
+    n = max(1, len(rows_t))
+    print(
+        f"    full p50={_ms(full_t)} ms  rows p50={_ms(rows_t)} ms  "
+        f"dirty={area / n / (w * h) * 100:5.1f}% of frame/move  fallbacks={fallbacks}  {'ok' if ok else 'MISMATCH'}"
+    )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-row kitchen focus re-render")
+    parser.add_argument("--size", default="800x480", help="Frame size WxH")
+    parser.add_argument("--moves", type=int, default=60, help="Focus moves per configuration")
+    parser.add_argument("--panel", action="store_true", help="Only test the panel (1-bit) theme")
+    parser.add_argument("--styles", default="row_box,rail", help="b_right_focus_style values")
+    parser.add_argument(
+        "--badges",
+        default="text,text_focus_invert,outline,invert,focus_invert",
+        help="b_badge_style values",
+    )
+    args = parser.parse_args()
+
+    fonts = _build_fonts(REPO_ROOT)
+    base = _load_theme(os.path.join(REPO_ROOT, "ui_tuner_theme.json"))
+    base["home_variant"] = "kitchen"
+    ok = True
+    for panel in ((True,) if args.panel else (False, True)):
+        for style in args.styles.split(","):
+            for badge in args.badges.split(","):
+                theme = dict(base, b_right_focus_style=style, b_badge_style=badge)
+                if panel:
+                    theme = build_panel_theme(theme)
+                print(f"  {'panel' if panel else 'rgb  '} focus={style:<8} badge={badge}")
+                ok = _run(theme, fonts, args) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
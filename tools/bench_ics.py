@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+ICS import throughput: stream-parse a large calendar export, then re-import it.
+
+Writes a synthetic export of about --size-mb MB (or reads --path): timed
+events in a TZID zone, UTC and all-day events, weekly/monthly series with
+EXDATEs and overridden instances, alarms, and long folded descriptions, as
+Google/Apple exports have. Reports
+- parse:    read_ics() over the whole file (MB/s, events/s) and the process
+            peak RSS growth, which stays small because only one VEVENT is
+            held at a time
+- import:   calendar_events() into CalendarEvents
+- re-import: the same file with --changed events given a higher SEQUENCE and
+            --removed events deleted; diff_calendar() must report exactly those
+
+Example:
+  python tools/bench_ics.py --size-mb 50
+  python tools/bench_ics.py --path ~/Downloads/family.ics
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from app.data.ics import calendar_events, diff_calendar, read_ics
+
+_HEADER = """BEGIN:VCALENDAR\r
+VERSION:2.0\r
+PRODID:-//bench//ics//EN\r
+BEGIN:VTIMEZONE\r
+TZID:America/New_York\r
+BEGIN:STANDARD\r
+DTSTART:19701101T020000\r
+TZOFFSETFROM:-0400\r
+TZOFFSETTO:-0500\r
+END:STANDARD\r
+END:VTIMEZONE\r
+"""
+
+
+def _fold(line: str) -> str:
+    # RFC 5545: at most 75 octets per line, continuations start with a space.
+    out = [line[:75]]
+    for k in range(75, len(line), 74):
+        out.append(" " + line[k : k + 74])
+    return "\r\n".join(out) + "\r\n"
+
+
+def _vevent(i: int, seq: int, rng: random.Random) -> str:
+    start = datetime(2023, 1, 1, 7) + timedelta(days=rng.randrange(365 * 4), hours=rng.randrange(14))
+    stamp = start.strftime("%Y%m%dT%H%M%S")
+    lines = ["BEGIN:VEVENT", f"UID:{i:08d}@bench.example", f"SEQUENCE:{seq}", "DTSTAMP:20260301T000000Z"]
+    lines.append(f"LAST-MODIFIED:{(datetime(2026, 1, 1) + timedelta(minutes=i + seq)).strftime('%Y%m%dT%H%M%S')}Z")
+    lines.append(f"SUMMARY:Event {i}\\, room {rng.randrange(100)}")
+    kind = i % 10
+    if kind == 0:
+        lines += [f"DTSTART;VALUE=DATE:{start:%Y%m%d}", f"DTEND;VALUE=DATE:{start + timedelta(days=2):%Y%m%d}"]
+    elif kind == 1:
+        lines += [f"DTSTART:{stamp}Z", "DURATION:PT45M"]
+    else:
+        end = (start + timedelta(hours=1)).strftime("%Y%m%dT%H%M%S")
+        lines += [f"DTSTART;TZID=America/New_York:{stamp}", f"DTEND;TZID=America/New_York:{end}"]
+    if kind == 2:
+        lines.append("RRULE:FREQ=WEEKLY;BYDAY=TU,TH;UNTIL=20271231T235959Z")
+        ex = (start + timedelta(days=14)).strftime("%Y%m%dT%H%M%S")
+        lines.append(f"EXDATE;TZID=America/New_York:{ex}")
+    elif kind == 3:
+        lines.append("RRULE:FREQ=MONTHLY;BYDAY=2TU;COUNT=12")
+    description = " ".join(f"word{rng.randrange(10000)}" for _ in range(rng.randrange(20, 60)))
+    lines.append(f"DESCRIPTION:{description}\\nSecond line")
+    lines.append(f"LOCATION:{rng.randrange(999)} Main St\\, Springfield")
+    body = "".join(_fold(line) for line in lines)
+    body += "BEGIN:VALARM\r\nACTION:DISPLAY\r\nTRIGGER:-PT15M\r\nDESCRIPTION:Reminder\r\nEND:VALARM\r\n"
+    body += "END:VEVENT\r\n"
+    if kind == 2:
+        # One moved instance of the series.
+        moved = (start + timedelta(days=7)).strftime("%Y%m%dT%H%M%S")
+        later = (start + timedelta(days=7, hours=2)).strftime("%Y%m%dT%H%M%S")
+        body += (
+            f"BEGIN:VEVENT\r\nUID:{i:08d}@bench.example\r\nRECURRENCE-ID;TZID=America/New_York:{moved}\r\n"
+            f"SUMMARY:Event {i} (moved)\r\nDTSTART;TZID=America/New_York:{later}\r\nDURATION:PT1H\r\nEND:VEVENT\r\n"
+        )
+    return body
+
+
+def _write(path: str, size_mb: float, seed: int, *, bump: set[int] = frozenset(), drop: set[int] = frozenset()) -> int:
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    n = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(_HEADER)
+        while written < target:
+            block = _vevent(n, 1 if n in bump else 0, rng)
+            if n not in drop:
+                f.write(block)
+            written += len(block)
+            n += 1
+        f.write("END:VCALENDAR\r\n")
+    return n
+
+
+def _series(eid: str) -> int:
+    """Series number of a synthetic event ("family:00000042@bench.example#...")."""
+    return int(eid.split(":", 1)[1].split("@")[0])
+
+
+def _rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stream-parse and re-import a large .ics export")
+    parser.add_argument("--path", default="", help="Parse this file instead of a synthetic one (no re-import check)")
+    parser.add_argument("--size-mb", type=float, default=50.0)
+    parser.add_argument("--changed", type=int, default=500, help="Events given a higher SEQUENCE in the re-import")
+    parser.add_argument("--removed", type=int, default=100, help="Events deleted in the re-import")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    tmp = None
+    path = args.path
+    if not path:
+        tmp = tempfile.mkdtemp(prefix="bench_ics_")
+        path = os.path.join(tmp, "family.ics")
+        n = _write(path, args.size_mb, args.seed)
+        print(f"wrote {path}: {n} VEVENT series")
+    size = os.path.getsize(path)
+    ok = True
+    try:
+        rss0 = _rss_mb()
+        errors: list[str] = []
+        t0 = time.perf_counter()
+        count = sum(1 for _ in read_ics(path, errors))
+        parse_s = time.perf_counter() - t0
+        print(
+            f"  parse    {size / 1e6:7.1f} MB  {count} VEVENTs in {parse_s:.2f} s  "
+            f"{size / 1e6 / parse_s:6.1f} MB/s  {count / parse_s:8.0f} events/s  "
+            f"peak RSS +{_rss_mb() - rss0:.1f} MB  errors={len(errors)}"
+        )
+        t0 = time.perf_counter()
+        first = calendar_events(read_ics(path), source="family")
+        import_s = time.perf_counter() - t0
+        print(f"  import   {len(first)} CalendarEvents in {import_s:.2f} s  ({len(first) / import_s:.0f} events/s)")
+        if tmp is None:
+            return 0
+
+        rng = random.Random(args.seed + 1)
+        series = sorted({_series(ev.eid) for ev in first})
+        picked = rng.sample(series, args.changed + args.removed)
+        bump, drop = set(picked[: args.changed]), set(picked[args.changed :])
+        _write(path, args.size_mb, args.seed, bump=bump, drop=drop)
+        t0 = time.perf_counter()
+        second = calendar_events(read_ics(path), source="family")
+        diff = diff_calendar(first, second, source="family")
+        reimport_s = time.perf_counter() - t0
+        upserted = {_series(ev.eid) for ev in diff.upserts}
+        removed = {_series(eid) for eid in diff.removed}
+        ok = upserted == bump and removed == drop
+        print(
+            f"  re-import {reimport_s:.2f} s: {len(diff.upserts)} updated, {len(diff.removed)} removed, "
+            f"{diff.unchanged} unchanged  matches the edits: {ok}"
+        )
+    finally:
+        if tmp is not None:
+            os.remove(path)
+            os.rmdir(tmp)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Measure knob input latency: kernel event timestamp -> reducer event delivery.
+
+Modes:
+- default (fake device): a writer thread pushes input_event records stamped
+  with the current time into a pipe; the evdev reader + InputLoop decode them.
+  Measures the user-space part of the path without hardware or uinput.
+- --device /dev/input/eventN: read a real device (turn the knob) for --count events.
+- --capture FILE: decode a captured stream (`cat /dev/input/eventN > FILE`)
+  and print the reducer events it produces.
+
+Example:
+  python tools/bench_input.py --events 5000 --rate 500
+  python tools/bench_input.py --device /dev/input/event0 --count 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from app.input.evdev import (
+    EV_KEY,
+    EV_REL,
+    EV_SYN,
+    KEY_ENTER,
+    REL_X,
+    EvdevDevice,
+    decode_event_file,
+    pack_input_event,
+)
+from app.input.loop import InputLoop
+
+
+def _report(latencies: list[float]) -> None:
+    if not latencies:
+        print("  no events delivered")
+        return
+    s = sorted(latencies)
+    pct = lambda q: s[min(len(s) - 1, int(len(s) * q))] * 1e6
+    print(f"  events={len(s)}  p50={pct(0.5):8.1f} us  p95={pct(0.95):8.1f} us  p99={pct(0.99):8.1f} us  max={s[-1] * 1e6:8.1f} us")
+
+
+def _fake(args) -> int:
+    rfd, wfd = os.pipe()
+    dev = EvdevDevice(rfd)
+    delivered: list[float] = []
+    done = threading.Event()
+
+    def sink(ts, ev):
+        delivered.append(time.monotonic() - ts)
+        if len(delivered) >= args.events:
+            done.set()
+
+    loop = InputLoop([dev], sink)
+    stop = threading.Event()
+    th = threading.Thread(target=loop.run, args=(stop,), kwargs={"timeout": 0.05}, daemon=True)
+    th.start()
+
+    rng = random.Random(args.seed)
+    gap = 1.0 / max(1.0, float(args.rate))
+    sent = 0
+    while sent < args.events:
+        now = time.time()
+        if rng.random() < 0.9:
+            rec = pack_input_event(now, EV_REL, REL_X, rng.choice((-1, 1)))
+            sent += 1
+        else:
+            # Press + release 60 ms apart -> one Click.
+            rec = pack_input_event(now, EV_KEY, KEY_ENTER, 1) + pack_input_event(now + 0.06, EV_KEY, KEY_ENTER, 0)
+            sent += 1
+        os.write(wfd, rec + pack_input_event(now, EV_SYN, 0, 0))
+        time.sleep(gap)
+    done.wait(5.0)
+    stop.set()
+    th.join(1.0)
+    os.close(wfd)
+    loop.close()
+    print(f"fake device: {args.events} records at ~{args.rate:.0f}/s")
+    # Clicks are timestamped at release (written 60 ms in the future); report rotations only.
+    _report([d for d in delivered if d >= 0])
+    return 0
+
+
+def _device(args) -> int:
+    dev = EvdevDevice(args.device, grab=args.grab)
+    latencies: list[float] = []
+
+    def sink(ts, ev):
+        lat = time.monotonic() - ts
+        latencies.append(lat)
+        print(f"  {type(ev).__name__:<10} {getattr(ev, 'delta', '')!s:>3}  latency={lat * 1e6:8.1f} us")
+
+    loop = InputLoop([dev], sink)
+    try:
+        while len(latencies) < args.count:
+            loop.run_once(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.close()
+    _report(latencies)
+    return 0
+
+
+def _capture(args) -> int:
+    t0 = None
+    for ts, ev in decode_event_file(args.capture):
+        t0 = ts if t0 is None else t0
+        print(f"  +{ts - t0:9.4f}s  {type(ev).__name__:<10} {getattr(ev, 'delta', '')}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure evdev knob input latency")
+    parser.add_argument("--device", default="", help="Real evdev node to read")
+    parser.add_argument("--grab", action="store_true", help="EVIOCGRAB the device while measuring")
+    parser.add_argument("--count", type=int, default=50, help="Events to read from --device")
+    parser.add_argument("--capture", default="", help="Decode a captured event stream file")
+    parser.add_argument("--events", type=int, default=5000, help="Fake-device records to send")
+    parser.add_argument("--rate", type=float, default=500.0, help="Fake-device records per second")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.capture:
+        return _capture(args)
+    if args.device:
+        return _device(args)
+    return _fake(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
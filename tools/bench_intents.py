@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Local intent parser (app.ai.intents) against a labelled corpus.
+
+Each corpus line is {"text", "todos"?, "reminders"?: [[text, "YYYY-MM-DD HH:MM"]],
+"escalate"?: true, "now"?: ISO time}. Lines without "escalate" are commands the
+fast path should handle by itself; "escalate" lines must be handed to the model.
+
+Reports:
+- coverage: share of the corpus answered locally
+- accuracy: handled lines whose todos/reminders match the labels exactly
+- wrong answers on lines that should have escalated (the costly failure)
+- parse latency per utterance (p50/p99/max), and with --remote-ms the
+  round trips the fast path saves against the model
+
+Example:
+  python tools/bench_intents.py
+  python tools/bench_intents.py --remote-ms 1800 --verbose
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from app.ai.intents import parse_intent
+
+DEFAULT_NOW = "2026-03-02T10:00"
+
+
+def _pct(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local intent parser coverage/accuracy/latency")
+    parser.add_argument("--corpus", default=os.path.join(REPO_ROOT, "data", "intent_corpus.jsonl"))
+    parser.add_argument("--repeat", type=int, default=200, help="Parses per utterance for the latency figures")
+    parser.add_argument("--remote-ms", type=float, default=0.0, help="Model round trip, for the time saved")
+    parser.add_argument("--verbose", action="store_true", help="Print every line, not just the misses")
+    args = parser.parse_args()
+
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        cases = [json.loads(line) for line in f if line.strip()]
+
+    handled = correct = should_escalate = escalated_ok = wrong_local = missed = 0
+    lat_us: list[float] = []
+    for case in cases:
+        now = datetime.fromisoformat(case.get("now", DEFAULT_NOW))
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            res = parse_intent(case["text"], now)
+        lat_us.append((time.perf_counter() - t0) / args.repeat * 1e6)
+
+        got_todos = res.todos()
+        got_rems = [[r["text"], datetime.fromtimestamp(r["due_ts"]).strftime("%Y-%m-%d %H:%M")] for r in res.reminders()]
+        if case.get("escalate"):
+            should_escalate += 1
+            ok = res.escalate
+            escalated_ok += ok
+            wrong_local += not ok
+            status = "escalated" if ok else "ANSWERED (should escalate)"
+        elif res.escalate:
+            ok = False
+            missed += 1
+            status = f"escalated: {res.reason}"
+        else:
+            handled += 1
+            ok = got_todos == case.get("todos", []) and got_rems == case.get("reminders", [])
+            correct += ok
+            status = "ok" if ok else "WRONG"
+        if args.verbose or not ok:
+            detail = "" if res.escalate else f"  todos={got_todos} reminders={got_rems}"
+            print(f"  [{status}] {case['text']!r}{detail}")
+
+    commands = len(cases) - should_escalate
+    local = handled + wrong_local
+    print(
+        f"  corpus {len(cases)} lines: {commands} commands, {should_escalate} for the model\n"
+        f"  coverage {handled}/{commands} commands handled locally ({handled * 100 / max(1, commands):.0f}%), "
+        f"{missed} escalated needlessly\n"
+        f"  accuracy {correct}/{handled} handled commands exactly right ({correct * 100 / max(1, handled):.0f}%)\n"
+        f"  escalation {escalated_ok}/{should_escalate} correct, {wrong_local} answered locally by mistake\n"
+        f"  latency per utterance: p50 {_pct(lat_us, 0.5):.0f} us, p99 {_pct(lat_us, 0.99):.0f} us, max {max(lat_us):.0f} us"
+    )
+    if args.remote_ms > 0:
+        print(
+            f"  fast path skips {local}/{len(cases)} model calls: ~{local * args.remote_ms / len(cases):.0f} ms saved "
+            f"per utterance on average at {args.remote_ms:.0f} ms per round trip"
+        )
+    return 0 if wrong_local == 0 and correct == handled else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
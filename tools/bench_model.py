@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Memory/time benchmark for the dashboard model item classes.
+
+Compares the slotted `Reminder`/`MemoItem` against an equivalent plain
+`@dataclass` (per-instance __dict__) for 10k-100k items:
+- resident size of the list (tracemalloc)
+- build time
+- toggle time (in-place vs dataclasses.replace)
+- rid -> position lookups (ReminderIndex vs linear scan)
+- kitchen focus moves (reduce(Rotate)) against the full list
+
+Example:
+  python tools/bench_model.py --sizes 10000,50000,100000
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, replace
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from app.core.reducer import Rotate, reduce
+from app.core.reminder_index import ReminderIndex
+from app.core.state import AppState, DashboardModel, MemoItem, Reminder
+
+
+@dataclass
+class _DictReminder:
+    rid: str
+    title: str
+    right: str = ""
+    completed: bool = False
+    category: str = "general"
+    created_at: float = 0.0
+
+
+@dataclass
+class _DictMemo:
+    mid: str
+    text: str
+    author: str
+    timestamp: float
+    is_new: bool = False
+
+
+_CATEGORIES = ("fridge", "shopping", "general")
+
+
+def _build_reminders(cls, n: int) -> list:
+    return [
+        cls(
+            rid=f"r{i}",
+            title=f"Item {i}",
+            right="EXP: 3 DAYS" if i % 3 == 0 else "",
+            completed=(i % 5 == 0),
+            category=_CATEGORIES[i % 3],
+            created_at=1_700_000_000.0 + i,
+        )
+        for i in range(n)
+    ]
+
+
+def _build_memos(cls, n: int) -> list:
+    return [cls(mid=f"m{i}", text=f"Memo number {i}", author="Mom", timestamp=1_700_000_000.0 + i) for i in range(n)]
+
+
+def _measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    out = fn()
+    dt = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, dt, peak
+
+
+def _toggle_replace(items: list, order: list[int]) -> float:
+    t0 = time.perf_counter()
+    for i in order:
+        r = items[i]
+        items[i] = replace(r, completed=not r.completed)
+    return time.perf_counter() - t0
+
+
+def _toggle_in_place(items: list, order: list[int]) -> float:
+    t0 = time.perf_counter()
+    for i in order:
+        r = items[i]
+        r.completed = not r.completed
+    return time.perf_counter() - t0
+
+
+def _lookup_scan(items: list, rids: list[str]) -> float:
+    t0 = time.perf_counter()
+    for rid in rids:
+        for i, r in enumerate(items):
+            if r.rid == rid:
+                break
+    return time.perf_counter() - t0
+
+
+def _lookup_index(index: ReminderIndex, rids: list[str]) -> float:
+    t0 = time.perf_counter()
+    for rid in rids:
+        index.position(rid)
+    return time.perf_counter() - t0
+
+
+def _focus_moves(reminders: list, moves: int) -> float:
+    state = AppState(model=DashboardModel(reminders=reminders))
+    theme = {"home_variant": "kitchen"}
+    reduce(state, Rotate(+1), theme=theme)  # build the index outside the timed loop
+    t0 = time.perf_counter()
+    for i in range(moves):
+        reduce(state, Rotate(+1 if (i // 7) % 2 == 0 else -1), theme=theme)
+    return time.perf_counter() - t0
+
+
+def _run(n: int, toggles: int, lookups: int, seed: int) -> None:
+    rng = random.Random(seed)
+    order = [rng.randrange(n) for _ in range(toggles)]
+    rids = [f"r{rng.randrange(n)}" for _ in range(lookups)]
+
+    dict_rem, dict_build, dict_mem = _measure(lambda: _build_reminders(_DictReminder, n))
+    slot_rem, slot_build, slot_mem = _measure(lambda: _build_reminders(Reminder, n))
+    _, _, dict_memo_mem = _measure(lambda: _build_memos(_DictMemo, n))
+    _, _, slot_memo_mem = _measure(lambda: _build_memos(MemoItem, n))
+
+    dict_toggle = _toggle_replace(dict_rem, order)
+    slot_toggle = _toggle_in_place(slot_rem, order)
+
+    # The linear scan is O(n) per lookup; cap it so 100k runs stay quick.
+    scan_rids = rids[: max(1, min(len(rids), 200))]
+    scan = _lookup_scan(slot_rem, scan_rids) * (len(rids) / len(scan_rids))
+    indexed = _lookup_index(ReminderIndex(slot_rem), rids)
+    moves = 1000
+    focus = _focus_moves(slot_rem, moves)
+
+    print(f"n={n}")
+    print(f"  reminders  mem   dict={dict_mem / 1e6:8.2f} MB  slots={slot_mem / 1e6:8.2f} MB  ({slot_mem / dict_mem:.0%})")
+    print(f"  memos      mem   dict={dict_memo_mem / 1e6:8.2f} MB  slots={slot_memo_mem / 1e6:8.2f} MB  ({slot_memo_mem / dict_memo_mem:.0%})")
+    print(f"  build            dict={dict_build * 1e3:8.1f} ms  slots={slot_build * 1e3:8.1f} ms")
+    print(
+        f"  {toggles} toggles    replace={dict_toggle * 1e3:8.2f} ms  in-place={slot_toggle * 1e3:8.2f} ms"
+        f"  ({dict_toggle / max(1e-9, slot_toggle):.1f}x)"
+    )
+    print(
+        f"  {lookups} lookups    scan~={scan * 1e3:8.1f} ms  indexed={indexed * 1e3:8.2f} ms"
+        f"  ({scan / max(1e-9, indexed):.0f}x)"
+    )
+    print(f"  {moves} focus moves  {focus * 1e6 / moves:8.1f} us/move")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark model item memory/time")
+    parser.add_argument("--sizes", default="10000,50000,100000", help="Comma-separated item counts")
+    parser.add_argument("--toggles", type=int, default=10000, help="Random toggles per size")
+    parser.add_argument("--lookups", type=int, default=10000, help="Random rid lookups per size")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for raw in args.sizes.split(","):
+        raw = raw.strip()
+        if raw:
+            _run(int(raw), args.toggles, args.lookups, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+FramePacker vs the Waveshare driver's getbuffer(): byte-exactness and speed.
+
+The reference is epd7in5_V2.EPD.getbuffer() when the waveshare_epd library
+imports (on a Pi), else a copy of its algorithm. Inputs: random 1-bit noise,
+rendered home frames, portrait (rotated) images and non-"1" modes.
+
+Example:
+  python tools/bench_packing.py
+  python tools/bench_packing.py --no-numpy --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+from PIL import Image
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from app.core.state import AppState
+from app.render.packing import FramePacker
+from app.render.panel import build_panel_theme, quantize_for_panel
+from app.ui.app import render_app
+from run_epaper_console import _build_fonts, _load_model, _load_theme
+
+
+class _ReferencePanel:
+    """epd7in5_V2.EPD.getbuffer() without the GPIO/SPI setup."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+    def getbuffer(self, image):
+        img = image
+        imwidth, imheight = img.size
+        if imwidth == self.width and imheight == self.height:
+            img = img.convert("1")
+        elif imwidth == self.height and imheight == self.width:
+            img = img.rotate(90, expand=True).convert("1")
+        else:
+            return [0x00] * (int(self.width / 8) * self.height)
+        buf = bytearray(img.tobytes("raw"))
+        for i in range(len(buf)):
+            buf[i] ^= 0xFF
+        return buf
+
+
+def _reference(width: int, height: int):
+    try:
+        from app.render.epd import _load_driver
+
+        epd7in5_V2, _ = _load_driver()
+        epd = epd7in5_V2.EPD()
+        if (epd.width, epd.height) == (width, height):
+            return epd, "waveshare_epd"
+    except Exception:
+        pass
+    return _ReferencePanel(width, height), "reference copy"
+
+
+def _inputs(w: int, h: int, rng: random.Random) -> list[tuple[str, Image.Image]]:
+    out = []
+    noise = Image.frombytes("1", (w, h), bytes(rng.getrandbits(8) for _ in range(w * h // 8)))
+    out.append(("noise", noise))
+    out.append(("noise-portrait", noise.rotate(-90, expand=True)))
+    gray = Image.frombytes("L", (w, h), bytes(rng.getrandbits(8) for _ in range(w * h)))
+    out.append(("gray (dithered)", gray))
+    fonts = _build_fonts(REPO_ROOT)
+    base = _load_theme(os.path.join(REPO_ROOT, "ui_tuner_theme.json"))
+    for variant in ("kitchen", "classic"):
+        theme = build_panel_theme(dict(base, home_variant=variant))
+        rgb = Image.new("RGB", (w, h), theme.get("bg", (255, 255, 255)))
+        render_app(rgb, AppState(model=_load_model(REPO_ROOT)), fonts, theme)
+        out.append((f"{variant} frame", quantize_for_panel(rgb)))
+        out.append((f"{variant} frame RGB", rgb))
+    return out
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check and time FramePacker against getbuffer()")
+    parser.add_argument("--size", default="800x480", help="Panel size WxH")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions (best of)")
+    parser.add_argument("--no-numpy", action="store_true", help="Force the pure-PIL path")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    rng = random.Random(args.seed)
+    ref, ref_name = _reference(w, h)
+    packer = FramePacker(w, h, use_numpy=not args.no_numpy)
+    print(f"  reference: {ref_name}; packer: {'numpy' if packer.use_numpy else 'PIL 1;I'}")
+
+    ok = True
+    for name, image in _inputs(w, h, rng):
+        want = bytes(ref.getbuffer(image))
+        got = bytes(packer.pack(image))
+        into = bytes(packer.pack_into(image))
+        if got != want or into != want:
+            print(f"  {name}: MISMATCH")
+            ok = False
+            continue
+        print(
+            f"  {name:<22} exact  "
+            f"getbuffer={_best(lambda: ref.getbuffer(image), args.repeat):6.2f} ms  "
+            f"pack={_best(lambda: packer.pack(image), args.repeat):6.2f} ms  "
+            f"pack_into={_best(lambda: packer.pack_into(image), args.repeat):6.2f} ms"
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
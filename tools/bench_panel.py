@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+End-to-end input-to-panel latency without hardware.
+
+Drives the real render path (FramePipeline + ClockUpdater + AsyncPanel) into
+a SimulatedDriver whose refreshes take the modelled panel time (scaled by
+--speed) and measures, per scenario, the time from the last submitted
+snapshot until the panel has shown the final frame:
+
+- spin:  bursts of --burst knob detents --interval apart; each burst settles
+         into one full refresh (--settle), plus one partial preview when it
+         lasts longer than --preview-after
+- timer: a running countdown, one snapshot per (scaled) second (partial
+         refreshes of the changed digits)
+
+Afterwards the simulated panel content is compared with a full render of the
+last state, and the panel I/O timing (queue wait, SPI transfer, BUSY wait) and
+the driver's refresh/ghosting counters are printed.
+
+Example:
+  python tools/bench_panel.py --speed 0.05
+  python tools/bench_panel.py --speed 1 --bursts 3 --out /tmp/epd-frames
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from PIL import Image, ImageChops
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from app.core import clock
+from app.core.reducer import Rotate, Tick
+from app.core.snapshot import fork, freeze, reduce_snapshot
+from app.core.state import AppState, WidgetMode
+from app.render.async_panel import AsyncPanel, RefreshTiming
+from app.render.clock_updater import ClockUpdater, PanelFrame, Preview, merge_frames
+from app.render.drivers import SimulatedDriver, SimTimings
+from app.render.panel import build_panel_theme, quantize_for_panel
+from app.render.pipeline import FramePipeline
+from app.ui.app import render_app
+from run_epaper_console import _build_fonts, _load_model, _load_theme
+
+
+def _ms(samples: list[float], q: float) -> str:
+    if not samples:
+        return "      -"
+    s = sorted(samples)
+    return f"{s[min(len(s) - 1, int(len(s) * q))] * 1e3:7.1f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Simulated end-to-end panel latency")
+    parser.add_argument("--variant", default="kitchen", help="home_variant")
+    parser.add_argument("--speed", type=float, default=0.05, help="Simulated refresh time scale (1: real time)")
+    parser.add_argument("--bursts", type=int, default=5, help="Knob bursts in the spin scenario")
+    parser.add_argument("--burst", type=int, default=8, help="Detents per burst")
+    parser.add_argument("--interval", type=float, default=0.03, help="Seconds between detents")
+    parser.add_argument("--settle", type=float, default=0.12, help="Pipeline settle time (s) after the last detent")
+    parser.add_argument("--preview-after", type=float, default=0.6, help="Preview a burst still going after this many seconds")
+    parser.add_argument("--seconds", type=int, default=20, help="Timer seconds in the timer scenario")
+    parser.add_argument("--out", default="", help="Write every simulated refresh as PNG here")
+    args = parser.parse_args()
+
+    fonts = _build_fonts(REPO_ROOT)
+    theme = build_panel_theme(dict(_load_theme(os.path.join(REPO_ROOT, "ui_tuner_theme.json")), home_variant=args.variant))
+    driver = SimulatedDriver(timings=SimTimings(), speed=args.speed, out_dir=args.out)
+    driver.init()
+    driver.clear()
+
+    def full(state: AppState) -> PanelFrame:
+        rgb = Image.new("RGB", (driver.width, driver.height), theme.get("bg", (255, 255, 255)))
+        render_app(rgb, state, fonts, theme)
+        image = quantize_for_panel(rgb)
+        return PanelFrame(image, None)
+
+    updater = ClockUpdater(full, fonts, theme, quantize=quantize_for_panel, pointwise=True)
+    timings: list[RefreshTiming] = []
+    panel_io = AsyncPanel(driver, merge=merge_frames, on_done=timings.append)
+    pipeline = FramePipeline(
+        updater.render,
+        panel_io.show,
+        name="sim",
+        merge_frames=merge_frames,
+        settle_s=args.settle,
+        preview_after_s=args.preview_after,
+        preview=Preview,
+    ).start()
+    state = freeze(AppState(model=_load_model(REPO_ROOT)))
+    pipeline.submit(state)
+    pipeline.wait_idle()
+
+    spin: list[float] = []
+    step = 1
+    for _ in range(args.bursts):
+        for _ in range(args.burst):
+            nxt = reduce_snapshot(state, Rotate(step), theme=theme)
+            if nxt.ui.focused_index == state.ui.focused_index:
+                step = -step
+                nxt = reduce_snapshot(state, Rotate(step), theme=theme)
+            state = nxt
+            pipeline.submit(state)
+            time.sleep(args.interval)
+        t0 = time.perf_counter()
+        pipeline.wait_idle()
+        spin.append(time.perf_counter() - t0 + args.interval)
+    spin_stats = (driver.stats.full_refreshes, driver.stats.partial_refreshes)
+
+    timer: list[float] = []
+    t_sim = clock.now()
+    with clock.frozen(t_sim):
+        ui_state = fork(state)
+        ui_state.ui.widget_mode = WidgetMode.TIMER
+        ui_state.ui.timer_seconds = args.seconds + 5
+        ui_state.ui.timer_running = True
+        ui_state.ui.timer_last_tick_at = t_sim
+        state = freeze(ui_state)
+        pipeline.submit(state)
+        pipeline.wait_idle()
+    for sec in range(1, args.seconds + 1):
+        with clock.frozen(t_sim + sec):
+            state = reduce_snapshot(state, Tick(now=t_sim + sec), theme=theme)
+            t0 = time.perf_counter()
+            pipeline.submit(state)
+            pipeline.wait_idle()
+            timer.append(time.perf_counter() - t0)
+        time.sleep(max(0.0, args.speed - timer[-1]))
+
+    with clock.frozen(t_sim + args.seconds):
+        ref = full(state).image
+    pipeline.stop()
+    panel_io.close()
+    diff = ImageChops.difference(driver.frame.convert("L"), ref.convert("L")).getbbox()
+
+    st = driver.stats
+    scale = args.speed if args.speed > 0 else 1.0
+    print(f"  speed={args.speed}  (latencies are wall time; divide by speed for panel time)")
+    print(
+        f"  spin   bursts={args.bursts}x{args.burst}  last input -> shown p50={_ms(spin, 0.5)} max={_ms(spin, 1.0)} ms  "
+        f"full={spin_stats[0] - 1} partial={spin_stats[1]}"
+    )
+    print(
+        f"  timer  ticks={args.seconds}  submit -> shown p50={_ms(timer, 0.5)} max={_ms(timer, 1.0)} ms  "
+        f"full={st.full_refreshes - spin_stats[0]} partial={st.partial_refreshes - spin_stats[1]}"
+    )
+    for kind in ("full", "partial"):
+        rows = [t for t in timings if t.kind == kind]
+        print(
+            f"  {kind:<8} n={len(rows):<3} queued p50={_ms([t.queued_s for t in rows], 0.5)}  "
+            f"transfer p50={_ms([t.transfer_s for t in rows], 0.5)}  busy p50={_ms([t.busy_s for t in rows], 0.5)} ms"
+        )
+    print(
+        f"  panel  modelled={driver.modeled_s:.1f}s  wall transfer={st.transfer_s:.2f}s busy={st.busy_s:.2f}s "
+        f"(x1/speed={(st.transfer_s + st.busy_s) / scale:.1f}s)  "
+        f"realigned={st.realigned}  ghost_max={driver.ghost_max}  partials_since_full={driver.partials_since_full}"
+    )
+    print(f"  final frame {'matches the full render' if diff is None else f'differs in {diff}'}")
+    return 0 if diff is None else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
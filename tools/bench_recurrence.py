@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Recurring calendars in render_calendar: per-frame expansion vs cached month views.
+
+Fills the calendar with --rules recurring events (daily/weekly/monthly/yearly
+with BYDAY, BYMONTHDAY, COUNT, UNTIL and exceptions) plus --events one-offs,
+then rotates the cursor over +-24 months (--months), rendering the calendar
+screen at every --step days. Compares
+- cold:   the index is dropped before every frame, so each frame expands
+          every rule for the visible month (no caching)
+- cached: one index; a month is materialized the first time it is shown
+          (first sweep) and read from the cache afterwards (second sweep)
+
+Then edits one recurring event (a new exception date) and one one-off event,
+rebuilds the index from the previous one, and reports how many month views
+were kept vs re-materialized. Every month in range is checked against a fresh
+index after the edit.
+
+Example:
+  python tools/bench_recurrence.py --rules 400 --events 2000 --months 24 --step 7
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+import os
+import random
+import statistics
+import sys
+import time
+
+from PIL import Image
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from app.core import clock
+from app.core.calendar_index import CalendarIndex, calendar_index
+from app.core.state import AppState, CalendarEvent, Screen
+from app.ui.calendar import render_calendar
+from run_epaper_console import _build_fonts, _load_model, _load_theme
+
+NOW = datetime(2026, 3, 14, 9, 30)
+RULES = [
+    "FREQ=WEEKLY",
+    "FREQ=WEEKLY;BYDAY=TU,TH",
+    "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO",
+    "FREQ=DAILY;INTERVAL=3",
+    "FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR;COUNT=60",
+    "FREQ=MONTHLY",
+    "FREQ=MONTHLY;BYDAY=2TU",
+    "FREQ=MONTHLY;BYDAY=-1FR",
+    "FREQ=MONTHLY;BYMONTHDAY=1,15",
+    "FREQ=MONTHLY;INTERVAL=3;COUNT=8",
+    "FREQ=YEARLY",
+    "FREQ=WEEKLY;UNTIL=20261231",
+]
+
+
+def _build(rules: int, events: int, rng: random.Random) -> list[CalendarEvent]:
+    base = datetime(2024, 6, 1)
+    out = []
+    for i in range(rules):
+        start = base + timedelta(days=rng.randrange(540), hours=rng.randrange(7, 21))
+        end = start + (timedelta(hours=1) if rng.random() < 0.9 else timedelta(days=2))
+        exdates = [(start + timedelta(days=7 * rng.randrange(1, 80))).timestamp() for _ in range(rng.randrange(3))]
+        rule = rng.choice(RULES)
+        out.append(CalendarEvent(f"r{i}", f"Rule {i}", start=start.timestamp(), end=end.timestamp(), rrule=rule, exdates=exdates))
+    for i in range(events):
+        start = base + timedelta(days=rng.randrange(365 * 4), hours=rng.randrange(7, 21))
+        out.append(CalendarEvent(f"e{i}", f"Event {i}", start=start.timestamp(), end=(start + timedelta(hours=1)).timestamp()))
+    return out
+
+
+def _offsets(months: int, step: int) -> list[int]:
+    span = (NOW.date() + timedelta(days=months * 31) - NOW.date()).days
+    forward = list(range(0, span + 1, step))
+    return forward + [-k for k in forward[1:]] + forward  # out and back, crossing today
+
+
+def _sweep(state: AppState, offsets: list[int], fonts, theme: dict, *, cold: bool) -> tuple[list[float], list[float]]:
+    render_s, query_s = [], []
+    image = Image.new("RGB", (800, 480), theme.get("bg", (255, 255, 255)))
+    for off in offsets:
+        state.ui.calendar_offset_days = off
+        if cold:
+            state.model.calendar_index = None
+        t0 = time.perf_counter()
+        day = NOW.date() + timedelta(days=off)
+        index = calendar_index(state)
+        index.days_with_events(day.year, day.month)
+        index.events_on(day)
+        query_s.append(time.perf_counter() - t0)
+        if cold:
+            state.model.calendar_index = None
+        t0 = time.perf_counter()
+        render_calendar(image, state, fonts, theme)
+        render_s.append(time.perf_counter() - t0)
+    return render_s, query_s
+
+
+def _ms(samples: list[float]) -> str:
+    s = sorted(samples)
+    return f"p50={statistics.median(s) * 1e3:7.2f} ms  p95={s[int(len(s) * 0.95) - 1] * 1e3:7.2f} ms"
+
+
+def _months(months: int) -> list[tuple[int, int]]:
+    out = []
+    for k in range(-months, months + 1):
+        m = NOW.month - 1 + k
+        out.append((NOW.year + m // 12, m % 12 + 1))
+    return out
+
+
+def _answers(index: CalendarIndex, months: list[tuple[int, int]]) -> list:
+    out = []
+    for year, month in months:
+        out.append(sorted(index.days_with_events(year, month)))
+        d = date(year, month, 1)
+        while d.month == month:
+            out.append([(o.event.eid, o.start) for o in index.events_on(d)])
+            d += timedelta(days=1)
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="render_calendar over recurring events: cold vs cached month views")
+    parser.add_argument("--rules", type=int, default=400)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--months", type=int, default=24, help="Rotate this many months either side of today")
+    parser.add_argument("--step", type=int, default=7, help="Days per cursor step")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    theme = _load_theme(os.path.join(REPO_ROOT, "ui_tuner_theme.json"))
+    fonts = _build_fonts(REPO_ROOT)
+    state = AppState(model=_load_model(REPO_ROOT))
+    state.ui.screen = Screen.CALENDAR
+    state.model.calendar = _build(args.rules, args.events, random.Random(args.seed))
+    offsets = _offsets(args.months, args.step)
+    months = _months(args.months)
+    ok = True
+
+    with clock.frozen(NOW.timestamp()):
+        print(f"rules={args.rules} events={args.events} frames={len(offsets)} (+-{args.months} months, step {args.step}d)")
+        cold_r, cold_q = _sweep(state, offsets, fonts, theme, cold=True)
+        print(f"  cold     render {_ms(cold_r)}   calendar data {_ms(cold_q)}")
+        state.model.calendar_index = None
+        first_r, first_q = _sweep(state, offsets, fonts, theme, cold=False)
+        print(f"  cached1  render {_ms(first_r)}   calendar data {_ms(first_q)}")
+        again_r, again_q = _sweep(state, offsets, fonts, theme, cold=False)
+        print(f"  cached2  render {_ms(again_r)}   calendar data {_ms(again_q)}")
+        index = calendar_index(state)
+        for year, month in months:
+            index.days_with_events(year, month)
+        print(f"  months materialized: {index.months_built}")
+
+        # Edit: cancel one instance of a rule, move one one-off event.
+        calendar = list(state.model.calendar)
+        rule = next(ev for ev in calendar if ev.rrule == "FREQ=MONTHLY;BYDAY=2TU")
+        k = calendar.index(rule)
+        calendar[k] = replace(rule, exdates=list(rule.exdates) + [rule.start + 86400 * 28])
+        k = args.rules
+        moved = calendar[k]
+        calendar[k] = replace(moved, start=moved.start + 86400 * 40, end=moved.end + 86400 * 40)
+        state.model.calendar = calendar
+        state.ui.calendar_version += 1
+        t0 = time.perf_counter()
+        edited = calendar_index(state)
+        rebuild = time.perf_counter() - t0
+        expected = _answers(CalendarIndex(calendar, state.ui.calendar_version, NOW.date()), months)
+        kept = edited.months_kept
+        same = _answers(edited, months) == expected
+        ok = ok and same
+        print(
+            f"  edit: rebuild {rebuild * 1e3:.1f} ms, months kept {kept}/{len(index._months)}, "
+            f"re-materialized {edited.months_built}  same answers as fresh index: {same}"
+        )
+    speed = statistics.median(cold_q) / max(1e-9, statistics.median(again_q))
+    print(f"  calendar data speedup (p50, cold vs cached): {speed:.0f}x")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
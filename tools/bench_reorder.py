@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark the delayed reorder on large reminder lists.
+
+Each round toggles a burst of reminders (biased to the rows a user can actually
+see: the first incomplete items), then runs the Tick that applies the reorder
+and re-clamps kitchen focus. Compares:
+- full:        stable sort of the whole list + index rebuild (previous behaviour)
+- incremental: ReminderIndex.reorder() moving only the toggled items
+
+Example:
+  python tools/bench_reorder.py --size 10000 --burst 5 --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from app.core.kitchen_queue import kitchen_visible_task_indices
+from app.core.reminder_index import ReminderIndex, reminder_index
+from app.core.state import AppState, DashboardModel, Reminder
+
+_CATEGORIES = ("fridge", "shopping", "general")
+
+
+def _build_state(n: int, completed_ratio: float, seed: int) -> AppState:
+    rng = random.Random(seed)
+    reminders = [
+        Reminder(rid=f"r{i}", title=f"Item {i}", completed=rng.random() < completed_ratio, category=_CATEGORIES[i % 3])
+        for i in range(n)
+    ]
+    # Start from a settled (already reordered) list like a long-running device would.
+    reminders.sort(key=lambda r: (r.completed,))
+    return AppState(model=DashboardModel(reminders=reminders))
+
+
+def _toggle_burst(state: AppState, rng: random.Random, burst: int, visible_bias: float) -> None:
+    index = reminder_index(state)
+    n = len(state.model.reminders)
+    for _ in range(burst):
+        if rng.random() < visible_bias:
+            heads = index.head(8, completed=False) or [0]
+            pos = rng.choice(heads)
+        else:
+            pos = rng.randrange(n)
+        state.ui.reminders_version += 1
+        index.set_completed(pos, not state.model.reminders[pos].completed, version=state.ui.reminders_version)
+
+
+def _full_reorder(state: AppState) -> None:
+    state.model.reminders = sorted(state.model.reminders, key=lambda r: (r.completed,))
+    state.ui.reminders_version += 1
+    state.model.reminder_index = ReminderIndex(state.model.reminders, state.ui.reminders_version)
+    kitchen_visible_task_indices(state)
+
+
+def _incremental_reorder(state: AppState) -> None:
+    index = reminder_index(state)
+    state.ui.reminders_version += 1
+    state.ui.last_reorder = index.reorder(version=state.ui.reminders_version)
+    kitchen_visible_task_indices(state)
+
+
+def _run(label: str, fn, args) -> list[float]:
+    state = _build_state(args.size, args.completed_ratio, args.seed)
+    rng = random.Random(args.seed + 1)
+    samples = []
+    spans = []
+    for _ in range(args.rounds):
+        _toggle_burst(state, rng, args.burst, args.visible_bias)
+        t0 = time.perf_counter()
+        fn(state)
+        samples.append(time.perf_counter() - t0)
+        last = state.ui.last_reorder
+        if last is not None:
+            spans.append(last.stop - last.start)
+    samples.sort()
+    p50 = statistics.median(samples) * 1e3
+    p95 = samples[int(len(samples) * 0.95) - 1] * 1e3
+    extra = f"  median span={statistics.median(spans):.0f} rows" if spans else ""
+    print(f"  {label:<12} p50={p50:7.3f} ms  p95={p95:7.3f} ms  max={samples[-1] * 1e3:7.3f} ms{extra}")
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark full vs incremental reminder reorder")
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--burst", type=int, default=5, help="Toggles between reorders")
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--completed-ratio", type=float, default=0.8, help="Share of historical items already done")
+    parser.add_argument("--visible-bias", type=float, default=0.8, help="Share of toggles hitting visible rows")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    print(f"size={args.size} burst={args.burst} rounds={args.rounds}")
+    full = _run("full", _full_reorder, args)
+    inc = _run("incremental", _incremental_reorder, args)
+    print(f"  speedup (p50) {statistics.median(full) / max(1e-9, statistics.median(inc)):.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
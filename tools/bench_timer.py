@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Timer countdown: per-second partial frames vs full renders.
+
+Starts a --minutes long timer on the home screen and steps the (pinned) clock
+one second at a time. Every second's snapshot goes through ClockUpdater, which
+redraws only the digit cells that changed. Every --check-every seconds the
+frame is compared with a full render + quantize of the same snapshot. Reports
+the CPU time per tick, the refreshed area and how many ticks were partial.
+
+Example:
+  python tools/bench_timer.py --minutes 60
+  python tools/bench_timer.py --variants classic --check-every 1 --minutes 3
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+import os
+import sys
+import time
+
+from PIL import Image, ImageChops
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from app.core import clock
+from app.core.reducer import Tick
+from app.core.snapshot import freeze, reduce_snapshot
+from app.core.state import AppState, WidgetMode
+from app.render.clock_updater import ClockUpdater, PanelFrame
+from app.render.panel import build_panel_theme, quantize_for_panel
+from app.ui.app import render_app
+from run_epaper_console import _build_fonts, _load_model, _load_theme
+
+
+def _pct(samples: list[float], q: float) -> str:
+    if not samples:
+        return "     -"
+    s = sorted(samples)
+    return f"{s[min(len(s) - 1, int(len(s) * q))] * 1e3:6.2f}"
+
+
+def _run(theme: dict, fonts, args) -> bool:
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    t0 = datetime.strptime(args.start, "%Y-%m-%d %H:%M").timestamp()
+
+    def full(state: AppState) -> PanelFrame:
+        rgb = Image.new("RGB", (w, h), theme.get("bg", (255, 255, 255)))
+        render_app(rgb, state, fonts, theme)
+        image = quantize_for_panel(rgb)
+        return PanelFrame(image, image.tobytes())
+
+    updater = ClockUpdater(
+        full,
+        fonts,
+        theme,
+        quantize=quantize_for_panel,
+        pack=lambda im: im.tobytes(),
+        full_every=args.full_every,
+        pointwise=not args.no_pointwise,
+    )
+    with clock.frozen(t0):
+        state = AppState(model=_load_model(REPO_ROOT))
+        state.ui.widget_mode = WidgetMode.TIMER
+        state.ui.timer_seconds = args.minutes * 60
+        state.ui.timer_running = True
+        state.ui.timer_last_tick_at = t0
+        state = freeze(state)
+        updater.render(state)
+
+    tick_t: list[float] = []
+    area = 0
+    partial = 0
+    ok = True
+    seconds = args.minutes * 60
+    for sec in range(1, seconds + 1):
+        with clock.frozen(t0 + sec):
+            state = reduce_snapshot(state, Tick(now=t0 + sec), theme=theme)
+            c0 = time.perf_counter()
+            frame = updater.render(state)
+            tick_t.append(time.perf_counter() - c0)
+            if frame.rects:
+                partial += 1
+                area += sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in frame.rects)
+            if sec % args.check_every and sec != seconds:
+                continue
+            ref = full(state)
+        diff = ImageChops.difference(frame.image.convert("L"), ref.image.convert("L")).getbbox()
+        if diff is not None:
+            print(f"    second {sec} ({state.ui.timer_seconds}s left): differs from full render in {diff}")
+            ok = False
+
+    n = max(1, partial)
+    print(
+        f"    ticks={seconds} partial={partial} full={updater.full_updates - 1}  "
+        f"tick p50={_pct(tick_t, 0.5)} p99={_pct(tick_t, 0.99)} ms  "
+        f"area={area / n / (w * h) * 100:5.2f}% of frame/partial  {'ok' if ok else 'MISMATCH'}"
+    )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check and time timer countdown partial refreshes")
+    parser.add_argument("--size", default="800x480", help="Frame size WxH")
+    parser.add_argument("--start", default="2026-03-14 23:30", help="Local start time YYYY-MM-DD HH:MM")
+    parser.add_argument("--minutes", type=int, default=60, help="Timer length in minutes")
+    parser.add_argument("--variants", default="kitchen,classic", help="home_variant values")
+    parser.add_argument("--check-every", type=int, default=30, help="Compare with a full render every N seconds")
+    parser.add_argument("--full-every", type=int, default=60, help="Partial refreshes between full ones (0: never)")
+    parser.add_argument("--no-pointwise", action="store_true", help="Quantize the whole frame on every tick")
+    parser.add_argument("--no-panel", action="store_true", help="Use the RGB theme instead of the panel theme")
+    args = parser.parse_args()
+    args.check_every = max(1, args.check_every)
+
+    fonts = _build_fonts(REPO_ROOT)
+    base = _load_theme(os.path.join(REPO_ROOT, "ui_tuner_theme.json"))
+    ok = True
+    for variant in args.variants.split(","):
+        theme = dict(base, home_variant=variant)
+        if not args.no_panel:
+            theme = build_panel_theme(theme)
+        print(f"  {variant}")
+        ok = _run(theme, fonts, args) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+VAD trimming and hands-free auto-stop on sample clips.
+
+Clips are recorded WAVs (--clips a.wav b.wav, 16 kHz mono S16_LE) or, by
+default, synthetic ones: room noise, then "speech" (voiced syllables with
+harmonics plus noisy fricatives, with pauses between words), then a silent
+tail. Synthetic clips know where speech is, so the bench also checks that
+trimming never cuts into it.
+
+Per clip it reports:
+- bytes kept after trim_silence() and the upload time that saves at
+  --uplink-kbps (push-to-talk: the user releases late)
+- hands-free: when EnergyVad ends the recording vs the fixed --fixed-s
+  window the hardware demo used, i.e. how much sooner the request can start
+
+Example:
+  python tools/bench_vad.py --clips 12
+  python tools/bench_vad.py --clips rec1.wav rec2.wav --fixed-s 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import struct
+import sys
+import time
+import wave
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from app.voice.capture import AudioFormat
+from app.voice.vad import EnergyVad, VadConfig
+
+FMT = AudioFormat()
+
+
+def _synth(rng: random.Random, fixed_s: float) -> tuple[bytes, tuple[int, int]]:
+    """(pcm, (speech_start, speech_end) in bytes) for one synthetic clip."""
+    rate = FMT.rate
+    noise_amp = rng.uniform(20, 120)  # about -64..-49 dBFS
+    lead = rng.uniform(0.3, 2.0)
+    samples: list[float] = [rng.gauss(0, noise_amp) for _ in range(int(lead * rate))]
+    start = len(samples)
+    words = rng.randint(2, 6)
+    for w in range(words):
+        for _ in range(rng.randint(1, 3)):
+            if rng.random() < 0.35:
+                # Fricative: quiet, high-frequency noise.
+                amp = rng.uniform(600, 1500)
+                prev = 0.0
+                for _ in range(int(rng.uniform(0.06, 0.12) * rate)):
+                    cur = rng.gauss(0, amp)
+                    samples.append(cur - prev + rng.gauss(0, noise_amp))
+                    prev = cur
+            f0 = rng.uniform(110, 230)
+            amp = rng.uniform(2000, 7000)
+            n = int(rng.uniform(0.12, 0.3) * rate)
+            for i in range(n):
+                env = math.sin(math.pi * i / n)
+                t = i / rate
+                v = sum(math.sin(2 * math.pi * f0 * k * t) / k for k in (1, 2, 3, 5))
+                samples.append(amp * env * v / 2.0 + rng.gauss(0, noise_amp))
+            for _ in range(int(rng.uniform(0.03, 0.12) * rate)):
+                samples.append(rng.gauss(0, noise_amp))
+        if w < words - 1:
+            for _ in range(int(rng.uniform(0.15, 0.45) * rate)):
+                samples.append(rng.gauss(0, noise_amp))
+    end = len(samples)
+    total = max(end + int(0.5 * rate), int(fixed_s * rate))
+    samples.extend(rng.gauss(0, noise_amp) for _ in range(total - end))
+    pcm = struct.pack(f"<{len(samples)}h", *(max(-32768, min(32767, int(v))) for v in samples))
+    return pcm, (start * 2, end * 2)
+
+
+def _load(path: str) -> bytes:
+    with wave.open(path, "rb") as w:
+        if (w.getframerate(), w.getnchannels(), w.getsampwidth()) != (FMT.rate, FMT.channels, FMT.sample_width):
+            raise SystemExit(f"{path}: need {FMT.rate} Hz mono 16-bit")
+        return w.readframes(w.getnframes())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="VAD trim + auto-stop on sample clips")
+    parser.add_argument("--clips", nargs="*", default=["8"], help="WAV files, or a number of synthetic clips")
+    parser.add_argument("--fixed-s", type=float, default=8.0, help="Fixed hands-free window to compare against")
+    parser.add_argument("--uplink-kbps", type=float, default=2000.0, help="Upload bandwidth for the time saved")
+    parser.add_argument("--chunk-ms", type=int, default=20, help="Capture chunk size fed to the VAD")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if len(args.clips) == 1 and args.clips[0].isdigit():
+        clips = [(f"synth{i}", *_synth(rng, args.fixed_s)) for i in range(int(args.clips[0]))]
+    else:
+        clips = [(os.path.basename(p), _load(p), None) for p in args.clips]
+
+    cfg = VadConfig()
+    chunk = FMT.bytes_for(args.chunk_ms / 1000.0)
+    uplink = args.uplink_kbps * 1000 / 8
+    ok = True
+    tot_in = tot_out = 0
+    earlier: list[float] = []
+    cpu = 0.0
+    for name, pcm, truth in clips:
+        vad = EnergyVad(FMT, cfg)
+        stop_at = None
+        t0 = time.perf_counter()
+        for at in range(0, len(pcm), chunk):
+            vad.feed(pcm[at : at + chunk])
+            if stop_at is None and vad.should_stop:
+                stop_at = vad.pos
+        cpu += time.perf_counter() - t0
+        bounds = vad.bounds(len(pcm))
+        kept = (bounds[1] - bounds[0]) if bounds else 0
+        tot_in += len(pcm)
+        tot_out += kept
+        fixed = min(len(pcm), FMT.bytes_for(args.fixed_s))
+        stop = stop_at if stop_at is not None else fixed
+        earlier.append(FMT.seconds(fixed - min(stop, fixed)))
+        note = ""
+        if truth is not None:
+            s, e = truth
+            if bounds is None or bounds[0] > s or bounds[1] < e:
+                note = f"  CUTS SPEECH (truth {FMT.seconds(s):.2f}-{FMT.seconds(e):.2f}s)"
+                ok = False
+            elif stop_at is not None and stop_at < e:
+                note = f"  STOPPED EARLY at {FMT.seconds(stop_at):.2f}s"
+                ok = False
+            else:
+                lead = FMT.seconds(s - bounds[0]) * 1e3
+                tail = FMT.seconds(bounds[1] - e) * 1e3
+                note = f"  margin {lead:4.0f}/{tail:4.0f} ms"
+        span = f"{FMT.seconds(bounds[0]):5.2f}-{FMT.seconds(bounds[1]):5.2f}s" if bounds else "   no speech  "
+        print(
+            f"  {name:<10} {FMT.seconds(len(pcm)):5.2f}s  speech {span}  kept {kept * 100 / max(1, len(pcm)):5.1f}%  "
+            f"auto-stop {FMT.seconds(stop):5.2f}s (fixed {FMT.seconds(fixed):4.1f}s){note}"
+        )
+
+    saved = tot_in - tot_out
+    print(
+        f"  total: {tot_in / 1024:.0f} KB -> {tot_out / 1024:.0f} KB ({saved * 100 / max(1, tot_in):.0f}% saved, "
+        f"{saved / uplink / len(clips) * 1e3:.0f} ms upload saved/clip at {args.uplink_kbps:.0f} kbit/s)"
+    )
+    print(
+        f"  hands-free: recording ends {sum(earlier) / len(earlier):.2f}s sooner on average than a {args.fixed_s:.0f}s window; "
+        f"VAD cost {cpu / max(1e-9, FMT.seconds(tot_in)) * 1e3:.2f} ms per second of audio"
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
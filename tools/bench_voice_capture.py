@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Voice capture hand-off: WAV file + upload vs in-memory streaming.
+
+Records --seconds of audio from a recorder process and measures the time from
+"button release" until the whole clip has reached the recognizer over a
+modelled uplink (--uplink-kbps):
+
+- file:   recorder writes a WAV file (arecord ... file.wav); on release it
+          is stopped, the file is read back and uploaded as a whole
+- memory: VoiceCapture reads raw PCM from the recorder's stdout; the clip is
+          uploaded after release, from memory
+- stream: like memory, but every chunk is sent while recording, so only the
+          tail is left after release
+
+The recorder is `arecord` with --arecord, else a stand-in process (this
+script with --emit) that produces a tone in real time and, like arecord,
+flushes and exits on SIGINT.
+
+Example:
+  python tools/bench_voice_capture.py --seconds 3 --runs 3
+  python tools/bench_voice_capture.py --arecord --device plughw:1,0
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import queue
+import signal
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import wave
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from app.voice.capture import AudioFormat, PipeSource, VoiceCapture, arecord_source
+
+FMT = AudioFormat()
+
+
+def _emit(target: str) -> int:
+    """Stand-in recorder: 440 Hz tone in real time to stdout ("-") or a WAV file."""
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    chunk = FMT.rate // 50
+    tone = b"".join(struct.pack("<h", int(8000 * math.sin(2 * math.pi * 440 * i / FMT.rate))) for i in range(FMT.rate))
+    if target == "-":
+        out = sys.stdout.buffer
+        wav = None
+    else:
+        wav = wave.open(target, "wb")
+        wav.setnchannels(FMT.channels)
+        wav.setsampwidth(FMT.sample_width)
+        wav.setframerate(FMT.rate)
+    t0 = time.perf_counter()
+    n = 0
+    while not stop.is_set():
+        stop.wait(max(0.0, t0 + (n + chunk) / FMT.rate - time.perf_counter()))
+        at = (n % FMT.rate) * 2
+        data = (tone + tone)[at : at + chunk * 2]
+        if wav is not None:
+            wav.writeframes(data)
+        else:
+            try:
+                out.write(data)
+                out.flush()
+            except BrokenPipeError:
+                return 0
+        n += chunk
+    if wav is not None:
+        wav.close()
+    return 0
+
+
+class _Uplink:
+    """Sends queued bytes at `bytes_per_s` on a thread (a stand-in for the recognizer upload)."""
+
+    def __init__(self, bytes_per_s: float):
+        self.rate = bytes_per_s
+        self._q: queue.Queue = queue.Queue()
+        self.sent = 0
+        self._t = threading.Thread(target=self._run, daemon=True)
+        self._t.start()
+
+    def send(self, data: bytes) -> None:
+        self._q.put(len(data))
+
+    def _run(self) -> None:
+        while True:
+            n = self._q.get()
+            if n is None:
+                return
+            time.sleep(n / self.rate)
+            self.sent += n
+
+    def finish(self) -> None:
+        self._q.put(None)
+        self._t.join()
+
+
+def _recorder(args, target: str) -> list[str]:
+    if args.arecord:
+        cmd = ["arecord", "-q", "-D", args.device, *FMT.arecord_args(), "-t"]
+        return cmd + (["raw"] if target == "-" else ["wav", target])
+    return [sys.executable, os.path.abspath(__file__), "--emit", target]
+
+
+def _run_file(args, path: str) -> tuple[float, int]:
+    proc = subprocess.Popen(_recorder(args, path), start_new_session=True, stdout=subprocess.DEVNULL)
+    time.sleep(args.seconds)
+    released = time.perf_counter()
+    os.killpg(proc.pid, signal.SIGINT)
+    proc.wait(timeout=5)
+    with open(path, "rb") as fh:
+        data = fh.read()
+    up = _Uplink(args.uplink_kbps * 1000 / 8)
+    up.send(data)
+    up.finish()
+    return time.perf_counter() - released, len(data)
+
+
+def _run_memory(args, stream: bool) -> tuple[float, int]:
+    up = _Uplink(args.uplink_kbps * 1000 / 8)
+    source = arecord_source(args.device, FMT) if args.arecord else PipeSource(_recorder(args, "-"), FMT)
+    capture = VoiceCapture(source, max_s=args.seconds + 5, on_chunk=up.send if stream else None).start()
+    time.sleep(args.seconds)
+    audio = capture.stop()
+    wav = audio.wav_bytes()
+    # Streaming already sent the PCM; only the container header is left.
+    up.send(wav[: len(wav) - len(audio.pcm)] if stream else wav)
+    up.finish()
+    return time.perf_counter() - audio.released_at, len(audio.pcm)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time from button release to uploaded clip")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Recording length")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--uplink-kbps", type=float, default=2000.0, help="Modelled upload bandwidth")
+    parser.add_argument("--arecord", action="store_true", help="Record with arecord instead of the stand-in")
+    parser.add_argument("--device", default="default", help="arecord -D device")
+    parser.add_argument("--emit", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.emit:
+        return _emit(args.emit)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("file", "memory", "stream"):
+            times = []
+            size = 0
+            for i in range(args.runs):
+                if name == "file":
+                    dt, size = _run_file(args, os.path.join(tmp, f"clip{i}.wav"))
+                else:
+                    dt, size = _run_memory(args, stream=name == "stream")
+                times.append(dt)
+            times.sort()
+            print(
+                f"  {name:<7} release -> uploaded p50={times[len(times) // 2] * 1e3:7.1f} ms  "
+                f"max={times[-1] * 1e3:7.1f} ms  clip={size / 1024:.0f} KB"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
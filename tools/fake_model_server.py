@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the model API, for exercising app.ai.client.HttpBackend.
+
+POST any path with {"model", "contents": [prompt, text | {"mime_type", "data"}]}
+and get {"text": "<model-style JSON>"} back. The reply is built with the local
+intent parser (app.ai.intents) from the user text and the "Current time:" in
+the prompt, so it looks like what the real model returns; audio parts get a
+canned transcript. Latency, failures (HTTP 503) and hangs (no answer within
+the client's timeout) are configurable to test caching, retries and tails.
+
+Example:
+  python tools/fake_model_server.py --port 8765 --latency-ms 800 --fail-rate 0.1
+  python tools/bench_ai_client.py --url http://127.0.0.1:8765/generate
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from app.ai.intents import parse_intent
+
+_NOW = re.compile(r"Current time: (\d{4}-\d{2}-\d{2} \d{2}:\d{2}(?::\d{2})?)")
+AUDIO_TRANSCRIPT = "buy milk and eggs"
+
+
+@dataclass
+class FakeConfig:
+    latency_ms: float = 300.0
+    jitter_ms: float = 100.0
+    fail_rate: float = 0.0
+    hang_rate: float = 0.0
+    hang_s: float = 30.0
+    seed: int = 1
+
+
+@dataclass
+class FakeStats:
+    requests: int = 0
+    failed: int = 0
+    hung: int = 0
+
+
+def model_reply(contents: list) -> str:
+    prompt = next((c for c in contents if isinstance(c, str)), "")
+    m = _NOW.search(prompt)
+    now = datetime.fromisoformat(m.group(1)) if m else datetime.now()
+    parts = [c for c in contents[1:] if c is not prompt]
+    text = " ".join(c for c in parts if isinstance(c, str)) or (AUDIO_TRANSCRIPT if parts else "")
+    res = parse_intent(text, now)
+    todos = [text] if res.escalate and text else res.todos()
+    reminders = [
+        {"text": r["text"], "due": datetime.fromtimestamp(r["due_ts"]).strftime("%Y-%m-%d %H:%M")}
+        for r in res.reminders()
+    ]
+    return "```json\n" + json.dumps({"transcript": text, "todos": todos, "reminders": reminders}) + "\n```"
+
+
+def start_server(host: str = "127.0.0.1", port: int = 0, config: FakeConfig = FakeConfig()):
+    """Serve on a daemon thread; returns (server, stats). server.server_address has the bound port."""
+    rng = random.Random(config.seed)
+    lock = threading.Lock()
+    stats = FakeStats()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            with lock:
+                stats.requests += 1
+                roll = rng.random()
+                delay = max(0.0, rng.gauss(config.latency_ms, config.jitter_ms)) / 1000.0
+            if roll < config.hang_rate:
+                with lock:
+                    stats.hung += 1
+                time.sleep(config.hang_s)
+            time.sleep(delay)
+            if config.hang_rate <= roll < config.hang_rate + config.fail_rate:
+                with lock:
+                    stats.failed += 1
+                self.send_error(503, "overloaded")
+                return
+            try:
+                contents = json.loads(body.decode("utf-8")).get("contents") or []
+                out = json.dumps({"text": model_reply(contents)}).encode("utf-8")
+            except (ValueError, AttributeError):
+                self.send_error(400, "bad request")
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(out)))
+            self.end_headers()
+            try:
+                self.wfile.write(out)
+            except OSError:
+                pass  # client gave up (timeout)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-model", daemon=True).start()
+    return server, stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fake model server for app.ai.client.HttpBackend")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--jitter-ms", type=float, default=100.0)
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Share of requests answered with HTTP 503")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="Share of requests that stall for --hang-s")
+    parser.add_argument("--hang-s", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    config = FakeConfig(args.latency_ms, args.jitter_ms, args.fail_rate, args.hang_rate, args.hang_s, args.seed)
+    server, stats = start_server(args.host, args.port, config)
+    print(f"fake model server on http://{args.host}:{server.server_address[1]}/generate (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        print(f"{stats.requests} requests, {stats.failed} failed, {stats.hung} hung")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
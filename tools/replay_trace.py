@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Replay a recorded session trace headlessly at max speed.
+
+Drives reduce() + render_app() + quantize_for_panel() with the clock pinned to
+each recorded timestamp, so the same build produces the same frames. Frames are
+rendered like the console runner does: only when render_signature() changes.
+
+Reports per-stage latency percentiles (reduce / render / quantize) per event
+type and a digest over all frame hashes. Use --hashes to save per-frame hashes
+and --check to compare a build against a previous run.
+
+Record a trace with:
+  python tools/run_epaper_console.py --record session.jsonl.gz
+  python tools/sim_app_tk.py --record session.jsonl.gz
+
+Example:
+  python tools/replay_trace.py session.jsonl.gz --hashes before.txt
+  python tools/replay_trace.py session.jsonl.gz --check before.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+import hashlib
+import os
+import sys
+import time
+
+from PIL import Image
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from app.core import clock
+from app.core.reducer import reduce
+from app.core.trace import initial_state, read_trace
+from app.render.panel import build_panel_theme, quantize_for_panel
+from app.ui.app import render_app, render_signature
+from run_epaper_console import _build_fonts, _load_theme, _theme_colors
+
+
+def _theme_from_meta(meta: dict) -> dict:
+    # The theme the session ran with; older traces without one get the default theme.
+    if meta.get("theme"):
+        return _theme_colors(meta["theme"])
+    return _load_theme(os.path.join(REPO_ROOT, "ui_tuner_theme.json"))
+
+
+def _pct(samples: list[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(len(samples) * q))]
+
+
+def _report(label: str, samples: list[float]) -> None:
+    if not samples:
+        return
+    s = sorted(samples)
+    print(
+        f"  {label:<18} n={len(s):6d}  p50={_pct(s, 0.50) * 1e3:8.3f}  p95={_pct(s, 0.95) * 1e3:8.3f}"
+        f"  p99={_pct(s, 0.99) * 1e3:8.3f}  max={s[-1] * 1e3:8.3f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay a session trace headlessly")
+    parser.add_argument("trace", help="Trace file written with --record")
+    parser.add_argument("--size", default="800x480", help="Frame size WxH")
+    parser.add_argument("--no-render", action="store_true", help="Only time the reducer")
+    parser.add_argument("--hashes", default="", help="Write per-frame hashes to this file")
+    parser.add_argument("--check", default="", help="Compare frame hashes against a previous --hashes file")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the trace N times (latency only)")
+    args = parser.parse_args()
+
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    fonts = _build_fonts(REPO_ROOT)
+
+    stages: dict[str, list[float]] = defaultdict(list)
+    hashes: list[str] = []
+    wall0 = time.perf_counter()
+    n_events = 0
+    for rep in range(max(1, args.repeat)):
+        header, events = read_trace(args.trace)
+        meta = header.get("meta") or {}
+        theme = _theme_from_meta(meta)
+        panel_theme = build_panel_theme(theme, muted_gray=int(meta.get("panel_muted", theme.get("panel_muted", 150))))
+        threshold = int(meta.get("panel_threshold", theme.get("panel_threshold", 168)))
+        gamma = float(meta.get("panel_gamma", theme.get("panel_gamma", 1.0)))
+        dither = bool(meta.get("panel_dither", theme.get("panel_dither", False)))
+
+        with clock.frozen(float(header["t0"])):
+            state = initial_state(header)
+        last_sig = None
+        for i, (ts, ev) in enumerate(events):
+            name = type(ev).__name__
+            with clock.frozen(ts):
+                t0 = time.perf_counter()
+                reduce(state, ev, theme=theme)
+                t1 = time.perf_counter()
+                stages[f"reduce {name}"].append(t1 - t0)
+                n_events += 1
+                if args.no_render:
+                    continue
+                sig = render_signature(state)
+                if sig == last_sig:
+                    continue
+                last_sig = sig
+                rgb = Image.new("RGB", (w, h), panel_theme.get("bg", (255, 255, 255)))
+                render_app(rgb, state, fonts, panel_theme)
+                t2 = time.perf_counter()
+                image = quantize_for_panel(rgb, threshold=threshold, gamma=gamma, dither=dither)
+                t3 = time.perf_counter()
+            stages[f"render {name}"].append(t2 - t1)
+            stages["quantize"].append(t3 - t2)
+            stages["frame total"].append(t3 - t0)
+            if rep == 0:
+                hashes.append(f"{i} {ts:.6f} {name} {hashlib.sha1(image.tobytes()).hexdigest()}")
+    wall = time.perf_counter() - wall0
+
+    print(f"trace={args.trace} events={n_events} frames={len(stages['quantize'])} wall={wall:.2f}s")
+    for key in sorted(stages):
+        _report(key, stages[key])
+
+    if not args.no_render:
+        digest = hashlib.sha1("\n".join(hashes).encode("utf-8")).hexdigest()
+        print(f"frames digest: {digest}")
+
+    if args.hashes:
+        with open(args.hashes, "w", encoding="utf-8") as f:
+            f.write("\n".join(hashes) + "\n")
+
+    if args.check:
+        with open(args.check, "r", encoding="utf-8") as f:
+            expected = [line.rstrip("\n") for line in f if line.strip()]
+        for got, exp in zip(hashes, expected):
+            if got != exp:
+                print(f"MISMATCH first differing frame:\n  expected {exp}\n  got      {got}")
+                return 1
+        if len(hashes) != len(expected):
+            print(f"MISMATCH frame count: expected {len(expected)}, got {len(hashes)}")
+            return 1
+        print(f"match: {len(hashes)} frames identical")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,19 +4,44 @@ Interactive runner for the e-paper on Raspberry Pi.
 
 This is the missing piece that makes the app non-static on hardware:
 - Keyboard maps to encoder-like events (rotate/click/back/long press)
+- --evdev / --gpio read a real knob (app.input) on a selector thread
 - Periodic Tick drives idle + timer + delayed reorder
+- Optional --record writes a session trace for tools/replay_trace.py
 
-Note: Uses full refresh via display_image() (simple + reliable). Partial refresh can be added later.
+Rendering and the panel refresh run on worker threads (app.render.pipeline), so
+knob input keeps being reduced during a refresh; intermediate frames are dropped
+and the panel ends on the latest state.
+
+State changes use a full refresh (simple + reliable). At each
+minute boundary only the clock is redrawn and partial-refreshed
+(app.render.clock_updater); --clock-full-every bounds the partial refreshes
+between full ones. A running timer is ticked on each second boundary and only
+its changed digits are redrawn and partial-refreshed.
+
+--sim runs without a panel (app.render.drivers.SimulatedDriver): refreshes
+take modelled time and are written out as PNGs.
+
+--voice DEVICE (or --voice-file WAV) enables voice sessions on long press:
+recording, upload and the model call run on app.voice.session.VoiceWorker and
+report back through the event queue, so the knob and rendering keep going.
+--oplog PATH appends every batch they add to the list (app.storage.oplog).
+
+--ics FILE (repeatable) replaces the sample calendar with exported .ics
+calendars (app.data.ics). The files are polled every --ics-poll seconds and a
+changed file is re-imported incrementally on a background thread.
 """
 
 from __future__ import annotations
 
 import argparse
+from datetime import datetime, timedelta
 import json
 import os
+import queue
 import select
 import sys
 import termios
+import threading
 import time
 import tty
 
@@ -27,13 +52,28 @@ REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if REPO_ROOT not in sys.path:
     sys.path.insert(0, REPO_ROOT)
 
-from app.core.reducer import reduce, Rotate, Click, LongPress, Back, Tick
+from app.core.reducer import Rotate, Click, LongPress, Back, Tick, next_timer_deadline, reduce
+from app.core.snapshot import freeze, reduce_snapshot
 from app.core.state import AppState, DashboardModel, Reminder, WeatherDay, CalendarEvent, MemoItem
-from app.render.epd import init_epd, display_image
+from app.core.trace import TraceRecorder
+from app.data.ics import IcsFeed
+from app.input.coalesce import RotaryAcceleration, RotaryCoalescer
+from app.input.evdev import EvdevDevice
+from app.input.gpiod_rotary import GpiodRotary
+from app.input.loop import InputLoop
+from app.render.clock_updater import ClockUpdater, MinuteTick, PanelFrame, Preview, merge_frames, next_minute
+from app.render.async_panel import AsyncPanel
+from app.render.drivers import SimulatedDriver, SimTimings
+from app.render.epd import open_driver
 from app.render.panel import build_panel_theme, quantize_for_panel
+from app.render.frame_cache import FrameCache
+from app.render.pipeline import FramePipeline
 from app.shared.fonts import FontBook
+from app.storage.oplog import OpLog
 from app.shared.paths import find_repo_root
-from app.ui.app import render_app
+from app.ui.app import render_app, render_signature
+from app.voice.capture import AudioFormat, FileSource, arecord_source
+from app.voice.session import CannedRecognizer, GeminiRecognizer, VoiceWorker
 
 
 def _hex_to_rgb(value):
@@ -52,7 +92,11 @@ def _load_theme(path: str) -> dict:
     if not path or not os.path.exists(path):
         return {}
     with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+        return _theme_colors(json.load(f))
+
+
+def _theme_colors(data: dict) -> dict:
+    # Hex strings and JSON lists become the RGB tuples the renderers expect.
     theme = dict(data)
     for key in ("ink", "border", "card", "muted", "bg"):
         val = theme.get(key)
@@ -99,6 +143,22 @@ def _parse_optional_humidity(raw) -> int | None:
         return None
 
 
+def _sample_calendar(now: float) -> list[CalendarEvent]:
+    # Dated sample events around today: one-offs, a weekly rule and a multi-day trip.
+    day = datetime.fromtimestamp(now).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def at(days: int, hour: int, minute: int = 0) -> float:
+        return (day + timedelta(days=days, hours=hour, minutes=minute)).timestamp()
+
+    return [
+        CalendarEvent("e0", "Dinner with Alex", start=at(0, 19), end=at(0, 21)),
+        CalendarEvent("e1", "Gym Session", start=at(0, 8), end=at(0, 9), rrule="FREQ=WEEKLY"),
+        CalendarEvent("e2", "Trash Day", start=at(2, 7), end=at(2, 7, 30), rrule="FREQ=WEEKLY"),
+        CalendarEvent("e3", "Dentist", start=at(5, 14, 30), end=at(5, 15, 30)),
+        CalendarEvent("e4", "Family Trip", start=at(9, 0), end=at(12, 0), all_day=True),
+    ]
+
+
 def _load_model(repo_root: str) -> DashboardModel:
     path = os.path.join(repo_root, "data", "dashboard.json")
     if os.path.exists(path):
@@ -151,10 +211,7 @@ def _load_model(repo_root: str) -> DashboardModel:
         except Exception:
             continue
 
-    cal = [
-        CalendarEvent("e0", "Dinner with Alex", "19:00"),
-        CalendarEvent("e1", "Gym Session", "08:00"),
-    ]
+    cal = _sample_calendar(time.time())
 
     memos = []
     for i, m in enumerate(d.get("memos") or []):
@@ -209,24 +266,77 @@ def _warn_missing_fonts(fonts: FontBook) -> None:
         print(f"  - {key}: {path}")
 
 
-def _render_to_epd(
-    epd,
+_QUIT = object()
+
+
+def _key_to_event(key: str):
+    if key in ("\x1b[D", "h"):  # left
+        return Rotate(-1)
+    if key in ("\x1b[C", "l"):  # right
+        return Rotate(+1)
+    if key in ("\r", "\n"):  # enter
+        return Click()
+    if key == " ":
+        return LongPress()
+    if key in ("b", "B", "\x7f", "\x1b"):  # backspace / esc
+        return Back()
+    if key in ("q", "Q"):
+        return _QUIT
+    return None
+
+
+def _input_loop(events: queue.Queue, stop: threading.Event) -> None:
+    # Input thread: keys keep flowing into the queue while a panel refresh is in progress.
+    while not stop.is_set():
+        if not select.select([sys.stdin], [], [], 0.05)[0]:
+            continue
+        ev = _key_to_event(_read_key_nonblocking())
+        if ev is not None:
+            events.put((time.monotonic(), ev))
+
+
+def _open_knob(args, events: queue.Queue):
+    devices = [EvdevDevice(path) for path in args.evdev]
+    if args.gpio:
+        chip, *lines = args.gpio.split(":")
+        devices.append(GpiodRotary(chip, *(int(v) for v in lines)))
+    if not devices:
+        return None
+    # Kernel timestamps (monotonic, like every queue entry) go into the queue so
+    # acceleration sees the real detent rate.
+    return InputLoop(devices, lambda ts, ev: events.put((ts, ev)))
+
+
+def _open_voice(args, events: queue.Queue):
+    if not (args.voice or args.voice_file):
+        return None
+    fmt = AudioFormat()
+    if args.voice_file:
+        open_source = lambda: FileSource(args.voice_file, fmt)
+    else:
+        open_source = lambda: arecord_source(args.voice, fmt)
+    recognizer = CannedRecognizer() if args.voice_offline else GeminiRecognizer(model=args.voice_model)
+    # Worker reports go through the same queue as input, so they are reduced (and recorded) in order.
+    return VoiceWorker(open_source, recognizer, lambda ev: events.put((time.monotonic(), ev)), fmt=fmt)
+
+
+def _render_frame(
     state: AppState,
     fonts: FontBook,
     theme: dict,
+    size: tuple[int, int],
     *,
     panel_threshold: int,
     panel_muted: int,
     panel_gamma: float,
     panel_dither: bool,
-) -> None:
+) -> Image.Image:
     # Render in RGB first, then quantize to 1-bit. This produces less jagged text
     # than drawing directly to mode '1'.
     t = build_panel_theme(theme, muted_gray=panel_muted)
-    rgb = Image.new("RGB", (epd.width, epd.height), t.get("bg", (255, 255, 255)))
+    rgb = Image.new("RGB", size, t.get("bg", (255, 255, 255)))
     render_app(rgb, state, fonts, t)
-    image = quantize_for_panel(rgb, threshold=panel_threshold, gamma=panel_gamma, dither=panel_dither)
-    display_image(epd, image, sleep_after=False)
+    return quantize_for_panel(rgb, threshold=panel_threshold, gamma=panel_gamma, dither=panel_dither)
 
 
 def main() -> int:
@@ -237,6 +347,33 @@ def main() -> int:
     parser.add_argument("--panel-muted", type=int, default=None, help="Muted gray before quantization (0-255)")
     parser.add_argument("--panel-gamma", type=float, default=None, help="Gamma before threshold (0.1-4.0)")
     parser.add_argument("--panel-dither", action="store_true", help="Use Floyd-Steinberg dithering before 1-bit output")
+    parser.add_argument("--record", default="", help="Write a session trace (JSON lines, .gz ok) for replay_trace.py")
+    parser.add_argument("--no-accel", action="store_true", help="Disable rotary acceleration for fast spins")
+    parser.add_argument("--evdev", action="append", default=[], help="Input device node, e.g. /dev/input/event0 (repeatable)")
+    parser.add_argument("--no-prefetch", action="store_true", help="Disable speculative rendering of neighbour frames")
+    parser.add_argument("--settle", type=float, default=0.12, help="Render once knob input paused this many seconds (0: off)")
+    parser.add_argument("--preview-after", type=float, default=0.6, help="Partial-refresh preview of a spin still going after this many seconds")
+    parser.add_argument("--gpio", default="", help="Raw GPIO encoder as CHIP:A:B[:SW], e.g. /dev/gpiochip0:17:18:27")
+    parser.add_argument(
+        "--clock-full-every",
+        type=int,
+        default=60,
+        help="Full refresh after this many minute-clock partial refreshes (0: never)",
+    )
+    parser.add_argument(
+        "--sim",
+        default="",
+        help="No panel: simulate one and write every refresh as PNG into this directory",
+    )
+    parser.add_argument("--sim-speed", type=float, default=1.0, help="Simulated refresh time scale (0: instant)")
+    parser.add_argument("--sim-fb", default="", help="Also keep the simulated framebuffer in this file, e.g. /dev/shm/epd.raw")
+    parser.add_argument("--voice", default="", help="arecord device for voice sessions on long press, e.g. default or plughw:1,0")
+    parser.add_argument("--voice-file", default="", help="Use a 16 kHz mono WAV as the microphone instead of arecord")
+    parser.add_argument("--voice-model", default="gemini-2.5-flash", help="Gemini model for voice sessions (GOOGLE_API_KEY)")
+    parser.add_argument("--voice-offline", action="store_true", help="Canned voice replies instead of the model")
+    parser.add_argument("--oplog", default="", help="Append list changes from voice/AI actions to this JSON-lines log")
+    parser.add_argument("--ics", action="append", default=[], help="Calendar export (.ics) to show instead of the sample calendar (repeatable)")
+    parser.add_argument("--ics-poll", type=float, default=60.0, help="Seconds between checks of the --ics files for changes")
     args = parser.parse_args()
 
     repo_root = find_repo_root(os.path.dirname(__file__))
@@ -251,83 +388,183 @@ def main() -> int:
     fonts = _build_fonts(repo_root)
     _warn_missing_fonts(fonts)
     state = AppState(model=_load_model(repo_root))
+    feed = None
+    if args.ics:
+        feed = IcsFeed(args.ics, interval_s=args.ics_poll)
+        state.model.calendar = []
+        for sync in feed.poll():
+            state = reduce(state, sync, theme=theme)
+        for err in feed.errors:
+            print(f"ics: {err}")
+        print(f"ics: {len(state.model.calendar)} events from {len(args.ics)} file(s)")
+    recorder = None
+    if args.record:
+        recorder = TraceRecorder(
+            args.record,
+            state,
+            meta={
+                "source": "run_epaper_console",
+                "theme": theme,
+                "panel_threshold": panel_threshold,
+                "panel_muted": panel_muted,
+                "panel_gamma": panel_gamma,
+                "panel_dither": panel_dither,
+            },
+        )
 
-    epd, _ = init_epd()
-    _render_to_epd(
-        epd,
-        state,
+    oplog = OpLog(args.oplog) if args.oplog else None
+    logged_version = 0
+
+    def dispatch(cur: AppState, ev) -> AppState:
+        nonlocal logged_version
+        # Snapshots: the render worker may still be drawing `cur` while we reduce.
+        if recorder is not None:
+            nxt = recorder.apply(reduce_snapshot, cur, ev, theme=theme)
+        else:
+            nxt = reduce_snapshot(cur, ev, theme=theme)
+        applied = nxt.ui.last_actions
+        if oplog is not None and applied is not None and applied.version > logged_version:
+            # One record per applied batch, however many items it added; logged
+            # per event, as one loop pass may reduce several voice results.
+            oplog.append(applied.ops, ts=time.time(), source=applied.source)
+            logged_version = applied.version
+        return nxt
+
+    if args.sim:
+        panel = SimulatedDriver(timings=SimTimings(), speed=args.sim_speed, out_dir=args.sim, fb_path=args.sim_fb)
+        panel.init()
+        panel.clear()
+    else:
+        panel = open_driver()
+
+    def render_panel(snap: AppState) -> PanelFrame:
+        image = _render_frame(
+            snap,
+            fonts,
+            theme,
+            (panel.width, panel.height),
+            panel_threshold=panel_threshold,
+            panel_muted=panel_muted,
+            panel_gamma=panel_gamma,
+            panel_dither=panel_dither,
+        )
+        # The panel packs it into its reused buffer when it is shown.
+        return PanelFrame(image, None)
+
+    # Frames one detent away are pre-rendered while the pipeline is idle.
+    pipeline: FramePipeline
+    cache = FrameCache(render_panel, theme, idle=lambda: pipeline.render_idle and not args.no_prefetch)
+    # Minute ticks redraw only the clock and partial-refresh its rect; focus
+    # and calendar cursor moves redraw and partial-refresh only what changed.
+    clock_updater = ClockUpdater(
+        cache.render,
         fonts,
-        theme,
-        panel_threshold=panel_threshold,
-        panel_muted=panel_muted,
-        panel_gamma=panel_gamma,
-        panel_dither=panel_dither,
+        build_panel_theme(theme, muted_gray=panel_muted),
+        quantize=lambda rgb: quantize_for_panel(rgb, threshold=panel_threshold, gamma=panel_gamma, dither=panel_dither),
+        full_every=args.clock_full_every,
+        lock=cache.render_lock,
+        pointwise=not panel_dither,
     )
-
+    # SPI transfer + BUSY wait run on the panel I/O thread; the display stage
+    # waits for it so the pipeline keeps latest-wins between refreshes.
+    panel_io = AsyncPanel(panel, merge=merge_frames)
+    # A knob spin settles into one full refresh (plus one partial preview if it goes on).
+    pipeline = FramePipeline(
+        clock_updater.render,
+        panel_io.show,
+        name="epd",
+        merge_frames=merge_frames,
+        settle_s=args.settle,
+        preview_after_s=args.preview_after,
+        preview=Preview,
+    ).start()
+    cache.start()
+    state = freeze(state)
+    pipeline.submit(state)
+    cache.speculate(state)
+
+    events: queue.Queue = queue.Queue(maxsize=256)
+    coalescer = RotaryCoalescer(None if args.no_accel else RotaryAcceleration.from_theme(theme))
+    stop = threading.Event()
+    reader = threading.Thread(target=_input_loop, args=(events, stop), name="input", daemon=True)
+    knob = _open_knob(args, events)
+    voice = _open_voice(args, events)
     fd = sys.stdin.fileno()
     old = termios.tcgetattr(fd)
     tty.setraw(fd)
     try:
         print("Controls: Left/Right rotate, Enter click, Space long press, B/Esc back, Q quit")
-        last_render_sig = None
+        reader.start()
+        if knob is not None:
+            threading.Thread(target=knob.run, args=(stop,), name="knob", daemon=True).start()
+        if feed is not None:
+            threading.Thread(target=feed.run, args=(lambda ev: events.put((time.monotonic(), ev)), stop), name="ics", daemon=True).start()
+        last_render_sig = render_signature(state)
+        last_layout_sig = render_signature(state, include_timer=False)
         next_tick = time.time()
+        next_clock = next_minute(next_tick)
         while True:
+            # Drain everything queued and merge rotate bursts into one Rotate(n),
+            # so a fast spin costs one reducer step and one render.
+            batch = []
+            try:
+                # A running timer is ticked on its second boundary, not on the next --tick.
+                deadline = min(next_tick, next_clock, next_timer_deadline(state) or next_tick)
+                batch.append(events.get(timeout=max(0.0, deadline - time.time())))
+                while True:
+                    batch.append(events.get_nowait())
+            except queue.Empty:
+                pass
+            for ev in coalescer.coalesce(batch):
+                if ev is _QUIT:
+                    return 0
+                state = dispatch(state, ev)
+
             now = time.time()
-            key = _read_key_nonblocking()
-
-            ev = None
-            if key in ("\x1b[D", "h"):  # left
-                ev = Rotate(-1)
-            elif key in ("\x1b[C", "l"):  # right
-                ev = Rotate(+1)
-            elif key in ("\r", "\n"):  # enter
-                ev = Click()
-            elif key == " ":
-                ev = LongPress()
-            elif key in ("b", "B", "\x7f", "\x1b"):  # backspace / esc
-                ev = Back()
-            elif key in ("q", "Q"):
-                return 0
-
-            if ev is not None:
-                reduce(state, ev, theme=theme)
-
-            if now >= next_tick:
-                reduce(state, Tick(now=now), theme=theme)
+            timer_due = next_timer_deadline(state)
+            if now >= next_tick or (timer_due is not None and now >= timer_due):
+                state = dispatch(state, Tick(now=now))
                 next_tick = now + float(args.tick)
+            if voice is not None:
+                voice.sync(state)
 
-            # Only re-render if state that affects UI changed.
-            sig = (
-                state.ui.screen,
-                state.ui.focused_index,
-                state.ui.page,
-                state.ui.idle,
-                state.ui.widget_mode,
-                state.ui.timer_seconds,
-                state.ui.timer_running,
-                state.ui.voice_active,
-                state.ui.menu_focused,
-                state.ui.active_menu,
-                tuple((r.rid, r.completed) for r in state.model.reminders),
-            )
+            # Only re-render if state that affects UI changed. While the panel is busy,
+            # the pipeline keeps only the newest snapshot/frame.
+            sig = render_signature(state)
             if sig != last_render_sig:
-                _render_to_epd(
-                    epd,
-                    state,
-                    fonts,
-                    theme,
-                    panel_threshold=panel_threshold,
-                    panel_muted=panel_muted,
-                    panel_gamma=panel_gamma,
-                    panel_dither=panel_dither,
-                )
+                pipeline.submit(state)
+                layout_sig = render_signature(state, include_timer=False)
+                if layout_sig != last_layout_sig:
+                    # Countdown seconds alone don't change the neighbouring frames.
+                    cache.speculate(state)
+                    last_layout_sig = layout_sig
                 last_render_sig = sig
-
-            time.sleep(0.01)
+            elif now >= next_clock:
+                pipeline.submit(MinuteTick(state))
+            if now >= next_clock:
+                next_clock = next_minute(now)
     finally:
+        stop.set()
         termios.tcsetattr(fd, termios.TCSADRAIN, old)
+        if knob is not None:
+            knob.close()
+        if voice is not None:
+            voice.close()
+        if oplog is not None:
+            oplog.close()
+        if recorder is not None:
+            recorder.close()
+        cache.stop()
+        pipeline.stop()
+        panel_io.close()
+        io = panel_io.stats
+        if io.refreshes:
+            print(
+                f"panel: {io.refreshes} refreshes, transfer {io.transfer_s / io.refreshes * 1e3:.0f} ms"
+                f" + busy {io.busy_s / io.refreshes * 1e3:.0f} ms per refresh"
+            )
         try:
-            epd.sleep()
+            panel.sleep()
         except Exception:
             pass
 
@@ -1,6 +1,8 @@
+import argparse
 import os
 import sys
 import json
+import queue
 import time
 import tkinter as tk
 from tkinter import ttk
@@ -12,11 +14,15 @@ if REPO_ROOT not in sys.path:
     sys.path.insert(0, REPO_ROOT)
 
 from app.core.state import AppState, DashboardModel, Reminder, WeatherDay, CalendarEvent, MemoItem
-from app.core.reducer import reduce, Rotate, Click, LongPress, Back, Tick, MemoDelta
+from app.core.reducer import Rotate, Click, LongPress, Back, Tick, MemoDelta
+from app.core.snapshot import SnapshotHistory, reduce_snapshot
+from app.core.trace import TraceRecorder
 from app.render.panel import build_panel_theme, quantize_for_panel
 from app.shared.fonts import FontBook
 from app.shared.paths import find_repo_root
 from app.ui.app import render_app
+from app.voice.capture import AudioFormat, FileSource, arecord_source
+from app.voice.session import CannedRecognizer, GeminiRecognizer, VoiceWorker
 
 
 def _hex_to_rgb(value):
@@ -184,7 +190,7 @@ def load_model(repo_root):
 
 
 class Simulator(tk.Tk):
-    def __init__(self):
+    def __init__(self, record_path="", voice_args=None):
         super().__init__()
         self.title("E-Ink Dashboard Simulator")
         self.geometry("1420x900")
@@ -194,6 +200,12 @@ class Simulator(tk.Tk):
         self.theme = load_theme(self.theme_path)
         self.fonts = build_fonts(self.repo_root)
         self.state = AppState(model=load_model(self.repo_root))
+        # Snapshots share structure, so keeping history for undo/time travel is cheap.
+        self.history = SnapshotHistory(self.state)
+        self.recorder = TraceRecorder(record_path, self.state, meta={"source": "sim_app_tk", "theme": self.theme}) if record_path else None
+        # Voice worker events arrive on its thread; they are reduced on the next tick.
+        self.voice_events = queue.Queue()
+        self.voice = self._open_voice(voice_args)
 
         self.preview_mode = tk.StringVar(value="Panel")
         self.panel_threshold = tk.IntVar(value=int(self.theme.get("panel_threshold", 168)))
@@ -240,9 +252,10 @@ class Simulator(tk.Tk):
             "Keys: \n"
             "  ←/→ = Rotate (move focus / auto page)\n"
             "  Enter = Click (open detail / toggle task / select menu)\n"
-            "  Space = Long press (voice overlay stub)\n"
+            "  Space = Long press (voice session; Enter ends recording, Esc cancels)\n"
             "  B / Esc / Backspace = Back (dashboard -> menu, detail/menu -> dashboard)\n"
             "  ↑/↓ = Memo (when left panel focused)\n"
+            "  Ctrl+Z / Ctrl+Y = Undo / redo (time travel)\n"
             "  Q = Quit"
         )
         self.help = ttk.Label(self, text=help_text, justify="left", anchor="w")
@@ -258,6 +271,8 @@ class Simulator(tk.Tk):
         self.bind("B", lambda _e: self._dispatch(Back()))
         self.bind("<Escape>", lambda _e: self._dispatch(Back()))
         self.bind("<BackSpace>", lambda _e: self._dispatch(Back()))
+        self.bind("<Control-z>", lambda _e: self._travel(self.history.undo))
+        self.bind("<Control-y>", lambda _e: self._travel(self.history.redo))
         self.bind("q", lambda _e: self.destroy())
 
         for v in (self.preview_mode, self.panel_threshold, self.panel_muted, self.panel_gamma, self.badge_style):
@@ -266,13 +281,46 @@ class Simulator(tk.Tk):
         self.after(100, self._tick)
         self._render()
 
+    def _open_voice(self, args):
+        if args is None or not (args.voice or args.voice_file):
+            return None
+        fmt = AudioFormat()
+        if args.voice_file:
+            open_source = lambda: FileSource(args.voice_file, fmt)
+        else:
+            open_source = lambda: arecord_source(args.voice, fmt)
+        recognizer = CannedRecognizer() if args.voice_offline else GeminiRecognizer()
+        return VoiceWorker(open_source, recognizer, self.voice_events.put, fmt=fmt)
+
+    def _reduce(self, ev):
+        if self.recorder is not None:
+            return self.recorder.apply(reduce_snapshot, self.state, ev, theme=self.theme)
+        return reduce_snapshot(self.state, ev, theme=self.theme)
+
     def _tick(self):
-        self.state = reduce(self.state, Tick(), theme=self.theme)
+        while True:
+            try:
+                ev = self.voice_events.get_nowait()
+            except queue.Empty:
+                break
+            self.state = self.history.record(self._reduce(ev))
+        self.state = self.history.record(self._reduce(Tick()), checkpoint=False)
+        if self.voice is not None:
+            self.voice.sync(self.state)
         self._render()
         self.after(100, self._tick)
 
     def _dispatch(self, ev):
-        self.state = reduce(self.state, ev, theme=self.theme)
+        self.state = self.history.record(self._reduce(ev))
+        if self.voice is not None:
+            self.voice.sync(self.state)
+        self._render()
+
+    def _travel(self, step):
+        if self.recorder is not None:
+            # Traces hold input events only; a history jump could not be replayed.
+            return
+        self.state = step()
         self._render()
 
     def _render(self):
@@ -314,7 +362,7 @@ class Simulator(tk.Tk):
         self.status.configure(
             text=(
                 f"screen={ui.screen.value} focus={ui.focused_index} page={ui.page} idle={ui.idle} "
-                f"pending_reorder={ui.pending_reorder} mode={mode} th={threshold} muted={muted} "
+                f"pending_reorder={ui.pending_reorder} history={self.history.position + 1}/{len(self.history)} mode={mode} th={threshold} muted={muted} "
                 f"gamma={gamma:.2f} dither={dither} badge_style={badge_style} "
                 f"focus_style={self.theme.get('b_right_focus_style', 'row_box')} fonts_ok={font_ok}"
             )
@@ -322,4 +370,17 @@ class Simulator(tk.Tk):
 
 
 if __name__ == "__main__":
-    Simulator().mainloop()
+    parser = argparse.ArgumentParser(description="E-ink dashboard simulator")
+    parser.add_argument("--record", default="", help="Write a session trace (JSON lines, .gz ok) for replay_trace.py")
+    parser.add_argument("--voice", default="", help="arecord device for voice sessions on Space, e.g. default")
+    parser.add_argument("--voice-file", default="", help="Use a 16 kHz mono WAV as the microphone instead of arecord")
+    parser.add_argument("--voice-offline", action="store_true", help="Canned voice replies instead of the model")
+    args = parser.parse_args()
+    sim = Simulator(record_path=args.record, voice_args=args)
+    try:
+        sim.mainloop()
+    finally:
+        if sim.voice is not None:
+            sim.voice.close()
+        if sim.recorder is not None:
+            sim.recorder.close()